@@ -12,9 +12,9 @@ Design Principles:
 - Metrics collection for visual QA tracking
 """
 
+import hashlib
 import json
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
@@ -28,12 +28,29 @@ if str(_scripts_dir) not in sys.path:
 from scripts.agent_loader import (  # noqa: E402
     load_content_agent as _load_content_agent,  # type: ignore
 )
+from src.agent_sdk.chart_renderer import (  # noqa: E402
+    is_current,
+    load_manifest,
+    record_render,
+    spec_digest,
+)
+from src.agent_sdk.chart_sandbox import ChartSandbox, get_sandbox  # noqa: E402
 from src.quality.chart_metrics import get_metrics_collector  # noqa: E402
 
 # Module-level prompt constant loaded from YAML
 _graphics_config = _load_content_agent("graphics")
 GRAPHICS_AGENT_PROMPT = _graphics_config.system_message
 
+# The prompt is this renderer's code: a chart cached under one prompt is stale
+# under another.
+_RENDERER_VERSION = (
+    "graphics-agent:" + hashlib.sha256(GRAPHICS_AGENT_PROMPT.encode()).hexdigest()[:12]
+)
+
+# Our name in the shared render manifest. finalise_art only redraws entries
+# chart_renderer wrote, so an LLM-drawn chart is never overwritten there.
+_RENDERER_NAME = "graphics_agent"
+
 
 class GraphicsAgent:
     """Generates Economist-style charts from specifications.
@@ -44,6 +61,7 @@ class GraphicsAgent:
     - Inline labels in clear space
     - Economist color palette
     - Metrics tracking via chart_metrics
+    - Skips the LLM when the PNG was already generated from the same spec
 
     Example:
         >>> agent = GraphicsAgent(llm_client)
@@ -58,10 +76,26 @@ class GraphicsAgent:
         GRAPHICS_AGENT_PROMPT  # loaded from agents/content_generation/graphics.yaml
     )
 
-    def __init__(self, llm_client):
-        """Initialize Graphics Agent with LLM client."""
+    def __init__(self, llm_client, sandbox: ChartSandbox | None = None):
+        """Initialize Graphics Agent with LLM client.
+
+        Args:
+            llm_client: Client passed to ``call_llm``.
+            sandbox: Worker pool that runs the generated code. Defaults to the
+                shared pool from ``get_sandbox``.
+
+        """
         self.client = llm_client
+        self._sandbox = sandbox
         self.metrics = get_metrics_collector()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Share of ``generate_chart`` calls answered from the render manifest."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
 
     def generate_chart(
         self,
@@ -107,6 +141,17 @@ class GraphicsAgent:
                 f"got: {type(output_path).__name__}",
             )
 
+        # Same spec, same prompt, same PNG still on disk: nothing to generate.
+        digest = spec_digest(chart_spec, version=_RENDERER_VERSION)
+        chart_path = Path(output_path)
+        if is_current(
+            chart_path, digest, load_manifest(chart_path.parent), _RENDERER_NAME
+        ):
+            self.cache_hits += 1
+            print(f"📈 Graphics Agent: {output_path} is current for this spec, reusing")
+            return output_path
+        self.cache_misses += 1
+
         print(
             f"📈 Graphics Agent: Creating visualization '{chart_spec.get('title', 'Untitled')[:40]}...'",
         )
@@ -118,6 +163,9 @@ class GraphicsAgent:
         )
 
         try:
+            # Start the workers now so they import matplotlib while the LLM writes.
+            self._ensure_sandbox()
+
             # Generate matplotlib code via LLM
             code = self._generate_matplotlib_code(chart_spec, max_tokens)
 
@@ -126,6 +174,8 @@ class GraphicsAgent:
 
             if success:
                 print(f"   ✓ Chart saved to {output_path}")
+                if chart_path.is_file():
+                    record_render(chart_path, digest, _RENDERER_NAME)
                 self.metrics.record_generation(chart_record, success=True)
                 return output_path
             return None
@@ -163,9 +213,18 @@ class GraphicsAgent:
 
         return code
 
+    def _ensure_sandbox(self) -> ChartSandbox:
+        """The worker pool generated code runs in."""
+        if self._sandbox is None:
+            self._sandbox = get_sandbox()
+        return self._sandbox
+
     def _execute_matplotlib_code(self, code: str, output_path: str) -> bool:
         """Execute matplotlib code to generate chart.
 
+        The code runs in a warm sandbox worker (see ``chart_sandbox``), in its
+        own scratch directory and under CPU, memory and time limits.
+
         Args:
             code: Python code string to execute
             output_path: Path to save chart PNG
@@ -174,37 +233,28 @@ class GraphicsAgent:
             True if successful, False otherwise
 
         """
+        output_path = str(Path(output_path).absolute())  # workers run elsewhere
+        savefig = (
+            f"plt.savefig({output_path!r}, dpi=300, bbox_inches='tight', "
+            "facecolor='#f1f0e9')"
+        )
         # Ensure savefig with correct parameters
         if "plt.savefig" not in code:
-            code += f"\nplt.savefig('{output_path}', dpi=300, bbox_inches='tight', facecolor='#f1f0e9')"
+            code += f"\n{savefig}"
         else:
-            code = re.sub(
-                r"plt\.savefig\([^)]+\)",
-                f"plt.savefig('{output_path}', dpi=300, bbox_inches='tight', facecolor='#f1f0e9')",
-                code,
-            )
-
-        # Write code to temp script
-        temp_script = "/tmp/chart_gen.py"
-        with open(temp_script, "w") as f:
-            f.write("import matplotlib\nmatplotlib.use('Agg')\n")
-            f.write(
-                "import matplotlib.pyplot as plt\n"
-                "import matplotlib.patches as mpatches\n"
-                "import numpy as np\n",
-            )
-            f.write(code)
+            code = re.sub(r"plt\.savefig\([^)]+\)", lambda _: savefig, code)
 
-        # Execute script
-        result = subprocess.run(
-            [sys.executable, temp_script],
-            capture_output=True,
-            text=True,
+        script = (
+            "import matplotlib\nmatplotlib.use('Agg')\n"
+            "import matplotlib.pyplot as plt\n"
+            "import matplotlib.patches as mpatches\n"
+            "import numpy as np\n" + code
         )
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        success, error_msg = self._ensure_sandbox().run(script, output_path)
 
-        if result.returncode == 0:
+        if success:
             return True
-        error_msg = result.stderr[:200]
         print(f"   ⚠ Chart generation failed: {error_msg}")
 
         # Record failure in chart record
@@ -2,7 +2,9 @@
 """Article Evaluator — 5-Dimension Quality Scoring (Story #116).
 
 Scores every generated article on 5 quality dimensions deterministically.
-Persists scores to logs/article_evals.json for trend tracking.
+Each article is scanned once into an ArticleFeatures vector; the scores and
+details are pure functions of it. Persists scores and features to
+logs/article_evals.jsonl (see eval_store.py) for trend tracking.
 
 Usage:
     from scripts.article_evaluator import ArticleEvaluator
@@ -10,18 +12,19 @@ Usage:
     evaluator = ArticleEvaluator()
     result = evaluator.evaluate(article_text)
     print(f"Score: {result.percentage}% ({result.total_score}/{result.max_score})")
-    result.persist("logs/article_evals.json")
+    result.persist()
 """
 
 import logging
 import re
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 import yaml
 
+from scripts.eval_store import EvalStore
+
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -123,11 +126,73 @@ _AMERICAN_SPELLINGS = [
 _REQUIRED_FRONTMATTER = ["layout", "title", "date", "categories", "image"]
 
 
+_DATA_TOKEN = re.compile(
+    r"\d+%|\$[\d,.]+|\d+\.?\d*\s*(billion|million|thousand)", re.IGNORECASE
+)
+_BANNED_OPENING_RES = [(p, re.compile(p, re.IGNORECASE)) for p in _BANNED_OPENINGS]
+_PLACEHOLDER = re.compile(r"\[NEEDS SOURCE\]|\[UNVERIFIED\]")
+_REFERENCES_SECTION = re.compile(r"## References\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_REFERENCE_ITEM = re.compile(r"^\d+\..*$", re.MULTILINE)
+_HEADING = re.compile(r"^#{2,3}\s", re.MULTILINE)
+_REFERENCES_TAIL = re.compile(r"## References.*", re.DOTALL | re.IGNORECASE)
+_LIST_ITEM = re.compile(r"^[-*]\s|^\d+\.\s", re.MULTILINE)
+_EMBEDDED_IMAGE = re.compile(r"!\[.*?\]\(.*?\)")
+_CHART_REFERENCES = ["as the chart", "chart shows", "chart illustrates", "figure shows"]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Data classes
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+@dataclass(frozen=True)
+class ArticleFeatures:
+    """Everything the scorers read from an article, extracted in one pass.
+
+    Scores and details are pure functions of these fields, and the vector is
+    persisted with each evaluation so trends can be tracked per feature.
+    """
+
+    # Frontmatter
+    missing_frontmatter: tuple[str, ...] = ()
+    has_image: bool = False
+    # Opening
+    banned_opening: str | None = None
+    opening_data_in_sentence: int = 0
+    opening_data_in_paragraph: int = 0
+    opening_data_tokens: int = 0  # any number in the first 200 characters
+    first_sentence_words: int = 0
+    # Evidence
+    placeholders: int = 0
+    vague_attributions: tuple[str, ...] = ()
+    has_reference_section: bool = False  # "## References" followed by a list
+    references: tuple[str, ...] = ()
+    fresh_years: tuple[str, ...] = ()
+    analyst_vendors: tuple[str, ...] = ()
+    # Voice
+    banned_phrases: tuple[str, ...] = ()
+    hedging_phrases: tuple[str, ...] = ()
+    american_spellings: tuple[str, ...] = ()
+    exclamations: int = 0
+    # Structure
+    heading_offsets: tuple[int, ...] = ()
+    prose_list_items: int = 0
+    word_count: int = 0
+    mentions_references: bool = False  # "## references" anywhere, any case
+    banned_closing: str | None = None
+    # Visual
+    has_embedded_image: bool = False
+    refers_to_chart: bool = False
+
+    @property
+    def headings(self) -> int:
+        return len(self.heading_offsets)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON persistence."""
+        return asdict(self)
+
+
 @dataclass
 class EvalResult:
     """Result of article evaluation across 5 dimensions."""
@@ -135,6 +200,7 @@ class EvalResult:
     scores: dict[str, int] = field(default_factory=dict)
     details: dict[str, str] = field(default_factory=dict)
     article_filename: str = ""
+    features: ArticleFeatures | None = None
 
     @property
     def total_score(self) -> int:
@@ -150,7 +216,7 @@ class EvalResult:
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON persistence."""
-        return {
+        record = {
             "article_filename": self.article_filename,
             "timestamp": datetime.now().isoformat(),
             "scores": self.scores,
@@ -159,23 +225,18 @@ class EvalResult:
             "percentage": self.percentage,
             "details": self.details,
         }
+        if self.features is not None:
+            record["features"] = self.features.to_dict()
+        return record
 
-    def persist(self, filepath: str = "logs/article_evals.json") -> None:
-        """Append evaluation to JSON log file."""
-        import orjson
-
-        path = Path(filepath)
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def persist(self, filepath: str | None = None) -> None:
+        """Append evaluation to the JSONL eval store (one atomic write).
 
-        evals: list[dict[str, Any]] = []
-        if path.exists():
-            try:
-                evals = orjson.loads(path.read_bytes())
-            except Exception:
-                evals = []
+        Args:
+            filepath: Store to append to; defaults to ``eval_store.EVALS_PATH``.
 
-        evals.append(self.to_dict())
-        path.write_bytes(orjson.dumps(evals, option=orjson.OPT_INDENT_2))
+        """
+        EvalStore(filepath).append(self.to_dict())
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -194,26 +255,84 @@ class ArticleEvaluator:
             filename: Optional filename for logging.
 
         Returns:
-            EvalResult with scores (1-10 each), details, and total.
+            EvalResult with scores (1-10 each), details, features, and total.
 
         """
+        features = self.extract_features(article)
+
+        result = EvalResult(article_filename=filename, features=features)
+        result.scores["opening_quality"] = self._score_opening(features)
+        result.scores["evidence_sourcing"] = self._score_evidence(features)
+        result.scores["voice_consistency"] = self._score_voice(features)
+        result.scores["structure"] = self._score_structure(features)
+        result.scores["visual_engagement"] = self._score_visual(features)
+
+        result.details["opening_quality"] = self._detail_opening(features)
+        result.details["evidence_sourcing"] = self._detail_evidence(features)
+        result.details["voice_consistency"] = self._detail_voice(features)
+        result.details["structure"] = self._detail_structure(features)
+        result.details["visual_engagement"] = self._detail_visual(features)
+
+        return result
+
+    def extract_features(self, article: str) -> ArticleFeatures:
+        """Scan an article once and return the features every dimension uses."""
         frontmatter = self._parse_frontmatter(article)
         body = self._extract_body(article)
+        body_lower = body.lower()
+
+        first_para = body.split("\n\n", maxsplit=1)[0] if body else ""
+        first_sentence = first_para.split(".")[0] if first_para else ""
+        banned_opening = next(
+            (p for p, regex in _BANNED_OPENING_RES if regex.search(first_para)), None
+        )
 
-        result = EvalResult(article_filename=filename)
-        result.scores["opening_quality"] = self._score_opening(body)
-        result.scores["evidence_sourcing"] = self._score_evidence(body)
-        result.scores["voice_consistency"] = self._score_voice(body)
-        result.scores["structure"] = self._score_structure(article, frontmatter, body)
-        result.scores["visual_engagement"] = self._score_visual(frontmatter, body)
+        ref_match = _REFERENCES_SECTION.search(body)
+        references = (
+            tuple(_REFERENCE_ITEM.findall(ref_match.group(1))) if ref_match else ()
+        )
 
-        result.details["opening_quality"] = self._detail_opening(body)
-        result.details["evidence_sourcing"] = self._detail_evidence(body)
-        result.details["voice_consistency"] = self._detail_voice(body)
-        result.details["structure"] = self._detail_structure(frontmatter, body)
-        result.details["visual_engagement"] = self._detail_visual(frontmatter, body)
+        last_500_lower = body[-500:].lower()
+        banned_closing = next(
+            (c for c in _BANNED_CLOSINGS if c.lower() in last_500_lower), None
+        )
 
-        return result
+        return ArticleFeatures(
+            missing_frontmatter=tuple(
+                f for f in _REQUIRED_FRONTMATTER if f not in frontmatter
+            ),
+            has_image=bool(frontmatter.get("image")),
+            banned_opening=banned_opening,
+            opening_data_in_sentence=len(_DATA_TOKEN.findall(first_sentence)),
+            opening_data_in_paragraph=len(_DATA_TOKEN.findall(first_para)),
+            opening_data_tokens=len(
+                re.findall(r"\d+%|\$[\d,.]+|\d+", first_para[:200])
+            ),
+            first_sentence_words=len(first_sentence.split()),
+            placeholders=len(_PLACEHOLDER.findall(body)),
+            vague_attributions=tuple(
+                p for p in _VAGUE_ATTRIBUTION if p.lower() in body_lower
+            ),
+            has_reference_section=ref_match is not None,
+            references=references,
+            fresh_years=tuple(
+                y for y in sorted(_FRESH_YEARS, reverse=True) if y in body
+            ),
+            analyst_vendors=tuple(v for v in _ANALYST_VENDORS if v in body_lower),
+            banned_phrases=tuple(p for p in _BANNED_PHRASES if p.lower() in body_lower),
+            hedging_phrases=tuple(
+                p for p in _HEDGING_PHRASES if p.lower() in body_lower
+            ),
+            american_spellings=tuple(w for w in _AMERICAN_SPELLINGS if w in body_lower),
+            exclamations=body.count("!"),
+            heading_offsets=tuple(m.start() for m in _HEADING.finditer(body)),
+            prose_list_items=len(_LIST_ITEM.findall(_REFERENCES_TAIL.sub("", body))),
+            word_count=len(body.split()),
+            mentions_references="## references" in body_lower,
+            banned_closing=banned_closing,
+            has_embedded_image=bool(_EMBEDDED_IMAGE.search(body)),
+            refers_to_chart=any(ref in body_lower for ref in _CHART_REFERENCES),
+        )
 
     # --- Helpers ---
 
@@ -238,69 +357,48 @@ class ArticleEvaluator:
 
     # --- Dimension 1: Opening Quality ---
 
-    def _score_opening(self, body: str) -> int:
-        first_para = body.split("\n\n", maxsplit=1)[0] if body else ""
-        first_sentence = first_para.split(".")[0] if first_para else ""
-
-        # Check for banned openings
-        for pattern in _BANNED_OPENINGS:
-            if re.search(pattern, first_para, re.IGNORECASE):
-                return 2
+    @staticmethod
+    def _score_opening(features: ArticleFeatures) -> int:
+        if features.banned_opening:
+            return 2
 
-        # Check for data in first sentence and first paragraph
-        data_in_sentence = re.findall(
-            r"\d+%|\$[\d,.]+|\d+\.?\d*\s*(billion|million|thousand)",
-            first_sentence,
-            re.IGNORECASE,
-        )
-        data_in_para = re.findall(
-            r"\d+%|\$[\d,.]+|\d+\.?\d*\s*(billion|million|thousand)",
-            first_para,
-            re.IGNORECASE,
-        )
-        if len(data_in_sentence) >= 2:
+        # Data in first sentence and first paragraph
+        if features.opening_data_in_sentence >= 2:
             return 10
-        if len(data_in_para) >= 2:
+        if features.opening_data_in_paragraph >= 2:
             return 9  # Data-rich opening paragraph
-        if len(data_in_sentence) >= 1:
+        if features.opening_data_in_sentence >= 1:
             return 8
 
         # Has some hook but no data
-        if len(first_sentence.split()) > 5:
+        if features.first_sentence_words > 5:
             return 6
 
         return 4
 
-    def _detail_opening(self, body: str) -> str:
-        first_para = body.split("\n\n", maxsplit=1)[0] if body else ""
-        for pattern in _BANNED_OPENINGS:
-            if re.search(pattern, first_para, re.IGNORECASE):
-                return f"Banned opening detected: '{pattern}'"
-        data_tokens = re.findall(r"\d+%|\$[\d,.]+|\d+", first_para[:200])
-        return f"Opening has {len(data_tokens)} data tokens"
+    @staticmethod
+    def _detail_opening(features: ArticleFeatures) -> str:
+        if features.banned_opening:
+            return f"Banned opening detected: '{features.banned_opening}'"
+        return f"Opening has {features.opening_data_tokens} data tokens"
 
     # --- Dimension 2: Evidence Sourcing ---
 
-    def _score_evidence(self, body: str) -> int:
+    @staticmethod
+    def _score_evidence(features: ArticleFeatures) -> int:
         score = 10
 
-        # Check for placeholders
-        placeholders = len(re.findall(r"\[NEEDS SOURCE\]|\[UNVERIFIED\]", body))
-        if placeholders > 0:
-            score -= placeholders * 3
+        # Placeholders
+        score -= features.placeholders * 3
 
-        # Check for vague attribution
-        vague_count = sum(
-            1 for phrase in _VAGUE_ATTRIBUTION if phrase.lower() in body.lower()
-        )
-        score -= vague_count * 2
+        # Vague attribution
+        score -= len(features.vague_attributions) * 2
 
-        # Check references section
-        ref_match = re.search(r"## References\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
-        if not ref_match:
+        # References section
+        if not features.has_reference_section:
             score -= 4
         else:
-            ref_count = len(re.findall(r"^\d+\.", ref_match.group(1), re.MULTILINE))
+            ref_count = len(features.references)
             if ref_count >= 5:
                 score += 0  # Already max
             elif ref_count >= 3:
@@ -309,179 +407,119 @@ class ArticleEvaluator:
                 score -= 3
 
         # Source freshness: penalise articles with no recent (2025-2026) citations
-        fresh_hits = sum(1 for year in _FRESH_YEARS if year in body)
+        fresh_hits = len(features.fresh_years)
         if fresh_hits == 0:
             score -= 3  # No recent sources at all
         elif fresh_hits == 1:
             score -= 1  # Only one recent year mentioned
 
         # Analyst over-reliance: penalise if more than 1 analyst vendor cited
-        analyst_hits = sum(1 for vendor in _ANALYST_VENDORS if vendor in body.lower())
+        analyst_hits = len(features.analyst_vendors)
         if analyst_hits > 1:
             score -= min(analyst_hits - 1, 3)  # -1 per extra vendor, max -3
 
         return max(1, min(10, score))
 
-    def _detail_evidence(self, body: str) -> str:
-        placeholders = len(re.findall(r"\[NEEDS SOURCE\]|\[UNVERIFIED\]", body))
-        ref_match = re.search(r"## References\s*\n(.*?)(?=\n##|\Z)", body, re.DOTALL)
-        ref_count = (
-            len(re.findall(r"^\d+\.", ref_match.group(1), re.MULTILINE))
-            if ref_match
-            else 0
-        )
-        fresh_hits = sum(1 for year in _FRESH_YEARS if year in body)
-        analyst_hits = sum(1 for vendor in _ANALYST_VENDORS if vendor in body.lower())
-        freshness_note = f"fresh citations ({'/'.join(sorted(_FRESH_YEARS, reverse=True))}): {fresh_hits}"
-        analyst_note = f"analyst vendors cited: {analyst_hits}"
+    @staticmethod
+    def _detail_evidence(features: ArticleFeatures) -> str:
+        freshness_note = f"fresh citations ({'/'.join(sorted(_FRESH_YEARS, reverse=True))}): {len(features.fresh_years)}"
+        analyst_note = f"analyst vendors cited: {len(features.analyst_vendors)}"
         return (
-            f"{ref_count} references cited, {placeholders} placeholders; "
+            f"{len(features.references)} references cited, "
+            f"{features.placeholders} placeholders; "
             f"{freshness_note}; {analyst_note}"
         )
 
     # --- Dimension 3: Voice Consistency ---
 
-    def _score_voice(self, body: str) -> int:
+    @staticmethod
+    def _score_voice(features: ArticleFeatures) -> int:
         score = 10
-        body_lower = body.lower()
-
-        # Check banned phrases
-        banned_count = sum(1 for p in _BANNED_PHRASES if p.lower() in body_lower)
-        score -= banned_count * 2
-
-        # Check hedging phrases (1 point each — undermine authoritative voice)
-        hedging_count = sum(1 for p in _HEDGING_PHRASES if p.lower() in body_lower)
-        score -= hedging_count
-
-        # Check American spellings
-        american_count = sum(1 for w in _AMERICAN_SPELLINGS if w in body_lower)
-        score -= american_count
-
-        # Check exclamation points
-        exclamation_count = body.count("!")
-        if exclamation_count > 0:
-            score -= min(exclamation_count, 3)
-
+        score -= len(features.banned_phrases) * 2
+        # Hedging: 1 point each — undermines the authoritative voice
+        score -= len(features.hedging_phrases)
+        score -= len(features.american_spellings)
+        score -= min(features.exclamations, 3)
         return max(1, min(10, score))
 
-    def _detail_voice(self, body: str) -> str:
-        body_lower = body.lower()
-        banned = [p for p in _BANNED_PHRASES if p.lower() in body_lower]
-        hedging = [p for p in _HEDGING_PHRASES if p.lower() in body_lower]
-        american = [w for w in _AMERICAN_SPELLINGS if w in body_lower]
+    @staticmethod
+    def _detail_voice(features: ArticleFeatures) -> str:
         parts = []
-        if banned:
-            parts.append(f"banned: {banned}")
-        if hedging:
-            parts.append(f"hedging: {hedging}")
-        if american:
-            parts.append(f"American spellings: {american}")
+        if features.banned_phrases:
+            parts.append(f"banned: {list(features.banned_phrases)}")
+        if features.hedging_phrases:
+            parts.append(f"hedging: {list(features.hedging_phrases)}")
+        if features.american_spellings:
+            parts.append(f"American spellings: {list(features.american_spellings)}")
         return ", ".join(parts) if parts else "Clean voice"
 
     # --- Dimension 4: Structure ---
 
-    def _score_structure(
-        self,
-        article: str,
-        frontmatter: dict[str, Any],
-        body: str,
-    ) -> int:
+    @staticmethod
+    def _score_structure(features: ArticleFeatures) -> int:
         score = 10
 
-        # Check frontmatter fields
-        missing = [f for f in _REQUIRED_FRONTMATTER if f not in frontmatter]
-        score -= len(missing)
+        score -= len(features.missing_frontmatter)
 
-        # Check headings — too few or too many both indicate poor structure
-        headings = re.findall(r"^#{2,3}\s", body, re.MULTILINE)
-        if len(headings) < 2 or len(headings) > 5:
+        # Headings — too few or too many both indicate poor structure
+        if features.headings < 2 or features.headings > 5:
             score -= 2
 
-        # Check for list formatting in prose (outside References section)
-        prose_only = re.sub(
-            r"## References.*",
-            "",
-            body,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-        list_items = re.findall(r"^[-*]\s|^\d+\.\s", prose_only, re.MULTILINE)
-        if len(list_items) > 2:
+        # List formatting in prose (outside References section)
+        if features.prose_list_items > 2:
             score -= 2
 
-        # Check word count (600 minimum per economist-writing skill)
-        word_count = len(body.split())
-        if word_count < 600:
+        # Word count (600 minimum per economist-writing skill)
+        if features.word_count < 600:
             score -= 3
-        elif word_count > 1500:
+        elif features.word_count > 1500:
             score -= 1
 
-        # Check references
-        if "## references" not in body.lower():
+        if not features.mentions_references:
             score -= 2
 
-        # Check for banned closings
-        last_500 = body[-500:] if len(body) > 500 else body
-        for closing in _BANNED_CLOSINGS:
-            if closing.lower() in last_500.lower():
-                score -= 1
-                break
+        if features.banned_closing:
+            score -= 1
 
         return max(1, min(10, score))
 
-    def _detail_structure(self, frontmatter: dict[str, Any], body: str) -> str:
-        headings = len(re.findall(r"^#{2,3}\s", body, re.MULTILINE))
-        words = len(body.split())
-        missing = [f for f in _REQUIRED_FRONTMATTER if f not in frontmatter]
-        has_refs = "## references" in body.lower()
-        prose_only = re.sub(
-            r"## References.*",
-            "",
-            body,
-            flags=re.DOTALL | re.IGNORECASE,
+    @staticmethod
+    def _detail_structure(features: ArticleFeatures) -> str:
+        parts = [f"{features.headings} headings", f"{features.word_count} words"]
+        if features.prose_list_items > 0:
+            parts.append(f"{features.prose_list_items} list items in prose")
+        if features.missing_frontmatter:
+            parts.append(f"missing: {list(features.missing_frontmatter)}")
+        parts.append(
+            "references: yes" if features.mentions_references else "references: no"
         )
-        list_count = len(re.findall(r"^[-*]\s|^\d+\.\s", prose_only, re.MULTILINE))
-        parts = [f"{headings} headings", f"{words} words"]
-        if list_count > 0:
-            parts.append(f"{list_count} list items in prose")
-        if missing:
-            parts.append(f"missing: {missing}")
-        parts.append("references: yes" if has_refs else "references: no")
         return ", ".join(parts)
 
     # --- Dimension 5: Visual Engagement ---
 
-    def _score_visual(self, frontmatter: dict[str, Any], body: str) -> int:
+    @staticmethod
+    def _score_visual(features: ArticleFeatures) -> int:
         score = 5  # Base score (not every article needs a chart)
 
-        # Image field present
-        if frontmatter.get("image"):
+        if features.has_image:
             score += 3
 
         # Chart/image embedded in body (bonus, not required)
-        if re.search(r"!\[.*?\]\(.*?\)", body):
+        if features.has_embedded_image:
             score += 1
 
         # Chart referenced naturally
-        chart_refs = [
-            "as the chart",
-            "chart shows",
-            "chart illustrates",
-            "figure shows",
-        ]
-        if any(ref in body.lower() for ref in chart_refs):
+        if features.refers_to_chart:
             score += 1
 
         # Good visual breaks (heading every ~300 words)
-        headings = re.findall(r"^#{2,3}\s", body, re.MULTILINE)
-        words = len(body.split())
-        if headings and words > 0:
-            avg_words_between = words / (len(headings) + 1)
+        if features.headings and features.word_count > 0:
+            avg_words_between = features.word_count / (features.headings + 1)
             if avg_words_between <= 350:
                 score += 1
 
         return max(1, min(10, score))
 
-    def _detail_visual(self, frontmatter: dict[str, Any], body: str) -> str:
-        has_image = bool(frontmatter.get("image"))
-        has_chart = bool(re.search(r"!\[.*?\]\(.*?\)", body))
-        return f"image: {'yes' if has_image else 'no'}, chart embedded: {'yes' if has_chart else 'no'}"
+    @staticmethod
+    def _detail_visual(features: ArticleFeatures) -> str:
+        return f"image: {'yes' if features.has_image else 'no'}, chart embedded: {'yes' if features.has_embedded_image else 'no'}"
@@ -17,6 +17,7 @@ import contextlib
 import logging
 import re
 import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -133,37 +134,11 @@ class ArxivSearcher:
         logger.info(f"Searching arXiv for: '{query}' (last {self.days_back} days)")
 
         try:
-            # Build search query with date filter
-            search_query = self._build_search_query(query, categories)
-
-            # Execute arXiv search
-            client = arxiv.Client()
-            search = arxiv.Search(
-                query=search_query,
-                max_results=self.max_results * 2,  # Get extra for filtering
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-            )
-
-            # Fetch with retry/backoff so a single 429 or transient connection
-            # error doesn't zero out the provider. A clean empty result is not
-            # an error and is not retried.
-            results = self._fetch_results(client, search)
-
-            papers = []
-            for result in results:
-                # Filter by date
-                if result.published.replace(tzinfo=None) < self.cutoff_date:
-                    continue
-
-                # Convert to our format
-                paper = self._format_paper_result(result, query)
-                papers.append(paper)
-
-                # Stop when we have enough recent papers
-                if len(papers) >= self.max_results:
+            client, search = self._prepare_search(query, categories)
+            papers: list[dict[str, Any]] = []
+            for result in self._stream_results(client, search):
+                if not self._collect(result, query, papers):
                     break
-
             logger.info(f"Found {len(papers)} recent papers")
             return papers
 
@@ -171,42 +146,97 @@ class ArxivSearcher:
             logger.error(f"arXiv search failed: {e}")
             raise ArxivSearchError(f"Search failed: {e}") from e
 
-    def _fetch_results(
+    def _prepare_search(
+        self,
+        query: str,
+        categories: list[str] | None,
+    ) -> tuple[arxiv.Client, arxiv.Search]:
+        """Build the client and search for one query.
+
+        The date cutoff is part of the query, so arXiv only returns recent
+        papers, and pages are sized to ``max_results``: one small page usually
+        answers the search, where the client default pulled 100 entries to keep
+        a handful. ``max_results * 2`` stays as the ceiling on what may be read.
+        """
+        client = arxiv.Client(page_size=max(1, min(self.max_results, 100)))
+        search = arxiv.Search(
+            query=self._build_search_query(query, categories),
+            max_results=self.max_results * 2,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending,
+        )
+        return client, search
+
+    def _collect(
+        self,
+        result: arxiv.Result,
+        query: str,
+        papers: list[dict[str, Any]],
+    ) -> bool:
+        """Add ``result`` to ``papers``; return False once reading can stop.
+
+        Results arrive newest-first, so the first paper older than the cutoff
+        means every later one is older too. The client-side check stays as a
+        backstop for the query-side filter.
+        """
+        if result.published.replace(tzinfo=None) < self.cutoff_date:
+            return False
+        papers.append(self._format_paper_result(result, query))
+        return len(papers) < self.max_results
+
+    @staticmethod
+    def _open_stream(
+        client: arxiv.Client,
+        search: arxiv.Search,
+        offset: int,
+    ) -> Iterator[arxiv.Result]:
+        """Open the result stream, resuming after ``offset`` results on a retry."""
+        if offset:
+            return iter(client.results(search, offset=offset))
+        return iter(client.results(search))
+
+    def _stream_results(
         self,
         client: arxiv.Client,
         search: arxiv.Search,
-    ) -> list[arxiv.Result]:
-        """Materialise arXiv search results with retry + exponential backoff.
+    ) -> Iterator[arxiv.Result]:
+        """Yield arXiv results lazily, with retry + exponential backoff.
 
-        Retries only on transient failures — HTTP 429 (rate limit), arXiv's
-        ``UnexpectedEmptyPageError``, and connection-level errors. A clean,
-        successfully-fetched (possibly empty) result list is returned without
-        retrying. After ``_MAX_ATTEMPTS`` the last error is re-raised for the
-        caller to convert into an ``ArxivSearchError``.
+        Pages are fetched only as the caller reads, so a caller that stops early
+        never pulls the next page. A transient failure mid-stream resumes from
+        the last result yielded rather than starting over. A clean,
+        successfully-fetched (possibly empty) stream is not retried.
         """
-        last_exc: Exception | None = None
+        consumed = 0
         for attempt in range(1, _MAX_ATTEMPTS + 1):
             try:
-                # Materialise the generator here so transient page-fetch
-                # errors surface inside the retry loop, not downstream.
-                return list(client.results(search))
+                for result in self._open_stream(client, search, consumed):
+                    consumed += 1
+                    yield result
+                return
             except Exception as exc:  # noqa: BLE001 - classified below
-                if not _is_retryable(exc) or attempt == _MAX_ATTEMPTS:
-                    raise
-                last_exc = exc
-                delay = _BASE_DELAY * (2 ** (attempt - 1))
-                logger.warning(
-                    "arXiv transient error (%s); retry %d/%d after %.1fs",
-                    exc,
-                    attempt + 1,
-                    _MAX_ATTEMPTS,
-                    delay,
-                )
-                time.sleep(delay)
-        # Unreachable: loop either returns or raises. Guard for type-checkers.
-        if last_exc is not None:  # pragma: no cover
-            raise last_exc
-        return []  # pragma: no cover
+                time.sleep(self._retry_delay(exc, attempt))
+
+    @staticmethod
+    def _retry_delay(exc: Exception, attempt: int) -> float:
+        """Return the backoff before the next attempt, or re-raise ``exc``.
+
+        Retries only on transient failures — HTTP 429 (rate limit), arXiv's
+        ``UnexpectedEmptyPageError``, and connection-level errors. After
+        ``_MAX_ATTEMPTS`` the error is re-raised for the caller to convert into
+        an ``ArxivSearchError``.
+        """
+        if not _is_retryable(exc) or attempt == _MAX_ATTEMPTS:
+            raise exc
+        delay = _BASE_DELAY * (2 ** (attempt - 1))
+        logger.warning(
+            "arXiv transient error (%s); retry %d/%d after %.1fs",
+            exc,
+            attempt + 1,
+            _MAX_ATTEMPTS,
+            delay,
+        )
+        return delay
 
     def extract_business_insights(self, papers: list[dict[str, Any]]) -> dict[str, Any]:
         """Extract business-relevant insights from arXiv papers.
@@ -289,16 +319,23 @@ class ArxivSearcher:
         query: str,
         categories: list[str] | None = None,
     ) -> str:
-        """Build optimized arXiv search query."""
+        """Build optimized arXiv search query, date-bounded to the cutoff."""
         # Clean and optimize search terms
         terms = self._optimize_search_terms(query)
 
+        # Push the recency window to arXiv instead of discarding old papers
+        # after they have been downloaded.
+        window = (
+            f"submittedDate:[{self.cutoff_date.strftime('%Y%m%d%H%M')} "
+            f"TO {datetime.now().strftime('%Y%m%d%H%M')}]"
+        )
+
         # Add category filters if specified
         if categories:
             category_filter = " OR ".join(f"cat:{cat}" for cat in categories)
-            return f"({terms}) AND ({category_filter})"
+            return f"({terms}) AND ({category_filter}) AND {window}"
 
-        return terms
+        return f"({terms}) AND {window}"
 
     def _optimize_search_terms(self, query: str) -> str:
         """Optimize search terms for better arXiv results."""
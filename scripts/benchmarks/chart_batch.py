@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark ``chart_renderer.render_charts`` against one-at-a-time renders.
+
+Renders ``--count`` distinct specs three ways and reports the wall time of
+each: ``render_chart`` in a loop, a cold ``render_charts`` batch (process
+pool), and the same batch again, when every PNG is already current.
+
+Usage:
+    python scripts/benchmarks/chart_batch.py [--count 24] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.agent_sdk.chart_renderer import render_chart, render_charts  # noqa: E402
+
+
+def synthetic_spec(index: int) -> dict:
+    """A deterministic spec with the shape Stage 3 produces."""
+    return {
+        "title": f"Chart number {index}",
+        "subtitle": "Share of respondents, %",
+        "data": [
+            {"metric": f"Category {i}", "value": (index * 7 + i * 13) % 90 + 5}
+            for i in range(6)
+        ],
+        "source": "Synthetic benchmark data",
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the wall time of each rendering strategy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=24, help="Charts to render")
+    parser.add_argument("--workers", type=int, default=None, help="Pool size")
+    args = parser.parse_args(argv)
+
+    specs = [synthetic_spec(i) for i in range(args.count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        for i, spec in enumerate(specs):
+            render_chart(spec, Path(tmp) / "loop" / f"{i}.png")
+        loop = time.perf_counter() - start
+
+        jobs = [
+            (spec, Path(tmp) / "batch" / f"{i}.png") for i, spec in enumerate(specs)
+        ]
+        start = time.perf_counter()
+        render_charts(jobs, max_workers=args.workers)
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = render_charts(jobs, max_workers=args.workers)
+        warm = time.perf_counter() - start
+
+    cached = sum(r.status == "cached" for r in results)
+    print(f"{'Strategy':<22} {'Total s':>8} {'ms/chart':>9}")
+    for label, seconds in (
+        ("render_chart loop", loop),
+        ("render_charts cold", cold),
+        ("render_charts cached", warm),
+    ):
+        print(f"{label:<22} {seconds:>8.2f} {seconds / args.count * 1000:>9.1f}")
+    print(f"Cache hits on the second batch: {cached}/{args.count}")
+
+
+if __name__ == "__main__":
+    main()
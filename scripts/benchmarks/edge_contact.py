@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark ``hero_svg.report_edge_contact`` across render sizes.
+
+Synthesises a hero-like raster (cream canvas, full-bleed floor band, a shape
+clipped by the top edge, anti-aliasing jitter) at 720p, 1080p, 1440p and 4K,
+and reports the median wall time per call.
+
+Usage:
+    python scripts/benchmarks/edge_contact.py [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.agent_sdk.hero_svg import report_edge_contact  # noqa: E402
+
+SIZES = {
+    "720p": (1280, 720),
+    "1080p": (1920, 1080),
+    "1440p": (2560, 1440),
+    "4K": (3840, 2160),
+}
+
+
+def synthetic_hero(width: int, height: int, seed: int = 0) -> Image.Image:
+    """A deterministic hero-like render of the given size."""
+    rng = np.random.default_rng(seed)
+    canvas = np.empty((height, width, 3), dtype=np.int16)
+    canvas[:] = (243, 239, 228)
+    canvas[int(height * 0.85) :, :] = (11, 43, 70)  # full-bleed floor
+    canvas[: height // 4, width // 3 : width // 2] = (227, 18, 11)  # clipped card
+    jitter = rng.integers(-8, 9, canvas.shape) * (rng.random(canvas.shape) < 0.05)
+    return Image.fromarray(np.clip(canvas + jitter, 0, 255).astype(np.uint8))
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print a timing table for each render size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per size")
+    args = parser.parse_args(argv)
+
+    print(f"{'Size':<7} {'Pixels':>10} {'Median ms':>10} {'MPix/s':>8}  Findings")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, (width, height) in SIZES.items():
+            path = Path(tmp) / f"{label}.png"
+            synthetic_hero(width, height).save(path)
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                findings = report_edge_contact(path)
+                timings.append(time.perf_counter() - start)
+            median = statistics.median(timings)
+            pixels = width * height
+            print(
+                f"{label:<7} {pixels:>10,} {median * 1000:>10.1f} "
+                f"{pixels / median / 1e6:>8.1f}  {len(findings)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
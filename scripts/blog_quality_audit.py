@@ -5,6 +5,13 @@ Fetches all _posts/ markdown files from oviney/blog via the GitHub API,
 evaluates each with ArticleEvaluator, and creates a GitHub issue in
 oviney/blog for any post scoring below 90%.
 
+The audit is incremental. One git-trees call lists every post with its blob
+SHA. That call is conditional on the last audit's ETag, and a 304 does not
+count against the rate limit. Only posts whose SHA differs from the previous
+logs/blog_audit.json are downloaded, concurrently over one pooled session, and
+re-evaluated in a process pool. Unchanged posts keep their previous scores.
+Setting BLOG_CLONE reads a local checkout instead of the API.
+
 Outputs a dashboard summary to logs/blog_audit.json.
 
 Usage:
@@ -14,21 +21,29 @@ Environment variables:
     GH_TOKEN        GitHub token with access to oviney/blog (BLOG_REPO_TOKEN)
     OPENAI_API_KEY  OpenAI key (passed through to ArticleEvaluator if needed)
     DRY_RUN         Set to 'true' to score posts without creating issues
+    BLOG_CLONE      Path to a local oviney/blog checkout to audit instead
 """
 
 import base64
+import hashlib
 import logging
+import multiprocessing
 import os
 import sys
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 # Allow running from repo root
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from scripts.article_evaluator import ArticleEvaluator
+from scripts.article_evaluator import ArticleEvaluator, EvalResult
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,7 +56,10 @@ logger = logging.getLogger(__name__)
 BLOG_REPO = "oviney/blog"
 QUALITY_THRESHOLD = 90  # percent
 AUDIT_LOG = Path("logs/blog_audit.json")
+ETAG_CACHE = Path("logs/blog_audit_etags.json")
 QUALITY_LABEL = "quality-audit"
+POSTS_DIR = "_posts"
+FETCH_WORKERS = 8  # concurrent blob downloads, and the size of the HTTP pool
 
 # ── GitHub helpers ───────────────────────────────────────────────────────────
 
@@ -63,18 +81,154 @@ def _gh_get(url: str) -> dict | list:
     return resp.json()
 
 
-def fetch_posts() -> list[dict]:
-    """Return list of {filename, path, content} dicts for all _posts/ files."""
-    url = f"https://api.github.com/repos/{BLOG_REPO}/contents/_posts"
-    items = _gh_get(url)
+class GitHubClient:
+    """Pooled, conditional GETs against the GitHub API.
+
+    One ``requests.Session`` is shared by the fetch threads, with its
+    connection pool sized to match them. Cacheable responses are remembered
+    by ETag. Asking again sends ``If-None-Match``, and a ``304`` returns the
+    remembered body. With a ``cache_path`` the cache is loaded from and saved
+    to that file, so it carries over between audits.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = FETCH_WORKERS,
+        cache_path: Path | None = None,
+    ) -> None:
+        self._session = requests.Session()
+        self._session.headers.update(_gh_headers())
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        )
+        self._cache_path = cache_path
+        self._cache: dict[str, dict[str, Any]] = {}
+        if cache_path is not None and cache_path.exists():
+            try:
+                self._cache = orjson.loads(cache_path.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.warning("Ignoring unreadable ETag cache %s", cache_path)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.not_modified = 0
+
+    def get(self, url: str, cacheable: bool = True) -> Any:
+        """GET ``url`` as JSON, revalidating a cached copy when there is one."""
+        with self._lock:
+            cached = self._cache.get(url) if cacheable else None
+            self.calls += 1
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        resp = self._session.get(url, headers=headers, timeout=30)
+        if resp.status_code == 304 and cached:
+            with self._lock:
+                self.not_modified += 1
+            return cached["body"]
+        resp.raise_for_status()
+        body = resp.json()
+        etag = resp.headers.get("ETag")
+        if cacheable and etag:
+            with self._lock:
+                self._cache[url] = {"etag": etag, "body": body}
+        return body
+
+    def save(self) -> None:
+        """Persist the ETag cache for the next audit."""
+        if self._cache_path is None:
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._cache_path.write_bytes(orjson.dumps(self._cache))
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def git_blob_sha(content: bytes) -> str:
+    """The SHA git (and the trees API) gives a file with this content."""
+    return hashlib.sha1(  # noqa: S324 — git's object id, not a security hash
+        b"blob %d\0" % len(content) + content
+    ).hexdigest()
+
+
+def _list_local_posts(clone: Path, known_shas: Mapping[str, str]) -> list[dict]:
     posts = []
-    for item in items:
-        if not item["name"].endswith(".md"):
-            continue
-        logger.info("Fetching %s …", item["name"])
-        file_data = _gh_get(item["url"])
-        raw = base64.b64decode(file_data["content"]).decode("utf-8")
-        posts.append({"filename": item["name"], "path": item["path"], "content": raw})
+    for path in sorted((clone / POSTS_DIR).glob("*.md")):
+        raw = path.read_bytes()
+        post_path = f"{POSTS_DIR}/{path.name}"
+        sha = git_blob_sha(raw)
+        posts.append(
+            {
+                "filename": path.name,
+                "path": post_path,
+                "sha": sha,
+                "content": None
+                if known_shas.get(post_path) == sha
+                else raw.decode("utf-8"),
+            }
+        )
+    return posts
+
+
+def fetch_posts(
+    known_shas: Mapping[str, str] | None = None,
+    client: GitHubClient | None = None,
+) -> list[dict]:
+    """Return {filename, path, sha, content} dicts for all _posts/ files.
+
+    One trees call lists the posts; their blobs are then downloaded
+    concurrently. A post whose SHA matches ``known_shas`` (path → SHA from the
+    last audit) is not downloaded and comes back with ``content`` None; the
+    same holds for a local ``BLOG_CLONE``, whose files are hashed instead.
+    """
+    known_shas = known_shas or {}
+    clone = os.environ.get("BLOG_CLONE")
+    if clone:
+        return _list_local_posts(Path(clone), known_shas)
+
+    own_client = client is None
+    client = client or GitHubClient(cache_path=ETAG_CACHE)
+    try:
+        tree = client.get(
+            f"https://api.github.com/repos/{BLOG_REPO}/git/trees/HEAD?recursive=1"
+        )
+        if tree.get("truncated"):
+            logger.warning("Tree listing for %s was truncated", BLOG_REPO)
+        posts = [
+            {
+                "filename": item["path"].rsplit("/", 1)[-1],
+                "path": item["path"],
+                "sha": item["sha"],
+                "content": None,
+                "url": item["url"],
+            }
+            for item in tree["tree"]
+            if item["type"] == "blob"
+            and item["path"].startswith(f"{POSTS_DIR}/")
+            and item["path"].count("/") == 1
+            and item["path"].endswith(".md")
+        ]
+        changed = [p for p in posts if known_shas.get(p["path"]) != p["sha"]]
+        logger.info(
+            "Fetching %d of %d posts (the rest are unchanged) …",
+            len(changed),
+            len(posts),
+        )
+
+        def download(post: dict) -> None:
+            blob = client.get(post["url"], cacheable=False)
+            post["content"] = base64.b64decode(blob["content"]).decode("utf-8")
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+            list(pool.map(download, changed))
+        client.save()
+        logger.info(
+            "%d GitHub API calls (%d not modified).", client.calls, client.not_modified
+        )
+    finally:
+        if own_client:
+            client.close()
+    for post in posts:
+        del post["url"]
     return posts
 
 
@@ -182,10 +336,49 @@ def _recommendations(result) -> str:
 # ── Audit logic ───────────────────────────────────────────────────────────────
 
 
-def run_audit(dry_run: bool = False) -> None:
-    evaluator = ArticleEvaluator()
-    posts = fetch_posts()
-    logger.info("Fetched %d posts from %s.", len(posts), BLOG_REPO)
+def _evaluate_post(post: dict) -> EvalResult:
+    return ArticleEvaluator().evaluate(post["content"], filename=post["filename"])
+
+
+def evaluate_posts(
+    posts: list[dict], max_workers: int | None = None
+) -> list[EvalResult]:
+    """Evaluate posts in a process pool, in order; in-process for one worker."""
+    workers = min(max_workers or os.cpu_count() or 1, len(posts))
+    if workers <= 1:
+        return [_evaluate_post(post) for post in posts]
+    # spawn, not fork: the fetch threads and their sockets must not be copied.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return list(pool.map(_evaluate_post, posts, chunksize=4))
+
+
+def _previous_results() -> dict[str, dict]:
+    """Last audit's entries by path, for posts whose SHA is recorded."""
+    try:
+        summary = orjson.loads(AUDIT_LOG.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    return {r["path"]: r for r in summary.get("results", []) if r.get("sha")}
+
+
+def run_audit(dry_run: bool = False, max_workers: int | None = None) -> None:
+    previous = _previous_results()
+    posts = fetch_posts({path: r["sha"] for path, r in previous.items()})
+    stale = [post for post in posts if post.get("content") is not None]
+    logger.info(
+        "Listed %d posts from %s; %d new or changed.",
+        len(posts),
+        BLOG_REPO,
+        len(stale),
+    )
+    evaluated = dict(
+        zip(
+            (post["path"] for post in stale),
+            evaluate_posts(stale, max_workers),
+            strict=True,
+        )
+    )
 
     if not dry_run:
         ensure_label()
@@ -194,27 +387,42 @@ def run_audit(dry_run: bool = False) -> None:
     issues_created = 0
 
     for post in posts:
-        eval_result = evaluator.evaluate(post["content"], filename=post["filename"])
-        logger.info(
-            "%s → %d%% (%d/%d)",
-            post["filename"],
-            eval_result.percentage,
-            eval_result.total_score,
-            eval_result.max_score,
-        )
-
-        entry: dict = {
-            "filename": post["filename"],
-            "path": post["path"],
-            **eval_result.to_dict(),
-            "issue_created": False,
-            "issue_url": None,
-        }
-
-        if eval_result.percentage < QUALITY_THRESHOLD:
+        eval_result = evaluated.get(post["path"])
+        if eval_result is None:
+            entry = {
+                **previous[post["path"]],
+                "reused": True,
+                "issue_created": False,
+                "issue_url": None,
+            }
+            post_title = entry["post_title"]
+            eval_result = EvalResult(
+                scores=entry["scores"],
+                details=entry["details"],
+                article_filename=entry["filename"],
+            )
+        else:
+            logger.info(
+                "%s → %d%% (%d/%d)",
+                post["filename"],
+                eval_result.percentage,
+                eval_result.total_score,
+                eval_result.max_score,
+            )
             fm = ArticleEvaluator._parse_frontmatter(post["content"])
             post_title = fm.get("title", post["filename"])
+            entry = {
+                "filename": post["filename"],
+                "path": post["path"],
+                "sha": post.get("sha"),
+                "post_title": post_title,
+                **eval_result.to_dict(),
+                "reused": False,
+                "issue_created": False,
+                "issue_url": None,
+            }
 
+        if eval_result.percentage < QUALITY_THRESHOLD:
             if dry_run:
                 logger.info(
                     "[DRY RUN] Would create issue for '%s' (%d%%)",
@@ -238,6 +446,7 @@ def run_audit(dry_run: bool = False) -> None:
         "threshold_percent": QUALITY_THRESHOLD,
         "dry_run": dry_run,
         "total_posts": len(posts),
+        "posts_evaluated": len(stale),
         "posts_below_threshold": sum(
             1 for r in results if r["percentage"] < QUALITY_THRESHOLD
         ),
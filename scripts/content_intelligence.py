@@ -11,8 +11,10 @@ pipeline learns from what's working.
 
 The SQLite schema has one row per (page_path, page_title, date) from
 the ETL. Callers almost always want aggregates per URL, so every
-query in this module aggregates by page_path using SUM(pageviews)
-and AVG(scores).
+query in this module reads the ``page_rollup`` table, which the
+database keeps up to date on each insert (see performance_rollup.py).
+The ETLs create it; a database they have not touched since is read by
+aggregating the daily rows per query instead.
 
 Example:
     from content_intelligence import get_performance_context
@@ -25,9 +27,20 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.performance_rollup import (  # noqa: E402
+    ROLLUP_SELECT_SQL,
+    rollup_is_current,
+)
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "data" / "performance.db"
@@ -72,8 +85,41 @@ class TrafficSummary:
     avg_composite_score: float
 
 
-def _connect(db_path: Path) -> sqlite3.Connection | None:
-    """Open the performance database, returning None if it does not exist."""
+# One connection per database file, shared by every query helper so that
+# ``get_performance_context`` does not open three in a row. Keyed on the
+# resolved path; the (device, inode) pair detects a file replaced underneath.
+_CONNECTIONS: dict[Path, tuple[tuple[int, int], sqlite3.Connection, str]] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+# Fallback when ``page_rollup`` is missing or not maintained: the same columns,
+# aggregated on the fly as every query did before the rollup existed.
+_ON_THE_FLY_ROLLUP = f"({ROLLUP_SELECT_SQL} GROUP BY page_path)"
+
+
+def _open(db_path: Path) -> tuple[sqlite3.Connection, str]:
+    """Connect read-only and pick the rollup source; return (conn, source).
+
+    Reading never writes: creating and backfilling ``page_rollup`` belongs to
+    the ETLs (``ensure_page_rollup``), not to every query helper's first open.
+    """
+    conn = sqlite3.connect(
+        f"{db_path.as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+    if rollup_is_current(conn):
+        return conn, "page_rollup"
+    logger.info(
+        "page_rollup is not set up in %s; aggregating per query. "
+        "Run scripts/ga4_etl.py to create it.",
+        db_path,
+    )
+    return conn, _ON_THE_FLY_ROLLUP
+
+
+def _query(db_path: Path, sql: str, params: tuple = ()) -> list[tuple] | None:
+    """Run ``sql`` against the page rollup, or return None if there is no db.
+
+    ``sql`` names its source table as ``{rollup}``.
+    """
     if not db_path.exists():
         logger.warning(
             "Performance database not found at %s. "
@@ -81,7 +127,24 @@ def _connect(db_path: Path) -> sqlite3.Connection | None:
             db_path,
         )
         return None
-    return sqlite3.connect(db_path)
+
+    path = db_path.resolve()
+    st = path.stat()
+    identity = (st.st_dev, st.st_ino)
+    with _CONNECTIONS_LOCK:
+        cached = _CONNECTIONS.get(path)
+        if cached is None or cached[0] != identity:
+            if cached is not None:
+                cached[1].close()
+            conn, source = _open(path)
+            _CONNECTIONS[path] = (identity, conn, source)
+        else:
+            _, conn, source = cached
+            if source != "page_rollup" and rollup_is_current(conn):
+                # An ETL has set the rollup up since this connection opened.
+                source = "page_rollup"
+                _CONNECTIONS[path] = (identity, conn, source)
+        return conn.execute(sql.format(rollup=source), params).fetchall()
 
 
 def _is_article(page_path: str) -> bool:
@@ -92,6 +155,44 @@ def _is_article(page_path: str) -> bool:
     return any(ch.isdigit() for ch in page_path)
 
 
+def _ranked(
+    db_path: Path | None,
+    min_pageviews: int,
+    order: str,
+) -> list[ArticlePerformance]:
+    """Articles from the page rollup ordered by composite score."""
+    rows = _query(
+        db_path or DEFAULT_DB_PATH,
+        f"""
+        SELECT
+            page_path,
+            page_title,
+            total_pageviews,
+            sum_engagement_rate / row_count,
+            sum_engagement_time / row_count,
+            sum_scroll_depth / row_count,
+            avg_composite_score
+        FROM {{rollup}}
+        WHERE row_count > 0 AND total_pageviews >= ?
+        ORDER BY avg_composite_score {order}
+        """,
+        (min_pageviews,),
+    )
+    return [
+        ArticlePerformance(
+            page_path=row[0],
+            page_title=row[1] or "",
+            total_pageviews=int(row[2]),
+            avg_engagement_rate=float(row[3]),
+            avg_engagement_time=float(row[4]),
+            avg_scroll_depth=float(row[5]),
+            avg_composite_score=float(row[6]),
+        )
+        for row in rows or []
+        if _is_article(row[0])
+    ]
+
+
 def get_top_performers(
     limit: int = 5,
     min_pageviews: int = 5,
@@ -113,45 +214,7 @@ def get_top_performers(
         Empty list if the database does not exist.
 
     """
-    conn = _connect(db_path or DEFAULT_DB_PATH)
-    if conn is None:
-        return []
-
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                page_path,
-                MAX(page_title) AS page_title,
-                SUM(pageviews) AS total_pageviews,
-                AVG(engagement_rate) AS avg_engagement_rate,
-                AVG(avg_engagement_time) AS avg_engagement_time,
-                AVG(scroll_depth_rate) AS avg_scroll_depth,
-                AVG(composite_score) AS avg_composite_score
-            FROM article_performance
-            GROUP BY page_path
-            HAVING total_pageviews >= ?
-            ORDER BY avg_composite_score DESC
-            """,
-            (min_pageviews,),
-        )
-        rows = [
-            ArticlePerformance(
-                page_path=row[0],
-                page_title=row[1] or "",
-                total_pageviews=int(row[2]),
-                avg_engagement_rate=float(row[3]),
-                avg_engagement_time=float(row[4]),
-                avg_scroll_depth=float(row[5]),
-                avg_composite_score=float(row[6]),
-            )
-            for row in cursor
-            if _is_article(row[0])
-        ]
-    finally:
-        conn.close()
-
-    return rows[:limit]
+    return _ranked(db_path, min_pageviews, "DESC")[:limit]
 
 
 def get_bottom_performers(
@@ -175,45 +238,7 @@ def get_bottom_performers(
         List of ArticlePerformance, sorted ascending by composite score.
 
     """
-    conn = _connect(db_path or DEFAULT_DB_PATH)
-    if conn is None:
-        return []
-
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                page_path,
-                MAX(page_title) AS page_title,
-                SUM(pageviews) AS total_pageviews,
-                AVG(engagement_rate) AS avg_engagement_rate,
-                AVG(avg_engagement_time) AS avg_engagement_time,
-                AVG(scroll_depth_rate) AS avg_scroll_depth,
-                AVG(composite_score) AS avg_composite_score
-            FROM article_performance
-            GROUP BY page_path
-            HAVING total_pageviews >= ?
-            ORDER BY avg_composite_score ASC
-            """,
-            (min_pageviews,),
-        )
-        rows = [
-            ArticlePerformance(
-                page_path=row[0],
-                page_title=row[1] or "",
-                total_pageviews=int(row[2]),
-                avg_engagement_rate=float(row[3]),
-                avg_engagement_time=float(row[4]),
-                avg_scroll_depth=float(row[5]),
-                avg_composite_score=float(row[6]),
-            )
-            for row in cursor
-            if _is_article(row[0])
-        ]
-    finally:
-        conn.close()
-
-    return rows[:limit]
+    return _ranked(db_path, min_pageviews, "ASC")[:limit]
 
 
 def get_traffic_summary(db_path: Path | None = None) -> TrafficSummary | None:
@@ -221,23 +246,20 @@ def get_traffic_summary(db_path: Path | None = None) -> TrafficSummary | None:
 
     Returns None if the database does not exist or has no rows.
     """
-    conn = _connect(db_path or DEFAULT_DB_PATH)
-    if conn is None:
+    rows = _query(
+        db_path or DEFAULT_DB_PATH,
+        """
+        SELECT
+            COUNT(*) AS article_count,
+            SUM(total_pageviews) AS total_pageviews,
+            SUM(sum_composite_score) / SUM(row_count) AS avg_composite_score
+        FROM {rollup}
+        WHERE row_count > 0
+        """,
+    )
+    if not rows:
         return None
-
-    try:
-        cursor = conn.execute(
-            """
-            SELECT
-                COUNT(DISTINCT page_path) AS article_count,
-                SUM(pageviews) AS total_pageviews,
-                AVG(composite_score) AS avg_composite_score
-            FROM article_performance
-            """,
-        )
-        row = cursor.fetchone()
-    finally:
-        conn.close()
+    row = rows[0]
 
     if row is None or row[0] == 0:
         return None
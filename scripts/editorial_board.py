@@ -38,11 +38,13 @@ Voting Process:
 4. Final ranking determined by consensus
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -50,12 +52,14 @@ from pathlib import Path
 # ═══════════════════════════════════════════════════════════════════════════
 from scripts.agent_loader import load_board_members as _load_board_members
 from scripts.content_intelligence import (
+    DEFAULT_DB_PATH,
     ArticlePerformance,
     get_bottom_performers,
+    get_top_performers,
 )
 
 # Import unified LLM client
-from scripts.llm_client import call_llm, create_llm_client
+from scripts.llm_client import acall_llm, call_llm, create_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +70,10 @@ BOARD_MEMBERS = _load_board_members()
 # `get_board_vote` can route around the LLM call.
 PERFORMANCE_ANALYST_ID = "performance_analyst"
 
+# Per-member deadline for the parallel board. A persona that has not answered
+# by then abstains so one slow call cannot hold the whole board.
+BOARD_MEMBER_TIMEOUT_S = 120.0
+
 # Common English/tech stop words filtered out of similarity comparisons.
 # Kept inline (not a dependency) — the list is small and deliberately covers
 # generic tokens that would otherwise create false positives between any two
@@ -189,9 +197,93 @@ def _topic_text(topic: dict) -> str:
     return " ".join(p for p in parts if p)
 
 
+class PerformerTitleIndex:
+    """Inverted index from distinctive title token to the articles carrying it.
+
+    Titles are tokenised once when the index is built, so scoring a board's
+    worth of topics is a handful of dictionary lookups per topic rather than a
+    re-tokenisation of every title for every topic.
+    """
+
+    def __init__(self, articles: list[ArticlePerformance]) -> None:
+        self.articles = list(articles)
+        self.tokens = [frozenset(_tokenise(a.page_title)) for a in self.articles]
+        self.postings: dict[str, list[int]] = defaultdict(list)
+        for i, tokens in enumerate(self.tokens):
+            for token in tokens:
+                self.postings[token].append(i)
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def best_match(
+        self, tokens: set[str]
+    ) -> tuple[ArticlePerformance | None, frozenset[str]]:
+        """Return the article sharing the most tokens, and the shared tokens.
+
+        Ties go to the article listed first, so for bottom performers (sorted
+        ascending by composite score) the weaker article wins.
+        """
+        counts = Counter(i for t in tokens for i in self.postings.get(t, ()))
+        if not counts:
+            return None, frozenset()
+        best = min(counts, key=lambda i: (-counts[i], i))
+        return self.articles[best], self.tokens[best] & tokens
+
+
+@dataclass(frozen=True)
+class PerformerIndexes:
+    """Title indexes over both ends of the performance table."""
+
+    bottom: PerformerTitleIndex
+    top: PerformerTitleIndex
+
+
+# Resolved db path -> (mtime signature, indexes). Rebuilt only when the ETL has
+# written to the database since the indexes were built.
+_PERFORMER_INDEX_CACHE: dict[Path, tuple[tuple[int, ...], PerformerIndexes]] = {}
+
+
+def _db_signature(db_path: Path) -> tuple[int, ...] | None:
+    """mtimes of the database and its WAL, or None when there is no database.
+
+    In WAL mode a commit lands in ``-wal`` and leaves the main file untouched
+    until the next checkpoint, so the WAL's mtime has to count as well.
+    """
+    try:
+        signature = [db_path.stat().st_mtime_ns]
+    except OSError:
+        return None
+    wal = db_path.with_name(db_path.name + "-wal")
+    if wal.exists():
+        signature.append(wal.stat().st_mtime_ns)
+    return tuple(signature)
+
+
+def load_performer_indexes(db_path: Path | None = None) -> PerformerIndexes:
+    """Return title indexes for the top and bottom performers in ``db_path``.
+
+    Built once per ETL refresh: the result is cached against the database's
+    mtime, so board runs between refreshes skip the SQLite aggregation.
+    """
+    path = (db_path or DEFAULT_DB_PATH).resolve()
+    signature = _db_signature(path)
+    cached = _PERFORMER_INDEX_CACHE.get(path)
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+
+    indexes = PerformerIndexes(
+        bottom=PerformerTitleIndex(get_bottom_performers(db_path=path)),
+        top=PerformerTitleIndex(get_top_performers(db_path=path)),
+    )
+    if signature is not None:
+        _PERFORMER_INDEX_CACHE[path] = (signature, indexes)
+    return indexes
+
+
 def _score_topic_against_underperformers(
     topic: dict,
-    underperformers: list[ArticlePerformance],
+    underperformers: list[ArticlePerformance] | PerformerTitleIndex,
 ) -> tuple[int, str]:
     """Return (score, rationale) for one topic vs the bottom-performer set.
 
@@ -201,13 +293,14 @@ def _score_topic_against_underperformers(
 
     Args:
         topic: A topic dict from Topic Scout.
-        underperformers: List of ``ArticlePerformance`` rows from
-            ``content_intelligence.get_bottom_performers``.
+        underperformers: ``ArticlePerformance`` rows from
+            ``content_intelligence.get_bottom_performers``, or a prebuilt
+            ``PerformerTitleIndex`` over them.
 
     Returns:
         Tuple of (score on the 1–10 scale, human-readable rationale).
     """
-    if not underperformers:
+    if not len(underperformers):
         return (
             _PERF_SCORE_NO_DATA,
             "No bottom-performer data available — abstaining with a neutral score.",
@@ -220,16 +313,11 @@ def _score_topic_against_underperformers(
             "Topic has no distinctive tokens to compare against past performance.",
         )
 
-    best_overlap: set[str] = set()
-    worst_title = ""
-    worst_score = 0.0
-    for article in underperformers:
-        ref_tokens = _tokenise(article.page_title)
-        shared = topic_tokens & ref_tokens
-        if len(shared) > len(best_overlap):
-            best_overlap = shared
-            worst_title = article.page_title
-            worst_score = article.avg_composite_score
+    if not isinstance(underperformers, PerformerTitleIndex):
+        underperformers = PerformerTitleIndex(underperformers)
+    worst, best_overlap = underperformers.best_match(topic_tokens)
+    worst_title = worst.page_title if worst else ""
+    worst_score = worst.avg_composite_score if worst else 0.0
 
     overlap_count = len(best_overlap)
     if overlap_count >= 2:
@@ -258,6 +346,21 @@ def _score_topic_against_underperformers(
     )
 
 
+def _top_performer_note(topic: dict, top: PerformerTitleIndex) -> str:
+    """Name the top performer a topic most resembles, if the overlap is strong.
+
+    Informational only: the analyst is a penalty signal, so resemblance to a
+    winner is reported in the rationale but does not raise the score.
+    """
+    article, shared = top.best_match(_tokenise(_topic_text(topic)))
+    if article is None or len(shared) < 2:
+        return ""
+    return (
+        f" Closest top performer: '{article.page_title}' "
+        f"(composite {article.avg_composite_score:.3f})."
+    )
+
+
 def get_performance_analyst_vote(
     member_info: dict,
     topics: list,
@@ -288,21 +391,23 @@ def get_performance_analyst_vote(
         )
 
     try:
-        underperformers = get_bottom_performers(db_path=db_path)
+        indexes = load_performer_indexes(db_path)
     except Exception as exc:  # pragma: no cover - defensive
         logger.warning(
             "Performance Analyst could not load bottom performers: %s. "
             "Falling back to neutral abstain.",
             exc,
         )
-        underperformers = []
+        indexes = PerformerIndexes(PerformerTitleIndex([]), PerformerTitleIndex([]))
 
     votes = []
     for i, topic in enumerate(topics):
         score, rationale = _score_topic_against_underperformers(
             topic,
-            underperformers,
+            indexes.bottom,
         )
+        if score == _PERF_SCORE_NO_MATCH:
+            rationale += _top_performer_note(topic, indexes.top)
         votes.append(
             {
                 "topic_index": i + 1,
@@ -336,9 +441,7 @@ def get_performance_analyst_vote(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def get_board_vote(client, member_id: str, member_info: dict, topics: list) -> dict:
-    """Get a single board member's votes on all topics."""
-    # Input validation
+def _validate_topics(member_id: str, topics: list) -> None:
     if not topics or not isinstance(topics, list):
         raise ValueError(
             f"[EDITORIAL_BOARD:{member_id}] Invalid topics. Expected non-empty list, "
@@ -348,6 +451,13 @@ def get_board_vote(client, member_id: str, member_info: dict, topics: list) -> d
     if len(topics) == 0:
         raise ValueError(f"[EDITORIAL_BOARD:{member_id}] No topics to evaluate")
 
+
+def _board_prompt_prefix(topics: list) -> str:
+    """The part of every vote prompt that does not depend on the persona.
+
+    Built once per board and placed first, so all personas send a byte-identical
+    prefix and the provider's prompt cache serves it after the first request.
+    """
     topics_text = "\n\n".join(
         [
             f"TOPIC {i + 1}: {t['topic']}\n"
@@ -360,9 +470,7 @@ def get_board_vote(client, member_id: str, member_info: dict, topics: list) -> d
         ],
     )
 
-    prompt = f"""{member_info["prompt"]}
-
-Here are the topics to evaluate:
+    return f"""Here are the topics to evaluate:
 
 {topics_text}
 
@@ -387,16 +495,14 @@ Respond in JSON format:
   ],
   "top_pick": 1,
   "top_pick_reason": "Why this is your #1 choice"
-}}"""
+}}
 
-    response_text = call_llm(
-        client,
-        "",  # System prompt embedded in member prompt
-        prompt,
-        max_tokens=1500,
-    )
+Evaluate the topics as this board member:
+
+"""
 
-    # Parse JSON
+
+def _parse_board_vote(response_text: str, member_id: str, member_info: dict) -> dict:
     try:
         start = response_text.find("{")
         end = response_text.rfind("}") + 1
@@ -415,6 +521,99 @@ Respond in JSON format:
         }
 
 
+def get_board_vote(
+    client,
+    member_id: str,
+    member_info: dict,
+    topics: list,
+    prompt_prefix: str | None = None,
+) -> dict:
+    """Get a single board member's votes on all topics."""
+    _validate_topics(member_id, topics)
+    prefix = prompt_prefix or _board_prompt_prefix(topics)
+
+    response_text = call_llm(
+        client,
+        "",  # System prompt embedded in member prompt
+        prefix + member_info["prompt"],
+        max_tokens=1500,
+    )
+    return _parse_board_vote(response_text, member_id, member_info)
+
+
+async def aget_board_vote(
+    client,
+    member_id: str,
+    member_info: dict,
+    topics: list,
+    prompt_prefix: str | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Async ``get_board_vote``; raises ``TimeoutError`` past ``timeout``."""
+    _validate_topics(member_id, topics)
+    prefix = prompt_prefix or _board_prompt_prefix(topics)
+
+    response_text = await acall_llm(
+        client, "", prefix + member_info["prompt"], max_tokens=1500, timeout=timeout
+    )
+    return _parse_board_vote(response_text, member_id, member_info)
+
+
+def _abstention(member_id: str, member_info: dict, reason: str) -> dict:
+    """A vote set with no scores; aggregation skips it like a parse failure."""
+    return {
+        "member_id": member_id,
+        "member_name": member_info["name"],
+        "weight": member_info["weight"],
+        "votes": [],
+        "error": reason,
+        "abstained": True,
+    }
+
+
+async def _arun_board_members(
+    client,
+    members: dict,
+    topics: list,
+    timeout_s: float = BOARD_MEMBER_TIMEOUT_S,
+) -> list[dict]:
+    """Collect every member's vote concurrently on one event loop.
+
+    A member that misses its deadline abstains rather than holding up the
+    board; a member whose call raises is dropped, as in the threaded runner.
+    The deadline is passed down to the request itself: cancelling a wait on a
+    key-based client's worker thread would leave the request running (and
+    spending tokens) while ``asyncio.run`` waits for it at shutdown.
+    """
+    prefix = _board_prompt_prefix(topics) if topics else None
+
+    async def _one(member_id: str, member_info: dict) -> dict | None:
+        try:
+            votes = await aget_board_vote(
+                client, member_id, member_info, topics, prefix, timeout=timeout_s
+            )
+        except TimeoutError:
+            votes = _abstention(
+                member_id, member_info, f"No vote within {timeout_s:.0f}s"
+            )
+            print(f"   ⏱ {member_info['name']} abstained ({votes['error']})")
+            return votes
+        except Exception as e:
+            print(f"   ✗ {member_id} failed: {e}")
+            return None
+        print(f"   ✓ {votes['member_name']} voted")
+        return votes
+
+    all_votes = []
+    for next_vote in asyncio.as_completed(
+        [_one(mid, minfo) for mid, minfo in members.items()]
+    ):
+        votes = await next_vote
+        if votes is not None:
+            all_votes.append(votes)
+    return all_votes
+
+
 def run_editorial_board(
     client,
     topics: list,
@@ -459,26 +658,16 @@ def run_editorial_board(
     }
 
     if parallel:
-        # Run all LLM board members in parallel
-        with ThreadPoolExecutor(max_workers=max(1, len(llm_members))) as executor:
-            futures = {
-                executor.submit(get_board_vote, client, mid, minfo, topics): mid
-                for mid, minfo in llm_members.items()
-            }
-
-            for future in as_completed(futures):
-                member_id = futures[future]
-                try:
-                    votes = future.result()
-                    all_votes.append(votes)
-                    print(f"   ✓ {votes['member_name']} voted")
-                except Exception as e:
-                    print(f"   ✗ {member_id} failed: {e}")
+        # One event loop, all LLM board members in flight at once.
+        all_votes.extend(asyncio.run(_arun_board_members(client, llm_members, topics)))
     else:
         # Run sequentially
+        prompt_prefix = _board_prompt_prefix(topics) if topics else None
         for member_id, member_info in llm_members.items():
             print(f"   Consulting {member_info['name']}...")
-            votes = get_board_vote(client, member_id, member_info, topics)
+            votes = get_board_vote(
+                client, member_id, member_info, topics, prompt_prefix
+            )
             all_votes.append(votes)
             print(f"   ✓ {votes['member_name']} voted")
 
@@ -547,8 +736,10 @@ def run_editorial_board(
     top_pick = rankings[0] if rankings else None
 
     # Check for unanimous top pick
-    top_pick_votes = [v for v in all_votes if v.get("top_pick") == 1]
-    consensus = len(top_pick_votes) == len(all_votes)
+    # Abstentions (members that missed their deadline) do not count either way.
+    voters = [v for v in all_votes if not v.get("abstained")]
+    top_pick_votes = [v for v in voters if v.get("top_pick") == 1]
+    consensus = len(top_pick_votes) == len(voters)
 
     # Find any strong dissent (score < 5 from any member)
     dissenting_views = []
@@ -6,11 +6,18 @@ and validates 6 quality dimensions.  Designed to catch defects that
 escape pre-deployment gates (missing layout, broken images, duplicate
 topics, etc.).
 
+API use is a fixed prefetch rather than one call per check. A single
+recursive git-trees call lists every path with its blob SHA, which answers
+image existence and the post listing. The article and every past post then
+come back from one batched GraphQL blob query. Responses are held for the
+judge's lifetime. With ``--cache-dir`` blobs are also kept on disk by SHA, and
+the tree is revalidated with its ETag, so a re-run downloads only what changed.
+
 Usage:
     python scripts/editorial_judge.py \\
         --blog-owner oviney --blog-repo blog \\
         --article 2026-04-04-article-slug.md \\
-        --create-issue-on-failure
+        --create-issue-on-failure [--cache-dir .cache/editorial-judge]
 """
 
 import argparse
@@ -20,8 +27,11 @@ import logging
 import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from pathlib import Path
 from typing import Any
 
 import yaml
@@ -91,6 +101,17 @@ _BANNED_PHRASES = [
     "only time will tell",
 ]
 
+# Blobs requested per GraphQL query; keeps each query well inside API limits
+_BLOBS_PER_QUERY = 100
+
+_BLOB_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+%s
+  }
+}
+"""
+
 
 class EditorialJudge:
     """Post-deployment quality validator for blog articles."""
@@ -100,35 +121,155 @@ class EditorialJudge:
         blog_owner: str,
         blog_repo: str,
         article_filename: str,
+        cache_dir: Path | None = None,
     ) -> None:
         self.blog_owner = blog_owner
         self.blog_repo = blog_repo
         self.article_filename = article_filename
+        self.cache_dir = cache_dir
         self._article_content: str | None = None
         self._frontmatter: dict[str, Any] | None = None
+        # Request-scoped API cache: each endpoint and blob is fetched once.
+        self._responses: dict[str, Any] = {}
+        self._tree: dict[str, str] | None = None  # path -> blob SHA
+        self._tree_truncated = False
+        self._blobs: dict[str, str] = {}  # blob SHA -> text
+        self._calls_lock = threading.Lock()
+        self.api_calls = 0
 
     # --- GitHub API layer ---
 
-    def _gh_api(self, endpoint: str) -> dict[str, Any]:
-        """Call GitHub REST API via gh CLI."""
-        result = subprocess.run(
-            ["gh", "api", f"repos/{self.blog_owner}/{self.blog_repo}/{endpoint}"],
+    def _run_gh(self, args: list[str]) -> subprocess.CompletedProcess[str]:
+        with self._calls_lock:
+            self.api_calls += 1
+        return subprocess.run(
+            ["gh", "api", *args],
             capture_output=True,
             text=True,
             timeout=30,
         )
+
+    def _gh_api(self, endpoint: str) -> dict[str, Any]:
+        """Call GitHub REST API via gh CLI (once per endpoint per judge)."""
+        if endpoint not in self._responses:
+            result = self._run_gh(
+                [f"repos/{self.blog_owner}/{self.blog_repo}/{endpoint}"]
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"gh api failed: {result.stderr.strip()}")
+            self._responses[endpoint] = json.loads(result.stdout)
+        return self._responses[endpoint]
+
+    def _gh_api_conditional(self, endpoint: str, cache_file: Path) -> Any:
+        """GET ``endpoint`` with ``If-None-Match``; a 304 reuses ``cache_file``."""
+        cached = json.loads(cache_file.read_text()) if cache_file.exists() else None
+        args = ["--include", f"repos/{self.blog_owner}/{self.blog_repo}/{endpoint}"]
+        if cached:
+            args[:0] = ["-H", f"If-None-Match: {cached['etag']}"]
+        result = self._run_gh(args)
+        head, _, body = result.stdout.replace("\r\n", "\n").partition("\n\n")
+        status_line, *header_lines = head.splitlines() or [""]
+        if cached and " 304" in status_line:
+            return cached["body"]
         if result.returncode != 0:
             raise RuntimeError(f"gh api failed: {result.stderr.strip()}")
-        return json.loads(result.stdout)
+        data = json.loads(body)
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "etag":
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps({"etag": value.strip(), "body": data}))
+        return data
+
+    def _get_tree(self) -> dict[str, str]:
+        """Every file in the blog repo mapped to its blob SHA (one call)."""
+        if self._tree is None:
+            endpoint = "git/trees/HEAD?recursive=1"
+            if self.cache_dir is not None:
+                data = self._gh_api_conditional(endpoint, self.cache_dir / "tree.json")
+            else:
+                data = self._gh_api(endpoint)
+            self._tree_truncated = bool(data.get("truncated"))
+            if self._tree_truncated:
+                logger.warning("Tree listing was truncated; some paths are missing")
+            self._tree = {
+                item["path"]: item["sha"]
+                for item in data.get("tree", [])
+                if item["type"] == "blob"
+            }
+        return self._tree
+
+    def _prefetch_blobs(self, paths: list[str]) -> None:
+        """Load the given files' text by blob SHA, in batched GraphQL queries.
+
+        Blobs already held in memory or in ``cache_dir`` are not requested.
+        """
+        tree = self._get_tree()
+        wanted = sorted(
+            {tree[p] for p in paths if p in tree and tree[p] not in self._blobs}
+        )
+        missing = []
+        for sha in wanted:
+            on_disk = self.cache_dir / "blobs" / sha if self.cache_dir else None
+            if on_disk is not None and on_disk.exists():
+                self._blobs[sha] = on_disk.read_text(encoding="utf-8")
+            else:
+                missing.append(sha)
+
+        for start in range(0, len(missing), _BLOBS_PER_QUERY):
+            batch = missing[start : start + _BLOBS_PER_QUERY]
+            fields = "\n".join(
+                f'    b{i}: object(oid: "{sha}") {{ ... on Blob {{ text }} }}'
+                for i, sha in enumerate(batch)
+            )
+            result = self._run_gh(
+                [
+                    "graphql",
+                    "-f",
+                    f"query={_BLOB_QUERY % fields}",
+                    "-f",
+                    f"owner={self.blog_owner}",
+                    "-f",
+                    f"name={self.blog_repo}",
+                ]
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"gh api graphql failed: {result.stderr.strip()}")
+            repository = json.loads(result.stdout)["data"]["repository"]
+            for i, sha in enumerate(batch):
+                text = (repository.get(f"b{i}") or {}).get("text")
+                if text is None:
+                    continue  # binary or missing; read via the contents API
+                self._blobs[sha] = text
+                if self.cache_dir is not None:
+                    on_disk = self.cache_dir / "blobs" / sha
+                    on_disk.parent.mkdir(parents=True, exist_ok=True)
+                    on_disk.write_text(text, encoding="utf-8")
+
+    def prefetch(self) -> None:
+        """Fetch the tree, the article and every past post up front."""
+        posts = [p["path"] for p in self._list_posts()]
+        self._prefetch_blobs([f"_posts/{self.article_filename}", *posts])
 
     def _fetch_file_content(self, path: str) -> str:
         """Fetch and decode a file from the blog repo."""
+        sha = self._tree.get(path) if self._tree is not None else None
+        if sha is not None and sha in self._blobs:
+            return self._blobs[sha]
         data = self._gh_api(f"contents/{path}")
         return base64.b64decode(data["content"]).decode("utf-8")
 
     def _file_exists(self, path: str) -> bool:
-        """Check whether a file exists in the blog repo."""
+        """Check whether a file exists in the blog repo.
+
+        A truncated tree listing proves nothing about a path it leaves out, so
+        such a path is looked up through the contents API instead.
+        """
         try:
+            if path in self._get_tree():
+                return True
+            if not self._tree_truncated:
+                return False
             self._gh_api(f"contents/{path}")
             return True
         except RuntimeError:
@@ -136,10 +277,11 @@ class EditorialJudge:
 
     def _list_posts(self) -> list[dict[str, str]]:
         """List all files in _posts/."""
-        data = self._gh_api("contents/_posts")
-        if isinstance(data, list):
-            return [{"name": f["name"], "path": f["path"]} for f in data]
-        return []
+        return [
+            {"name": path.removeprefix("_posts/"), "path": path}
+            for path in self._get_tree()
+            if path.startswith("_posts/") and path.count("/") == 1
+        ]
 
     def _get_article(self) -> str:
         """Fetch the article under test (cached)."""
@@ -286,7 +428,14 @@ class EditorialJudge:
                 if not past_words:
                     continue
 
-                ratio = SequenceMatcher(None, new_body_words, past_words).ratio()
+                # Cheap upper bounds first: skip posts that cannot beat the best
+                matcher = SequenceMatcher(None, new_body_words, past_words)
+                if (
+                    matcher.real_quick_ratio() <= highest_ratio
+                    or matcher.quick_ratio() <= highest_ratio
+                ):
+                    continue
+                ratio = matcher.ratio()
                 if ratio > highest_ratio:
                     highest_ratio = ratio
                     most_similar = post["name"]
@@ -383,7 +532,15 @@ class EditorialJudge:
     # --- Orchestration ---
 
     def run_all_checks(self) -> JudgeReport:
-        """Run all 6 quality checks and produce a report."""
+        """Run all 6 quality checks and produce a report.
+
+        Everything the checks read is prefetched first (a tree call and one
+        blob query), then the checks run concurrently against that snapshot.
+        """
+        try:
+            self.prefetch()
+        except (RuntimeError, OSError, ValueError, KeyError) as e:
+            logger.warning("Prefetch failed (%s); checks will fetch lazily", e)
         fm = self._get_frontmatter()
         title = fm.get("title", self.article_filename)
         url = f"https://github.com/{self.blog_owner}/{self.blog_repo}/blob/main/_posts/{self.article_filename}"
@@ -403,15 +560,16 @@ class EditorialJudge:
             self.check_structure,
         ]
 
-        for check_fn in checks:
+        def run(check_fn: Any) -> CheckResult:
             try:
-                result = check_fn()
-                report.checks.append(result)
+                return check_fn()
             except Exception as e:
-                report.checks.append(
-                    CheckResult(check_fn.__name__, FAIL, f"Check crashed: {e}"),
-                )
+                return CheckResult(check_fn.__name__, FAIL, f"Check crashed: {e}")
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            report.checks.extend(pool.map(run, checks))
 
+        logger.info("Editorial judge made %d GitHub API calls", self.api_calls)
         return report
 
     @staticmethod
@@ -545,9 +703,16 @@ def main() -> None:
         action="store_true",
         help="Create GitHub issue on economist-agents if checks fail",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Keep blobs (by SHA) and the tree ETag here between runs",
+    )
     args = parser.parse_args()
 
-    judge = EditorialJudge(args.blog_owner, args.blog_repo, args.article)
+    judge = EditorialJudge(
+        args.blog_owner, args.blog_repo, args.article, cache_dir=args.cache_dir
+    )
     report = judge.run_all_checks()
 
     print(EditorialJudge.format_report(report))
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Append-only store for article evaluations (``logs/article_evals.jsonl``).
+
+Set ``ARTICLE_EVALS_PATH`` to keep the store somewhere else.
+
+Each evaluation is one JSON line, written with a single ``O_APPEND`` write so
+concurrent pipeline runs never interleave or lose records, and appending
+costs the same however long the history is.
+
+A side index (``<store>.idx``, SQLite) maps each record's byte offset to its
+``article_filename`` and ``timestamp`` so readers can seek straight to a
+filename or a time range. The JSONL file is the source of truth: the index
+catches up from its last offset whenever it is opened, and is rebuilt if
+the log was replaced, so a crash between the two writes loses nothing.
+
+Usage:
+    from scripts.eval_store import EvalStore
+
+    store = EvalStore()
+    store.append(result.to_dict())
+    for record in store.iter_records(since="2026-04-01"):
+        ...
+
+    # One-off: move a legacy logs/article_evals.json array into the store
+    python scripts/eval_store.py --migrate logs/article_evals.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+EVALS_PATH = Path(os.environ.get("ARTICLE_EVALS_PATH", "logs/article_evals.jsonl"))
+
+_INDEX_SQL = """
+CREATE TABLE IF NOT EXISTS evals (
+    offset           INTEGER PRIMARY KEY,
+    length           INTEGER NOT NULL,
+    article_filename TEXT,
+    timestamp        TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evals_timestamp ON evals (timestamp);
+CREATE INDEX IF NOT EXISTS idx_evals_filename ON evals (article_filename, timestamp);
+"""
+
+
+class EvalStore:
+    """JSONL evaluation log with an offset index by filename and timestamp."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialise the store.
+
+        Args:
+            path: Path to the JSONL log; the index lives beside it. Defaults
+                to :data:`EVALS_PATH`, read when the store is created.
+
+        """
+        self.path = Path(path) if path is not None else EVALS_PATH
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Writes
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def append(self, record: dict[str, Any]) -> None:
+        """Append one evaluation record atomically."""
+        self.extend([record])
+
+    def extend(self, records: Iterable[dict[str, Any]]) -> int:
+        """Append several records in one write.
+
+        Returns:
+            Number of records appended.
+
+        """
+        lines = [orjson.dumps(r) + b"\n" for r in records]
+        if not lines:
+            return 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b"".join(lines))
+        finally:
+            os.close(fd)
+        return len(lines)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Reads
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def iter_records(
+        self,
+        since: str | None = None,
+        until: str | None = None,
+        article_filename: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream records in append order, optionally filtered via the index.
+
+        Args:
+            since: Earliest ``timestamp`` to include (ISO-8601, inclusive).
+            until: Latest ``timestamp`` to include (ISO-8601, exclusive).
+            article_filename: Only records for this article.
+
+        Yields:
+            Evaluation record dicts. Unreadable lines are skipped.
+
+        """
+        if not self.path.exists():
+            return
+        if since is None and until is None and article_filename is None:
+            with self.path.open("rb") as fh:
+                for line in fh:
+                    record = _decode(line)
+                    if record is not None:
+                        yield record
+            return
+
+        clauses: list[str] = []
+        params: list[str] = []
+        for clause, value in (
+            ("timestamp >= ?", since),
+            ("timestamp < ?", until),
+            ("article_filename = ?", article_filename),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        with self._index() as conn:
+            spans = conn.execute(
+                f"SELECT offset, length FROM evals WHERE {' AND '.join(clauses)} "
+                "ORDER BY offset",
+                params,
+            ).fetchall()
+        with self.path.open("rb") as fh:
+            for offset, length in spans:
+                fh.seek(offset)
+                record = _decode(fh.read(length))
+                if record is not None:
+                    yield record
+
+    def __len__(self) -> int:
+        """Number of indexed records."""
+        if not self.path.exists():
+            return 0
+        with self._index() as conn:
+            return conn.execute("SELECT COUNT(*) FROM evals").fetchone()[0]
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Index
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        """Open the index, first indexing any lines appended since last use."""
+        with closing(sqlite3.connect(str(self.index_path))) as conn:
+            self._catch_up(conn)
+            yield conn
+
+    def _catch_up(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(_INDEX_SQL)
+        indexed_end = conn.execute(
+            "SELECT COALESCE(MAX(offset + length), 0) FROM evals"
+        ).fetchone()[0]
+        size = self.path.stat().st_size
+        if size < indexed_end:
+            logger.warning("Eval log %s shrank; rebuilding its index", self.path)
+            conn.execute("DELETE FROM evals")
+            indexed_end = 0
+        if size > indexed_end:
+            with self.path.open("rb") as fh:
+                fh.seek(indexed_end)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO evals VALUES (?, ?, ?, ?)",
+                    _index_rows(fh, indexed_end),
+                )
+            conn.commit()
+
+
+def _decode(line: bytes) -> dict[str, Any] | None:
+    """Parse one JSONL line; None (and a warning) if it is torn or corrupt."""
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        logger.warning("Skipping unreadable eval line: %.80r", line)
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def _index_rows(
+    fh: Any,
+    offset: int,
+) -> Iterator[tuple[int, int, str | None, str | None]]:
+    """Yield index rows for the complete lines from ``offset`` to EOF.
+
+    A final line without a newline is still being written (or was torn by a
+    crash) and is left for the next catch-up.
+    """
+    for line in fh:
+        if not line.endswith(b"\n"):
+            return
+        record = _decode(line) or {}
+        yield (
+            offset,
+            len(line),
+            record.get("article_filename"),
+            record.get("timestamp"),
+        )
+        offset += len(line)
+
+
+def migrate_json_log(
+    json_path: str | Path,
+    store: EvalStore | None = None,
+) -> int:
+    """Move a legacy JSON-array eval log into the JSONL store.
+
+    Records are appended in their original order and the legacy file is
+    renamed to ``<name>.migrated`` so a rerun cannot import it twice.
+
+    Args:
+        json_path: Path to the legacy ``article_evals.json``.
+        store: Destination store (defaults to :data:`EVALS_PATH`).
+
+    Returns:
+        Number of records migrated (0 when there is no legacy file).
+
+    """
+    json_path = Path(json_path)
+    if not json_path.exists():
+        logger.info("No legacy eval log at %s", json_path)
+        return 0
+    if store is None:
+        store = EvalStore()
+    records = orjson.loads(json_path.read_bytes())
+    migrated = store.extend(r for r in records if isinstance(r, dict))
+    json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+    logger.info("Migrated %d evals from %s to %s", migrated, json_path, store.path)
+    return migrated
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point: run the one-off migration."""
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Article evaluation store")
+    parser.add_argument(
+        "--migrate",
+        metavar="JSON",
+        default="logs/article_evals.json",
+        help="Legacy JSON-array log to import (default: logs/article_evals.json)",
+    )
+    parser.add_argument(
+        "--store",
+        default=str(EVALS_PATH),
+        help=f"Destination JSONL store (default: {EVALS_PATH})",
+    )
+    args = parser.parse_args(argv)
+    migrate_json_log(args.migrate, EvalStore(args.store))
+
+
+if __name__ == "__main__":
+    main()
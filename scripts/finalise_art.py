@@ -7,10 +7,15 @@ Run after drawing the hero and (optionally) editing the chart spec::
 
 Three steps, each a no-op when its input is absent:
 
-1. **Render the chart** from ``output/charts/<slug>.spec.json``. A PNG already
-   at ``output/charts/<slug>.png`` **wins and is never overwritten** — that is
-   the fully-manual route, and silently replacing hand-made art with a rendered
-   spec would be exactly the automation this item exists to remove.
+1. **Render the chart** from ``output/charts/<slug>.spec.json``. A hand-made
+   PNG at ``output/charts/<slug>.png`` **wins and is never overwritten** — that
+   is the fully-manual route, and silently replacing hand-made art with a
+   rendered spec would be exactly the automation this item exists to remove.
+   A PNG this script rendered (recorded in ``output/charts/render-manifest.json``
+   with the hash of its spec) is re-rendered only when the spec has changed
+   since. A PNG with no manifest entry, one edited since it was rendered, or
+   one another renderer recorded (the Graphics Agent's LLM-drawn charts) counts
+   as hand-made.
 2. **Embed the chart** in the article, before ``## References``. An embed is a
    claim that a figure exists, so it is written here — after the PNG does —
    rather than by Stage 4, which used to insert it unconditionally.
@@ -30,7 +35,12 @@ import sys
 from pathlib import Path
 
 from src.agent_sdk._shared import _auto_embed_chart
-from src.agent_sdk.chart_renderer import ChartRenderError, render_chart
+from src.agent_sdk.chart_renderer import (
+    ChartResult,
+    load_manifest,
+    render_charts,
+    was_rendered,
+)
 from src.agent_sdk.hero_svg import HERO_IMAGES_DIR
 from src.agent_sdk.pipeline import _link_hero_asset
 
@@ -60,34 +70,98 @@ _UNFRAMED_HINT = (
 )
 
 
+def _load_spec(spec_path: Path) -> dict | None:
+    try:
+        return json.loads(spec_path.read_text())
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"  Chart: spec at {spec_path} is unreadable — {exc}", file=sys.stderr)
+        return None
+
+
 def _render_chart_if_needed(slug: str) -> Path | None:
-    """Render the spec unless a PNG is already there. Returns the PNG, if any."""
+    """Render the spec unless its PNG is hand-made or current. Returns the PNG."""
     png = CHARTS_DIR / f"{slug}.png"
-    if png.is_file():
+    existing = png if png.is_file() else None
+    if existing and not was_rendered(png, load_manifest(CHARTS_DIR)):
         print(f"  Chart: using the existing PNG at {png} (not overwritten)")
         return png
 
     spec_path = CHARTS_DIR / f"{slug}.spec.json"
     if not spec_path.is_file():
-        print("  Chart: none — no spec and no PNG, so the article ships without one")
-        return None
-
-    try:
-        spec = json.loads(spec_path.read_text())
-    except (OSError, json.JSONDecodeError) as exc:
-        print(f"  Chart: spec at {spec_path} is unreadable — {exc}", file=sys.stderr)
-        return None
-
-    try:
-        render_chart(spec, png)
-    except ChartRenderError as exc:
-        print(f"  Chart: spec rejected — {exc}", file=sys.stderr)
+        if existing:
+            print(f"  Chart: using {png} (its spec is gone, so it is kept as is)")
+        else:
+            print(
+                "  Chart: none — no spec and no PNG, so the article ships without one"
+            )
+        return existing
+
+    spec = _load_spec(spec_path)
+    if spec is None:
+        return existing
+
+    (result,) = render_charts([(spec, png)])
+    if result.status == "failed":
+        print(f"  Chart: spec rejected — {result.error}", file=sys.stderr)
         print(f"  {_UNFRAMED_HINT}", file=sys.stderr)
-        return None
-    print(f"  Chart: rendered {png}")
+        if existing:
+            print(f"  Chart: keeping the previous render at {png}", file=sys.stderr)
+        return existing
+    if result.status == "cached":
+        print(f"  Chart: {png} is up to date with its spec")
+    elif existing:
+        print(f"  Chart: re-rendered {png} (the spec changed)")
+    else:
+        print(f"  Chart: rendered {png}")
     return png
 
 
+def rebuild_all(max_workers: int | None = None) -> int:
+    """Re-render every stale chart spec under ``CHARTS_DIR``. Returns an exit code.
+
+    Hand-made PNGs are skipped, as in :func:`finalise`. The summary line reports
+    how many rendered PNGs were already current (the cache hit rate).
+    """
+    manifest = load_manifest(CHARTS_DIR)
+    jobs: list[tuple[dict, Path]] = []
+    hand_made = unreadable = 0
+    for spec_path in sorted(CHARTS_DIR.glob("*.spec.json")):
+        png = CHARTS_DIR / spec_path.name.replace(".spec.json", ".png")
+        if png.is_file() and not was_rendered(png, manifest):
+            print(f"  {png.name}: hand-made, not overwritten")
+            hand_made += 1
+            continue
+        spec = _load_spec(spec_path)
+        if spec is None:
+            unreadable += 1
+            continue
+        jobs.append((spec, png))
+
+    results = render_charts(jobs, max_workers=max_workers)
+    for result in results:
+        _print_result(result)
+
+    counts = {
+        status: sum(r.status == status for r in results)
+        for status in ("cached", "rendered", "failed")
+    }
+    hit_rate = counts["cached"] / len(results) if results else 0.0
+    print(
+        f"\nCharts: {len(results)} specs — {counts['cached']} cached "
+        f"({hit_rate:.0%} hit rate), {counts['rendered']} rendered, "
+        f"{counts['failed'] + unreadable} failed, {hand_made} hand-made kept"
+    )
+    return 1 if counts["failed"] or unreadable else 0
+
+
+def _print_result(result: ChartResult) -> None:
+    name = result.output_path.name
+    if result.status == "failed":
+        print(f"  {name}: spec rejected — {result.error}", file=sys.stderr)
+    else:
+        print(f"  {name}: {result.status}")
+
+
 def finalise(slug: str) -> int:
     """Fold the owner's art into the article. Returns a process exit code."""
     article_path = POSTS_DIR / f"{slug}.md"
@@ -128,8 +202,19 @@ def main(argv: list[str] | None = None) -> int:
         level=logging.INFO, format="%(levelname)s %(name)s: %(message)s"
     )
     parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
-    parser.add_argument("--slug", required=True, help="Article slug (no extension)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--slug", help="Article slug (no extension)")
+    target.add_argument(
+        "--all",
+        action="store_true",
+        help="Re-render every changed chart spec in output/charts, in parallel",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Render processes for --all"
+    )
     args = parser.parse_args(argv)
+    if args.all:
+        return rebuild_all(args.workers)
     return finalise(args.slug)
 
 
@@ -6,6 +6,7 @@ engagement score per ADR-002, and stores results in SQLite.
 
 Usage:
     python scripts/ga4_etl.py --days 30
+    python scripts/ga4_etl.py --compact --retain-days 365
 
 Environment variables (loaded from .env):
     GOOGLE_APPLICATION_CREDENTIALS — path to service account JSON
@@ -19,7 +20,8 @@ import logging
 import os
 import pathlib
 import sqlite3
-from datetime import UTC, datetime
+import sys
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import orjson
@@ -34,6 +36,15 @@ from google.analytics.data_v1beta.types import (
 )
 from google.oauth2.service_account import Credentials
 
+_REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.performance_rollup import (  # noqa: E402
+    bulk_rollup,
+    ensure_page_rollup,
+)
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -102,10 +113,38 @@ CREATE TABLE IF NOT EXISTS article_performance (
     avg_engagement_time REAL,
     scroll_depth_rate   REAL,
     composite_score     REAL,
-    fetched_at          TEXT
+    fetched_at          TEXT,
+    date                TEXT
 );
 """
 
+# One row per page per GA4 day: reruns and overlapping windows upsert instead
+# of appending. Rows written before the ``date`` column existed carry NULL,
+# which UNIQUE treats as distinct, so legacy history loads without conflict.
+CREATE_INDEXES_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS ux_article_performance_page_date
+    ON article_performance (page_path, date);
+CREATE INDEX IF NOT EXISTS idx_article_performance_date
+    ON article_performance (date);
+"""
+
+UPSERT_SQL = """
+INSERT INTO article_performance
+    (page_path, page_title, pageviews, engagement_rate, avg_engagement_time,
+     scroll_depth_rate, composite_score, fetched_at, date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (page_path, date) DO UPDATE SET
+    page_title = excluded.page_title,
+    pageviews = excluded.pageviews,
+    engagement_rate = excluded.engagement_rate,
+    avg_engagement_time = excluded.avg_engagement_time,
+    scroll_depth_rate = excluded.scroll_depth_rate,
+    composite_score = excluded.composite_score,
+    fetched_at = excluded.fetched_at
+"""
+
+DEFAULT_RETAIN_DAYS = 365
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -188,6 +227,12 @@ def fetch_ga4_report(
 def parse_rows(response: RunReportResponse) -> list[dict[str, Any]]:
     """Parse a GA4 RunReportResponse into a list of row dicts.
 
+    GA4 splits a page's day across every ``pageTitle`` it was seen with (a
+    retitled post, say), but the table keys on (page_path, date). Those rows
+    are merged here, so the upsert sees one row per key instead of each title
+    overwriting the last: pageviews and scrolled users are summed, the rates
+    are pageview-weighted, and the most-viewed title wins.
+
     Args:
         response: The GA4 API response.
 
@@ -196,18 +241,17 @@ def parse_rows(response: RunReportResponse) -> list[dict[str, Any]]:
         pageviews, engagement_rate, avg_engagement_time, scroll_depth_rate.
 
     """
-    rows: list[dict[str, Any]] = []
     if not response.rows:
         logger.warning("GA4 returned no data rows")
-        return rows
+        return []
 
+    by_page_day: dict[tuple[str, str], list[dict[str, Any]]] = {}
     for row in response.rows:
         dims = row.dimension_values
         mets = row.metric_values
         pageviews = int(mets[0].value)
-        # scrolledUsers / screenPageViews as scroll-depth proxy
-        scroll_depth_rate = float(mets[3].value) / pageviews if pageviews > 0 else 0.0
-        rows.append(
+        scrolled_users = float(mets[3].value)
+        by_page_day.setdefault((dims[0].value, dims[2].value), []).append(
             {
                 "page_path": dims[0].value,
                 "page_title": dims[1].value,
@@ -215,13 +259,42 @@ def parse_rows(response: RunReportResponse) -> list[dict[str, Any]]:
                 "pageviews": pageviews,
                 "engagement_rate": float(mets[1].value),
                 "avg_engagement_time": float(mets[2].value),
-                "scroll_depth_rate": scroll_depth_rate,
+                # scrolledUsers / screenPageViews as scroll-depth proxy
+                "scroll_depth_rate": (
+                    scrolled_users / pageviews if pageviews > 0 else 0.0
+                ),
             },
         )
-    logger.info("Parsed %d rows from GA4 response", len(rows))
+    rows = [
+        group[0] if len(group) == 1 else _merge_title_rows(group)
+        for group in by_page_day.values()
+    ]
+    logger.info(
+        "Parsed %d rows (%d page-days) from GA4 response",
+        len(response.rows),
+        len(rows),
+    )
     return rows
 
 
+def _merge_title_rows(group: list[dict[str, Any]]) -> dict[str, Any]:
+    """One row for a page-day GA4 reported under several titles."""
+    views = sum(r["pageviews"] for r in group)
+
+    def weighted(key: str) -> float:
+        if not views:
+            return sum(r[key] for r in group) / len(group)
+        return sum(r[key] * r["pageviews"] for r in group) / views
+
+    return {
+        **max(group, key=lambda r: r["pageviews"]),
+        "pageviews": views,
+        "engagement_rate": weighted("engagement_rate"),
+        "avg_engagement_time": weighted("avg_engagement_time"),
+        "scroll_depth_rate": weighted("scroll_depth_rate"),
+    }
+
+
 def compute_scores(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Compute composite engagement scores for each row.
 
@@ -262,55 +335,122 @@ def compute_scores(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return rows
 
 
+def _iso_date(value: str | None) -> str | None:
+    """GA4 reports dates as ``YYYYMMDD``; store them as ``YYYY-MM-DD``."""
+    if value and len(value) == 8 and value.isdigit():
+        return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+    return value
+
+
+def open_db(db_path: pathlib.Path | str = DB_PATH) -> sqlite3.Connection:
+    """Open the performance database with the ETL's schema, indexes and WAL.
+
+    Migrates databases written before the ``date`` column existed.
+    """
+    db_path = pathlib.Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(str(db_path))
+    # WAL lets content_intelligence keep reading while the ETL writes.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(CREATE_TABLE_SQL)
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(article_performance)")}
+    if "date" not in columns:
+        conn.execute("ALTER TABLE article_performance ADD COLUMN date TEXT")
+    conn.executescript(CREATE_INDEXES_SQL)
+    ensure_page_rollup(conn)
+    return conn
+
+
 def store_results(
     rows: list[dict[str, Any]],
     db_path: pathlib.Path | str = DB_PATH,
 ) -> int:
-    """Write scored rows into SQLite ``article_performance`` table.
+    """Upsert scored rows into SQLite ``article_performance`` table.
+
+    Idempotent: rows are keyed on ``(page_path, date)``, so rerunning the ETL
+    over an overlapping window refreshes those days instead of duplicating
+    them. All rows go in one ``executemany`` transaction, with the
+    ``page_rollup`` triggers suspended and the touched pages recomputed once
+    at the end.
 
     Args:
         rows: Scored row dicts from :func:`compute_scores`.
         db_path: Path to the SQLite database file.
 
     Returns:
-        Number of rows inserted.
+        Number of rows written (inserted or updated).
 
     """
-    db_path = pathlib.Path(db_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
     fetched_at = datetime.now(UTC).isoformat()
 
-    conn = sqlite3.connect(str(db_path))
+    conn = open_db(db_path)
     try:
-        conn.execute(CREATE_TABLE_SQL)
-        inserted = 0
-        for row in rows:
-            conn.execute(
-                """
-                INSERT INTO article_performance
-                    (page_path, page_title, pageviews, engagement_rate,
-                     avg_engagement_time, scroll_depth_rate, composite_score, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    row["page_path"],
-                    row["page_title"],
-                    row["pageviews"],
-                    row["engagement_rate"],
-                    row["avg_engagement_time"],
-                    row["scroll_depth_rate"],
-                    row["composite_score"],
-                    fetched_at,
-                ),
+        with bulk_rollup(conn, pages={row["page_path"] for row in rows}):
+            conn.executemany(
+                UPSERT_SQL,
+                [
+                    (
+                        row["page_path"],
+                        row["page_title"],
+                        row["pageviews"],
+                        row["engagement_rate"],
+                        row["avg_engagement_time"],
+                        row["scroll_depth_rate"],
+                        row["composite_score"],
+                        fetched_at,
+                        _iso_date(row.get("date")),
+                    )
+                    for row in rows
+                ],
             )
-            inserted += 1
-        conn.commit()
-        logger.info("Inserted %d rows into %s", inserted, db_path)
+        logger.info("Upserted %d rows into %s", len(rows), db_path)
     finally:
         conn.close()
 
-    return inserted
+    return len(rows)
+
+
+def compact(
+    db_path: pathlib.Path | str = DB_PATH,
+    retain_days: int = DEFAULT_RETAIN_DAYS,
+) -> int:
+    """Apply the retention window, then reclaim space.
+
+    Deletes rows whose GA4 date is older than ``retain_days``. Undated rows
+    from before the ``date`` column existed are dropped once they were
+    *fetched* before the cutoff — a row cannot be fetched before the day it
+    describes, so those are out of the window too.
+
+    Args:
+        db_path: Path to the SQLite database file.
+        retain_days: Days of history to keep.
+
+    Returns:
+        Number of rows deleted.
+
+    """
+    cutoff = datetime.now(UTC).date() - timedelta(days=retain_days)
+    conn = open_db(db_path)
+    try:
+        with bulk_rollup(conn):
+            deleted = conn.execute(
+                """
+                DELETE FROM article_performance
+                WHERE date < :cutoff
+                   OR (date IS NULL AND fetched_at < :cutoff)
+                """,
+                {"cutoff": cutoff.isoformat()},
+            ).rowcount
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+        logger.info(
+            "Compacted %s: removed %d rows older than %s", db_path, deleted, cutoff
+        )
+    finally:
+        conn.close()
+    return deleted
 
 
 # ---------------------------------------------------------------------------
@@ -340,6 +480,17 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fetch and score but do not write to the database",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Apply the retention window and reclaim space, then exit (no fetch)",
+    )
+    parser.add_argument(
+        "--retain-days",
+        type=int,
+        default=DEFAULT_RETAIN_DAYS,
+        help=f"Days of history kept by --compact (default: {DEFAULT_RETAIN_DAYS})",
+    )
     return parser
 
 
@@ -355,6 +506,11 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.compact:
+        deleted = compact(args.db, retain_days=args.retain_days)
+        logger.info("Compaction complete: %d rows removed from %s", deleted, args.db)
+        return
+
     property_id = os.environ.get("GA4_PROPERTY_ID", "")
     if not property_id:
         logger.error("GA4_PROPERTY_ID environment variable is not set")
@@ -4,6 +4,15 @@
 Queries the GSC Search Analytics API for keyword and search performance data,
 identifies content gaps, and stores results in SQLite.
 
+Extraction streams: each date window is paged through with ``startRow`` and
+daily (date, query, page) rows are upserted into ``keyword_data`` in batches,
+so memory stays flat however large the property is. Per-property low- and
+high-water marks in ``gsc_load_state`` bound the days already loaded, so a
+run only fetches days outside them (earlier days when ``--days`` widens, and
+newer ones), plus the last few days GSC may still be revising. Page
+aggregates and content gaps are then computed in SQLite over the trailing
+window.
+
 Usage:
     python scripts/gsc_etl.py --days 30
 """
@@ -12,7 +21,9 @@ import argparse
 import logging
 import sqlite3
 import statistics
-from datetime import UTC, datetime, timedelta
+import sys
+from collections.abc import Iterator, Sequence
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +32,15 @@ from dotenv import load_dotenv
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts.performance_rollup import (  # noqa: E402
+    ensure_page_rollup,
+    upsert_search_rollup,
+)
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -33,6 +53,28 @@ GSC_SCOPE = "https://www.googleapis.com/auth/webmasters.readonly"
 DB_PATH = Path(__file__).resolve().parent.parent / "data" / "performance.db"
 CONTENT_GAP_CTR_THRESHOLD = 0.03
 
+# Search Analytics returns at most 25,000 rows per request.
+ROW_LIMIT = 25000
+WINDOW_DAYS = 7
+BATCH_SIZE = 5000
+# GSC keeps revising the most recent days, so they are refetched on every run
+# and the high-water mark never advances past them.
+FRESH_DATA_DAYS = 3
+DAILY_DIMENSIONS = ("date", "query", "page")
+
+KEYWORD_UPSERT_SQL = """
+INSERT INTO keyword_data
+    (query, page_url, impressions, clicks, ctr, position, is_content_gap,
+     fetched_at, date)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (date, query, page_url) DO UPDATE SET
+    impressions = excluded.impressions,
+    clicks = excluded.clicks,
+    ctr = excluded.ctr,
+    position = excluded.position,
+    fetched_at = excluded.fetched_at
+"""
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Database
@@ -42,6 +84,8 @@ CONTENT_GAP_CTR_THRESHOLD = 0.03
 def init_db(db_path: Path) -> sqlite3.Connection:
     """Create SQLite database and tables if they do not exist.
 
+    Includes the shared ``page_rollup`` table (see performance_rollup.py).
+
     Args:
         db_path: Path to the SQLite database file.
 
@@ -73,14 +117,72 @@ def init_db(db_path: Path) -> sqlite3.Connection:
             ctr            REAL,
             position       REAL,
             is_content_gap BOOLEAN,
-            fetched_at     TEXT
+            fetched_at     TEXT,
+            date           TEXT
         )
         """,
     )
-    conn.commit()
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(keyword_data)")}
+    if "date" not in columns:
+        conn.execute("ALTER TABLE keyword_data ADD COLUMN date TEXT")
+    conn.executescript(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS ux_keyword_data_date_query_page
+            ON keyword_data (date, query, page_url);
+        CREATE TABLE IF NOT EXISTS gsc_load_state (
+            site_url       TEXT PRIMARY KEY,
+            loaded_through TEXT NOT NULL,
+            loaded_from    TEXT
+        );
+        """,
+    )
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(gsc_load_state)")}
+    if "loaded_from" not in columns:
+        conn.execute("ALTER TABLE gsc_load_state ADD COLUMN loaded_from TEXT")
+    ensure_page_rollup(conn)
     return conn
 
 
+def get_loaded_range(
+    conn: sqlite3.Connection,
+    site_url: str,
+) -> tuple[date, date] | None:
+    """Return the first and last day fully loaded for ``site_url``, or None.
+
+    A mark written before the low-water mark existed has no first day; it is
+    reported as covering only its last day, so the next run backfills the
+    window once rather than trusting days it cannot vouch for.
+    """
+    row = conn.execute(
+        "SELECT loaded_from, loaded_through FROM gsc_load_state WHERE site_url = ?",
+        (site_url,),
+    ).fetchone()
+    if row is None:
+        return None
+    loaded_through = date.fromisoformat(row[1])
+    loaded_from = date.fromisoformat(row[0]) if row[0] else loaded_through
+    return loaded_from, loaded_through
+
+
+def set_loaded_range(
+    conn: sqlite3.Connection,
+    site_url: str,
+    loaded_from: date,
+    loaded_through: date,
+) -> None:
+    """Record ``loaded_from..loaded_through`` as fully loaded. Does not commit."""
+    conn.execute(
+        """
+        INSERT INTO gsc_load_state (site_url, loaded_from, loaded_through)
+        VALUES (?, ?, ?)
+        ON CONFLICT (site_url) DO UPDATE SET
+            loaded_from = excluded.loaded_from,
+            loaded_through = excluded.loaded_through
+        """,
+        (site_url, loaded_from.isoformat(), loaded_through.isoformat()),
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GSC Client
 # ═══════════════════════════════════════════════════════════════════════════
@@ -106,6 +208,65 @@ def build_gsc_service(
     return service
 
 
+def iter_search_analytics(
+    service: Any,
+    site_url: str,
+    start_date: date,
+    end_date: date,
+    dimensions: Sequence[str] = DAILY_DIMENSIONS,
+    row_limit: int = ROW_LIMIT,
+) -> Iterator[dict[str, Any]]:
+    """Yield every Search Analytics row for one date range, page by page.
+
+    Requests advance ``startRow`` by ``row_limit`` until a page comes back
+    short, so only one page of rows is held at a time.
+
+    Args:
+        service: GSC API service resource.
+        site_url: The verified property URL (e.g. ``https://www.viney.ca/``).
+        start_date: First day of the range (inclusive).
+        end_date: Last day of the range (inclusive).
+        dimensions: Dimensions to group by, in ``keys`` order.
+        row_limit: Rows per request (the API maximum is 25,000).
+
+    Yields:
+        Raw row dicts with keys, impressions, clicks, ctr, position.
+
+    """
+    start_row = 0
+    while True:
+        request_body: dict[str, Any] = {
+            "startDate": start_date.isoformat(),
+            "endDate": end_date.isoformat(),
+            "dimensions": list(dimensions),
+            "rowLimit": row_limit,
+            "startRow": start_row,
+        }
+        response: dict[str, Any] = (
+            service.searchanalytics()
+            .query(siteUrl=site_url, body=request_body)
+            .execute()
+        )
+        rows: list[dict[str, Any]] = response.get("rows", [])
+        yield from rows
+        if len(rows) < row_limit:
+            return
+        start_row += len(rows)
+
+
+def date_windows(
+    start_date: date,
+    end_date: date,
+    window_days: int = WINDOW_DAYS,
+) -> Iterator[tuple[date, date]]:
+    """Split ``start_date..end_date`` (inclusive) into consecutive windows."""
+    step = timedelta(days=window_days)
+    while start_date <= end_date:
+        window_end = min(start_date + step - timedelta(days=1), end_date)
+        yield start_date, window_end
+        start_date = window_end + timedelta(days=1)
+
+
 def fetch_search_analytics(
     service: Any,
     site_url: str,
@@ -113,6 +274,9 @@ def fetch_search_analytics(
 ) -> list[dict[str, Any]]:
     """Query GSC Search Analytics for query+page performance rows.
 
+    Collects :func:`iter_search_analytics` over the whole trailing window
+    without a date dimension. :func:`run_etl` streams instead.
+
     Args:
         service: GSC API service resource.
         site_url: The verified property URL (e.g. ``https://www.viney.ca/``).
@@ -126,13 +290,6 @@ def fetch_search_analytics(
     end_date = datetime.now(tz=UTC).date()
     start_date = end_date - timedelta(days=days)
 
-    request_body: dict[str, Any] = {
-        "startDate": start_date.isoformat(),
-        "endDate": end_date.isoformat(),
-        "dimensions": ["query", "page"],
-        "rowLimit": 25000,
-    }
-
     logger.info(
         "Querying GSC: site=%s, start=%s, end=%s",
         site_url,
@@ -140,11 +297,11 @@ def fetch_search_analytics(
         end_date.isoformat(),
     )
 
-    response: dict[str, Any] = (
-        service.searchanalytics().query(siteUrl=site_url, body=request_body).execute()
+    rows = list(
+        iter_search_analytics(
+            service, site_url, start_date, end_date, dimensions=("query", "page")
+        )
     )
-
-    rows: list[dict[str, Any]] = response.get("rows", [])
     if not rows:
         logger.warning(
             "GSC returned no data for %s. "
@@ -161,23 +318,28 @@ def fetch_search_analytics(
 
 def parse_rows(
     rows: list[dict[str, Any]],
+    dimensions: Sequence[str] = ("query", "page"),
 ) -> list[dict[str, Any]]:
     """Normalise raw GSC rows into flat dicts.
 
     Args:
         rows: Raw rows from the GSC response.
+        dimensions: The dimensions the rows were requested with, in ``keys``
+            order.
 
     Returns:
-        List of dicts with query, page_url, impressions, clicks, ctr, position.
+        List of dicts with query, page_url, impressions, clicks, ctr, position,
+        plus date when ``dimensions`` includes it.
 
     """
     parsed: list[dict[str, Any]] = []
     for row in rows:
-        keys = row.get("keys", [])
+        keys = dict(zip(dimensions, row.get("keys", []), strict=False))
         parsed.append(
             {
-                "query": keys[0] if len(keys) > 0 else "",
-                "page_url": keys[1] if len(keys) > 1 else "",
+                **({"date": keys.get("date")} if "date" in dimensions else {}),
+                "query": keys.get("query", ""),
+                "page_url": keys.get("page", ""),
                 "impressions": int(row.get("impressions", 0)),
                 "clicks": int(row.get("clicks", 0)),
                 "ctr": float(row.get("ctr", 0.0)),
@@ -267,21 +429,11 @@ def aggregate_by_page(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def store_results(
+def _store_page_rows(
     conn: sqlite3.Connection,
     page_rows: list[dict[str, Any]],
-    keyword_rows: list[dict[str, Any]],
     fetched_at: str,
 ) -> None:
-    """Persist page and keyword data to SQLite.
-
-    Args:
-        conn: Open SQLite connection.
-        page_rows: Per-page aggregated rows.
-        keyword_rows: Per-keyword rows with content-gap flags.
-        fetched_at: ISO-8601 timestamp string for this fetch.
-
-    """
     conn.executemany(
         """
         INSERT INTO search_performance
@@ -300,12 +452,30 @@ def store_results(
             for r in page_rows
         ],
     )
+    upsert_search_rollup(conn, page_rows)
+
+
+def store_keyword_batch(
+    conn: sqlite3.Connection,
+    keyword_rows: list[dict[str, Any]],
+    fetched_at: str,
+) -> int:
+    """Upsert one batch of keyword rows, keyed on ``(date, query, page_url)``.
+
+    Refetched days overwrite their earlier values rather than duplicating
+    them. Rows without a ``date`` are plain inserts. Does not commit.
+
+    Args:
+        conn: Open SQLite connection.
+        keyword_rows: Parsed keyword rows; ``is_content_gap`` is optional.
+        fetched_at: ISO-8601 timestamp string for this fetch.
+
+    Returns:
+        Number of rows written.
+
+    """
     conn.executemany(
-        """
-        INSERT INTO keyword_data
-            (query, page_url, impressions, clicks, ctr, position, is_content_gap, fetched_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        KEYWORD_UPSERT_SQL,
         [
             (
                 r["query"],
@@ -314,12 +484,35 @@ def store_results(
                 r["clicks"],
                 r["ctr"],
                 r["position"],
-                r["is_content_gap"],
+                r.get("is_content_gap"),
                 fetched_at,
+                r.get("date"),
             )
             for r in keyword_rows
         ],
     )
+    return len(keyword_rows)
+
+
+def store_results(
+    conn: sqlite3.Connection,
+    page_rows: list[dict[str, Any]],
+    keyword_rows: list[dict[str, Any]],
+    fetched_at: str,
+) -> None:
+    """Persist page and keyword data to SQLite.
+
+    Also refreshes the search columns of each page's ``page_rollup`` row.
+
+    Args:
+        conn: Open SQLite connection.
+        page_rows: Per-page aggregated rows.
+        keyword_rows: Per-keyword rows with content-gap flags.
+        fetched_at: ISO-8601 timestamp string for this fetch.
+
+    """
+    _store_page_rows(conn, page_rows, fetched_at)
+    store_keyword_batch(conn, keyword_rows, fetched_at)
     conn.commit()
     logger.info(
         "Stored %d page rows and %d keyword rows in %s",
@@ -329,11 +522,143 @@ def store_results(
     )
 
 
+# Daily rows in the trailing window rolled up to one row per (query, page),
+# the grain the non-daily API request returns. CTR and position are derived
+# the way GSC derives them: clicks / impressions, impression-weighted rank.
+_WINDOW_PAIRS_SQL = """
+WITH pairs AS (
+    SELECT
+        query,
+        page_url,
+        SUM(impressions) AS impressions,
+        SUM(clicks) AS clicks,
+        CASE WHEN SUM(impressions) > 0
+            THEN 1.0 * SUM(clicks) / SUM(impressions) ELSE 0.0 END AS ctr,
+        CASE WHEN SUM(impressions) > 0
+            THEN SUM(position * impressions) / SUM(impressions)
+            ELSE AVG(position) END AS position
+    FROM keyword_data
+    WHERE date >= :since
+    GROUP BY query, page_url
+)
+"""
+
+
+def summarise_window(
+    conn: sqlite3.Connection,
+    since: date,
+    fetched_at: str,
+) -> dict[str, Any]:
+    """Flag content gaps and store page aggregates for the trailing window.
+
+    Works on the rows already in ``keyword_data``, so the result is the same
+    whether the window was loaded in one run or over many incremental ones.
+    Applies :func:`identify_content_gaps`'s rule to each (query, page) pair
+    and marks every daily row of a gap pair. Commits.
+
+    Args:
+        conn: Open SQLite connection.
+        since: First day of the window (inclusive).
+        fetched_at: ISO-8601 timestamp string for this fetch.
+
+    Returns:
+        Summary dict with total_queries, total_pages, content_gaps counts.
+
+    """
+    params = {"since": since.isoformat()}
+    total_queries = conn.execute(
+        f"{_WINDOW_PAIRS_SQL} SELECT COUNT(*) FROM pairs", params
+    ).fetchone()[0]
+    if not total_queries:
+        return {"total_queries": 0, "total_pages": 0, "content_gaps": 0}
+
+    middle = conn.execute(
+        f"{_WINDOW_PAIRS_SQL} SELECT impressions FROM pairs "
+        "ORDER BY impressions LIMIT :n OFFSET :offset",
+        {**params, "n": 2 - total_queries % 2, "offset": (total_queries - 1) // 2},
+    ).fetchall()
+    gap_params = {
+        **params,
+        "median": statistics.median(v for (v,) in middle),
+        "ctr": CONTENT_GAP_CTR_THRESHOLD,
+    }
+    content_gaps = conn.execute(
+        f"{_WINDOW_PAIRS_SQL} SELECT COUNT(*) FROM pairs "
+        "WHERE impressions > :median AND ctr < :ctr",
+        gap_params,
+    ).fetchone()[0]
+    conn.execute(
+        f"""
+        UPDATE keyword_data SET is_content_gap = (query, page_url) IN (
+            {_WINDOW_PAIRS_SQL}
+            SELECT query, page_url FROM pairs
+            WHERE impressions > :median AND ctr < :ctr
+        )
+        WHERE date >= :since
+        """,
+        gap_params,
+    )
+
+    page_rows = [
+        {
+            "page_url": page_url,
+            "total_impressions": impressions,
+            "total_clicks": clicks,
+            "avg_ctr": ctr,
+            "avg_position": position,
+        }
+        for page_url, impressions, clicks, ctr, position in conn.execute(
+            f"""
+            {_WINDOW_PAIRS_SQL}
+            SELECT page_url, SUM(impressions), SUM(clicks), AVG(ctr), AVG(position)
+            FROM pairs GROUP BY page_url
+            """,
+            params,
+        )
+    ]
+    _store_page_rows(conn, page_rows, fetched_at)
+    conn.commit()
+    return {
+        "total_queries": total_queries,
+        "total_pages": len(page_rows),
+        "content_gaps": content_gaps,
+    }
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Orchestrator
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _load_window(
+    conn: sqlite3.Connection,
+    service: Any,
+    site_url: str,
+    start_date: date,
+    end_date: date,
+    fetched_at: str,
+) -> int:
+    """Stream one date window into ``keyword_data`` in batches. Does not commit."""
+    logger.info(
+        "Querying GSC: site=%s, start=%s, end=%s",
+        site_url,
+        start_date.isoformat(),
+        end_date.isoformat(),
+    )
+    stored = 0
+    batch: list[dict[str, Any]] = []
+    for row in iter_search_analytics(
+        service, site_url, start_date, end_date, row_limit=ROW_LIMIT
+    ):
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            parsed = parse_rows(batch, DAILY_DIMENSIONS)
+            stored += store_keyword_batch(conn, parsed, fetched_at)
+            batch.clear()
+    parsed = parse_rows(batch, DAILY_DIMENSIONS)
+    return stored + store_keyword_batch(conn, parsed, fetched_at)
+
+
 def run_etl(
     credentials_path: str,
     site_url: str,
@@ -342,6 +667,14 @@ def run_etl(
 ) -> dict[str, Any]:
     """Execute the full ETL pipeline.
 
+    Fetches only the days of the trailing window outside the property's
+    loaded range — before its low-water mark when ``days`` is wider than any
+    earlier run, after its high-water mark otherwise — plus the last
+    :data:`FRESH_DATA_DAYS`, which GSC may still revise. Each
+    :data:`WINDOW_DAYS` window is committed with the marks, and the backfill
+    runs newest-first, so the loaded range stays contiguous and an
+    interrupted run resumes where it stopped.
+
     Args:
         credentials_path: Path to the GCP service-account JSON key.
         site_url: GSC verified property URL.
@@ -353,29 +686,60 @@ def run_etl(
 
     """
     service = build_gsc_service(credentials_path)
-    raw_rows = fetch_search_analytics(service, site_url, days)
-
-    if not raw_rows:
-        logger.info("No data returned. Nothing to store.")
-        return {"total_queries": 0, "total_pages": 0, "content_gaps": 0}
-
-    keyword_rows = parse_rows(raw_rows)
-    keyword_rows = identify_content_gaps(keyword_rows)
-    page_rows = aggregate_by_page(keyword_rows)
+    today = datetime.now(tz=UTC).date()
+    since = today - timedelta(days=days)
+    settled = today - timedelta(days=FRESH_DATA_DAYS)
     fetched_at = datetime.now(tz=UTC).isoformat()
 
     conn = init_db(db_path)
     try:
-        store_results(conn, page_rows, keyword_rows, fetched_at)
+        loaded = get_loaded_range(conn, site_url)
+        if loaded is not None and loaded[1] < since - timedelta(days=1):
+            loaded = None  # a gap separates it from the window; start afresh
+        if loaded is None:
+            loaded_from, loaded_through = since, None
+            backfill: list[tuple[date, date]] = []
+            start = since
+        else:
+            loaded_from, loaded_through = loaded
+            backfill = list(date_windows(since, loaded_from - timedelta(days=1)))
+            start = max(since, loaded_through + timedelta(days=1))
+
+        fetched = 0
+        for window_start, window_end in reversed(backfill):
+            fetched += _load_window(
+                conn, service, site_url, window_start, window_end, fetched_at
+            )
+            loaded_from = window_start
+            set_loaded_range(conn, site_url, loaded_from, loaded_through)
+            conn.commit()
+        for window_start, window_end in date_windows(start, today):
+            fetched += _load_window(
+                conn, service, site_url, window_start, window_end, fetched_at
+            )
+            if window_start <= settled:
+                loaded_through = min(window_end, settled)
+                set_loaded_range(conn, site_url, loaded_from, loaded_through)
+            conn.commit()
+        logger.info(
+            "Fetched %d rows (%d backfill windows, new days from %s)",
+            fetched,
+            len(backfill),
+            start.isoformat(),
+        )
+
+        summary = summarise_window(conn, since, fetched_at)
     finally:
         conn.close()
 
-    content_gaps = sum(1 for r in keyword_rows if r.get("is_content_gap"))
-    summary: dict[str, Any] = {
-        "total_queries": len(keyword_rows),
-        "total_pages": len(page_rows),
-        "content_gaps": content_gaps,
-    }
+    if not summary["total_queries"]:
+        logger.warning(
+            "GSC returned no data for %s. "
+            "New properties can take 24-48 hours to populate.",
+            site_url,
+        )
+        return summary
+
     logger.info(
         "ETL complete — queries=%d, pages=%d, content_gaps=%d",
         summary["total_queries"],
@@ -9,6 +9,10 @@ Environment Variables:
     ANTHROPIC_MODEL: Anthropic model (default: claude-sonnet-4-6)
     OPENAI_API_KEY: OpenAI API key (fallback)
     OPENAI_MODEL: OpenAI model (default: gpt-4o)
+    AGENT_SDK_POOL: Set to 0 to give every Agent SDK call its own one-shot
+        CLI process instead of a pooled session
+    AGENT_SDK_POOL_WARM: Set to 1 to keep a connected spare session ready
+        for the next call with the same system prompt (default: 0)
 
 Usage:
     from llm_client import create_llm_client, call_llm
@@ -17,9 +21,16 @@ Usage:
     response = call_llm(client, system_prompt, user_prompt)
 """
 
+import asyncio
+import atexit
+import concurrent.futures
 import logging
 import os
+import threading
 import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -120,7 +131,7 @@ def _create_agent_sdk_client() -> LLMClient:
         An ``agent_sdk`` LLMClient.
 
     """
-    model = os.environ.get("AGENT_SDK_MODEL", "claude-sonnet-4-6")
+    model = _agent_sdk_model()
     return LLMClient(provider="agent_sdk", client=None, model=model)
 
 
@@ -154,6 +165,7 @@ def _call_agent_sdk(
     user_prompt: str,
     max_tokens: int = 3000,
     temperature: float = 1.0,
+    timeout: float | None = None,
 ) -> str:
     """Call Claude through the Agent SDK — no API key, no metered billing.
 
@@ -166,52 +178,341 @@ def _call_agent_sdk(
     not doing so. Callers use them as advisory ceilings, and no in-tree caller
     depends on either being enforced.
 
+    This is the blocking wrapper. The call itself runs on the session pool's
+    loop (see ``AgentSDKSessionPool``); callers already on an event loop should
+    await ``acall_llm`` instead.
+
     Args:
         system_prompt: System/context prompt.
         user_prompt: User message.
         max_tokens: Ignored; see above.
         temperature: Ignored; see above.
+        timeout: Seconds before the call is cancelled; ``None`` waits forever.
 
     Returns:
         The assistant's text, or ``""`` when the SDK yields nothing.
 
     Raises:
         ImportError: If claude_agent_sdk is not installed.
+        TimeoutError: If ``timeout`` elapses first.
 
     """
-    import asyncio
+    if _session_pool_enabled():
+        return (
+            get_session_pool()
+            .submit(system_prompt, user_prompt, _agent_sdk_model(), timeout)
+            .result()
+        )
+    return asyncio.run(_acall_agent_sdk(system_prompt, user_prompt, timeout=timeout))
 
-    try:
-        from claude_agent_sdk import (
-            AssistantMessage,
-            ClaudeAgentOptions,
-            TextBlock,
-            query,
+
+async def _acall_agent_sdk(
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 3000,
+    temperature: float = 1.0,
+    timeout: float | None = None,
+) -> str:
+    """Async ``_call_agent_sdk``; same contract, awaited on the caller's loop."""
+    if _session_pool_enabled():
+        return await asyncio.wrap_future(
+            get_session_pool().submit(
+                system_prompt, user_prompt, _agent_sdk_model(), timeout
+            )
         )
+    return await asyncio.wait_for(_query_agent_sdk(system_prompt, user_prompt), timeout)
+
+
+def _agent_sdk_model() -> str:
+    return os.environ.get("AGENT_SDK_MODEL", "claude-sonnet-4-6")
+
+
+def _agent_sdk_options(model: str, system_prompt: str) -> Any:
+    try:
+        from claude_agent_sdk import ClaudeAgentOptions
     except ImportError as err:
         raise ImportError(
             "[LLM_CLIENT] claude_agent_sdk not installed. "
             "Install it: pip install claude-agent-sdk",
         ) from err
 
-    async def _run() -> str:
-        options = ClaudeAgentOptions(
-            model=os.environ.get("AGENT_SDK_MODEL", "claude-sonnet-4-6"),
-            system_prompt=system_prompt,
-            max_turns=1,
-            permission_mode="bypassPermissions",
-            allowed_tools=[],
-            mcp_servers={},
+    return ClaudeAgentOptions(
+        model=model,
+        system_prompt=system_prompt,
+        max_turns=1,
+        permission_mode="bypassPermissions",
+        allowed_tools=[],
+        mcp_servers={},
+    )
+
+
+def _assistant_text(message: Any) -> str:
+    from claude_agent_sdk import AssistantMessage, TextBlock
+
+    if not isinstance(message, AssistantMessage):
+        return ""
+    return "".join(b.text for b in message.content if isinstance(b, TextBlock))
+
+
+async def _query_agent_sdk(system_prompt: str, user_prompt: str) -> str:
+    """One-shot ``query()``: spawns a CLI process, asks, and tears it down."""
+    options = _agent_sdk_options(_agent_sdk_model(), system_prompt)
+    from claude_agent_sdk import query
+
+    parts: list[str] = []
+    async for message in query(prompt=user_prompt, options=options):
+        parts.append(_assistant_text(message))
+    return "".join(parts).strip()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# AGENT SDK SESSION POOL
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Most Agent SDK calls in flight at once, across every caller in the process.
+# Calls beyond it queue, and a call's timeout only starts once it holds a slot.
+# At least as wide as the editorial board's six personas, so a board runs in
+# one wave instead of queueing its last members behind the first.
+AGENT_SDK_POOL_SIZE = 6
+
+# Connected sessions kept ready per (model, system prompt). Off by default: a
+# spare is connected after every call, including a process's last, where it
+# only costs a CLI spawn. Long-lived processes that make back-to-back calls
+# opt in with AGENT_SDK_POOL_WARM.
+AGENT_SDK_POOL_WARM = 0
+
+# Distinct (model, system prompt) pairs that keep spares; the least recently
+# used pair loses its spares beyond this.
+_POOL_MAX_WARM_KEYS = 4
+
+_POOL_TIMING_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class SessionTiming:
+    """Where one pooled call spent its time."""
+
+    startup_s: float  # waiting for a connected session; ~0 on a warm hit
+    inference_s: float  # prompt sent -> ResultMessage received
+    warm: bool
+
+
+def _sdk_client_for(model: str, system_prompt: str) -> Any:
+    from claude_agent_sdk import ClaudeSDKClient
+
+    return ClaudeSDKClient(_agent_sdk_options(model, system_prompt))
+
+
+class AgentSDKSessionPool:
+    """Keeps `claude` CLI sessions connected ahead of demand.
+
+    Spawning and initialising the CLI dominates a short single-turn call. With
+    ``warm_spares`` set, the pool connects a spare session in the background
+    after each call, so the next call with the same model and system prompt
+    starts on a warm process. Without it, the pool only bounds concurrency.
+
+    A session answers exactly one prompt and is then retired: the CLI keeps
+    the conversation history of a session, and reusing one across unrelated
+    prompts would leak each caller's context into the next. A spare whose CLI
+    died while it waited fails on that prompt, and the prompt is resent on a
+    freshly connected session.
+
+    All sessions live on one event loop owned by a daemon thread, because an
+    SDK client is bound to the loop it connected on. Blocking callers wait on
+    ``submit(...).result()``; async callers wrap the same future.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = AGENT_SDK_POOL_SIZE,
+        warm_spares: int = AGENT_SDK_POOL_WARM,
+        client_factory: Callable[[str, str], Any] = _sdk_client_for,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.warm_spares = max(0, warm_spares)
+        self._client_factory = client_factory
+        self._spares: OrderedDict[tuple[str, str], list[Any]] = OrderedDict()
+        self._connecting: Counter[tuple[str, str]] = Counter()
+        self._background: set[asyncio.Task] = set()
+        self._timings: deque[SessionTiming] = deque(maxlen=_POOL_TIMING_WINDOW)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str,
+        timeout: float | None = None,
+    ) -> concurrent.futures.Future[str]:
+        """Schedule one prompt on the pool; cancelling the future stops it.
+
+        ``timeout`` runs from the moment the call holds a concurrency slot, not
+        from submission, and the future then fails with ``TimeoutError``.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._call((model, system_prompt), user_prompt, timeout),
+            self._ensure_loop(),
+        )
+
+    def stats(self) -> dict[str, float]:
+        """Startup versus inference latency over the recent calls."""
+        timings = list(self._timings)
+        if not timings:
+            return {"calls": 0, "warm_hits": 0}
+        return {
+            "calls": len(timings),
+            "warm_hits": sum(t.warm for t in timings),
+            "mean_startup_s": sum(t.startup_s for t in timings) / len(timings),
+            "mean_inference_s": sum(t.inference_s for t in timings) / len(timings),
+        }
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Disconnect every spare and stop the pool's loop."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._aclose(), loop).result(timeout)
+        except Exception as e:  # noqa: BLE001 - shutdown is best-effort
+            logger.debug("[LLM_CLIENT] Session pool close: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="agent-sdk-pool", daemon=True
+                ).start()
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._loop = loop
+            return self._loop
+
+    async def _call(
+        self, key: tuple[str, str], user_prompt: str, timeout: float | None = None
+    ) -> str:
+        assert self._semaphore is not None
+        async with self._semaphore, asyncio.timeout(timeout):
+            started = time.monotonic()
+            client, warm = await self._checkout(key)
+            connected = time.monotonic()
+            self._refill(key)
+            try:
+                try:
+                    await client.query(user_prompt)
+                except Exception as e:  # noqa: BLE001 - retried on a cold session
+                    if not warm:
+                        raise
+                    logger.debug("[LLM_CLIENT] Discarding a dead warm session: %s", e)
+                    self._retire(client)
+                    client, warm = await self._connect(key), False
+                    await client.query(user_prompt)
+                parts = [_assistant_text(m) async for m in client.receive_response()]
+            finally:
+                self._retire(client)
+            timing = SessionTiming(
+                startup_s=connected - started,
+                inference_s=time.monotonic() - connected,
+                warm=warm,
+            )
+        self._timings.append(timing)
+        logger.debug(
+            "[LLM_CLIENT] Agent SDK call: startup %.2fs (%s), inference %.2fs",
+            timing.startup_s,
+            "warm" if warm else "cold",
+            timing.inference_s,
         )
-        parts: list[str] = []
-        async for message in query(prompt=user_prompt, options=options):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        parts.append(block.text)
         return "".join(parts).strip()
 
-    return asyncio.run(_run())
+    async def _checkout(self, key: tuple[str, str]) -> tuple[Any, bool]:
+        spares = self._spares.get(key)
+        if spares:
+            return spares.pop(), True
+        return await self._connect(key), False
+
+    async def _connect(self, key: tuple[str, str]) -> Any:
+        client = self._client_factory(*key)
+        await client.connect()
+        return client
+
+    def _refill(self, key: tuple[str, str]) -> None:
+        if not self.warm_spares:
+            return
+        self._spares.setdefault(key, [])
+        self._spares.move_to_end(key)
+        while len(self._spares) > _POOL_MAX_WARM_KEYS:
+            _, evicted = self._spares.popitem(last=False)
+            for client in evicted:
+                self._retire(client)
+        missing = self.warm_spares - len(self._spares[key]) - self._connecting[key]
+        for _ in range(max(0, missing)):
+            self._connecting[key] += 1
+            self._spawn(self._connect_spare(key))
+
+    async def _connect_spare(self, key: tuple[str, str]) -> None:
+        client = self._client_factory(*key)
+        try:
+            await client.connect()
+        except Exception as e:  # noqa: BLE001 - the next call connects cold
+            logger.debug("[LLM_CLIENT] Warm session failed to connect: %s", e)
+            return
+        finally:
+            self._connecting[key] -= 1
+        if key in self._spares:
+            self._spares[key].append(client)
+        else:
+            self._retire(client)
+
+    def _retire(self, client: Any) -> None:
+        self._spawn(self._disconnect(client))
+
+    @staticmethod
+    async def _disconnect(client: Any) -> None:
+        try:
+            await client.disconnect()
+        except Exception as e:  # noqa: BLE001 - the process is going away anyway
+            logger.debug("[LLM_CLIENT] Session disconnect: %s", e)
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _aclose(self) -> None:
+        spares = [c for clients in self._spares.values() for c in clients]
+        self._spares.clear()
+        await asyncio.gather(*(self._disconnect(c) for c in spares))
+        await asyncio.gather(*self._background, return_exceptions=True)
+
+
+_session_pool: AgentSDKSessionPool | None = None
+_session_pool_lock = threading.Lock()
+
+
+def _session_pool_enabled() -> bool:
+    return os.environ.get("AGENT_SDK_POOL", "1") != "0"
+
+
+def _pool_warm_spares() -> int:
+    raw = os.environ.get("AGENT_SDK_POOL_WARM", "")
+    try:
+        return int(raw) if raw else AGENT_SDK_POOL_WARM
+    except ValueError:
+        logger.warning("[LLM_CLIENT] Ignoring AGENT_SDK_POOL_WARM=%r", raw)
+        return AGENT_SDK_POOL_WARM
+
+
+def get_session_pool() -> AgentSDKSessionPool:
+    """The process-wide Agent SDK session pool, created on first use."""
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = AgentSDKSessionPool(warm_spares=_pool_warm_spares())
+            atexit.register(_session_pool.close)
+        return _session_pool
 
 
 def _create_anthropic_client() -> LLMClient:
@@ -310,6 +611,7 @@ def call_llm(
     user_prompt: str,
     max_tokens: int = 3000,
     temperature: float = 1.0,
+    timeout: float | None = None,
 ) -> str:
     """Call LLM API (dispatches to correct provider).
 
@@ -319,13 +621,21 @@ def call_llm(
         user_prompt: User message.
         max_tokens: Maximum tokens in response.
         temperature: Sampling temperature (0-2).
+        timeout: Seconds the request may take, enforced by the provider's own
+            client (key-based requests are then not retried); ``None`` keeps
+            the provider default.
 
     Returns:
         Response text from LLM.
 
+    Raises:
+        TimeoutError: If ``timeout`` elapses first.
+
     """
     if llm_client.provider == "agent_sdk":
-        return _call_agent_sdk(system_prompt, user_prompt, max_tokens, temperature)
+        return _call_agent_sdk(
+            system_prompt, user_prompt, max_tokens, temperature, timeout=timeout
+        )
 
     if llm_client.provider == "anthropic":
         return _call_anthropic(
@@ -335,6 +645,7 @@ def call_llm(
             user_prompt,
             max_tokens,
             temperature,
+            timeout,
         )
     return _call_openai(
         llm_client.client,
@@ -343,6 +654,58 @@ def call_llm(
         user_prompt,
         max_tokens,
         temperature,
+        timeout,
+    )
+
+
+async def acall_llm(
+    llm_client: LLMClient,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int = 3000,
+    temperature: float = 1.0,
+    timeout: float | None = None,
+) -> str:
+    """Awaitable ``call_llm`` for callers that fan out on one event loop.
+
+    The Agent SDK provider is awaited natively, so concurrent calls share the
+    caller's loop instead of each starting its own via ``asyncio.run``. The
+    key-based SDK clients are synchronous and run on a worker thread. The
+    provider client applies ``timeout`` per HTTP phase (connect, each read), so
+    a slow trickle of bytes could outlast it; ``asyncio.wait_for`` makes it one
+    overall deadline for the caller. A worker thread cannot be cancelled, so the
+    per-phase limit on the request is still what ends the thread.
+
+    Args:
+        llm_client: LLMClient instance.
+        system_prompt: System/context prompt.
+        user_prompt: User message.
+        max_tokens: Maximum tokens in response.
+        temperature: Sampling temperature (0-2).
+        timeout: As for ``call_llm``.
+
+    Returns:
+        Response text from LLM.
+
+    Raises:
+        TimeoutError: If ``timeout`` elapses first.
+
+    """
+    if llm_client.provider == "agent_sdk":
+        return await _acall_agent_sdk(
+            system_prompt, user_prompt, max_tokens, temperature, timeout=timeout
+        )
+    return await asyncio.wait_for(
+        asyncio.to_thread(
+            call_llm,
+            llm_client,
+            system_prompt,
+            user_prompt,
+            max_tokens,
+            temperature,
+            timeout,
+        ),
+        timeout,
     )
 
 
@@ -353,15 +716,27 @@ def _call_anthropic(
     user_prompt: str,
     max_tokens: int,
     temperature: float,
+    timeout: float | None = None,
 ) -> str:
     """Call Anthropic API."""
-    response = client.messages.create(
-        model=model,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_prompt}],
-    )
+    request = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+    if timeout is None:
+        response = client.messages.create(**request)
+    else:
+        from anthropic import APITimeoutError
+
+        # A retried timeout would run past the caller's deadline.
+        client = client.with_options(timeout=timeout, max_retries=0)
+        try:
+            response = client.messages.create(**request)
+        except APITimeoutError as exc:
+            raise TimeoutError(f"Anthropic request exceeded {timeout}s") from exc
 
     try:
         from scripts.token_usage import log_token_usage
@@ -385,17 +760,29 @@ def _call_openai(
     user_prompt: str,
     max_tokens: int,
     temperature: float,
+    timeout: float | None = None,
 ) -> str:
     """Call OpenAI API."""
-    response = client.chat.completions.create(
-        model=model,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        messages=[
+    request = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-    )
+    }
+    if timeout is None:
+        response = client.chat.completions.create(**request)
+    else:
+        from openai import APITimeoutError
+
+        # A retried timeout would run past the caller's deadline.
+        client = client.with_options(timeout=timeout, max_retries=0)
+        try:
+            response = client.chat.completions.create(**request)
+        except APITimeoutError as exc:
+            raise TimeoutError(f"OpenAI request exceeded {timeout}s") from exc
 
     try:
         from scripts.token_usage import log_token_usage
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Materialised per-page rollups for data/performance.db.
+
+The GA4 ETL stores one ``article_performance`` row per (page, date), and every
+reader wants per-page aggregates. Rather than ``GROUP BY page_path`` over the
+whole history on each read, ``page_rollup`` keeps one row per page:
+
+- GA4 columns are running sums plus a row count, maintained by SQLite
+  triggers on ``article_performance``. An insert adds to the page's row in
+  O(1); a delete or update (retention, upserts) recomputes just that page.
+  Because the triggers live in the database, any writer keeps the rollup
+  consistent, not only the ETL scripts.
+- Search columns hold the latest GSC aggregate for the page and are written
+  by ``scripts/gsc_etl.py`` via :func:`upsert_search_rollup`.
+
+Averages are derived as ``sum / row_count`` so they match ``AVG()`` over the
+daily rows; ``avg_composite_score`` is also stored so rankings use an index.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import urlparse
+
+CREATE_ROLLUP_SQL = """
+CREATE TABLE IF NOT EXISTS page_rollup (
+    page_path            TEXT PRIMARY KEY,
+    page_title           TEXT,
+    row_count            INTEGER NOT NULL DEFAULT 0,
+    total_pageviews      INTEGER NOT NULL DEFAULT 0,
+    sum_engagement_rate  REAL NOT NULL DEFAULT 0,
+    sum_engagement_time  REAL NOT NULL DEFAULT 0,
+    sum_scroll_depth     REAL NOT NULL DEFAULT 0,
+    sum_composite_score  REAL NOT NULL DEFAULT 0,
+    avg_composite_score  REAL NOT NULL DEFAULT 0,
+    search_impressions   INTEGER,
+    search_clicks        INTEGER,
+    search_ctr           REAL,
+    search_position      REAL
+);
+CREATE INDEX IF NOT EXISTS idx_page_rollup_score
+    ON page_rollup (avg_composite_score);
+"""
+
+# The GA4 half of a rollup row, aggregated from the daily table. Shared by the
+# backfill, the delete/update triggers and the read-only fallback.
+ROLLUP_SELECT_SQL = """
+SELECT
+    page_path,
+    MAX(page_title) AS page_title,
+    COUNT(*) AS row_count,
+    COALESCE(SUM(pageviews), 0) AS total_pageviews,
+    COALESCE(SUM(engagement_rate), 0) AS sum_engagement_rate,
+    COALESCE(SUM(avg_engagement_time), 0) AS sum_engagement_time,
+    COALESCE(SUM(scroll_depth_rate), 0) AS sum_scroll_depth,
+    COALESCE(SUM(composite_score), 0) AS sum_composite_score,
+    COALESCE(AVG(composite_score), 0) AS avg_composite_score
+FROM article_performance
+"""
+
+_UPSERT_GA4_SQL = f"""
+INSERT INTO page_rollup
+    (page_path, page_title, row_count, total_pageviews, sum_engagement_rate,
+     sum_engagement_time, sum_scroll_depth, sum_composite_score,
+     avg_composite_score)
+{ROLLUP_SELECT_SQL} {{where}} GROUP BY page_path
+ON CONFLICT (page_path) DO UPDATE SET
+    page_title = excluded.page_title,
+    row_count = excluded.row_count,
+    total_pageviews = excluded.total_pageviews,
+    sum_engagement_rate = excluded.sum_engagement_rate,
+    sum_engagement_time = excluded.sum_engagement_time,
+    sum_scroll_depth = excluded.sum_scroll_depth,
+    sum_composite_score = excluded.sum_composite_score,
+    avg_composite_score = excluded.avg_composite_score
+"""
+
+
+_ZERO_GA4_SQL = """
+UPDATE page_rollup SET
+    row_count = 0, total_pageviews = 0, sum_engagement_rate = 0,
+    sum_engagement_time = 0, sum_scroll_depth = 0,
+    sum_composite_score = 0, avg_composite_score = 0
+"""
+
+
+def _recompute_page(ref: str) -> str:
+    """Trigger body that rebuilds the rollup row for ``<ref>.page_path``."""
+    return (
+        _UPSERT_GA4_SQL.format(where=f"WHERE page_path = {ref}.page_path")
+        + ";\n"
+        + f"""{_ZERO_GA4_SQL}
+    WHERE page_path = {ref}.page_path
+      AND NOT EXISTS (
+          SELECT 1 FROM article_performance WHERE page_path = {ref}.page_path
+      );
+"""
+    )
+
+
+_TRIGGERS: dict[str, str] = {
+    "page_rollup_ai": """
+CREATE TRIGGER IF NOT EXISTS page_rollup_ai AFTER INSERT ON article_performance
+BEGIN
+    INSERT INTO page_rollup
+        (page_path, page_title, row_count, total_pageviews,
+         sum_engagement_rate, sum_engagement_time, sum_scroll_depth,
+         sum_composite_score, avg_composite_score)
+    VALUES (
+        NEW.page_path, NEW.page_title, 1, COALESCE(NEW.pageviews, 0),
+        COALESCE(NEW.engagement_rate, 0), COALESCE(NEW.avg_engagement_time, 0),
+        COALESCE(NEW.scroll_depth_rate, 0), COALESCE(NEW.composite_score, 0),
+        COALESCE(NEW.composite_score, 0)
+    )
+    ON CONFLICT (page_path) DO UPDATE SET
+        page_title = CASE
+            WHEN page_title IS NULL OR excluded.page_title > page_title
+            THEN excluded.page_title ELSE page_title END,
+        row_count = row_count + 1,
+        total_pageviews = total_pageviews + excluded.total_pageviews,
+        sum_engagement_rate = sum_engagement_rate + excluded.sum_engagement_rate,
+        sum_engagement_time = sum_engagement_time + excluded.sum_engagement_time,
+        sum_scroll_depth = sum_scroll_depth + excluded.sum_scroll_depth,
+        sum_composite_score = sum_composite_score + excluded.sum_composite_score,
+        avg_composite_score =
+            (sum_composite_score + excluded.sum_composite_score) / (row_count + 1);
+END
+""",
+    "page_rollup_ad": f"""
+CREATE TRIGGER IF NOT EXISTS page_rollup_ad AFTER DELETE ON article_performance
+BEGIN
+    {_recompute_page("OLD")}
+END
+""",
+    "page_rollup_au": f"""
+CREATE TRIGGER IF NOT EXISTS page_rollup_au AFTER UPDATE ON article_performance
+BEGIN
+    {_recompute_page("OLD")}
+    {_recompute_page("NEW")}
+END
+""",
+}
+
+
+def _exists(conn: sqlite3.Connection, kind: str, name: str) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?",
+        (kind, name),
+    ).fetchone()
+    return row is not None
+
+
+def refresh_page_rollup(
+    conn: sqlite3.Connection,
+    pages: Iterable[str] | None = None,
+) -> None:
+    """Recompute the GA4 columns of ``pages`` (every page when None).
+
+    Pages with no daily rows left are zeroed rather than deleted, so their
+    search columns survive. Does not commit.
+    """
+    if pages is None:
+        conn.execute(_ZERO_GA4_SQL)
+        conn.execute(_UPSERT_GA4_SQL.format(where="WHERE true"))
+        return
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _rollup_pages (page_path TEXT)")
+    conn.execute("DELETE FROM _rollup_pages")
+    conn.executemany("INSERT INTO _rollup_pages VALUES (?)", ((p,) for p in set(pages)))
+    scope = "WHERE page_path IN (SELECT page_path FROM _rollup_pages)"
+    conn.execute(f"{_ZERO_GA4_SQL} {scope}")
+    conn.execute(_UPSERT_GA4_SQL.format(where=scope))
+    conn.execute("DELETE FROM _rollup_pages")
+
+
+def rollup_is_current(conn: sqlite3.Connection) -> bool:
+    """Whether ``page_rollup`` exists and its triggers are keeping it current.
+
+    Read-only: readers use this to decide between the rollup and aggregating
+    the daily rows themselves; only the ETLs call :func:`ensure_page_rollup`.
+    """
+    return _exists(conn, "table", "page_rollup") and all(
+        _exists(conn, "trigger", name) for name in _TRIGGERS
+    )
+
+
+def ensure_page_rollup(conn: sqlite3.Connection) -> None:
+    """Create ``page_rollup`` and its triggers, backfilling when first wired.
+
+    Idempotent. The triggers need ``article_performance`` to exist, so they
+    are added (and the GA4 columns rebuilt from the existing daily rows) the
+    first time this runs after that table appears — or after a bulk load
+    that dropped them was interrupted. Commits.
+    """
+    conn.executescript(CREATE_ROLLUP_SQL)
+    if _exists(conn, "table", "article_performance") and not all(
+        _exists(conn, "trigger", name) for name in _TRIGGERS
+    ):
+        refresh_page_rollup(conn)
+        for ddl in _TRIGGERS.values():
+            conn.execute(ddl)
+    conn.commit()
+
+
+@contextmanager
+def bulk_rollup(
+    conn: sqlite3.Connection,
+    pages: Iterable[str] | None = None,
+) -> Iterator[None]:
+    """Suspend the per-row triggers around a bulk write to ``article_performance``.
+
+    Per-row maintenance is O(1) for a plain insert but recomputes the page
+    for every upserted or deleted row. For a backfill or a compaction it is
+    cheaper to write with the triggers off and recompute the touched
+    ``pages`` (every page when None) once afterwards. Commits on success; if
+    the write fails the transaction is rolled back, triggers included.
+    """
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    for name in _TRIGGERS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    try:
+        yield
+        refresh_page_rollup(conn, pages)
+        for ddl in _TRIGGERS.values():
+            conn.execute(ddl)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def page_path_of(page_url: str) -> str:
+    """GSC reports full URLs; GA4 and the rollup key on the path."""
+    parsed = urlparse(page_url)
+    return (parsed.path or "/") if parsed.scheme else page_url
+
+
+def upsert_search_rollup(
+    conn: sqlite3.Connection,
+    page_rows: list[dict[str, Any]],
+) -> None:
+    """Replace each page's search columns with the latest GSC aggregate.
+
+    GSC rows are trailing-window aggregates, so they overwrite rather than
+    accumulate. Does not commit; the caller's transaction covers it.
+    """
+    conn.executemany(
+        """
+        INSERT INTO page_rollup
+            (page_path, search_impressions, search_clicks, search_ctr,
+             search_position)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (page_path) DO UPDATE SET
+            search_impressions = excluded.search_impressions,
+            search_clicks = excluded.search_clicks,
+            search_ctr = excluded.search_ctr,
+            search_position = excluded.search_position
+        """,
+        [
+            (
+                page_path_of(r["page_url"]),
+                r["total_impressions"],
+                r["total_clicks"],
+                r["avg_ctr"],
+                r["avg_position"],
+            )
+            for r in page_rows
+        ],
+    )
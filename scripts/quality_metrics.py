@@ -9,6 +9,11 @@ a quality dashboard JSON with:
 - Quality score trends (weekly averages, per-dimension)
 - Revision loop frequency
 
+Evaluations are parsed once per run into :class:`EvalColumns` — NumPy column
+arrays (scores, week codes, a failure-mode count matrix, joined retries) —
+and every metric is a vectorised reduction over those columns, so the
+dashboard stays fast as the evaluation history grows.
+
 Output is written to ``logs/quality_dashboard.json``.
 
 Usage::
@@ -22,13 +27,24 @@ Usage::
 
 import logging
 import re
-from collections import defaultdict
-from datetime import UTC, datetime
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import orjson
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from scripts import eval_store  # noqa: E402
+from scripts.eval_store import EvalStore  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -54,6 +70,226 @@ _DIMENSIONS: list[str] = [
     "visual_engagement",
 ]
 
+_FAILURE_MODES: list[str] = [
+    "banned_opening",
+    "unverified_claims",
+    "missing_references",
+    "poor_evidence",
+    "banned_phrases",
+    "american_spellings",
+    "missing_frontmatter_fields",
+    "insufficient_word_count",
+    "missing_image",
+    "missing_chart",
+]
+_MODE_INDEX: dict[str, int] = {mode: i for i, mode in enumerate(_FAILURE_MODES)}
+# Upper bound on failure hits per eval (missing_references can hit twice).
+_MAX_HITS: int = len(_FAILURE_MODES) + 1
+_NOT_SEEN: int = np.iinfo(np.int64).max
+
+_PLACEHOLDERS_RE = re.compile(r"(\d+) placeholders")
+_WORDS_RE = re.compile(r"(\d+) words")
+
+_ROLLING_WEEKS: int = 4
+_SCORE_PERCENTILES: tuple[int, ...] = (10, 25, 50, 75, 90)
+
+
+def _failure_hits(record: dict[str, Any]) -> list[str]:
+    """Return the failure modes detected in one valid eval, in detection order.
+
+    A mode appears once per matching check, so ``missing_references`` can
+    appear twice (evidence and structure details).
+    """
+    hits: list[str] = []
+    details = record.get("details", {})
+    scores = record.get("scores", {})
+
+    # Opening failures
+    if "Banned opening" in details.get("opening_quality", ""):
+        hits.append("banned_opening")
+
+    # Evidence failures
+    evidence_detail = details.get("evidence_sourcing", "")
+    m = _PLACEHOLDERS_RE.search(evidence_detail)
+    if m and int(m.group(1)) > 0:
+        hits.append("unverified_claims")
+    if "0 references" in evidence_detail:
+        hits.append("missing_references")
+    if scores.get("evidence_sourcing", 10) <= 4:
+        hits.append("poor_evidence")
+
+    # Voice failures
+    voice_detail = details.get("voice_consistency", "")
+    if "banned:" in voice_detail:
+        hits.append("banned_phrases")
+    if "American spellings" in voice_detail:
+        hits.append("american_spellings")
+
+    # Structure failures
+    structure_detail = details.get("structure", "")
+    if "missing:" in structure_detail:
+        hits.append("missing_frontmatter_fields")
+    if "references: no" in structure_detail:
+        hits.append("missing_references")
+    m = _WORDS_RE.search(structure_detail)
+    if m and int(m.group(1)) < 800:
+        hits.append("insufficient_word_count")
+
+    # Visual failures
+    visual_detail = details.get("visual_engagement", "")
+    if "image: no" in visual_detail:
+        hits.append("missing_image")
+    if "chart embedded: no" in visual_detail:
+        hits.append("missing_chart")
+
+    return hits
+
+
+def _ranked_modes(counts: np.ndarray, first_seen: np.ndarray) -> list[str]:
+    """Failure modes with a non-zero count, most frequent first.
+
+    Ties keep the order the modes were first seen in, matching a stable sort
+    over a dict that was filled in record order.
+    """
+    present = np.flatnonzero(counts)
+    order = present[np.lexsort((first_seen[present], -counts[present]))]
+    return [_FAILURE_MODES[i] for i in order]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Columnar store
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class EvalColumns:
+    """Column arrays over one run's evaluations, shared by every metric.
+
+    ``published`` and ``first_attempt`` cover every record (for pass rates).
+    The remaining arrays cover valid records only, in file order:
+    ``scores`` has one column per dimension (NaN when absent), ``failures``
+    counts each failure mode, and ``failure_rank`` orders first sightings
+    (``_NOT_SEEN`` when a mode is absent). ``week`` indexes ``weeks``, or is
+    -1 when the timestamp does not parse.
+    """
+
+    total_records: int
+    has_runs: bool
+    published: np.ndarray
+    first_attempt: np.ndarray
+    total_score: np.ndarray
+    percentage: np.ndarray
+    retries: np.ndarray
+    scores: np.ndarray
+    failures: np.ndarray
+    failure_rank: np.ndarray
+    week: np.ndarray
+    weeks: list[str]
+
+    @classmethod
+    def from_records(
+        cls,
+        evals: Iterable[dict[str, Any]],
+        runs: list[dict[str, Any]] | None = None,
+    ) -> "EvalColumns":
+        """Parse eval records (joined to their runs) into columns in one pass.
+
+        Invalid records are logged and skipped everywhere except the pass-rate
+        columns.
+
+        Args:
+            evals: Article evaluation records; any iterable, consumed once.
+            runs: Optional list of pipeline run records.
+
+        Returns:
+            The populated columns.
+
+        """
+        runs_by_file: dict[str, dict[str, Any]] = {
+            r["article_filename"]: r for r in runs or [] if "article_filename" in r
+        }
+        published: list[bool] = []
+        first_attempt: list[bool] = []
+        total_score: list[float] = []
+        percentage: list[float] = []
+        retries: list[float] = []
+        scores: list[list[float]] = []
+        failure_rows: list[int] = []
+        failure_modes: list[int] = []
+        failure_pos: list[int] = []
+        week_labels: list[str | None] = []
+        week_of_day: dict[date, str] = {}
+
+        total_records = 0
+        for record in evals:
+            total_records += 1
+            run = (
+                runs_by_file.get(record.get("article_filename", ""), {})
+                if isinstance(record, dict)
+                else {}
+            )
+            published.append(run.get("status") == "published")
+            first_attempt.append(published[-1] and run.get("retries", 0) == 0)
+
+            if not QualityMetricsPipeline._is_valid_eval(record):
+                logger.warning(
+                    "Skipping invalid eval record: %s",
+                    record.get("article_filename", "<unknown>")
+                    if isinstance(record, dict)
+                    else "<unknown>",
+                )
+                continue
+
+            row = len(total_score)
+            total_score.append(record["total_score"])
+            percentage.append(record["percentage"])
+            retries.append(run.get("retries", 0))
+            record_scores = record["scores"]
+            scores.append(
+                [float(record_scores.get(d, np.nan)) for d in _DIMENSIONS],
+            )
+            for pos, mode in enumerate(_failure_hits(record)):
+                failure_rows.append(row)
+                failure_modes.append(_MODE_INDEX[mode])
+                failure_pos.append(row * _MAX_HITS + pos)
+            try:
+                day = datetime.fromisoformat(record["timestamp"]).date()
+                if day not in week_of_day:
+                    week_of_day[day] = day.strftime("%G-W%V")
+                week_labels.append(week_of_day[day])
+            except (KeyError, ValueError) as exc:
+                logger.warning("Skipping eval with invalid timestamp: %s", exc)
+                week_labels.append(None)
+
+        n = len(total_score)
+        failures = np.zeros((n, len(_FAILURE_MODES)), dtype=np.int64)
+        np.add.at(failures, (failure_rows, failure_modes), 1)
+        failure_rank = np.full_like(failures, _NOT_SEEN)
+        np.minimum.at(failure_rank, (failure_rows, failure_modes), failure_pos)
+
+        dated = [i for i, label in enumerate(week_labels) if label is not None]
+        weeks, codes = np.unique(
+            np.array([week_labels[i] for i in dated], dtype=str),
+            return_inverse=True,
+        )
+        week = np.full(n, -1, dtype=np.int64)
+        week[dated] = codes
+
+        return cls(
+            total_records=total_records,
+            has_runs=bool(runs),
+            published=np.array(published, dtype=bool),
+            first_attempt=np.array(first_attempt, dtype=bool),
+            total_score=np.array(total_score, dtype=float),
+            percentage=np.array(percentage, dtype=float),
+            retries=np.array(retries, dtype=float),
+            scores=np.array(scores, dtype=float).reshape(n, len(_DIMENSIONS)),
+            failures=failures,
+            failure_rank=failure_rank,
+            week=week,
+            weeks=[str(w) for w in weeks],
+        )
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Pipeline
@@ -69,19 +305,21 @@ class QualityMetricsPipeline:
 
     def __init__(
         self,
-        evals_path: str | Path = "logs/article_evals.json",
+        evals_path: str | Path | None = None,
         runs_path: str | Path = "logs/pipeline_runs.json",
         dashboard_path: str | Path = "logs/quality_dashboard.json",
     ) -> None:
         """Initialise the pipeline with configurable file paths.
 
         Args:
-            evals_path: Path to article evaluations JSON (from ArticleEvaluator).
+            evals_path: Path to the article evaluation store (JSONL, from
+                ArticleEvaluator); a legacy ``.json`` array is also accepted.
+                Defaults to ``eval_store.EVALS_PATH``.
             runs_path: Path to pipeline run metadata JSON (optional).
             dashboard_path: Path to write the output dashboard JSON.
 
         """
-        self.evals_path = Path(evals_path)
+        self.evals_path = Path(evals_path or eval_store.EVALS_PATH)
         self.runs_path = Path(runs_path)
         self.dashboard_path = Path(dashboard_path)
 
@@ -90,20 +328,32 @@ class QualityMetricsPipeline:
     # ─────────────────────────────────────────────────────────────────────────
 
     def _load_evals(self) -> list[dict[str, Any]]:
-        """Load article evaluations from JSON log.
+        """Load article evaluations into a list.
 
         Returns:
             List of eval records, or empty list if file absent or corrupt.
 
+        """
+        return list(self._iter_evals())
+
+    def _iter_evals(self) -> Iterator[dict[str, Any]]:
+        """Stream article evaluations from the eval store.
+
+        Yields:
+            Eval records in append order. Nothing if the file is absent or
+            (for a legacy JSON array) corrupt; corrupt JSONL lines are skipped.
+
         """
         if not self.evals_path.exists():
             logger.info("Evals file not found: %s", self.evals_path)
-            return []
+            return
+        if self.evals_path.suffix == ".jsonl":
+            yield from EvalStore(self.evals_path).iter_records()
+            return
         try:
-            return orjson.loads(self.evals_path.read_bytes())
+            yield from orjson.loads(self.evals_path.read_bytes())
         except Exception as exc:
             logger.error("Failed to load evals from %s: %s", self.evals_path, exc)
-            return []
 
     def _load_pipeline_runs(self) -> list[dict[str, Any]]:
         """Load pipeline run metadata from JSON log.
@@ -129,9 +379,19 @@ class QualityMetricsPipeline:
     # Metric computation
     # ─────────────────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _columns(
+        evals: list[dict[str, Any]] | EvalColumns,
+        runs: list[dict[str, Any]] | None = None,
+    ) -> EvalColumns:
+        """Return *evals* as columns, parsing them unless already parsed."""
+        if isinstance(evals, EvalColumns):
+            return evals
+        return EvalColumns.from_records(evals, runs)
+
     def calculate_pass_rates(
         self,
-        evals: list[dict[str, Any]],
+        evals: list[dict[str, Any]] | EvalColumns,
         runs: list[dict[str, Any]],
     ) -> dict[str, Any]:
         """Calculate article pass rates.
@@ -140,7 +400,8 @@ class QualityMetricsPipeline:
         Falls back to ``percentage >= _PASS_THRESHOLD_PCT`` when runs are absent.
 
         Args:
-            evals: List of article evaluation records.
+            evals: Article evaluation records, or columns built from them
+                together with *runs*.
             runs: List of pipeline run records (may be empty).
 
         Returns:
@@ -148,7 +409,8 @@ class QualityMetricsPipeline:
             ``overall_publish_rate``.
 
         """
-        total = len(evals)
+        columns = self._columns(evals, runs)
+        total = columns.total_records
         if total == 0:
             return {
                 "total_articles": 0,
@@ -156,27 +418,12 @@ class QualityMetricsPipeline:
                 "overall_publish_rate": 0.0,
             }
 
-        if runs:
-            runs_by_file: dict[str, dict[str, Any]] = {
-                r["article_filename"]: r for r in runs if "article_filename" in r
-            }
-            first_attempt = 0
-            published = 0
-            for e in evals:
-                run = runs_by_file.get(e.get("article_filename", ""), {})
-                if run.get("status") == "published":
-                    published += 1
-                    if run.get("retries", 0) == 0:
-                        first_attempt += 1
+        if columns.has_runs:
+            first_attempt = int(np.count_nonzero(columns.first_attempt))
+            published = int(np.count_nonzero(columns.published))
         else:
-            passing = [
-                e
-                for e in evals
-                if self._is_valid_eval(e)
-                and e.get("percentage", 0) >= _PASS_THRESHOLD_PCT
-            ]
-            first_attempt = len(passing)
-            published = len(passing)
+            passing = columns.percentage >= _PASS_THRESHOLD_PCT
+            first_attempt = published = int(np.count_nonzero(passing))
 
         return {
             "total_articles": total,
@@ -184,83 +431,45 @@ class QualityMetricsPipeline:
             "overall_publish_rate": round(published / total, 4),
         }
 
-    def categorize_failure_modes(self, evals: list[dict[str, Any]]) -> dict[str, int]:
+    def categorize_failure_modes(
+        self,
+        evals: list[dict[str, Any]] | EvalColumns,
+    ) -> dict[str, int]:
         """Categorise and count failure modes from evaluation details.
 
         Skips records that do not pass ``_is_valid_eval`` and logs a warning.
 
         Args:
-            evals: List of article evaluation records.
+            evals: Article evaluation records, or columns built from them.
 
         Returns:
-            Dict mapping failure mode name to occurrence count.
+            Dict mapping failure mode name to occurrence count, in the order
+            each mode was first seen.
 
         """
-        counts: dict[str, int] = defaultdict(int)
-
-        for eval_record in evals:
-            if not self._is_valid_eval(eval_record):
-                logger.warning(
-                    "Skipping invalid eval record: %s",
-                    eval_record.get("article_filename", "<unknown>"),
-                )
-                continue
-
-            details = eval_record.get("details", {})
-            scores = eval_record.get("scores", {})
-
-            # Opening failures
-            opening_detail = details.get("opening_quality", "")
-            if "Banned opening" in opening_detail:
-                counts["banned_opening"] += 1
-
-            # Evidence failures
-            evidence_detail = details.get("evidence_sourcing", "")
-            m = re.search(r"(\d+) placeholders", evidence_detail)
-            if m and int(m.group(1)) > 0:
-                counts["unverified_claims"] += 1
-            if "0 references" in evidence_detail:
-                counts["missing_references"] += 1
-            if scores.get("evidence_sourcing", 10) <= 4:
-                counts["poor_evidence"] += 1
-
-            # Voice failures
-            voice_detail = details.get("voice_consistency", "")
-            if "banned:" in voice_detail:
-                counts["banned_phrases"] += 1
-            if "American spellings" in voice_detail:
-                counts["american_spellings"] += 1
-
-            # Structure failures
-            structure_detail = details.get("structure", "")
-            if "missing:" in structure_detail:
-                counts["missing_frontmatter_fields"] += 1
-            if "references: no" in structure_detail:
-                counts["missing_references"] += 1
-            m = re.search(r"(\d+) words", structure_detail)
-            if m and int(m.group(1)) < 800:
-                counts["insufficient_word_count"] += 1
-
-            # Visual failures
-            visual_detail = details.get("visual_engagement", "")
-            if "image: no" in visual_detail:
-                counts["missing_image"] += 1
-            if "chart embedded: no" in visual_detail:
-                counts["missing_chart"] += 1
-
-        return dict(counts)
+        columns = self._columns(evals)
+        counts = columns.failures.sum(axis=0)
+        first_seen = columns.failure_rank.min(axis=0, initial=_NOT_SEEN)
+        present = np.flatnonzero(counts)
+        return {
+            _FAILURE_MODES[i]: int(counts[i])
+            for i in present[np.argsort(first_seen[present], kind="stable")]
+        }
 
     def compute_score_trends(
         self,
-        evals: list[dict[str, Any]],
+        evals: list[dict[str, Any]] | EvalColumns,
         runs: list[dict[str, Any]] | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, list[float]]]:
         """Compute weekly score trends and per-dimension trend arrays.
 
-        Invalid or unparseable records are skipped with a warning.
+        Invalid or unparseable records are skipped with a warning. Each week
+        also carries ``rolling_avg_score``: the average score over the last
+        ``_ROLLING_WEEKS`` weeks that had evaluations.
 
         Args:
-            evals: List of article evaluation records.
+            evals: Article evaluation records, or columns built from them
+                together with *runs*.
             runs: Optional list of pipeline run records for retry metrics.
 
         Returns:
@@ -269,70 +478,58 @@ class QualityMetricsPipeline:
             when the lists are empty.
 
         """
-        by_week: dict[str, list[dict[str, Any]]] = defaultdict(list)
-
-        for eval_record in evals:
-            if not self._is_valid_eval(eval_record):
-                logger.warning(
-                    "Skipping invalid eval in score trends: %s",
-                    eval_record.get("article_filename", "<unknown>"),
-                )
-                continue
-            try:
-                ts = datetime.fromisoformat(eval_record["timestamp"])
-                week_key = ts.strftime("%G-W%V")
-                by_week[week_key].append(eval_record)
-            except (KeyError, ValueError) as exc:
-                logger.warning("Skipping eval with invalid timestamp: %s", exc)
-
-        # Index runs by filename for per-week retry lookup
-        runs_by_file: dict[str, dict[str, Any]] = (
-            {r["article_filename"]: r for r in runs if "article_filename" in r}
-            if runs
-            else {}
-        )
+        columns = self._columns(evals, runs)
+        dated = columns.week >= 0
+        codes = columns.week[dated]
+        n_weeks = len(columns.weeks)
+
+        def per_week(values: np.ndarray) -> np.ndarray:
+            return np.bincount(codes, weights=values[dated], minlength=n_weeks)
+
+        count = np.bincount(codes, minlength=n_weeks)
+        score_sum = per_week(columns.total_score)
+        published = per_week(columns.percentage >= _PASS_THRESHOLD_PCT)
+        retries_sum = per_week(columns.retries)
+
+        failures = np.zeros((n_weeks, len(_FAILURE_MODES)), dtype=np.int64)
+        np.add.at(failures, codes, columns.failures[dated])
+        first_seen = np.full_like(failures, _NOT_SEEN)
+        np.minimum.at(first_seen, codes, columns.failure_rank[dated])
+
+        scores = columns.scores[dated]
+        has_score = ~np.isnan(scores)
+        dim_count = np.zeros((n_weeks, len(_DIMENSIONS)))
+        dim_sum = np.zeros((n_weeks, len(_DIMENSIONS)))
+        np.add.at(dim_count, codes, has_score)
+        np.add.at(dim_sum, codes, np.where(has_score, scores, 0.0))
+
+        # Trailing sums over the last _ROLLING_WEEKS rows via cumulative sums.
+        window_sum = np.cumsum(score_sum)
+        window_count = np.cumsum(count)
+        window_sum[_ROLLING_WEEKS:] -= window_sum[:-_ROLLING_WEEKS].copy()
+        window_count[_ROLLING_WEEKS:] -= window_count[:-_ROLLING_WEEKS].copy()
 
-        dimension_weekly: dict[str, list[float]] = {d: [] for d in _DIMENSIONS}
         weekly_trends: list[dict[str, Any]] = []
-
-        for week in sorted(by_week.keys()):
-            week_evals = by_week[week]
-            count = len(week_evals)
-            if count == 0:
-                continue
-
-            avg_score = sum(e["total_score"] for e in week_evals) / count
-            published = sum(
-                1 for e in week_evals if e.get("percentage", 0) >= _PASS_THRESHOLD_PCT
-            )
-            failed = count - published
-            top_failures = self._top_failures_for_evals(week_evals)
-
-            week_retries = [
-                runs_by_file.get(e.get("article_filename", ""), {}).get("retries", 0)
-                for e in week_evals
-            ]
-            avg_retries = round(sum(week_retries) / len(week_retries), 2)
-
+        dimension_weekly: dict[str, list[float]] = {d: [] for d in _DIMENSIONS}
+        for w, week in enumerate(columns.weeks):
             weekly_trends.append(
                 {
                     "week": week,
-                    "articles_generated": count,
-                    "published": published,
-                    "failed": failed,
-                    "avg_score": round(avg_score, 2),
-                    "avg_retries": avg_retries,
-                    "top_failure_modes": top_failures,
+                    "articles_generated": int(count[w]),
+                    "published": int(published[w]),
+                    "failed": int(count[w] - published[w]),
+                    "avg_score": round(float(score_sum[w] / count[w]), 2),
+                    "rolling_avg_score": round(
+                        float(window_sum[w] / window_count[w]), 2
+                    ),
+                    "avg_retries": round(float(retries_sum[w] / count[w]), 2),
+                    "top_failure_modes": _ranked_modes(failures[w], first_seen[w])[:3],
                 },
             )
-
-            for dim in _DIMENSIONS:
-                dim_scores = [
-                    e["scores"][dim] for e in week_evals if dim in e.get("scores", {})
-                ]
-                if dim_scores:
+            for d, dim in enumerate(_DIMENSIONS):
+                if dim_count[w, d]:
                     dimension_weekly[dim].append(
-                        round(sum(dim_scores) / len(dim_scores), 2),
+                        round(float(dim_sum[w, d] / dim_count[w, d]), 2),
                     )
 
         return weekly_trends, dimension_weekly
@@ -358,32 +555,22 @@ class QualityMetricsPipeline:
                 "top_revision_triggers": [],
             }
 
-        retries = [r.get("retries", 0) for r in runs]
-        total = len(retries)
-        avg = sum(retries) / total if total > 0 else 0.0
-        zero = sum(1 for r in retries if r == 0)
-        one = sum(1 for r in retries if r == 1)
-        two_plus = sum(1 for r in retries if r >= 2)
+        retries = np.array([r.get("retries", 0) for r in runs], dtype=float)
+        total = retries.size
 
-        trigger_counts: dict[str, int] = defaultdict(int)
-        for run in runs:
-            for reason in run.get("failure_reasons", []):
-                trigger_counts[reason] += 1
+        def pct(mask: np.ndarray) -> float:
+            return round(float(np.count_nonzero(mask)) / total * 100, 1)
 
-        top_triggers = sorted(
-            trigger_counts,
-            key=lambda k: trigger_counts[k],
-            reverse=True,
-        )[:3]
+        triggers = Counter(
+            reason for run in runs for reason in run.get("failure_reasons", [])
+        )
 
         return {
-            "avg_retries": round(avg, 2),
-            "zero_revision_pct": round(zero / total * 100, 1) if total > 0 else 0.0,
-            "one_revision_pct": round(one / total * 100, 1) if total > 0 else 0.0,
-            "two_plus_revision_pct": (
-                round(two_plus / total * 100, 1) if total > 0 else 0.0
-            ),
-            "top_revision_triggers": top_triggers,
+            "avg_retries": round(float(retries.mean()), 2),
+            "zero_revision_pct": pct(retries == 0),
+            "one_revision_pct": pct(retries == 1),
+            "two_plus_revision_pct": pct(retries >= 2),
+            "top_revision_triggers": [reason for reason, _ in triggers.most_common(3)],
         }
 
     def generate_alerts(
@@ -519,24 +706,28 @@ class QualityMetricsPipeline:
             ``skills/observability/SKILL.md``.
 
         """
-        evals = self._load_evals()
         runs = self._load_pipeline_runs()
+        columns = EvalColumns.from_records(self._iter_evals(), runs)
 
-        pass_rates = self.calculate_pass_rates(evals, runs)
-        failure_modes = self.categorize_failure_modes(evals)
-        weekly_trends, dimension_trends = self.compute_score_trends(evals, runs)
+        pass_rates = self.calculate_pass_rates(columns, runs)
+        failure_modes = self.categorize_failure_modes(columns)
+        weekly_trends, dimension_trends = self.compute_score_trends(columns, runs)
         revision_freq = self.compute_revision_frequency(runs)
 
-        valid_evals = [e for e in evals if self._is_valid_eval(e)]
-        avg_score = (
-            sum(e["total_score"] for e in valid_evals) / len(valid_evals)
-            if valid_evals
-            else 0.0
-        )
-        avg_pct = (
-            sum(e["percentage"] for e in valid_evals) / len(valid_evals)
-            if valid_evals
-            else 0.0
+        scored = columns.total_score.size
+        avg_score = float(columns.total_score.mean()) if scored else 0.0
+        avg_pct = float(columns.percentage.mean()) if scored else 0.0
+        score_percentiles = (
+            {
+                f"p{q}": round(float(v), 2)
+                for q, v in zip(
+                    _SCORE_PERCENTILES,
+                    np.percentile(columns.total_score, _SCORE_PERCENTILES),
+                    strict=True,
+                )
+            }
+            if scored
+            else {}
         )
 
         summary: dict[str, Any] = {
@@ -550,6 +741,7 @@ class QualityMetricsPipeline:
         return {
             "generated_at": datetime.now(UTC).isoformat(),
             "summary": summary,
+            "score_percentiles": score_percentiles,
             "weekly_trends": weekly_trends,
             "dimension_trends": dimension_trends,
             "failure_mode_counts": failure_modes,
@@ -590,27 +782,12 @@ class QualityMetricsPipeline:
         required = {"scores", "total_score", "percentage", "timestamp"}
         return isinstance(record, dict) and required.issubset(record.keys())
 
-    def _top_failures_for_evals(self, evals: list[dict[str, Any]]) -> list[str]:
-        """Return the top-3 failure mode names for a collection of evals.
-
-        Args:
-            evals: List of eval records.
-
-        Returns:
-            List of up to three failure mode names, sorted by frequency.
-
-        """
-        modes = self.categorize_failure_modes(evals)
-        return sorted(modes, key=lambda k: modes[k], reverse=True)[:3]
-
 
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI entry point
 # ─────────────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
-    import sys
-
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     pipeline = QualityMetricsPipeline()
     result = pipeline.run()
@@ -33,17 +33,23 @@ from __future__ import annotations
 import argparse
 import logging
 import sqlite3
+import sys
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.telemetry.bus import emit  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Default DB path (overridable via DB_PATH env-var or function argument)
 # ---------------------------------------------------------------------------
-_REPO_ROOT = Path(__file__).parent.parent
 DEFAULT_DB_PATH = _REPO_ROOT / "data" / "metrics.db"
 
 # ---------------------------------------------------------------------------
@@ -180,6 +186,21 @@ def record_run(
         logger.info("Recorded run %s (%s / %s)", run_id, agent_name, status)
     finally:
         conn.close()
+    emit(
+        "recorded_run",
+        {
+            "run_id": run_id,
+            "timestamp": timestamp,
+            "agent_name": agent_name,
+            "topic": topic,
+            "editorial_score": editorial_score,
+            "gates_passed": gates_passed,
+            "token_count": token_count,
+            "cost_usd": cost_usd,
+            "duration_s": duration_s,
+            "status": status,
+        },
+    )
 
     return run_id
 
@@ -2,8 +2,9 @@
 """OpenAI Token Usage Logger
 
 Captures token consumption and estimated cost for every LLM API call.
-Usage data is appended to ~/.economist-agents/token-usage.jsonl and a
-summary line is printed to stdout.
+Usage data is emitted on the telemetry bus, whose background writer
+appends it to ~/.economist-agents/token-usage.jsonl, and a summary line is
+printed to stdout.
 
 Cost estimates are defined as module-level constants to make pricing
 updates easy.
@@ -23,9 +24,16 @@ from __future__ import annotations
 
 import logging
 import os
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.telemetry.bus import JsonlMirror, emit, flush  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -76,9 +84,10 @@ def log_token_usage(
 ) -> float:
     """Log token usage for a single LLM API call.
 
-    Appends a JSONL record to *log_file* (defaults to
-    ``~/.economist-agents/token-usage.jsonl``) and prints a one-line
-    summary to stdout.
+    Emits a record that the telemetry bus appends to *log_file* (defaults to
+    ``~/.economist-agents/token-usage.jsonl``) off the calling thread, and
+    prints a one-line summary to stdout. Call ``src.telemetry.flush()``
+    before reading the log back.
 
     Args:
         model: OpenAI model name used for the call.
@@ -91,8 +100,6 @@ def log_token_usage(
         Estimated cost in USD for this call.
 
     """
-    import orjson  # noqa: PLC0415 — deferred so module loads without orjson
-
     cost = estimate_cost(model, prompt_tokens, completion_tokens)
 
     record = {
@@ -113,14 +120,9 @@ def log_token_usage(
         f"est_cost=${cost:.3f}",
     )
 
-    # Persist to JSONL log
+    # Persist to JSONL log (written by the telemetry bus, off this thread)
     target = log_file if log_file is not None else _DEFAULT_LOG_FILE
-    try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        with target.open("ab") as fh:
-            fh.write(orjson.dumps(record) + b"\n")
-    except OSError as exc:
-        logger.warning("Could not write token-usage log to %s: %s", target, exc)
+    emit("token_usage", record, mirror=JsonlMirror(Path(target)))
 
     return cost
 
@@ -137,6 +139,7 @@ def read_usage_log(log_file: Path | None = None) -> list[dict]:
     """
     import orjson  # noqa: PLC0415
 
+    flush()  # include records this process emitted but the bus has not written
     target = log_file if log_file is not None else _DEFAULT_LOG_FILE
     if not target.exists():
         return []
@@ -243,8 +246,6 @@ def print_ci_summary(log_file: Path | None = None) -> None:
 
 if __name__ == "__main__":  # pragma: no cover
     # Quick smoke-test / manual inspection helper
-    import sys
-
     if len(sys.argv) > 1 and sys.argv[1] == "--summary":
         records = read_usage_log()
         by_model = summarise_usage(records)
@@ -342,13 +342,18 @@ def _run_web_searches(topic: str) -> tuple[str, dict[str, Any]]:
 
 def audit_article_stats(article: str, research_brief: str) -> str:
     """Strip sentences whose numeric claims are not in the research brief."""
+    return audit_stat_sentences(article, research_brief)[0]
+
+
+def audit_stat_sentences(article: str, research_brief: str) -> tuple[str, int]:
+    """Run :func:`audit_article_stats`; also return how many sentences it cut."""
     if article.strip().startswith("---"):
         parts = article.split("---", 2)
         if len(parts) >= 3:
             frontmatter = "---" + parts[1] + "---"
             body = parts[2]
         else:
-            return article
+            return article, 0
     else:
         frontmatter = ""
         body = article
@@ -392,7 +397,7 @@ def audit_article_stats(article: str, research_brief: str) -> str:
         )
 
     cleaned_body = " ".join(kept) + refs_section
-    return frontmatter + cleaned_body
+    return frontmatter + cleaned_body, removed_count
 
 
 # ─── Stage 4: deterministic editorial fixes ────────────────────────────
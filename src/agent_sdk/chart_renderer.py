@@ -13,6 +13,17 @@ render_chart(spec: dict, output_path: Path) -> Path
     Render a horizontal-bar chart to *output_path*. Returns the
     written path. Auto-creates parent directories.
 
+render_charts(jobs, max_workers=None) -> list[ChartResult]
+    Render many specs at once in a process pool. Each worker imports
+    matplotlib once and redraws one pre-styled figure, and a spec whose
+    PNG is already current (same :func:`spec_digest`) is skipped.
+
+spec_digest(spec: dict) -> str
+    Content hash of a spec plus :data:`RENDERER_VERSION`.
+
+load_manifest / is_current / was_rendered / record_render
+    Read and update the render manifest described below.
+
 Spec contract
 -------------
 ::
@@ -30,12 +41,46 @@ Spec contract
         ],
         "source": str,                # optional, shown bottom-left
     }
+
+Render manifest
+---------------
+Every directory :func:`render_charts` writes to holds a
+``render-manifest.json`` recording, per PNG, the digest it was rendered from,
+the renderer that wrote it, and the size and mtime it was written with. A PNG
+is *current* when its entry's digest matches the spec and the file on disk is
+still the one that was written; anything else (no entry, a changed spec, a PNG
+replaced by hand) is rerendered.
+
+Other renderers (the LLM-driven Graphics Agent) record their PNGs in the same
+manifest under their own name. :func:`was_rendered` only vouches for entries
+written by the renderer it is asked about, so ``finalise_art`` never mistakes
+another renderer's chart for one of its own it may redraw.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+#: Bump whenever a change to this module alters the pixels drawn for an
+#: unchanged spec, so that every cached PNG is rendered again.
+RENDERER_VERSION = "1"
+
+MANIFEST_NAME = "render-manifest.json"
+
+#: This module's name in the manifest's ``renderer`` field.
+RENDERER_NAME = "chart_renderer"
 
 # Lazy matplotlib import — matplotlib pulls in numpy + tk and adds ~1s to
 # every module import. Push that cost to render-time so tests that don't
@@ -117,53 +162,56 @@ def _validate_spec(spec: Any) -> None:
         )
 
 
-def render_chart(spec: dict, output_path: Path) -> Path:
-    """Render *spec* to a PNG at *output_path*.
+class _Template:
+    """One 1200×800 figure carrying the styling every chart shares.
 
-    Args:
-        spec: Chart spec matching the contract documented at module top.
-        output_path: Destination PNG path. Parent directories are created
-            if missing.
+    Built once per process. Each render clears what the previous spec drew
+    (the axes and the figure text) and keeps the figure, the canvas and the
+    red rule, which is most of the per-chart setup cost.
+    """
 
-    Returns:
-        The resolved output path.
+    def __init__(self) -> None:
+        import matplotlib
 
-    Raises:
-        ChartRenderError: spec is malformed or matplotlib raises.
-    """
-    _validate_spec(spec)
+        matplotlib.use("Agg")  # headless backend
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.patches import Rectangle
 
-    import matplotlib
+        # 1200×800 PNG — figsize 12×8 inches at 100 dpi gives exactly that.
+        # A bare Figure, not pyplot: it lives for the whole process and must
+        # not sit in pyplot's figure registry.
+        self.fig = Figure(figsize=(12, 8), dpi=100)
+        FigureCanvasAgg(self.fig)
+        self.fig.patch.set_facecolor(_BG_COLOR)
+        self.ax = self.fig.add_subplot()
 
-    matplotlib.use("Agg")  # headless backend
-    import matplotlib.pyplot as plt
+        # Economist top-of-chart red rule (signature visual).
+        self.fig.add_artist(
+            Rectangle(
+                (0.06, 0.93), 0.04, 0.012, color=_RED, transform=self.fig.transFigure
+            )
+        )
 
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    def draw(self, spec: dict, output_path: Path) -> None:
+        """Draw *spec* on the template and save it to *output_path*."""
+        fig, ax = self.fig, self.ax
+        ax.clear()
+        for text in list(fig.texts):
+            text.remove()
 
-    title = spec["title"]
-    subtitle = spec.get("subtitle", "")
-    source = spec.get("source", "")
-    data = spec["data"]
+        title = spec["title"]
+        subtitle = spec.get("subtitle", "")
+        source = spec.get("source", "")
+        data = spec["data"]
 
-    metrics = [item["metric"] for item in data]
-    values = [float(item["value"]) for item in data]
-    colors = [_resolve_color(item.get("color")) for item in data]
-    unit = data[0].get("unit", "")  # use first item's unit for axis label
+        metrics = [item["metric"] for item in data]
+        values = [float(item["value"]) for item in data]
+        colors = [_resolve_color(item.get("color")) for item in data]
+        unit = data[0].get("unit", "")  # use first item's unit for axis label
 
-    # 1200×800 PNG — figsize 12×8 inches at 100 dpi gives exactly that.
-    fig, ax = plt.subplots(figsize=(12, 8), dpi=100)
-    try:
-        fig.patch.set_facecolor(_BG_COLOR)
         ax.set_facecolor(_BG_COLOR)
 
-        # Economist top-of-chart red rule (signature visual).
-        fig.add_artist(
-            plt.Rectangle(
-                (0.06, 0.93), 0.04, 0.012, color=_RED, transform=fig.transFigure
-            )
-        )
-
         y_pos = list(range(len(metrics)))
         ax.barh(y_pos, values, color=colors, height=0.6, edgecolor=_BG_COLOR)
 
@@ -214,11 +262,268 @@ def render_chart(spec: dict, output_path: Path) -> Path:
         # truncated (previously a fixed 0.22 clipped long metric names).
         longest = max((len(str(m)) for m in display_metrics), default=0)
         left_margin = min(0.46, max(0.22, 0.055 + longest * 0.0085))
-        plt.subplots_adjust(left=left_margin, right=0.95, top=0.78, bottom=0.10)
+        fig.subplots_adjust(left=left_margin, right=0.95, top=0.78, bottom=0.10)
         fig.savefig(output_path, dpi=100, facecolor=_BG_COLOR)
-    except Exception as exc:
-        raise ChartRenderError(f"matplotlib render failed: {exc}") from exc
-    finally:
-        plt.close(fig)
 
+
+# Built by the first render in each process (see the lazy-import note above).
+_template: _Template | None = None
+_template_lock = threading.Lock()
+
+
+def _stock_style() -> Any:
+    """Matplotlib's stock rcParams for the duration of a render.
+
+    Other code in the process (a generated chart script, a test) may restyle
+    matplotlib globally. A chart must come out the same here as in a fresh pool
+    worker, or a cached PNG would not be what its spec renders to.
+    """
+    import matplotlib.style
+
+    return matplotlib.style.context("default")
+
+
+def _draw(spec: dict, output_path: Path) -> None:
+    """Render a validated *spec* with this process's template."""
+    global _template
+    with _template_lock, _stock_style():
+        try:
+            if _template is None:
+                _template = _Template()
+            _template.draw(spec, output_path)
+        except Exception as exc:
+            # A failure can leave the figure half-drawn; start the next render
+            # from a fresh one.
+            _template = None
+            raise ChartRenderError(f"matplotlib render failed: {exc}") from exc
+
+
+def render_chart(spec: dict, output_path: Path) -> Path:
+    """Render *spec* to a PNG at *output_path*.
+
+    Args:
+        spec: Chart spec matching the contract documented at module top.
+        output_path: Destination PNG path. Parent directories are created
+            if missing.
+
+    Returns:
+        The resolved output path.
+
+    Raises:
+        ChartRenderError: spec is malformed or matplotlib raises.
+    """
+    _validate_spec(spec)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _draw(spec, output_path)
     return output_path
+
+
+# ── batch rendering ──────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class ChartResult:
+    """Outcome of one job in :func:`render_charts`."""
+
+    output_path: Path
+    status: Literal["rendered", "cached", "failed"]
+    digest: str
+    error: str | None = None
+
+
+def spec_digest(spec: dict, version: str | None = None) -> str:
+    """SHA-256 of *spec* (key order ignored) and the renderer *version*.
+
+    *version* defaults to :data:`RENDERER_VERSION`; another renderer sharing
+    the manifest passes its own.
+    """
+    canonical = json.dumps(
+        spec, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    version = RENDERER_VERSION if version is None else version
+    return hashlib.sha256(f"{version}\n{canonical}".encode()).hexdigest()
+
+
+def load_manifest(directory: Path) -> dict[str, dict[str, Any]]:
+    """The render manifest in *directory*, keyed by PNG file name.
+
+    A missing or unreadable manifest is an empty one: everything rerenders.
+    """
+    try:
+        manifest = json.loads((Path(directory) / MANIFEST_NAME).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def was_rendered(
+    png: Path,
+    manifest: dict[str, dict[str, Any]],
+    renderer: str = RENDERER_NAME,
+) -> bool:
+    """True if *png* is still the file *renderer* recorded in *manifest*.
+
+    False for a PNG with no entry, one replaced since (i.e. made by hand), or
+    one another renderer wrote.
+    """
+    entry = manifest.get(png.name)
+    if not isinstance(entry, dict) or entry.get("renderer") != renderer:
+        return False
+    try:
+        stat = png.stat()
+    except OSError:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == (
+        stat.st_mtime_ns
+    )
+
+
+def is_current(
+    png: Path,
+    digest: str,
+    manifest: dict[str, dict[str, Any]],
+    renderer: str = RENDERER_NAME,
+) -> bool:
+    """True if *png* is the file *renderer* drew from a spec with *digest*."""
+    entry = manifest.get(png.name)
+    return (
+        isinstance(entry, dict)
+        and entry.get("digest") == digest
+        and was_rendered(png, manifest, renderer)
+    )
+
+
+def _manifest_entry(
+    png: Path, digest: str, renderer: str = RENDERER_NAME
+) -> dict[str, Any]:
+    stat = png.stat()
+    return {
+        "digest": digest,
+        "renderer": renderer,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def record_render(png: Path, digest: str, renderer: str = RENDERER_NAME) -> None:
+    """Record in its directory's manifest that *renderer* drew *png* from *digest*."""
+    png = Path(png)
+    manifest = load_manifest(png.parent)
+    manifest[png.name] = _manifest_entry(png, digest, renderer)
+    _save_manifest(png.parent, manifest)
+
+
+def _save_manifest(directory: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    path = directory / MANIFEST_NAME
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    os.replace(tmp, path)  # a reader never sees a half-written manifest
+
+
+def _render_job(spec: dict, output_path: Path) -> str | None:
+    """Render one job; returns the error text instead of raising.
+
+    Runs in a pool worker, so it must be a module-level function.
+    """
+    try:
+        _draw(spec, output_path)
+    except ChartRenderError as exc:
+        return str(exc)
+    return None
+
+
+def _init_worker() -> None:
+    """Pool initializer: import matplotlib and build the template up front."""
+    global _template
+    with _stock_style():
+        _template = _Template()
+
+
+def render_charts(
+    jobs: Iterable[tuple[dict, Path]],
+    max_workers: int | None = None,
+) -> list[ChartResult]:
+    """Render many ``(spec, output_path)`` jobs, skipping PNGs already current.
+
+    Stale jobs are spread over a pool of worker processes, each of which pays
+    the matplotlib import and figure setup once. With one stale job, or one
+    worker, they are drawn in this process instead: a pool would only add
+    another interpreter's startup.
+    The render manifest of each output directory is updated once, here, after
+    every worker has finished.
+
+    Args:
+        jobs: Pairs of chart spec and destination PNG path.
+        max_workers: Pool size. Defaults to the CPU count, capped at the
+            number of stale jobs.
+
+    Returns:
+        One :class:`ChartResult` per job, in input order. A malformed spec or
+        a matplotlib failure is reported as ``"failed"``, not raised.
+    """
+    results: list[ChartResult | None] = []
+    manifests: dict[Path, dict[str, dict[str, Any]]] = {}
+    stale: list[tuple[int, dict, Path, str]] = []
+
+    for index, (spec, output_path) in enumerate(jobs):
+        output_path = Path(output_path)
+        try:
+            _validate_spec(spec)
+        except ChartRenderError as exc:
+            results.append(ChartResult(output_path, "failed", "", str(exc)))
+            continue
+        digest = spec_digest(spec)
+        directory = output_path.parent
+        if directory not in manifests:
+            manifests[directory] = load_manifest(directory)
+        if is_current(output_path, digest, manifests[directory]):
+            results.append(ChartResult(output_path, "cached", digest))
+            continue
+        results.append(None)
+        stale.append((index, spec, output_path, digest))
+
+    for directory in {output_path.parent for _, _, output_path, _ in stale}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(stale))
+    if workers <= 1:
+        errors = [_render_job(spec, path) for _, spec, path, _ in stale]
+    else:
+        # spawn, not fork: the parent may be running threads (telemetry, HTTP
+        # clients), and a forked child would inherit their locks mid-use.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            errors = list(
+                pool.map(
+                    _render_job,
+                    [spec for _, spec, _, _ in stale],
+                    [path for _, _, path, _ in stale],
+                )
+            )
+
+    touched: set[Path] = set()
+    for (index, _, output_path, digest), error in zip(stale, errors, strict=True):
+        if error is not None:
+            results[index] = ChartResult(output_path, "failed", digest, error)
+            continue
+        manifests[output_path.parent][output_path.name] = _manifest_entry(
+            output_path, digest
+        )
+        touched.add(output_path.parent)
+        results[index] = ChartResult(output_path, "rendered", digest)
+
+    for directory in touched:
+        _save_manifest(directory, manifests[directory])
+
+    rendered = sum(r is not None and r.status == "rendered" for r in results)
+    logger.info(
+        "Rendered %d of %d charts (%d already current)",
+        rendered,
+        len(results),
+        sum(r is not None and r.status == "cached" for r in results),
+    )
+    return [r for r in results if r is not None]
@@ -0,0 +1,255 @@
+"""Run generated matplotlib scripts in a pool of warm, resource-limited workers.
+
+The graphics agent asks an LLM for a matplotlib script and then has to run it.
+A fresh ``python`` per chart pays interpreter startup plus the matplotlib and
+NumPy imports every time. A fixed ``/tmp`` script path also let two concurrent
+runs overwrite each other's code. :class:`ChartSandbox` keeps a few worker
+processes alive with matplotlib already imported. Scripts reach them over a
+pipe, so each chart costs only its own drawing.
+
+Isolation per job:
+
+* The script runs in its own temporary directory (its working directory, and
+  where its source is written), with fresh globals.
+* ``rcParams`` are restored and every figure is closed afterwards, so one
+  chart's styling cannot leak into the next.
+* CPU time (``RLIMIT_CPU``, re-armed per job) and memory (``RLIMIT_DATA``) are
+  capped where the platform has :mod:`resource`. A wall-clock timeout is
+  enforced by the parent. A worker that exceeds a limit, hangs or dies is
+  killed and replaced, and the job is reported as failed.
+
+This is process isolation for code from our own prompt, not a security
+boundary against hostile code.
+
+Usage:
+    from src.agent_sdk.chart_sandbox import get_sandbox
+
+    ok, error = get_sandbox().run(code, "output/charts/my-chart.png")
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import traceback
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+WORKERS = 2
+TIMEOUT_SECONDS = 60.0
+CPU_SECONDS = 60
+MEMORY_MB = 2048
+
+#: Longest error text returned to the caller, as the subprocess runner did.
+_ERROR_CHARS = 200
+
+
+def _apply_memory_limit(memory_mb: int) -> None:
+    try:
+        import resource
+    except ImportError:  # not on this platform
+        return
+    limit = memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_DATA, (limit, hard))
+
+
+def _arm_cpu_limit(cpu_seconds: int) -> None:
+    """Allow ``cpu_seconds`` more CPU time; the limit counts the process's total."""
+    try:
+        import resource
+    except ImportError:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _run_job(code: str, plt: Any, matplotlib: Any) -> str | None:
+    """Execute one script in a scratch directory; returns error text or None."""
+    import runpy
+
+    cwd = os.getcwd()
+    output = io.StringIO()
+    with tempfile.TemporaryDirectory(prefix="chart-job-") as scratch:
+        script = Path(scratch) / "chart.py"
+        script.write_text(code)
+        try:
+            os.chdir(scratch)
+            with (
+                matplotlib.rc_context(),
+                contextlib.redirect_stdout(output),
+                contextlib.redirect_stderr(output),
+            ):
+                runpy.run_path(str(script), run_name="__main__")
+        except BaseException:  # noqa: BLE001 — SystemExit from a script is a failure too
+            return traceback.format_exc(limit=-1)
+        finally:
+            os.chdir(cwd)
+            plt.close("all")
+    return None
+
+
+def _worker_main(conn: Connection, cpu_seconds: int, memory_mb: int) -> None:
+    """Worker loop: import matplotlib once, then run scripts until told to stop."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.patches  # noqa: F401 — warm the imports scripts use
+    import matplotlib.pyplot as plt
+    import numpy  # noqa: F401
+
+    _apply_memory_limit(memory_mb)
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        _arm_cpu_limit(cpu_seconds)
+        conn.send(_run_job(job, plt, matplotlib))
+
+
+class _Worker:
+    def __init__(self, context: Any, cpu_seconds: int, memory_mb: int) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child, cpu_seconds, memory_mb),
+            name="chart-sandbox",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ChartSandbox:
+    """A fixed pool of warm matplotlib workers. Safe to share between threads."""
+
+    def __init__(
+        self,
+        workers: int = WORKERS,
+        timeout: float = TIMEOUT_SECONDS,
+        cpu_seconds: int = CPU_SECONDS,
+        memory_mb: int = MEMORY_MB,
+    ):
+        """Start the workers; they import matplotlib in the background.
+
+        Args:
+            workers: Scripts that can run at once.
+            timeout: Wall-clock seconds a script may take.
+            cpu_seconds: CPU seconds a script may use.
+            memory_mb: Heap a worker may grow to.
+
+        """
+        self.timeout = timeout
+        self._cpu_seconds = cpu_seconds
+        self._memory_mb = memory_mb
+        # spawn, not fork: the parent runs threads (telemetry, HTTP clients).
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers: list[_Worker] = []
+        for _ in range(workers):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._context, self._cpu_seconds, self._memory_mb)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            self._workers.remove(worker)
+        self._idle.put(self._spawn())
+
+    def run(self, code: str, output_path: str | Path) -> tuple[bool, str]:
+        """Run a chart script and check it wrote ``output_path``.
+
+        Returns:
+            ``(True, "")`` on success, else ``(False, error_text)``.
+
+        """
+        worker = self._idle.get()
+        try:
+            if not worker.ready:
+                # Normally long done: workers warm up while the LLM writes code.
+                if not worker.conn.poll(self.timeout) or worker.conn.recv() != "ready":
+                    raise EOFError("worker did not start")
+                worker.ready = True
+            worker.conn.send(code)
+            if not worker.conn.poll(self.timeout):
+                self._replace(worker)
+                return False, f"Chart script timed out after {self.timeout:g}s"
+            error = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            exitcode = worker.process.exitcode
+            self._replace(worker)
+            return False, (
+                f"Chart worker died (exit code {exitcode}); the script may have "
+                "exceeded its CPU or memory limit"
+            )
+        self._idle.put(worker)
+        if error is not None:
+            return False, error[-_ERROR_CHARS:]
+        if not Path(output_path).is_file():
+            return False, f"Chart script did not write {output_path}"
+        return True, ""
+
+    def close(self) -> None:
+        """Stop every worker."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+
+# Global sandbox instance
+_sandbox: ChartSandbox | None = None
+_sandbox_lock = threading.Lock()
+
+
+def get_sandbox() -> ChartSandbox:
+    """Get the shared sandbox, starting its workers on first use."""
+    global _sandbox
+    with _sandbox_lock:
+        if _sandbox is None:
+            _sandbox = ChartSandbox()
+            atexit.register(_sandbox.close)
+        return _sandbox
@@ -0,0 +1,328 @@
+"""A warm headless-Chrome renderer for hero SVGs.
+
+:func:`hero_svg.render_to_png` launches Chrome once per raster. Browser startup
+costs seconds, which is paid again for every iteration while the owner refines
+a hero. :class:`HeroRenderer` keeps one headless browser running and drives it
+over the DevTools protocol (CDP), so each later render is a navigation and a
+screenshot.
+
+Scope: since B-042 the pipeline does not rasterise heroes, so nothing in it
+calls ``render_to_png`` or this module. The warm browser serves the owner's
+``--watch`` loop and any script that renders several SVGs in one process; it
+does not make a pipeline run faster.
+
+Requests are queued to a single worker thread that owns the browser, so callers
+on any thread can submit work and the CDP connection is only ever used serially.
+Each render's latency is logged and kept in :attr:`HeroRenderer.latencies_ms`.
+
+The failure policy is the same as ``render_to_png`` (B-016b, row 2): a
+malfunction degrades and never raises. If the browser cannot start, or a CDP
+call fails, that request falls back to the one-shot ``render_to_png``. The
+browser is restarted on the next request. There is no in-process rasteriser to
+fall back to: ``hero_svg`` records why (no rsvg or cairosvg here, and Chrome
+already does the job).
+
+Usage:
+    with HeroRenderer() as renderer:
+        for svg in drafts:
+            renderer.render(svg, svg.with_suffix(".png"))
+
+    # Owner loop: re-render each SVG whenever it is saved
+    python -m src.agent_sdk.hero_renderer output/posts/images/hero.svg --watch
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import contextlib
+import json
+import logging
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from src.agent_sdk.hero_svg import (
+    _RENDER_HEIGHT,
+    _RENDER_TIMEOUT_S,
+    _RENDER_WIDTH,
+    _find_chrome,
+    render_to_png,
+)
+
+logger = logging.getLogger(__name__)
+
+#: How long a cold browser may take to publish its DevTools port.
+_STARTUP_TIMEOUT_S = 20.0
+
+#: How often ``--watch`` checks the SVGs for changes.
+_WATCH_INTERVAL_S = 0.5
+
+
+class RendererError(RuntimeError):
+    """The warm browser failed; the caller falls back to a one-shot render."""
+
+
+def _reap(process: subprocess.Popen[bytes], profile: str) -> None:
+    """Stop Chrome and delete its profile.
+
+    Registered with ``weakref.finalize``, so it also runs at interpreter exit
+    for a browser nobody closed: the worker thread is a daemon, and an orphaned
+    Chrome would keep its DevTools port open, unsandboxed, with the temp
+    profile left behind.
+    """
+    if process.poll() is None:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    shutil.rmtree(profile, ignore_errors=True)
+
+
+class _Browser:
+    """One headless Chrome process and a CDP session on a single page."""
+
+    def __init__(self, binary: str) -> None:
+        self._profile = tempfile.mkdtemp(prefix="hero-renderer-")
+        try:
+            self._process = subprocess.Popen(  # noqa: S603 - fixed argv, no shell
+                [
+                    binary,
+                    "--headless",
+                    "--disable-gpu",
+                    "--no-sandbox",
+                    "--hide-scrollbars",
+                    # Port 0: Chrome picks a free one and writes it to the profile.
+                    "--remote-debugging-port=0",
+                    f"--user-data-dir={self._profile}",
+                    "about:blank",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            shutil.rmtree(self._profile, ignore_errors=True)
+            raise
+        self._reaper = weakref.finalize(self, _reap, self._process, self._profile)
+        self._next_id = 0
+        self._events: deque[dict[str, Any]] = deque()
+        self._navigations = 0
+        try:
+            import websocket  # websocket-client
+
+            self._ws = websocket.create_connection(
+                self._endpoint(), timeout=_RENDER_TIMEOUT_S, suppress_origin=True
+            )
+            target = self._call("Target.createTarget", {"url": "about:blank"})
+            self._session = self._call(
+                "Target.attachToTarget",
+                {"targetId": target["targetId"], "flatten": True},
+            )["sessionId"]
+            self._call("Page.enable", session=True)
+            self._call(
+                "Emulation.setDeviceMetricsOverride",
+                {
+                    "width": _RENDER_WIDTH,
+                    "height": _RENDER_HEIGHT,
+                    "deviceScaleFactor": 1,
+                    "mobile": False,
+                },
+                session=True,
+            )
+        except Exception:
+            self.close()
+            raise
+
+    def _endpoint(self) -> str:
+        """Wait for Chrome to write its DevTools port into the profile."""
+        active_port = Path(self._profile) / "DevToolsActivePort"
+        deadline = time.monotonic() + _STARTUP_TIMEOUT_S
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RendererError(f"browser exited {self._process.returncode}")
+            lines = active_port.read_text().split() if active_port.exists() else []
+            if len(lines) >= 2:
+                return f"ws://127.0.0.1:{lines[0]}{lines[1]}"
+            time.sleep(0.05)
+        raise RendererError("browser did not open a DevTools port in time")
+
+    def _call(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        session: bool = False,
+    ) -> dict[str, Any]:
+        self._next_id += 1
+        message: dict[str, Any] = {
+            "id": self._next_id,
+            "method": method,
+            "params": params or {},
+        }
+        if session:
+            message["sessionId"] = self._session
+        self._ws.send(json.dumps(message))
+        while True:
+            reply = json.loads(self._ws.recv())
+            if reply.get("id") == self._next_id:
+                if "error" in reply:
+                    raise RendererError(f"{method}: {reply['error']}")
+                return reply.get("result", {})
+            self._events.append(reply)
+
+    def _wait_for(self, event: str) -> None:
+        while True:
+            while self._events:
+                if self._events.popleft().get("method") == event:
+                    return
+            self._events.append(json.loads(self._ws.recv()))
+
+    def screenshot(self, svg_path: Path) -> bytes:
+        """Load ``svg_path`` in the page and return it as PNG bytes."""
+        self._events.clear()
+        self._navigations += 1
+        # A fresh query string per render: the same file, redrawn, must not be
+        # served from the page cache.
+        url = f"{svg_path.resolve().as_uri()}?render={self._navigations}"
+        self._call("Page.navigate", {"url": url}, session=True)
+        self._wait_for("Page.loadEventFired")
+        shot = self._call("Page.captureScreenshot", {"format": "png"}, session=True)
+        return base64.b64decode(shot["data"])
+
+    def close(self) -> None:
+        ws = getattr(self, "_ws", None)
+        if ws is not None:
+            with contextlib.suppress(Exception):  # best-effort teardown
+                ws.close()
+        self._reaper()
+
+
+class HeroRenderer:
+    """Queue of hero renders served by one long-lived headless browser."""
+
+    def __init__(self, binary: str | None = None) -> None:
+        """Create the renderer; the browser starts with the first request.
+
+        Args:
+            binary: Chrome/Chromium executable. Found with the same search as
+                ``render_to_png`` when omitted.
+        """
+        self._binary = binary
+        self._browser: _Browser | None = None
+        self._requests: queue.Queue[tuple[Path, Path, Future[Path | None]] | None] = (
+            queue.Queue()
+        )
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+        #: Wall time of each completed render, in submission order.
+        self.latencies_ms: list[float] = []
+
+    def __enter__(self) -> HeroRenderer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(self, svg_path: Path, png_path: Path) -> Future[Path | None]:
+        """Queue one render; the future resolves to ``png_path`` or ``None``."""
+        future: Future[Path | None] = Future()
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._serve, name="hero-renderer", daemon=True
+                )
+                self._worker.start()
+            self._requests.put((Path(svg_path), Path(png_path), future))
+        return future
+
+    def render(self, svg_path: Path, png_path: Path) -> Path | None:
+        """Render one SVG and wait for it. Same contract as ``render_to_png``."""
+        return self.submit(svg_path, png_path).result()
+
+    def close(self) -> None:
+        """Finish queued renders, then shut the browser down."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._requests.put(None)
+            worker.join()
+
+    def _serve(self) -> None:
+        while (request := self._requests.get()) is not None:
+            svg_path, png_path, future = request
+            if future.set_running_or_notify_cancel():
+                future.set_result(self._render_one(svg_path, png_path))
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+    def _render_one(self, svg_path: Path, png_path: Path) -> Path | None:
+        start = time.perf_counter()
+        result, mode = self._render_warm(svg_path, png_path), "warm browser"
+        if result is None:
+            result, mode = render_to_png(svg_path, png_path), "one-shot Chrome"
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.latencies_ms.append(elapsed_ms)
+        logger.info("Rendered %s in %.0f ms (%s)", svg_path.name, elapsed_ms, mode)
+        return result
+
+    def _render_warm(self, svg_path: Path, png_path: Path) -> Path | None:
+        """Render through the warm browser, or ``None`` to fall back."""
+        try:
+            if self._browser is None:
+                binary = self._binary or _find_chrome()
+                if binary is None:
+                    return None  # render_to_png logs the missing-Chrome warning
+                self._browser = _Browser(binary)
+            png = self._browser.screenshot(svg_path)
+            png_path.parent.mkdir(parents=True, exist_ok=True)
+            png_path.write_bytes(png)
+        except Exception as exc:  # noqa: BLE001 — a renderer must never break a run
+            logger.warning(
+                "Warm hero renderer failed (%s) — falling back to one-shot Chrome",
+                exc,
+            )
+            if self._browser is not None:
+                self._browser.close()
+                self._browser = None
+            return None
+        return png_path
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="Render hero SVGs to PNG.")
+    parser.add_argument("svgs", nargs="+", type=Path, help="SVG files to render")
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the browser warm and re-render each SVG when it changes",
+    )
+    args = parser.parse_args(argv)
+
+    with HeroRenderer() as renderer:
+        seen: dict[Path, float] = {}
+        while True:
+            for svg in args.svgs:
+                if not svg.exists():
+                    continue
+                mtime = svg.stat().st_mtime
+                if seen.get(svg) != mtime:
+                    seen[svg] = mtime
+                    renderer.submit(svg, svg.with_suffix(".png"))
+            if not args.watch:
+                break
+            time.sleep(_WATCH_INTERVAL_S)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,16 @@ naming the specific failure.
 from __future__ import annotations
 
 import logging
+import os
 import re
 import shutil
 import subprocess
-from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
 from xml.etree import ElementTree
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 #: Where Claude's hand-drawn heroes land (Operating Constraint #4). Defined here,
@@ -88,30 +91,131 @@ def _parse_viewbox(value: str) -> tuple[float, float]:
     return width, height
 
 
-def check_hero_svg(source: str) -> None:
+#: Bytes handed to the parser at a time.
+_CHUNK_BYTES = 16_384
+
+
+def _read_chunks(source: str | os.PathLike[str]) -> Iterator[bytes]:
+    """Yield the document in chunks, refusing it once it passes ``_MAX_BYTES``.
+
+    A path is never read further than the ceiling, so an oversized or hostile
+    file is rejected without being loaded.
+    """
+    if isinstance(source, str):
+        data = source.encode("utf-8")
+        if len(data) > _MAX_BYTES:
+            raise HeroSvgError(
+                f"hero SVG is {len(data)} bytes; ceiling is "
+                f"{_MAX_BYTES} (the shipped reference hero is ~5,700)"
+            )
+        for start in range(0, len(data), _CHUNK_BYTES):
+            yield data[start : start + _CHUNK_BYTES]
+        return
+
+    try:
+        with open(source, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            read = 0
+            while chunk := handle.read(_CHUNK_BYTES):
+                read += len(chunk)
+                if max(size, read) > _MAX_BYTES:
+                    raise HeroSvgError(
+                        f"hero SVG is {max(size, read)} bytes or more; ceiling is "
+                        f"{_MAX_BYTES} (the shipped reference hero is ~5,700)"
+                    )
+                yield chunk
+    except OSError as exc:
+        raise HeroSvgError(f"hero SVG could not be read: {exc}") from exc
+
+
+def _check_element(element: ElementTree.Element) -> None:
+    """Rules decidable from an element's start tag; the first failure raises."""
+    name = _localname(element.tag)
+    if name == "script":
+        raise HeroSvgError("hero SVG must not contain <script>")
+    if name == "image":
+        # The only element that pulls in raster content. Banned outright
+        # rather than URL-filtered, which would miss a relative path.
+        raise HeroSvgError(
+            "hero SVG must not contain <image>; the drawing must be "
+            "self-contained geometry (Operating Constraint #4)"
+        )
+    if name in _TEXT_ELEMENTS:
+        raise HeroSvgError(
+            f"hero SVG must not render text (found <{name}>); words belong in "
+            "the caption, not the artwork"
+        )
+
+    for attr, value in element.attrib.items():
+        attr_local = _localname(attr)
+        if _EVENT_HANDLER.match(attr_local):
+            raise HeroSvgError(
+                f"hero SVG must not contain event handlers (found {attr_local!r})"
+            )
+        if attr_local in ("href", "src") and _EXTERNAL_REF.match(value):
+            raise HeroSvgError(
+                f"hero SVG must be self-contained; found an external "
+                f"reference {value!r}"
+            )
+
+
+def check_hero_svg(source: str | os.PathLike[str]) -> None:
     """Validate a hero SVG, raising :class:`HeroSvgError` on the first failure.
 
+    The document is parsed incrementally. Forbidden content (``<script>``,
+    ``<image>``, text, event handlers, external references) fails as soon as
+    its start tag is read. Each element is discarded once closed, so memory
+    stays flat however large the drawing.
+
     Args:
-        source: The complete SVG document as text.
+        source: The complete SVG document as text, or a path to the file.
 
     Raises:
         HeroSvgError: With a message naming the specific rule that failed.
     """
-    if len(source.encode("utf-8")) > _MAX_BYTES:
-        raise HeroSvgError(
-            f"hero SVG is {len(source.encode('utf-8'))} bytes; ceiling is "
-            f"{_MAX_BYTES} (the shipped reference hero is ~5,700)"
-        )
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    open_elements: list[ElementTree.Element] = []
+    root: ElementTree.Element | None = None
+    root_attrib: dict[str, str] = {}
+    titles: list[str] = []
+    descs: list[str] = []
+    primitives = 0
+
+    def drain() -> None:
+        nonlocal root, root_attrib, primitives
+        for event, element in parser.read_events():
+            name = _localname(element.tag)
+            if event == "start":
+                if root is None:
+                    root, root_attrib = element, dict(element.attrib)
+                _check_element(element)
+                if name in _PRIMITIVES:
+                    primitives += 1
+                open_elements.append(element)
+                continue
+            if name == "title":
+                titles.append((element.text or "").strip())
+            elif name == "desc":
+                descs.append((element.text or "").strip())
+            open_elements.pop()
+            if open_elements:
+                open_elements[-1].remove(element)  # keep memory flat
+            element.clear()
 
     try:
-        root = ElementTree.fromstring(source)
+        for chunk in _read_chunks(source):
+            parser.feed(chunk)
+            drain()
+        parser.close()
+        drain()
     except ElementTree.ParseError as exc:
         raise HeroSvgError(f"hero SVG is not well-formed XML: {exc}") from exc
 
+    assert root is not None  # close() raises on a document with no element
     if _localname(root.tag) != "svg":
         raise HeroSvgError(f"root element must be <svg>, got <{_localname(root.tag)}>")
 
-    viewbox = root.get("viewBox")
+    viewbox = root_attrib.get("viewBox")
     if not viewbox:
         raise HeroSvgError("hero SVG must set viewBox so it scales on the blog")
     width, height = _parse_viewbox(viewbox)
@@ -123,47 +227,6 @@ def check_hero_svg(source: str) -> None:
             f"({_TARGET_RATIO:.3f}) within {_RATIO_TOLERANCE:.0%}"
         )
 
-    titles: list[str] = []
-    descs: list[str] = []
-    primitives = 0
-    for element in root.iter():
-        name = _localname(element.tag)
-
-        if name == "title":
-            titles.append((element.text or "").strip())
-            continue
-        if name == "desc":
-            descs.append((element.text or "").strip())
-            continue
-        if name == "script":
-            raise HeroSvgError("hero SVG must not contain <script>")
-        if name == "image":
-            # The only element that pulls in raster content. Banned outright
-            # rather than URL-filtered, which would miss a relative path.
-            raise HeroSvgError(
-                "hero SVG must not contain <image>; the drawing must be "
-                "self-contained geometry (Operating Constraint #4)"
-            )
-        if name in _TEXT_ELEMENTS:
-            raise HeroSvgError(
-                f"hero SVG must not render text (found <{name}>); words belong in "
-                "the caption, not the artwork"
-            )
-        if name in _PRIMITIVES:
-            primitives += 1
-
-        for attr, value in element.attrib.items():
-            attr_local = _localname(attr)
-            if _EVENT_HANDLER.match(attr_local):
-                raise HeroSvgError(
-                    f"hero SVG must not contain event handlers (found {attr_local!r})"
-                )
-            if attr_local in ("href", "src") and _EXTERNAL_REF.match(value):
-                raise HeroSvgError(
-                    f"hero SVG must be self-contained; found an external "
-                    f"reference {value!r}"
-                )
-
     if len(titles) != 1 or not titles[0]:
         raise HeroSvgError(
             f"hero SVG must have exactly one non-empty <title> (found {len(titles)})"
@@ -242,54 +305,49 @@ def report_edge_contact(png_path: Path) -> list[str]:
         from PIL import Image
 
         with Image.open(png_path) as handle:
-            image = handle.convert("RGB")
-            width, height = image.size
-            pixels = image.load()
+            rgb = np.asarray(handle.convert("RGB"))
     except Exception as exc:  # noqa: BLE001 — a reporter must never break a run
         logger.debug("edge-contact check skipped for %s (%s)", png_path, exc)
         return []
 
+    height, width = rgb.shape[:2]
     if width < 2 or height < 2:
         return []
 
-    def _close(a: tuple[int, ...], b: tuple[int, ...]) -> bool:
-        return all(
-            abs(c - d) <= _EDGE_COLOUR_TOLERANCE for c, d in zip(a, b, strict=True)
-        )
-
-    row_spans: dict[int, bool] = {}
-    col_spans: dict[int, bool] = {}
-
-    def _row_crosses(y: int) -> bool:
-        """True when row ``y`` is one colour all the way across — a full-bleed band."""
-        if y not in row_spans:
-            first = pixels[0, y]
-            row_spans[y] = all(_close(pixels[x, y], first) for x in range(width))
-        return row_spans[y]
-
-    def _col_crosses(x: int) -> bool:
-        """True when column ``x`` is one colour top to bottom."""
-        if x not in col_spans:
-            first = pixels[x, 0]
-            col_spans[x] = all(_close(pixels[x, y], first) for y in range(height))
-        return col_spans[x]
-
-    edges: dict[str, tuple[list[tuple[int, int, int]], object]] = {
-        "top": ([pixels[x, 0] for x in range(width)], _col_crosses),
-        "bottom": ([pixels[x, height - 1] for x in range(width)], _col_crosses),
-        "left": ([pixels[0, y] for y in range(height)], _row_crosses),
-        "right": ([pixels[width - 1, y] for y in range(height)], _row_crosses),
+    # Channel planes, so every per-row and per-column reduction below runs over
+    # contiguous memory instead of striding across interleaved RGB.
+    planes = np.ascontiguousarray(rgb.transpose(2, 0, 1))
+
+    def _uniform(axis: int, first: np.ndarray) -> np.ndarray:
+        """Per line along ``axis``: every pixel within tolerance of ``first``.
+
+        A line is one colour all the way across exactly when, per channel, its
+        extremes both sit within tolerance of its first pixel.
+        """
+        first = first.astype(np.int16)
+        return (
+            (planes.max(axis=axis) <= first + _EDGE_COLOUR_TOLERANCE)
+            & (planes.min(axis=axis) >= first - _EDGE_COLOUR_TOLERANCE)
+        ).all(axis=0)
+
+    # A row (column) "crosses" when it spans the frame in one colour — a
+    # full-bleed band.
+    row_crosses = _uniform(2, planes[:, :, 0])
+    col_crosses = _uniform(1, planes[:, 0, :])
+
+    edges: dict[str, tuple[np.ndarray, np.ndarray]] = {
+        "top": (planes[:, 0, :], col_crosses),
+        "bottom": (planes[:, height - 1, :], col_crosses),
+        "left": (planes[:, :, 0], row_crosses),
+        "right": (planes[:, :, width - 1], row_crosses),
     }
 
     findings: list[str] = []
-    for name, (line, crosses) in edges.items():
-        dominant = Counter(line).most_common(1)[0][0]
-        clipped = sum(
-            1
-            for index, colour in enumerate(line)
-            if not _close(colour, dominant) and not crosses(index)  # type: ignore[operator]
-        )
-        coverage = clipped / len(line)
+    for name, (channels, crosses) in edges.items():
+        line = channels.T.astype(np.int16)  # (pixels, RGB)
+        dominant = line[_dominant_index(line)]
+        off_colour = (np.abs(line - dominant) > _EDGE_COLOUR_TOLERANCE).any(axis=1)
+        coverage = np.count_nonzero(off_colour & ~crosses) / len(line)
         if coverage >= _EDGE_MIN_COVERAGE:
             findings.append(
                 f"Content meets the {name} edge across {coverage:.0%} of it without "
@@ -299,6 +357,17 @@ def report_edge_contact(png_path: Path) -> list[str]:
     return findings
 
 
+def _dominant_index(line: np.ndarray) -> int:
+    """Index of the first pixel of ``line``'s most common exact colour.
+
+    Ties go to the colour seen first, as ``Counter.most_common`` broke them.
+    """
+    rgb = line.astype(np.int32)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    _, first, counts = np.unique(packed, return_index=True, return_counts=True)
+    return int(first[counts == counts.max()].min())
+
+
 def _find_chrome() -> str | None:
     """Locate a Chrome/Chromium executable, or ``None`` if none is installed.
 
@@ -325,6 +394,10 @@ def render_to_png(svg_path: Path, png_path: Path) -> Path | None:
     *enable* a quality check, so its absence must degrade to "no critique
     available", never to a failed article (spec failure policy, row 2: a vision
     malfunction must not affect the exit code).
+
+    Each call starts and stops a browser. The owner's ``--watch`` loop in
+    ``src.agent_sdk.hero_renderer`` keeps one browser warm instead, and falls
+    back to this function when it cannot.
     """
     binary = _find_chrome()
     if binary is None:
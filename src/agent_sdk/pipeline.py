@@ -17,8 +17,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Literal
 
-import orjson
-
 from src.agent_sdk._shared import (
     SearchProvidersEmptyError,
     SearchProvidersFailedError,
@@ -33,6 +31,7 @@ from src.agent_sdk.stage3_runner import (
     run_stage3,
 )
 from src.agent_sdk.stage4_runner import run_stage4
+from src.telemetry.bus import JsonlMirror, emit
 from src.telemetry.roi_tracker import ROITracker, get_tracker
 
 logger = logging.getLogger(__name__)
@@ -136,6 +135,7 @@ async def run_pipeline(
     writer_model: str = DEFAULT_WRITER_MODEL,
     research_mode: Literal["deterministic", "deep", "claude_web"] = "deterministic",
     brief_override: str | None = None,
+    writer_parallelism: int = 1,
 ) -> PipelineResult:
     """Generate one article through the Agent SDK pipeline — Stage 3 then Stage 4.
 
@@ -151,6 +151,7 @@ async def run_pipeline(
         writer_model=writer_model,
         research_mode=research_mode,
         brief_override=brief_override,
+        writer_parallelism=writer_parallelism,
     )
     article_for_stage4 = _prepare_for_stage4(stage3.article)
     stage4 = run_stage4(article_for_stage4)
@@ -187,7 +188,7 @@ async def run_pipeline(
     )
     wall_seconds = result.stage3_seconds + result.stage4_seconds
     try:
-        await asyncio.to_thread(_append_cost_log, result, wall_seconds)
+        _append_cost_log(result, wall_seconds)
     except Exception as exc:
         logger.warning("Cost log write failed (non-fatal): %s", exc)
     try:
@@ -275,8 +276,7 @@ def _strip_image_frontmatter(article: str) -> str:
 
 
 def _append_cost_log(result: PipelineResult, total_wall_seconds: float) -> None:
-    """Append a single JSON line summarising this run for spend tracking."""
-    COST_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    """Emit this run's spend summary; the bus appends it to the JSONL cost log."""
     entry = {
         "timestamp": datetime.now(UTC).isoformat(),
         "topic": result.topic,
@@ -299,8 +299,7 @@ def _append_cost_log(result: PipelineResult, total_wall_seconds: float) -> None:
         "publication_validator_passed": result.publication_validator_passed,
         "article_chars": result.article_chars,
     }
-    with COST_LOG_PATH.open("ab") as fh:
-        fh.write(orjson.dumps(entry) + b"\n")
+    emit("pipeline_run", entry, mirror=JsonlMirror(COST_LOG_PATH))
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -327,6 +326,17 @@ def main(argv: list[str] | None = None) -> None:
         default=DEFAULT_WRITER_MODEL,
         help=f"Writer model id (default {DEFAULT_WRITER_MODEL})",
     )
+    parser.add_argument(
+        "--writer-parallelism",
+        type=int,
+        default=1,
+        metavar="K",
+        help=(
+            "Opt-in speculative writing: run K writer attempts at once under the "
+            "same --writer-budget and keep the first acceptable draft (default 1, "
+            "serial retries). Trades writer spend for latency."
+        ),
+    )
     parser.add_argument(
         "--research-only",
         action="store_true",
@@ -377,6 +387,7 @@ def main(argv: list[str] | None = None) -> None:
         writer_model=args.writer_model,
         research_mode=args.research_mode,
         brief_override=load_brief_file(args.brief) if args.brief else None,
+        writer_parallelism=args.writer_parallelism,
     )
 
 
@@ -474,6 +485,7 @@ def _run_end_to_end(
     writer_model: str,
     research_mode: str,
     brief_override: str | None = None,
+    writer_parallelism: int = 1,
 ) -> None:
     """Run the pipeline end to end, write the article, and hand off the art.
 
@@ -491,6 +503,7 @@ def _run_end_to_end(
                 writer_model=writer_model,
                 research_mode=research_mode,
                 brief_override=brief_override,
+                writer_parallelism=writer_parallelism,
             )
         )
     except SearchProvidersFailedError as exc:
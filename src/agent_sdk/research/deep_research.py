@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from typing import Any
 
 from src.agent_sdk.research.extractor import extract_passages
@@ -30,6 +31,11 @@ MAX_ITERATIONS = 2
 MAX_ITERATIONS_CEILING = 3  # spec: "Ask first to exceed"; clamp as a backstop
 DEFAULT_RESEARCH_BUDGET_USD = 2.50
 SOURCES_PER_SUBQUESTION = 5
+#: Wall-clock bound on one sub-question's search + extraction.
+SUBQUESTION_TIMEOUT_S = 180.0
+#: Share of a generation's sub-questions that must land before the synthesizer
+#: is asked for gaps — one slow straggler must not hold the whole hop.
+ASSESS_QUORUM = 0.5
 
 # The same anti-fabrication guardrails the deterministic build_research_brief
 # prepends. Duplicated here (not imported) because the source lives in
@@ -91,6 +97,10 @@ def _format_brief(topic: str, findings: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
+#: ``(finding, cost_usd)`` — what one sub-question or one assessment returns.
+_Outcome = tuple[dict[str, Any], float]
+
+
 async def _research_one(
     subquestion: str, budget: float
 ) -> tuple[dict[str, Any], float]:
@@ -101,6 +111,30 @@ async def _research_one(
     return await extract_passages(subquestion, sources, max_budget_usd=budget)
 
 
+async def _research_one_bounded(
+    subquestion: str, budget: float
+) -> tuple[dict[str, Any], float]:
+    """``_research_one`` under ``SUBQUESTION_TIMEOUT_S``.
+
+    A straggler is recorded as "no evidence" instead of holding the loop, and is
+    charged its whole budget slice: the extractor call was abandoned mid-flight,
+    so what it spent is unknown and the guard must not undercount it. The search
+    runs in a worker thread, which cannot be interrupted — it finishes in the
+    background and its result is discarded.
+    """
+    try:
+        return await asyncio.wait_for(
+            _research_one(subquestion, budget), SUBQUESTION_TIMEOUT_S
+        )
+    except TimeoutError:
+        logger.warning(
+            "Deep research sub-question timed out after %gs: %s",
+            SUBQUESTION_TIMEOUT_S,
+            subquestion,
+        )
+        return {"subquestion": subquestion, "passages": [], "confidence": 0.0}, budget
+
+
 async def build_deep_research_brief(
     topic: str,
     max_iterations: int = MAX_ITERATIONS,
@@ -112,9 +146,19 @@ async def build_deep_research_brief(
     the writer + stat audit are unchanged); the cost is surfaced so the pipeline
     can record research spend in the cost log.
 
-    Budget is enforced cumulatively: each call receives the *remaining* budget as
-    its per-call ceiling, and the parallel fan-out divides the remainder across
-    the in-flight sub-questions so a single iteration cannot overspend.
+    Scheduling is as-completed, not iteration-by-iteration: findings are taken
+    as each sub-question lands, and once ``ASSESS_QUORUM`` of the newest
+    generation is in, the synthesizer assesses what has arrived while the
+    stragglers keep running. Its gap sub-questions are dispatched the moment it
+    answers, and an ``enough`` verdict stops the loop early, abandoning anything
+    still in flight. ``max_iterations`` still caps the number of generations
+    (planner questions, then up to ``max_iterations - 1`` rounds of gaps).
+
+    Budget is enforced cumulatively: each sub-question receives a slice of the
+    budget not yet spent or reserved by in-flight sub-questions, divided across
+    the generation it is dispatched with, so a fan-out cannot collectively
+    overspend. A sub-question abandoned on an ``enough`` verdict is charged its
+    whole slice, as a timed-out one is.
     """
     max_iterations = max(1, min(max_iterations, MAX_ITERATIONS_CEILING))
     spent = 0.0
@@ -132,49 +176,118 @@ async def build_deep_research_brief(
 
         return build_research_brief(topic), spent
 
-    findings: list[dict[str, Any]] = []
-    for iteration in range(max_iterations):
-        remaining = research_budget_usd - spent
-        if remaining <= 0:
-            logger.warning(
-                "Deep research budget $%.2f exhausted before iteration %d; stopping",
-                research_budget_usd,
-                iteration + 1,
-            )
-            break
-        # Divide the remaining budget across the parallel sub-questions so the
-        # fan-out cannot collectively overspend within a single iteration.
-        per_call = remaining / len(subquestions)
-        results = await asyncio.gather(
-            *(_research_one(q, per_call) for q in subquestions)
-        )
-        for finding, call_cost in results:
-            findings.append(finding)
-            spent += call_cost
+    #: (dispatch order, finding) — sorted at the end so the brief reads in the
+    #: order the questions were asked, not the order they happened to land.
+    findings: list[tuple[int, dict[str, Any]]] = []
+    #: task -> (dispatch order, generation, budget slice)
+    in_flight: dict[asyncio.Task[_Outcome], tuple[int, int, float]] = {}
+    asked: list[str] = []
+    generation_sizes: list[int] = []
+    landed: list[int] = []
+    assessment: asyncio.Task[_Outcome] | None = None
+    assessed_generations = 0
+    budget_reached = False
+
+    def unreserved() -> float:
+        return research_budget_usd - spent - sum(s for *_, s in in_flight.values())
 
-        if spent >= research_budget_usd:
+    def dispatch(questions: list[str]) -> None:
+        available = unreserved()
+        if available <= 0:
             logger.warning(
-                "Deep research budget $%.2f reached after iteration %d; stopping",
+                "Deep research budget $%.2f exhausted before generation %d; "
+                "not dispatching %d sub-question(s)",
                 research_budget_usd,
-                iteration + 1,
+                len(generation_sizes) + 1,
+                len(questions),
             )
-            break
-        # Last iteration: skip the synthesizer (a wasted Sonnet call — we won't
-        # loop again regardless of its verdict).
-        if iteration == max_iterations - 1:
-            break
-
-        verdict, call_cost = await assess_completeness(
-            topic, findings, max_budget_usd=research_budget_usd - spent
-        )
-        spent += call_cost
-        if verdict["enough"] or not verdict["gaps"]:
-            break
-        subquestions = verdict["gaps"]
+            return
+        per_call = available / len(questions)
+        generation = len(generation_sizes)
+        generation_sizes.append(len(questions))
+        landed.append(0)
+        for question in questions:
+            task = asyncio.create_task(_research_one_bounded(question, per_call))
+            in_flight[task] = (len(asked), generation, per_call)
+            asked.append(question)
+
+    dispatch(subquestions)
+    try:
+        while in_flight or assessment is not None:
+            waiting: set[asyncio.Task[_Outcome]] = set(in_flight)
+            if assessment is not None:
+                waiting.add(assessment)
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            verdict: dict[str, Any] | None = None
+            for task in done:
+                if task is assessment:
+                    verdict, call_cost = task.result()
+                    spent += call_cost
+                    assessment = None
+                    continue
+                order, generation, _ = in_flight.pop(task)
+                finding, call_cost = task.result()
+                findings.append((order, finding))
+                spent += call_cost
+                landed[generation] += 1
+
+            if verdict is not None:
+                if verdict["enough"]:
+                    if in_flight:
+                        logger.info(
+                            "Deep research complete by synthesizer verdict; "
+                            "abandoning %d in-flight sub-question(s)",
+                            len(in_flight),
+                        )
+                    break
+                gaps = [g for g in verdict["gaps"] if g not in asked]
+                if gaps:
+                    dispatch(gaps)
+
+            newest = len(generation_sizes) - 1
+            if (
+                assessment is None
+                and not budget_reached
+                and assessed_generations == newest
+                and newest < max_iterations - 1
+                and landed[newest]
+                >= math.ceil(ASSESS_QUORUM * generation_sizes[newest])
+            ):
+                if spent >= research_budget_usd:
+                    logger.warning(
+                        "Deep research budget $%.2f reached after generation %d; "
+                        "stopping",
+                        research_budget_usd,
+                        newest + 1,
+                    )
+                    budget_reached = True
+                    continue
+                assessed_generations += 1
+                assessment = asyncio.create_task(
+                    assess_completeness(
+                        topic,
+                        [finding for _, finding in findings],
+                        max_budget_usd=max(unreserved(), 0.0),
+                    )
+                )
+    finally:
+        leftovers = [*in_flight, *([assessment] if assessment is not None else [])]
+        for task in leftovers:
+            task.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+        # An abandoned sub-question is charged like a timed-out one: its
+        # reported cost if it managed to finish, otherwise its whole slice.
+        for task, (*_, reserved) in in_flight.items():
+            if task.cancelled() or task.exception() is not None:
+                spent += reserved
+            else:
+                spent += task.result()[1]
 
     logger.info(
         "Deep research complete: %d findings across the topic, $%.4f spent",
         len(findings),
         spent,
     )
-    return _format_brief(topic, findings), spent
+    findings.sort(key=lambda pair: pair[0])
+    return _format_brief(topic, [finding for _, finding in findings]), spent
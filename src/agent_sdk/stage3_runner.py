@@ -31,6 +31,7 @@ import orjson
 from claude_agent_sdk import (
     AssistantMessage,
     ClaudeAgentOptions,
+    ClaudeSDKClient,
     ResultMessage,
     TextBlock,
     create_sdk_mcp_server,
@@ -55,6 +56,9 @@ from src.agent_sdk._shared import (
 from src.agent_sdk._shared import (
     audit_article_stats as _audit_article_stats,
 )
+from src.agent_sdk._shared import (
+    audit_stat_sentences as _audit_stat_sentences,
+)
 from src.agent_sdk.image_prompt_synth import PromptSynthError, compose_prompt
 from src.agent_sdk.research.claude_web import (
     brief_has_findings,
@@ -64,7 +68,11 @@ from src.agent_sdk.research.deep_research import (
     brief_has_findings as deep_brief_has_findings,
 )
 from src.agent_sdk.research.deep_research import build_deep_research_brief
-from src.agent_sdk.tools.research_tools import SourceFetchSession, build_search_tool
+from src.agent_sdk.tools.research_tools import (
+    SourceCache,
+    SourceFetchSession,
+    build_search_tool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +141,15 @@ DEFAULT_CALL_TIMEOUT_S = 900.0
 #: drift apart again.
 DEFAULT_WRITER_BUDGET_USD = _WRITER_ATTEMPT_COST_USD * _WRITER_MAX_ATTEMPTS
 
+#: Opt-in speculative writing (``writer_parallelism > 1``): a draft whose stat
+#: audit would strip more sentences than this is passed over while a sibling
+#: attempt may still come back cleaner.
+_SPECULATIVE_MAX_STAT_REMOVALS = 2
+
+#: How long a losing speculative attempt gets to stop at its next message
+#: boundary (the BUG-048-safe exit) before it is hard-cancelled.
+_SPECULATIVE_CANCEL_GRACE_S = 5.0
+
 WRITER_SYSTEM_PROMPT = """You are an Economist-style Writer renowned for sharp, witty prose with British flair.
 Every article must satisfy the 10 rules below before submission. Do not read files. Write primarily
 from the brief. You MAY call the `search_for_source` tool sparingly (at most 3 times per article)
@@ -485,6 +502,23 @@ def _extract_article(text: str) -> str:
     return text.rstrip() + "\n"
 
 
+def _malformed_diagnostic(candidate: str) -> str:
+    """Return why ``candidate`` is not a well-formed article, or ``''`` if it is.
+
+    Requires an opening ``---``, a closing ``---`` on its own line, and a
+    non-empty body (BUG-044). ``re.DOTALL`` so the frontmatter block can contain
+    newlines.
+    """
+    fm_match = re.match(r"^---\r?\n.*?\r?\n---\r?\n(.+)", candidate, re.DOTALL)
+    body_is_empty = fm_match is None or not fm_match.group(1).strip()
+    if candidate.startswith("---") and not body_is_empty:
+        return ""
+    return (
+        f"(starts_with_dash={candidate.startswith('---')!r}, "
+        f"body_empty={body_is_empty!r}). First 120 chars: {candidate[:120]!r}"
+    )
+
+
 def _raise_if_budget_exceeded(
     msg: ResultMessage, cost: float, max_budget_usd: float | None
 ) -> None:
@@ -503,6 +537,17 @@ def _raise_if_budget_exceeded(
     )
 
 
+async def _interrupt_when_set(
+    client: ClaudeSDKClient, stop_event: asyncio.Event, label: str
+) -> None:
+    """Interrupt ``client``'s turn once ``stop_event`` is set."""
+    await stop_event.wait()
+    try:
+        await client.interrupt()
+    except Exception as exc:  # noqa: BLE001 — the turn may already be over
+        logger.debug("%s: interrupt not delivered: %s", label, exc)
+
+
 async def _collect_text(
     prompt: str,
     system_prompt: str,
@@ -513,6 +558,7 @@ async def _collect_text(
     max_turns: int = 1,
     timeout_s: float | None = None,
     label: str = "stage 3",
+    stop_event: asyncio.Event | None = None,
 ) -> tuple[str, float]:
     """Run an Agent SDK query and return ``(text, cost_usd)``.
 
@@ -531,6 +577,14 @@ async def _collect_text(
     no way to opt out — an unbounded call is the defect. A caller that needs a
     tighter bound passes a smaller ``timeout_s`` (``hero_author`` bounds its own
     draw at 600s, well inside the default backstop).
+
+    ``stop_event`` lets a caller that no longer wants the answer (a losing
+    speculative writer) end the call early. Such calls run on a
+    ``ClaudeSDKClient`` instead of ``query()``: setting the event sends the CLI
+    an interrupt, and the turn ends with its own ``ResultMessage``. Nothing is
+    cancelled mid-pump, and no ``query()`` generator needs closing from
+    outside (BUG-048). The client's task group belongs to this task, so even a
+    hard cancel unwinds it in place. Whatever text was collected is returned.
     """
     bound = DEFAULT_CALL_TIMEOUT_S if timeout_s is None else timeout_s
     options = ClaudeAgentOptions(
@@ -546,24 +600,40 @@ async def _collect_text(
     text_chunks: list[str] = []
     cost = 0.0
     budget_msg: ResultMessage | None = None
+
+    async def consume(messages: Any) -> None:
+        nonlocal cost, budget_msg
+        async for msg in messages:
+            if isinstance(msg, AssistantMessage):
+                for block in msg.content:
+                    if isinstance(block, TextBlock):
+                        text_chunks.append(block.text)
+            elif isinstance(msg, ResultMessage):
+                cost = float(msg.total_cost_usd or 0.0)
+                if msg.subtype == "error_max_budget_usd":
+                    # Break out and raise AFTER the loop (below). Raising
+                    # here, mid-iteration, makes the async-for finalise the
+                    # query() generator while it is still running its
+                    # subprocess pump — 'aclose(): asynchronous generator is
+                    # already running' then masks the real
+                    # BudgetExceededError (BUG-048).
+                    budget_msg = msg
+                    break
+
     try:
         async with asyncio.timeout(bound):
-            async for msg in query(prompt=prompt, options=options):
-                if isinstance(msg, AssistantMessage):
-                    for block in msg.content:
-                        if isinstance(block, TextBlock):
-                            text_chunks.append(block.text)
-                elif isinstance(msg, ResultMessage):
-                    cost = float(msg.total_cost_usd or 0.0)
-                    if msg.subtype == "error_max_budget_usd":
-                        # Break out and raise AFTER the loop (below). Raising
-                        # here, mid-iteration, makes the async-for finalise the
-                        # query() generator while it is still running its
-                        # subprocess pump — 'aclose(): asynchronous generator is
-                        # already running' then masks the real
-                        # BudgetExceededError (BUG-048).
-                        budget_msg = msg
-                        break
+            if stop_event is None:
+                await consume(query(prompt=prompt, options=options))
+            else:
+                async with ClaudeSDKClient(options=options) as client:
+                    await client.query(prompt)
+                    interrupter = asyncio.create_task(
+                        _interrupt_when_set(client, stop_event, label)
+                    )
+                    try:
+                        await consume(client.receive_response())
+                    finally:
+                        interrupter.cancel()
     except TimeoutError as exc:
         # BUG-059: the call stalled. Nothing was returned, so there is nothing
         # to salvage — fail loudly and name the call rather than waiting forever.
@@ -598,12 +668,260 @@ async def _collect_text(
     return "".join(pieces), cost
 
 
+@dataclass
+class _WriterDraft:
+    """One speculative writer attempt, checked and stat-audited."""
+
+    attempt: int
+    article: str
+    session: SourceFetchSession
+    cost_usd: float
+    #: ``''`` when the draft passed the well-formed check (BUG-044).
+    diagnostic: str
+    stat_removals: int = 0
+
+
+async def _speculative_attempt(
+    attempt: int,
+    writer_prompt: str,
+    research_brief: str,
+    *,
+    writer_model: str,
+    budget_usd: float | None,
+    stop_event: asyncio.Event,
+    source_cache: SourceCache | None = None,
+) -> _WriterDraft:
+    """Run one writer attempt for the speculative path and grade the draft.
+
+    Each attempt owns its ``SourceFetchSession`` — as the serial loop does — so
+    concurrent searches cannot share a call budget; sources one attempt has
+    already fetched reach its siblings through ``source_cache``. The stat
+    audit runs here, against the brief plus this attempt's own supplement, so the
+    caller can rank drafts by how much the audit had to strip.
+    """
+    session = SourceFetchSession(cache=source_cache)
+    research_server = create_sdk_mcp_server(
+        "research", tools=[build_search_tool(session)]
+    )
+    raw_writer_output, cost = await _collect_text(
+        writer_prompt,
+        WRITER_SYSTEM_PROMPT,
+        model=writer_model,
+        max_budget_usd=budget_usd,
+        mcp_servers={"research": research_server},
+        allowed_tools=["mcp__research__search_for_source"],
+        max_turns=2 * session.max_calls + 2,
+        label=f"writer (speculative attempt {attempt}/{_WRITER_MAX_ATTEMPTS})",
+        stop_event=stop_event,
+    )
+    candidate = _strip_duplicate_article(_extract_article(raw_writer_output))
+    draft = _WriterDraft(
+        attempt=attempt,
+        article=candidate,
+        session=session,
+        cost_usd=cost,
+        diagnostic=_malformed_diagnostic(candidate),
+    )
+    if not draft.diagnostic:
+        _, draft.stat_removals = _audit_stat_sentences(
+            candidate, research_brief + session.brief_supplement()
+        )
+    return draft
+
+
+async def _stop_losing_attempts(
+    pending: set[asyncio.Task[_WriterDraft]], stop_event: asyncio.Event
+) -> float:
+    """Stop the attempts that lost the race without tripping BUG-048.
+
+    The stop event makes each ``_collect_text`` interrupt its client, and the
+    CLI ends the turn with a ``ResultMessage``. An attempt that has still not
+    finished after ``_SPECULATIVE_CANCEL_GRACE_S`` is hard-cancelled. That is
+    safe because the client, unlike a ``query()`` generator, is owned by the
+    attempt's own task. Every task is awaited so none outlives the run.
+
+    Returns the losers' cost: what each interrupted turn's ``ResultMessage``
+    reported, or ``_WRITER_ATTEMPT_COST_USD`` for an attempt that reported
+    nothing because it was hard-cancelled or failed.
+    """
+    if not pending:
+        return 0.0
+    stop_event.set()
+    _, stragglers = await asyncio.wait(pending, timeout=_SPECULATIVE_CANCEL_GRACE_S)
+    for task in stragglers:
+        task.cancel()
+    outcomes = await asyncio.gather(*pending, return_exceptions=True)
+    return sum(
+        draft.cost_usd if isinstance(draft, _WriterDraft) else _WRITER_ATTEMPT_COST_USD
+        for draft in outcomes
+    )
+
+
+async def _run_speculative_writers(
+    writer_prompt: str,
+    research_brief: str,
+    *,
+    writer_model: str,
+    writer_budget_usd: float | None,
+    parallelism: int,
+    source_cache: SourceCache | None = None,
+) -> tuple[str, float, SourceFetchSession]:
+    """Race up to ``parallelism`` writer attempts; the first acceptable draft wins.
+
+    Returns ``(pre_audit_article, writer_cost_usd, search_session)``.
+
+    Opt-in latency-for-cost trade: instead of waiting out a malformed draft
+    before the next attempt starts, a wave of attempts runs at once and the
+    first draft that is well-formed AND whose stat audit strips no more than
+    ``_SPECULATIVE_MAX_STAT_REMOVALS`` sentences is taken; the rest are stopped.
+    ``_WRITER_MAX_ATTEMPTS`` still bounds the total number of attempts, across
+    waves. A well-formed draft that misses the audit threshold is held back
+    rather than discarded: if no sibling beats it, the cleanest one is used.
+
+    The budget stays cumulative (BUG-061). A wave is only as wide as the
+    remaining budget can fund at ``_WRITER_ATTEMPT_COST_USD`` each, and each
+    attempt is capped at an equal slice of it. A stopped attempt is charged
+    what its interrupted turn reported; one that had to be hard-cancelled
+    reports nothing and is charged the measured per-attempt estimate — the
+    guard overstates spend rather than lets it drift.
+
+    Raises:
+        BudgetExceededError: when a further wave is needed but the remaining
+            budget cannot fund a single attempt.
+        MalformedArticleError: when every attempt came back malformed.
+    """
+    writer_cost = 0.0
+    attempts_dispatched = 0
+    fallback: _WriterDraft | None = None
+    last_diagnostic = ""
+    last_error: Exception | None = None
+    while attempts_dispatched < _WRITER_MAX_ATTEMPTS:
+        remaining_budget = (
+            None
+            if writer_budget_usd is None
+            else max(0.0, writer_budget_usd - writer_cost)
+        )
+        width = min(parallelism, _WRITER_MAX_ATTEMPTS - attempts_dispatched)
+        if remaining_budget is not None:
+            fundable = int(remaining_budget // _WRITER_ATTEMPT_COST_USD)
+            # The first wave always dispatches, exactly as the serial loop's
+            # first attempt does; later waves must be paid for (BUG-061).
+            width = min(width, fundable if attempts_dispatched else max(fundable, 1))
+        if width < 1:
+            if fallback is not None:
+                break
+            raise BudgetExceededError(
+                f"Writer attempt {attempts_dispatched + 1} of "
+                f"{_WRITER_MAX_ATTEMPTS} needs ~${_WRITER_ATTEMPT_COST_USD:.2f} "
+                f"but only ${remaining_budget:.2f} is left of --writer-budget "
+                f"${writer_budget_usd:.2f} (spent ${writer_cost:.2f}). Raise "
+                f"--writer-budget to at least "
+                f"${DEFAULT_WRITER_BUDGET_USD:.2f} to fund every attempt.",
+                budget_usd=writer_budget_usd,
+            )
+        if width < min(parallelism, _WRITER_MAX_ATTEMPTS - attempts_dispatched):
+            logger.warning(
+                "Writer budget funds only %d concurrent attempt(s) of the %d requested",
+                width,
+                parallelism,
+            )
+        slice_usd = None if remaining_budget is None else remaining_budget / width
+        stop_event = asyncio.Event()
+        pending = {
+            asyncio.create_task(
+                _speculative_attempt(
+                    attempt,
+                    writer_prompt,
+                    research_brief,
+                    writer_model=writer_model,
+                    budget_usd=slice_usd,
+                    stop_event=stop_event,
+                    source_cache=source_cache,
+                )
+            )
+            for attempt in range(
+                attempts_dispatched + 1, attempts_dispatched + width + 1
+            )
+        }
+        attempts_dispatched += width
+        logger.info("Dispatched %d speculative writer attempt(s)", width)
+        winner: _WriterDraft | None = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    try:
+                        draft = task.result()
+                    except (BudgetExceededError, ModelCallTimeoutError) as exc:
+                        # One attempt exhausting its slice or stalling must not
+                        # take its siblings down with it.
+                        logger.warning("Speculative writer attempt failed: %s", exc)
+                        writer_cost += slice_usd or _WRITER_ATTEMPT_COST_USD
+                        last_error = exc
+                        continue
+                    writer_cost += draft.cost_usd
+                    if draft.diagnostic:
+                        last_diagnostic = draft.diagnostic
+                        logger.warning(
+                            "Writer attempt %d/%d produced malformed output %s",
+                            draft.attempt,
+                            _WRITER_MAX_ATTEMPTS,
+                            draft.diagnostic,
+                        )
+                    elif draft.stat_removals <= _SPECULATIVE_MAX_STAT_REMOVALS:
+                        # Keep draining ``done`` so every finished attempt's
+                        # cost is counted; the first acceptable draft wins.
+                        winner = winner or draft
+                    elif (
+                        fallback is None or draft.stat_removals < fallback.stat_removals
+                    ):
+                        logger.info(
+                            "Writer attempt %d: stat audit would strip %d "
+                            "sentence(s); holding it while siblings finish",
+                            draft.attempt,
+                            draft.stat_removals,
+                        )
+                        fallback = draft
+        finally:
+            losers = len(pending)
+            losers_cost = await _stop_losing_attempts(pending, stop_event)
+        if losers:
+            writer_cost += losers_cost
+            logger.info(
+                "Stopped %d losing speculative writer attempt(s) ($%.2f)",
+                losers,
+                losers_cost,
+            )
+        if winner is not None:
+            logger.info("Speculative writer attempt %d won", winner.attempt)
+            return winner.article, writer_cost, winner.session
+
+    if fallback is not None:
+        logger.warning(
+            "No speculative draft met the stat-audit threshold (%d); using "
+            "attempt %d, which loses %d sentence(s) to the audit",
+            _SPECULATIVE_MAX_STAT_REMOVALS,
+            fallback.attempt,
+            fallback.stat_removals,
+        )
+        return fallback.article, writer_cost, fallback.session
+    if last_error is not None and not last_diagnostic:
+        raise last_error
+    raise MalformedArticleError(
+        f"Writer output is not a well-formed article after "
+        f"{_WRITER_MAX_ATTEMPTS} attempts {last_diagnostic}"
+    )
+
+
 async def run_stage3(
     topic: str,
     writer_budget_usd: float | None = DEFAULT_WRITER_BUDGET_USD,
     writer_model: str = DEFAULT_WRITER_MODEL,
     research_mode: str = "deterministic",
     brief_override: str | None = None,
+    writer_parallelism: int = 1,
 ) -> Stage3Result:
     """Generate one article via the Agent SDK and return captured metrics.
 
@@ -622,6 +940,11 @@ async def run_stage3(
             because the Story 4 verification run showed Opus 4.7 cost
             3.4× more for a marginally LOWER score on this task. Override
             with WRITER_MODEL env var if your topic needs deeper reasoning.
+        writer_parallelism: Opt-in speculative writing. Above 1, that many
+            writer attempts run at once under the same cumulative budget and
+            the first acceptable draft wins (``_run_speculative_writers``).
+            Trades writer spend for latency; the default 1 keeps the serial
+            retry loop.
 
     Returns:
         Stage3Result with article text, the chart proposal, cost, and timing.
@@ -649,7 +972,8 @@ async def run_stage3(
 
     writer_prompt = _build_writer_prompt(topic, research_brief, style_section)
     # #389 hybrid research: expose a budget-capped source-search tool the writer
-    # can call mid-draft. A fresh session per article isolates budget/dedupe.
+    # can call mid-draft. A fresh session per attempt isolates the call budget;
+    # the run's SourceCache (below) shares what earlier attempts fetched.
     # max_turns must exceed 1 so the SDK can drive the tool-use loop.
     #
     # Bounded retry (BUG-044): the writer (esp. via the subscription CLI)
@@ -664,74 +988,86 @@ async def run_stage3(
     # BudgetExceededError rather than overspend).
     pre_audit_article = ""
     writer_cost = 0.0
-    search_session = SourceFetchSession()
+    # One cache for the whole run: a retry re-asks the searches the failed
+    # attempt already paid for, and each session's budget is spent only on
+    # queries nobody in this run (or, with SOURCE_CACHE_PATH, earlier runs)
+    # has fetched.
+    source_cache = SourceCache.for_run()
+    search_session = SourceFetchSession(cache=source_cache)
     last_diagnostic = ""
-    for attempt in range(1, _WRITER_MAX_ATTEMPTS + 1):
-        search_session = SourceFetchSession()
-        research_server = create_sdk_mcp_server(
-            "research", tools=[build_search_tool(search_session)]
-        )
-        remaining_budget = (
-            None
-            if writer_budget_usd is None
-            else max(0.0, writer_budget_usd - writer_cost)
-        )
-        # Never dispatch a retry the budget cannot pay for (BUG-061). The SDK
-        # would abort it anyway, but generically — the operator needs the
-        # arithmetic and the name of the knob, not "budget exceeded".
-        if (
-            attempt > 1
-            and remaining_budget is not None
-            and remaining_budget < _WRITER_ATTEMPT_COST_USD
-        ):
-            raise BudgetExceededError(
-                f"Writer attempt {attempt} of {_WRITER_MAX_ATTEMPTS} needs "
-                f"~${_WRITER_ATTEMPT_COST_USD:.2f} but only "
-                f"${remaining_budget:.2f} is left of --writer-budget "
-                f"${writer_budget_usd:.2f} (spent ${writer_cost:.2f}). Raise "
-                f"--writer-budget to at least "
-                f"${DEFAULT_WRITER_BUDGET_USD:.2f} to fund every attempt.",
-                budget_usd=writer_budget_usd,
-            )
-        raw_writer_output, attempt_cost = await _collect_text(
+    if writer_parallelism > 1:
+        (
+            pre_audit_article,
+            writer_cost,
+            search_session,
+        ) = await _run_speculative_writers(
             writer_prompt,
-            WRITER_SYSTEM_PROMPT,
-            model=writer_model,
-            max_budget_usd=remaining_budget,
-            mcp_servers={"research": research_server},
-            allowed_tools=["mcp__research__search_for_source"],
-            # Each search costs 2 turns (the tool_use, then consuming the
-            # tool_result); plus the initial draft and 1 turn of headroom.
-            max_turns=2 * search_session.max_calls + 2,
-            label=f"writer (attempt {attempt}/{_WRITER_MAX_ATTEMPTS})",
-        )
-        writer_cost += attempt_cost
-        # _extract_article (BUG-047) unwraps a fence AND strips conversational
-        # preamble / stray rules before the frontmatter, so a preambled draft
-        # passes the well-formed check on this attempt instead of retrying.
-        candidate = _strip_duplicate_article(_extract_article(raw_writer_output))
-        # Require opening ---, a closing --- on its own line, and a non-empty
-        # body. re.DOTALL so the frontmatter block can contain newlines.
-        _fm_match = re.match(r"^---\r?\n.*?\r?\n---\r?\n(.+)", candidate, re.DOTALL)
-        body_is_empty = _fm_match is None or not _fm_match.group(1).strip()
-        if candidate.startswith("---") and not body_is_empty:
-            pre_audit_article = candidate
-            break
-        last_diagnostic = (
-            f"(starts_with_dash={candidate.startswith('---')!r}, "
-            f"body_empty={body_is_empty!r}). First 120 chars: {candidate[:120]!r}"
-        )
-        logger.warning(
-            "Writer attempt %d/%d produced malformed output %s; retrying",
-            attempt,
-            _WRITER_MAX_ATTEMPTS,
-            last_diagnostic,
+            research_brief,
+            writer_model=writer_model,
+            writer_budget_usd=writer_budget_usd,
+            parallelism=writer_parallelism,
+            source_cache=source_cache,
         )
     else:
-        raise MalformedArticleError(
-            f"Writer output is not a well-formed article after "
-            f"{_WRITER_MAX_ATTEMPTS} attempts {last_diagnostic}"
-        )
+        for attempt in range(1, _WRITER_MAX_ATTEMPTS + 1):
+            search_session = SourceFetchSession(cache=source_cache)
+            research_server = create_sdk_mcp_server(
+                "research", tools=[build_search_tool(search_session)]
+            )
+            remaining_budget = (
+                None
+                if writer_budget_usd is None
+                else max(0.0, writer_budget_usd - writer_cost)
+            )
+            # Never dispatch a retry the budget cannot pay for (BUG-061). The SDK
+            # would abort it anyway, but generically — the operator needs the
+            # arithmetic and the name of the knob, not "budget exceeded".
+            if (
+                attempt > 1
+                and remaining_budget is not None
+                and remaining_budget < _WRITER_ATTEMPT_COST_USD
+            ):
+                raise BudgetExceededError(
+                    f"Writer attempt {attempt} of {_WRITER_MAX_ATTEMPTS} needs "
+                    f"~${_WRITER_ATTEMPT_COST_USD:.2f} but only "
+                    f"${remaining_budget:.2f} is left of --writer-budget "
+                    f"${writer_budget_usd:.2f} (spent ${writer_cost:.2f}). Raise "
+                    f"--writer-budget to at least "
+                    f"${DEFAULT_WRITER_BUDGET_USD:.2f} to fund every attempt.",
+                    budget_usd=writer_budget_usd,
+                )
+            raw_writer_output, attempt_cost = await _collect_text(
+                writer_prompt,
+                WRITER_SYSTEM_PROMPT,
+                model=writer_model,
+                max_budget_usd=remaining_budget,
+                mcp_servers={"research": research_server},
+                allowed_tools=["mcp__research__search_for_source"],
+                # Each search costs 2 turns (the tool_use, then consuming the
+                # tool_result); plus the initial draft and 1 turn of headroom.
+                max_turns=2 * search_session.max_calls + 2,
+                label=f"writer (attempt {attempt}/{_WRITER_MAX_ATTEMPTS})",
+            )
+            writer_cost += attempt_cost
+            # _extract_article (BUG-047) unwraps a fence AND strips conversational
+            # preamble / stray rules before the frontmatter, so a preambled draft
+            # passes the well-formed check on this attempt instead of retrying.
+            candidate = _strip_duplicate_article(_extract_article(raw_writer_output))
+            last_diagnostic = _malformed_diagnostic(candidate)
+            if not last_diagnostic:
+                pre_audit_article = candidate
+                break
+            logger.warning(
+                "Writer attempt %d/%d produced malformed output %s; retrying",
+                attempt,
+                _WRITER_MAX_ATTEMPTS,
+                last_diagnostic,
+            )
+        else:
+            raise MalformedArticleError(
+                f"Writer output is not a well-formed article after "
+                f"{_WRITER_MAX_ATTEMPTS} attempts {last_diagnostic}"
+            )
 
     if search_session.calls_made:
         logger.info(
@@ -7,7 +7,14 @@ wants to support.
 
 Design (see docs/specs/389-hybrid-research.md):
 - Per-article ``SourceFetchSession`` enforces a hard call budget and dedupes
-  identical queries within one run (no cross-article persistence).
+  identical queries within one article.
+- An optional ``SourceCache`` is shared across sessions — run-scoped by
+  default, persisted to ``SOURCE_CACHE_PATH`` when set — so a writer retry or
+  a related article reuses sources already fetched. A shared hit costs nothing
+  against the session's call budget.
+- Provider calls block (HTTP plus backoff sleeps), so the async tool runs them
+  on a small shared worker pool rather than on the writer's event loop, and
+  over-fetches so a follow-up for more of the same query is a cache hit.
 - Backed by the existing provider stack (Brave-first for latency, Google web
   fallback) via ``scripts/*_search.py`` — no new providers.
 - Fetched sources are accumulated so ``run_stage3`` can append them to the
@@ -17,19 +24,63 @@ Design (see docs/specs/389-hybrid-research.md):
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
 import orjson
 from claude_agent_sdk import tool
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no flock
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Hard cap on writer search calls per article (resolved design question #1).
 DEFAULT_SEARCH_CALL_BUDGET = 3
 
+#: Worker threads shared by every session's provider calls. Small on purpose:
+#: arXiv asks for one request every few seconds, so width buys overlap with the
+#: writer's own turns, not provider throughput.
+PROVIDER_MAX_WORKERS = 4
+
+#: Minimum results fetched per provider call, so a follow-up asking for more
+#: of the same query is served from the cache.
+PREFETCH_RESULTS = 5
+
+#: Most results one ``search_for_source`` call returns; stated in the tool's
+#: description and enforced by clamping.
+MAX_RESULTS_PER_QUERY = 10
+
+#: How long a persisted ``SourceCache`` entry stays usable. Sources feed a
+#: "fresh research" brief, so a week-old search is re-run rather than reused.
+DEFAULT_SOURCE_CACHE_TTL_S = 7 * 24 * 3600.0
+
 Source = dict[str, str]
 
+_provider_pool: ThreadPoolExecutor | None = None
+_provider_pool_lock = threading.Lock()
+
+
+def _provider_executor() -> ThreadPoolExecutor:
+    """Return the process-wide provider pool, creating it on first use."""
+    global _provider_pool
+    with _provider_pool_lock:
+        if _provider_pool is None:
+            _provider_pool = ThreadPoolExecutor(
+                max_workers=PROVIDER_MAX_WORKERS, thread_name_prefix="source-search"
+            )
+        return _provider_pool
+
 
 def _run_provider_search(query: str, max_results: int) -> list[Source]:
     """Fetch sources for ``query`` via the free academic provider stack.
@@ -80,41 +131,277 @@ def _run_provider_search(query: str, max_results: int) -> list[Source]:
     ][:max_results]
 
 
+def _covers(sources: list[Source], limit: int, max_results: int) -> bool:
+    """Whether results fetched with ``limit`` can answer ``max_results``."""
+    return max_results <= limit or len(sources) < limit
+
+
+def _fetch_limit(max_results: int) -> int:
+    return max(min(max_results, MAX_RESULTS_PER_QUERY), PREFETCH_RESULTS)
+
+
+def _record_line(
+    key: str, fetched_at: float, sources: list[Source], limit: int
+) -> bytes:
+    record = {
+        "query": key,
+        "fetched_at": fetched_at,
+        "sources": sources,
+        "limit": limit,
+    }
+    return orjson.dumps(record) + b"\n"
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[bool]:
+    """Hold an exclusive ``flock`` on ``path``'s ``.lock`` sidecar.
+
+    Yields whether the lock is held: ``False`` where ``flock`` is missing or
+    the sidecar cannot be created, and the caller must then assume another
+    process may be writing.
+    """
+    if fcntl is None:
+        yield False
+        return
+    try:
+        fh = path.with_suffix(path.suffix + ".lock").open("ab")
+    except OSError:
+        yield False
+        return
+    with fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        yield True
+
+
+class SourceCache:
+    """Provider results shared by every ``SourceFetchSession`` in a run.
+
+    Keyed by the normalised query, like a session's own dedupe cache. In memory
+    only by default; given a ``path`` it also loads and appends JSON lines there,
+    so later runs (related articles) start warm, and compacts the file on load
+    under a lock that appends from other runs also take.
+    Empty results are never stored — a provider outage must not be remembered
+    as "nothing exists".
+    Thread-safe: sessions fetch on the shared worker pool.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl_s: float = DEFAULT_SOURCE_CACHE_TTL_S,
+    ) -> None:
+        self.path = path
+        self.ttl_s = ttl_s
+        self.hits = 0
+        #: key -> (fetched_at, sources, results the provider was asked for)
+        self._entries: dict[str, tuple[float, list[Source], int]] = {}
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            self._load(path)
+
+    @classmethod
+    def for_run(cls) -> SourceCache:
+        """A run-scoped cache, persisted only when ``SOURCE_CACHE_PATH`` is set."""
+        configured = os.environ.get("SOURCE_CACHE_PATH")
+        return cls(Path(configured) if configured else None)
+
+    def _load(self, path: Path) -> None:
+        # Appends from other runs take the same lock, so none can land between
+        # this read and the compaction's rewrite and be lost.
+        with _file_lock(path) as locked:
+            try:
+                lines = path.read_bytes().splitlines()
+            except OSError as exc:
+                logger.warning(
+                    "Source cache %s unreadable (%s); starting cold", path, exc
+                )
+                return
+            self._parse(lines)
+            if locked and len(lines) > len(self._entries):
+                self._compact(path)
+
+    def _parse(self, lines: list[bytes]) -> None:
+        cutoff = time.time() - self.ttl_s
+        for line in lines:
+            try:
+                record = orjson.loads(line)
+                key, fetched_at = record["query"], float(record["fetched_at"])
+                sources = list(record["sources"])
+                limit = int(record.get("limit", PREFETCH_RESULTS))
+            except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+                continue  # a torn final line from an interrupted run
+            if fetched_at >= cutoff:
+                self._entries[key] = (fetched_at, sources, limit)
+
+    def _compact(self, path: Path) -> None:
+        """Rewrite ``path`` with only the live entries.
+
+        Appends never remove anything, so expired, superseded and torn lines
+        are dropped here, on load, instead of the file growing forever. Only
+        called under :func:`_file_lock`; without the lock the file is left
+        to grow.
+        """
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        try:
+            tmp.write_bytes(
+                b"".join(
+                    _record_line(key, *entry) for key, entry in self._entries.items()
+                )
+            )
+            os.replace(tmp, path)  # a reader never sees a half-written cache
+        except OSError as exc:  # compaction is best-effort, like persistence
+            logger.warning("Could not compact source cache %s: %s", path, exc)
+
+    def get(self, key: str, max_results: int = 0) -> list[Source] | None:
+        """Return the cached sources for ``key``, or ``None`` on a miss.
+
+        An entry fetched with a smaller limit than ``max_results`` is a miss
+        unless the provider had already run out of results.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time() - self.ttl_s:
+                return None
+            if not _covers(entry[1], entry[2], max_results):
+                return None
+            self.hits += 1
+            return list(entry[1])
+
+    def put(
+        self, key: str, sources: list[Source], limit: int = PREFETCH_RESULTS
+    ) -> None:
+        """Store ``sources`` for ``key`` and append them to the backing file."""
+        if not sources:
+            return
+        fetched_at = time.time()
+        with self._lock:
+            self._entries[key] = (fetched_at, list(sources), limit)
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with _file_lock(self.path), self.path.open("ab") as fh:
+                    fh.write(_record_line(key, fetched_at, sources, limit))
+            except OSError as exc:  # persistence is best-effort
+                logger.warning("Could not persist source cache entry: %s", exc)
+
+
 class SourceFetchSession:
     """Per-article budget, dedupe cache, and accumulator for writer searches."""
 
-    def __init__(self, max_calls: int = DEFAULT_SEARCH_CALL_BUDGET) -> None:
+    def __init__(
+        self,
+        max_calls: int = DEFAULT_SEARCH_CALL_BUDGET,
+        cache: SourceCache | None = None,
+    ) -> None:
         self.max_calls = max_calls
         self.calls_made = 0
+        self.shared_hits = 0
+        self.shared_cache = cache
         self.fetched: list[Source] = []
         self._cache: dict[str, list[Source]] = {}
+        self._limits: dict[str, int] = {}
+        self._in_flight: dict[str, asyncio.Future[list[Source]]] = {}
 
     def search(self, query: str, max_results: int = 3) -> list[Source]:
         """Return sources for ``query``, honouring the dedupe cache and budget.
 
         Returns an empty list (never raises) when the budget is exhausted or the
-        provider fails, so the writer turn always survives.
+        provider fails, so the writer turn always survives. A hit in the shared
+        ``SourceCache`` is served without spending budget.
+        """
+        key = query.strip().lower()
+        max_results = min(max_results, MAX_RESULTS_PER_QUERY)
+        if self._cached(key, max_results) or self._adopt_shared(key, max_results):
+            return self._serve(key, max_results)
+        if not self._claim_call(query):
+            return self._serve(key, max_results) if key in self._cache else []
+        limit = _fetch_limit(max_results)
+        self._store(key, self._fetch(query, limit), limit)
+        return self._serve(key, max_results)
+
+    async def asearch(self, query: str, max_results: int = 3) -> list[Source]:
+        """Async ``search``: the provider call runs on the shared worker pool.
+
+        Same cache, budget and never-raises contract as ``search``. A query
+        already being fetched is awaited rather than fetched twice, so
+        concurrent identical calls cost one provider call and one budget unit.
         """
         key = query.strip().lower()
-        if key in self._cache:
-            return self._cache[key]
+        max_results = min(max_results, MAX_RESULTS_PER_QUERY)
+        if self._cached(key, max_results) or self._adopt_shared(key, max_results):
+            return self._serve(key, max_results)
+        if key in self._in_flight:
+            await asyncio.shield(self._in_flight[key])
+            if self._cached(key, max_results):
+                return self._serve(key, max_results)
+        if not self._claim_call(query):
+            return self._serve(key, max_results) if key in self._cache else []
+
+        limit = _fetch_limit(max_results)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_provider_executor(), self._fetch, query, limit)
+        self._in_flight[key] = future
+        try:
+            self._store(key, await future, limit)
+        finally:
+            del self._in_flight[key]
+        return self._serve(key, max_results)
+
+    def _cached(self, key: str, max_results: int) -> bool:
+        return key in self._cache and _covers(
+            self._cache[key], self._limits[key], max_results
+        )
+
+    def _adopt_shared(self, key: str, max_results: int) -> bool:
+        """Copy a shared-cache hit into this session; free against the budget."""
+        if self.shared_cache is None:
+            return False
+        sources = self.shared_cache.get(key, max_results)
+        if sources is None:
+            return False
+        self.shared_hits += 1
+        logger.info("search_for_source %r served from the shared source cache", key)
+        self._cache[key] = sources
+        # Fewer sources than asked for means the provider had run dry, and a
+        # limit above the count makes _covers() answer any larger request.
+        ran_dry = len(sources) < max_results
+        self._limits[key] = len(sources) + 1 if ran_dry else len(sources)
+        return True
+
+    def _store(self, key: str, sources: list[Source], limit: int) -> None:
+        self._cache[key] = sources
+        self._limits[key] = limit
+        if self.shared_cache is not None:
+            self.shared_cache.put(key, sources, limit)
 
+    def _claim_call(self, query: str) -> bool:
+        """Spend one unit of the call budget, or refuse once it is exhausted."""
         if self.calls_made >= self.max_calls:
             logger.info(
                 "search_for_source budget (%d) exhausted; refusing query %r",
                 self.max_calls,
                 query,
             )
-            return []
-
+            return False
         self.calls_made += 1
+        return True
+
+    def _fetch(self, query: str, limit: int) -> list[Source]:
+        """One provider call for ``limit`` results (at least ``PREFETCH_RESULTS``)."""
         try:
-            results = _run_provider_search(query, max_results)
+            return _run_provider_search(query, limit)
         except Exception as exc:  # provider must never break the writer
             logger.warning("search_for_source provider error for %r: %s", query, exc)
-            results = []
+            return []
+
+    def _serve(self, key: str, max_results: int) -> list[Source]:
+        """Slice the cached results to what was asked for and record them.
 
-        self._cache[key] = results
+        Only sources actually handed to the writer join ``fetched`` (and so the
+        brief supplement); the over-fetched remainder waits for a follow-up.
+        """
+        results = self._cache[key][: max(max_results, 0)]
         for source in results:
             if source not in self.fetched:
                 self.fetched.append(source)
@@ -143,8 +430,9 @@ def build_search_tool(session: SourceFetchSession) -> Any:
         (
             "Find sources for a specific claim. Returns title/url/snippet for "
             "each result. Use this only when you are about to make a claim that "
-            "is not supported by the research brief. Call sparingly (at most 3 "
-            "per article) — prefer claims from the brief when possible."
+            "is not supported by the research brief. max_results defaults to 3 "
+            "and is capped at 10. Call sparingly (at most 3 per article) — "
+            "prefer claims from the brief when possible."
         ),
         {"query": str, "max_results": int},
     )
@@ -158,7 +446,7 @@ def build_search_tool(session: SourceFetchSession) -> Any:
             max_results = int(args.get("max_results", 3) or 3)
         except (TypeError, ValueError):
             max_results = 3
-        results = session.search(query, max_results)
+        results = await session.asearch(query, max_results)
         return {
             "content": [{"type": "text", "text": orjson.dumps(results).decode("utf-8")}]
         }
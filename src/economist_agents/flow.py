@@ -683,7 +683,7 @@ class EconomistContentFlow:
         try:
             evaluator = ArticleEvaluator()
             result = evaluator.evaluate(article, filename=status)
-            result.persist("logs/article_evals.json")
+            result.persist()
             logger.info(
                 "   📊 Article eval: %s/%s (%s%%)",
                 result.total_score,
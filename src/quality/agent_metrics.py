@@ -13,11 +13,14 @@ Usage:
     metrics.save()
 """
 
+import copy
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from src.telemetry.bus import emit
+
 
 class AgentMetrics:
     """Tracks and analyzes agent performance over time"""
@@ -221,6 +224,7 @@ class AgentMetrics:
 
         # Add current run to history
         self.metrics["runs"].append(self.current_run)
+        emit("agent_metrics_run", copy.deepcopy(self.current_run))
         self.metrics["summary"]["total_runs"] = len(self.metrics["runs"])
 
         # Update per-agent summaries
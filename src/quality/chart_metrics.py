@@ -12,12 +12,15 @@ Tracks visual quality metrics for Economist-style charts:
 Integrates with skills_manager for persistent metrics storage.
 """
 
+import copy
 import json
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from src.telemetry.bus import emit
+
 
 class ChartMetricsCollector:
     """Collects and persists chart generation metrics"""
@@ -200,6 +203,7 @@ class ChartMetricsCollector:
         }
 
         self.metrics["sessions"].append(session_summary)
+        emit("chart_session", copy.deepcopy(session_summary))
         self.metrics["last_updated"] = datetime.now().isoformat()
         self.save()
 
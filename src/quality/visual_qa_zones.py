@@ -32,11 +32,47 @@ Usage:
 
     if not is_valid:
         print(f"Zone violations: {issues}")
+
+    # Whole archive: concurrent decode, per-check timings, nothing swallowed
+    results = validator.validate_charts(Path('output/charts').glob('*.png'))
 """
 
 import ast
 import re
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+RED_BAR_RGB = (227, 49, 11)  # #e3120b
+BG_RGB = (241, 240, 233)  # #f1f0e9
+
+#: The pixel checks look at every Nth row and column, with N chosen so about
+#: this many rows are sampled. Both checks compare the share of matching pixels
+#: in a zone against a threshold, which a regular sample estimates closely;
+#: charts rendered at 300 dpi are then checked for the cost of a 400-px one.
+#: A share within a point or two of a threshold, or a pattern that repeats
+#: at the sampling step, can get a different verdict from a full scan.
+PIXEL_SAMPLE_ROWS = 400
+
+
+@dataclass
+class ChartQAResult:
+    """Outcome of the zone checks for one chart in a batch."""
+
+    path: Path
+    issues: list[str] = field(default_factory=list)
+    #: Wall time per check: ``filename``, ``code``, ``decode``, ``red_bar``,
+    #: ``background``. A check that did not run has no entry.
+    timings_ms: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
 
 
 class ZoneBoundaryValidator:
@@ -362,45 +398,105 @@ class ZoneBoundaryValidator:
 
     def _validate_pixels(self, chart_path: Path) -> list[str]:
         """Validate chart at pixel level for zone boundaries"""
-        issues = []
-
         try:
-            import numpy as np
-            from PIL import Image
-
-            with Image.open(chart_path) as img:
-                pixels = np.array(img.convert("RGB"))
-            height, width = pixels.shape[:2]
-
-            # Raster rows count down from the top, unlike figure coordinates.
-            red_bar_height = max(1, int(height * 0.04))
-            red_bar_zone = (0, red_bar_height)
-            title_zone = (int(height * 0.06), int(height * 0.15))
+            pixels = self._load_pixels(chart_path)
+            return self._check_red_bar(pixels) + self._check_background(pixels)
+        except Exception:
+            # Pixel validation optional - don't fail if it errors
+            return []
 
-            # Check 1: Red bar present at top
-            red_bar_pixels = pixels[red_bar_zone[0] : red_bar_zone[1], :, :]
-            red_bar_color = np.array([227, 49, 11])  # #e3120b
+    def _load_pixels(self, chart_path: Path) -> np.ndarray:
+        """Decode a chart to an RGB array, without copying if already RGB(A)."""
+        from PIL import Image
+
+        with Image.open(chart_path) as img:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGB")
+            pixels = np.asarray(img)
+        return pixels[:, :, :3]
+
+    def _sample(self, zone: np.ndarray, height: int) -> np.ndarray:
+        """Every Nth row and column of a zone, signed so differences can't wrap."""
+        step = max(1, height // PIXEL_SAMPLE_ROWS)
+        return zone[::step, ::step].astype(np.int16)
+
+    def _check_red_bar(self, pixels: np.ndarray) -> list[str]:
+        """Check 1: red bar colour dominant in the top 4%."""
+        # Raster rows count down from the top, unlike figure coordinates.
+        height = pixels.shape[0]
+        zone = self._sample(pixels[: max(1, int(height * 0.04))], height)
+        red_matches = (np.abs(zone - RED_BAR_RGB) < 10).all(axis=2)
+        if red_matches.mean() < 0.5:
+            return ["Red bar not detected in RED BAR ZONE (top 4%)"]
+        return []
+
+    def _check_background(self, pixels: np.ndarray) -> list[str]:
+        """Check 2: warm beige background across the title zone."""
+        height = pixels.shape[0]
+        zone = self._sample(pixels[int(height * 0.06) : int(height * 0.15)], height)
+        bg_matches = (np.abs(zone - BG_RGB) < 30).all(axis=2)
+        if bg_matches.size and bg_matches.mean() < 0.3:
+            return ["Background color #f1f0e9 not dominant (expected warm beige)"]
+        return []
+
+    def validate_charts(
+        self,
+        chart_paths: Iterable[str | Path],
+        max_workers: int | None = None,
+    ) -> list[ChartQAResult]:
+        """Run the zone checks over many charts at once.
 
-            # Check if red bar color is dominant in that zone
-            red_matches = np.all(np.abs(red_bar_pixels - red_bar_color) < 10, axis=2)
-            if red_matches.sum() < (red_bar_pixels.shape[0] * width * 0.5):
-                issues.append("Red bar not detected in RED BAR ZONE (top 4%)")
+        Charts are decoded concurrently (PIL releases the GIL while inflating a
+        PNG) and each check is timed. Unlike :meth:`validate_chart`, a chart
+        whose pixels cannot be read is reported as an issue rather than passed
+        silently. ``self.issues`` is left untouched.
 
-            # Check 2: Background color
-            bg_color = np.array([241, 240, 233])  # #f1f0e9
-            bg_pixels = pixels[title_zone[0] : title_zone[1], :, :]
-            bg_matches = np.all(np.abs(bg_pixels - bg_color) < 30, axis=2)
+        Args:
+            chart_paths: PNG files. Every path is queued on the pool up front;
+                at most ``max_workers`` charts are decoded at once.
+            max_workers: Decode threads (the executor default when omitted).
 
-            if bg_matches.sum() < (bg_pixels.shape[0] * bg_pixels.shape[1] * 0.3):
-                issues.append(
-                    "Background color #f1f0e9 not dominant (expected warm beige)",
-                )
+        Returns:
+            One :class:`ChartQAResult` per path, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._validate_one, map(Path, chart_paths)))
 
-        except Exception:
-            # Pixel validation optional - don't fail if it errors
-            pass
+    def _validate_one(self, chart_path: Path) -> ChartQAResult:
+        result = ChartQAResult(chart_path)
+        if not chart_path.exists():
+            result.issues.append(f"Chart file not found: {chart_path}")
+            return result
+
+        def timed(name: str, check: Callable[..., Any], *args: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return check(*args)
+            finally:
+                result.timings_ms[name] = (time.perf_counter() - start) * 1000
+
+        if not timed("filename", self._validate_filename, chart_path):
+            result.issues.append(
+                f"Invalid filename: {chart_path.name}. Must be slug-style (lowercase-with-hyphens.png)",
+            )
+        script_path = (
+            chart_path.parent.parent
+            / "scripts"
+            / chart_path.name.replace(".png", ".py")
+        )
+        if script_path.exists():
+            result.issues.extend(
+                timed("code", self._validate_matplotlib_code, script_path)
+            )
 
-        return issues
+        try:
+            pixels = timed("decode", self._load_pixels, chart_path)
+        except Exception as exc:  # noqa: BLE001 — reported, not swallowed
+            result.issues.append(f"Pixel checks could not run: {exc}")
+            return result
+        result.issues.extend(timed("red_bar", self._check_red_bar, pixels))
+        result.issues.extend(timed("background", self._check_background, pixels))
+        return result
 
     def generate_report(self) -> str:
         """Generate human-readable validation report"""
@@ -430,28 +526,66 @@ def validate_chart_cli():
     parser = argparse.ArgumentParser(
         description="Validate Economist-style chart zone boundaries",
     )
-    parser.add_argument("chart_path", help="Path to chart PNG file")
+    parser.add_argument(
+        "chart_path",
+        nargs="+",
+        help="Chart PNG file(s), or directories of them",
+    )
     parser.add_argument(
         "--report",
         action="store_true",
         help="Generate detailed report",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print the time spent in each check (batch mode)",
+    )
 
     args = parser.parse_args()
 
     validator = ZoneBoundaryValidator()
-    is_valid, issues = validator.validate_chart(args.chart_path)
-
-    if args.report:
-        print(validator.generate_report())
-    elif is_valid:
-        print(f"✅ {args.chart_path}: All checks PASSED")
-    else:
-        print(f"❌ {args.chart_path}: {len(issues)} issues found")
-        for issue in issues:
-            print(f"   • {issue}")
-
-    return 0 if is_valid else 1
+    if len(args.chart_path) == 1 and not Path(args.chart_path[0]).is_dir():
+        chart_path = args.chart_path[0]
+        is_valid, issues = validator.validate_chart(chart_path)
+
+        if args.report:
+            print(validator.generate_report())
+        elif is_valid:
+            print(f"✅ {chart_path}: All checks PASSED")
+        else:
+            print(f"❌ {chart_path}: {len(issues)} issues found")
+            for issue in issues:
+                print(f"   • {issue}")
+
+        return 0 if is_valid else 1
+
+    paths = []
+    for arg in map(Path, args.chart_path):
+        paths.extend(sorted(arg.glob("*.png")) if arg.is_dir() else [arg])
+    start = time.perf_counter()
+    results = validator.validate_charts(paths)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.is_valid:
+            print(f"✅ {result.path}: All checks PASSED")
+        else:
+            print(f"❌ {result.path}: {len(result.issues)} issues found")
+            for issue in result.issues:
+                print(f"   • {issue}")
+
+    failed = sum(not r.is_valid for r in results)
+    print(f"\n{len(results) - failed}/{len(results)} charts passed in {elapsed:.2f}s")
+    if args.timings:
+        totals: dict[str, float] = {}
+        for result in results:
+            for check, ms in result.timings_ms.items():
+                totals[check] = totals.get(check, 0.0) + ms
+        for check, ms in totals.items():
+            print(f"   {check:<11} {ms:>9.1f} ms total")
+
+    return 0 if failed == 0 else 1
 
 
 if __name__ == "__main__":
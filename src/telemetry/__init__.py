@@ -1,8 +1,10 @@
 """ROI Telemetry System
 
 Tracks token usage, costs, and human-hour equivalent savings for business ROI validation.
+Cost, token and timing events from every stage go through the telemetry bus.
 """
 
+from .bus import JsonlMirror, TelemetryBus, emit, flush, get_bus
 from .roi_tracker import ROITracker
 
-__all__ = ["ROITracker"]
+__all__ = ["JsonlMirror", "ROITracker", "TelemetryBus", "emit", "flush", "get_bus"]
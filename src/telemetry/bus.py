@@ -0,0 +1,287 @@
+"""Telemetry Bus - one in-process path for cost, token and timing events
+
+Producers call :func:`emit`, which only puts the event on a queue and
+returns. A background thread drains the queue in batches and writes each
+batch to a single SQLite sink (``logs/telemetry.db``, WAL mode) with one
+``executemany``, so no caller waits on disk I/O.
+
+Legacy files keep their formats through mirrors: an event emitted with a
+:class:`JsonlMirror` is also appended to that JSONL file, one write per
+file per batch. ``logs/agent_sdk_costs.jsonl`` and
+``~/.economist-agents/token-usage.jsonl`` are written this way.
+
+Call :func:`flush` before reading a mirrored file you have just emitted to;
+pending events are also flushed at interpreter exit.
+
+Usage:
+    from src.telemetry import emit, flush
+
+    emit("token_usage", record, mirror=JsonlMirror(log_file))
+    flush()
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path("logs/telemetry.db")
+BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 1.0
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS events (
+    id        INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    kind      TEXT NOT NULL,
+    payload   BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_kind ON events (kind, timestamp);
+"""
+
+
+@dataclass(frozen=True)
+class JsonlMirror:
+    """Append an event's payload to a legacy JSONL file, as the old writer did."""
+
+    path: Path
+
+    def __post_init__(self) -> None:
+        # Resolve against the emitter's cwd; the writer runs later.
+        object.__setattr__(self, "path", Path(self.path).absolute())
+
+    def write(self, payloads: list[dict[str, Any]]) -> None:
+        """Append all ``payloads`` in one ``O_APPEND`` write."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b"".join(orjson.dumps(p) + b"\n" for p in payloads))
+        finally:
+            os.close(fd)
+
+
+@dataclass(frozen=True)
+class _Event:
+    timestamp: str
+    kind: str
+    payload: dict[str, Any]
+    mirror: JsonlMirror | None
+
+
+class TelemetryBus:
+    """Queue plus background batch writer for telemetry events."""
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        """Initialize the bus; the writer thread starts on the first emit.
+
+        Args:
+            db_path: SQLite sink. Defaults to ``$TELEMETRY_DB_PATH`` or
+                ``logs/telemetry.db``.
+            batch_size: Most events written per transaction.
+            flush_interval: Seconds the writer waits for more events.
+
+        """
+        if db_path is None:
+            db_path = os.environ.get("TELEMETRY_DB_PATH", DEFAULT_DB_PATH)
+        self.db_path = Path(db_path).absolute()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._start_lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # A forked child inherits the queue but not the writer thread.
+        self._pid = os.getpid()
+        self._queue: queue.SimpleQueue[_Event | threading.Event] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+
+    def emit(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        mirror: JsonlMirror | None = None,
+    ) -> None:
+        """Queue one event without blocking.
+
+        Args:
+            kind: Event type, e.g. ``"token_usage"``.
+            payload: JSON-serialisable event body. Not copied, so do not
+                mutate it after emitting.
+            mirror: Legacy file the payload should also be appended to.
+
+        """
+        self._ensure_writer()
+        self._queue.put(
+            _Event(datetime.now(UTC).isoformat(), kind, payload, mirror),
+        )
+
+    def flush(self, timeout: float | None = 10.0) -> bool:
+        """Block until every event emitted so far is written.
+
+        Returns:
+            False if the writer did not catch up within ``timeout``.
+
+        """
+        if self._thread is None or self._pid != os.getpid():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _ensure_writer(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid != os.getpid():
+                self._reset()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="telemetry-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch, waiters = self._next_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception:  # the writer must outlive a bad batch
+                    logger.exception("Telemetry writer failed on a batch")
+            for waiter in waiters:
+                waiter.set()
+
+    def _next_batch(self) -> tuple[list[_Event], list[threading.Event]]:
+        """Wait for one item, then collect more for up to ``flush_interval``."""
+        batch: list[_Event] = []
+        waiters: list[threading.Event] = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break  # write what precedes the flush request now
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                break
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+        return batch, waiters
+
+    def _write(self, batch: list[_Event]) -> None:
+        mirrors: dict[JsonlMirror, list[dict[str, Any]]] = {}
+        for event in batch:
+            if event.mirror is not None:
+                mirrors.setdefault(event.mirror, []).append(event.payload)
+        for mirror, payloads in mirrors.items():
+            try:
+                mirror.write(payloads)
+            except (OSError, TypeError) as exc:
+                logger.warning("Could not write telemetry to %s: %s", mirror.path, exc)
+
+        try:
+            rows = [
+                (e.timestamp, e.kind, orjson.dumps(e.payload, default=str))
+                for e in batch
+            ]
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(str(self.db_path), timeout=30.0)) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA_SQL)
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO events (timestamp, kind, payload) "
+                        "VALUES (?, ?, ?)",
+                        rows,
+                    )
+        except (OSError, TypeError, sqlite3.Error) as exc:
+            logger.warning(
+                "Dropped %d telemetry events (%s): %s", len(batch), self.db_path, exc
+            )
+
+    def iter_events(
+        self,
+        kind: str | None = None,
+        since: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream written events, oldest first.
+
+        Args:
+            kind: Only events of this type.
+            since: Earliest timestamp to include (ISO-8601, UTC).
+
+        Yields:
+            Dicts with ``timestamp``, ``kind`` and ``payload``.
+
+        """
+        if not self.db_path.exists():
+            return
+        sql = "SELECT timestamp, kind, payload FROM events WHERE 1=1"
+        params: list[str] = []
+        if kind is not None:
+            sql += " AND kind = ?"
+            params.append(kind)
+        if since is not None:
+            sql += " AND timestamp >= ?"
+            params.append(since)
+        with closing(sqlite3.connect(str(self.db_path))) as conn:
+            for timestamp, event_kind, payload in conn.execute(
+                sql + " ORDER BY id", params
+            ):
+                yield {
+                    "timestamp": timestamp,
+                    "kind": event_kind,
+                    "payload": orjson.loads(payload),
+                }
+
+
+# Global bus instance
+_bus: TelemetryBus | None = None
+
+
+def get_bus() -> TelemetryBus:
+    """Get the global telemetry bus, creating it on first use."""
+    global _bus
+    if _bus is None:
+        _bus = TelemetryBus()
+    return _bus
+
+
+def emit(
+    kind: str,
+    payload: dict[str, Any],
+    mirror: JsonlMirror | None = None,
+) -> None:
+    """Queue an event on the global bus (see :meth:`TelemetryBus.emit`)."""
+    get_bus().emit(kind, payload, mirror)
+
+
+def flush(timeout: float | None = 10.0) -> bool:
+    """Wait for the global bus to write everything emitted so far."""
+    return _bus.flush(timeout) if _bus is not None else True
+
+
+atexit.register(flush)
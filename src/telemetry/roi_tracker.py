@@ -1,7 +1,21 @@
 """ROI Tracker - Business Value Telemetry
 
-Logs token costs and human-hour equivalent savings to logs/execution_roi.json
-for business ROI validation.
+Logs token costs and human-hour equivalent savings for business ROI
+validation.
+
+Storage: finished executions are appended to a SQLite event table
+(``logs/execution_roi.db``, WAL mode) next to per-agent counters that each
+append updates in the same transaction, so ending an execution costs one
+small write however long the history is, and parallel pipeline runs can
+write concurrently. Compaction — the 30-day rotation, a recount of the
+counters and a rewrite of the legacy ``logs/execution_roi.json`` snapshot —
+runs at most once per ``COMPACT_INTERVAL``. Between compactions the snapshot
+lags the store; the global tracker from :func:`get_tracker` rewrites it at
+process exit. Set ``ROI_LOG_PATH`` to keep both files somewhere else.
+
+``avg_roi_multiplier`` keeps its legacy definition: the sum of the positive
+multipliers over all executions, so a zero-cost execution counts but adds
+nothing.
 
 Design Philosophy:
 - Minimal overhead (<10ms per LLM call)
@@ -13,12 +27,19 @@ Author: Economist Agents Team
 Sprint: 14, Story: STORY-007
 """
 
+import atexit
 import json
+import os
+import sqlite3
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+from .bus import emit
+
 # Model pricing - USD per 1M tokens (base input / output rates).
 #
 # Source: Anthropic API pricing page,
@@ -62,6 +83,84 @@ HUMAN_HOUR_BENCHMARKS = {
 # Human hourly rate (USD) - QE engineer average
 HUMAN_HOURLY_RATE = 75.0
 
+ROI_LOG_PATH = Path(os.environ.get("ROI_LOG_PATH", "logs/execution_roi.json"))
+RETENTION_DAYS = 30
+COMPACT_INTERVAL = timedelta(hours=1)
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS executions (
+    seq            INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id   TEXT NOT NULL,
+    agent          TEXT NOT NULL,
+    start_time     TEXT NOT NULL,
+    total_tokens   INTEGER NOT NULL,
+    total_cost_usd REAL NOT NULL,
+    human_hours    REAL NOT NULL,
+    human_cost     REAL NOT NULL,
+    roi_multiplier REAL NOT NULL,
+    record         TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_executions_id ON executions (execution_id);
+CREATE INDEX IF NOT EXISTS idx_executions_start ON executions (start_time);
+CREATE TABLE IF NOT EXISTS agent_totals (
+    agent          TEXT PRIMARY KEY,
+    executions     INTEGER NOT NULL,
+    total_tokens   INTEGER NOT NULL,
+    total_cost_usd REAL NOT NULL,
+    human_hours    REAL NOT NULL,
+    human_cost     REAL NOT NULL,
+    roi_sum        REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_INSERT_EXECUTION_SQL = """
+INSERT INTO executions
+    (execution_id, agent, start_time, total_tokens, total_cost_usd,
+     human_hours, human_cost, roi_multiplier, record)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# roi_sum holds only positive multipliers (see the module docstring).
+_BUMP_TOTALS_SQL = """
+INSERT INTO agent_totals
+    (agent, executions, total_tokens, total_cost_usd, human_hours, human_cost,
+     roi_sum)
+VALUES (?, 1, ?, ?, ?, ?, MAX(?, 0))
+ON CONFLICT (agent) DO UPDATE SET
+    executions = executions + 1,
+    total_tokens = total_tokens + excluded.total_tokens,
+    total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+    human_hours = human_hours + excluded.human_hours,
+    human_cost = human_cost + excluded.human_cost,
+    roi_sum = roi_sum + excluded.roi_sum
+"""
+
+_RECOUNT_TOTALS_SQL = """
+INSERT INTO agent_totals
+SELECT agent, COUNT(*), SUM(total_tokens), SUM(total_cost_usd),
+       SUM(human_hours), SUM(human_cost), SUM(MAX(roi_multiplier, 0))
+FROM executions
+GROUP BY agent
+"""
+
+
+def _execution_row(execution: dict[str, Any]) -> tuple[Any, ...]:
+    return (
+        execution["execution_id"],
+        execution["agent"],
+        execution["start_time"],
+        execution["total_tokens"],
+        execution["total_cost_usd"],
+        execution["human_hours_equivalent"],
+        execution["human_cost_equivalent"],
+        execution["roi_multiplier"],
+        json.dumps(execution),
+    )
+
 
 class ROITracker:
     """Track ROI metrics for agent execution.
@@ -96,54 +195,136 @@ class ROITracker:
         metrics = tracker.get_metrics(execution_id)
     """
 
-    def __init__(self, log_file: str = "logs/execution_roi.json"):
+    def __init__(self, log_file: str | None = None):
         """Initialize ROI tracker.
 
         Args:
-            log_file: Path to JSON log file
+            log_file: Path to the JSON snapshot; the event store is the
+                ``.db`` file beside it. Defaults to :data:`ROI_LOG_PATH`.
 
         """
-        self.log_file = Path(log_file)
+        self.log_file = Path(log_file) if log_file is not None else ROI_LOG_PATH
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.log_file.with_suffix(".db")
 
         # In-memory execution tracking
         self.active_executions: dict[str, dict[str, Any]] = {}
+        # Executions ended since the JSON snapshot was last written
+        self._unsaved = False
+
+        with self._db() as conn:
+            # WAL is persistent: set once, it lets parallel runs write.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA_SQL)
 
         # Load existing log
         self._load_log()
 
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        """Open the store for one operation; commits on success."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> str | None:
+        row = conn.execute(
+            "SELECT value FROM store_meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
     def _load_log(self) -> None:
-        """Load existing execution log from disk."""
-        if self.log_file.exists():
-            with open(self.log_file) as f:
-                self.log = json.load(f)
-        else:
-            self.log = {
-                "version": "1.0",
-                "created": datetime.now().isoformat(),
-                "executions": [],
-                "summary": {
-                    "total_executions": 0,
-                    "total_tokens": 0,
-                    "total_cost_usd": 0.0,
-                    "total_human_hours_saved": 0.0,
-                    "avg_roi_multiplier": 0.0,
-                },
-            }
+        """Open the event store, importing a legacy JSON log on first use.
+
+        Only the summary is read here, from the per-agent counters; the
+        execution records are left in the store until :attr:`log` is read.
+        """
+        with self._db() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if self._meta(conn, "created") is None:
+                legacy: dict[str, Any] = {}
+                if self.log_file.exists():
+                    with open(self.log_file) as f:
+                        legacy = json.load(f)
+                conn.executemany(
+                    _INSERT_EXECUTION_SQL,
+                    [_execution_row(e) for e in legacy.get("executions", [])],
+                )
+                conn.execute(_RECOUNT_TOTALS_SQL)
+                self._set_meta(
+                    conn, "created", legacy.get("created", datetime.now().isoformat())
+                )
+            created = self._meta(conn, "created")
+
+        self._log: dict[str, Any] = {
+            "version": "1.0",
+            "created": created,
+            "summary": {
+                "total_executions": 0,
+                "total_tokens": 0,
+                "total_cost_usd": 0.0,
+                "total_human_hours_saved": 0.0,
+                "avg_roi_multiplier": 0.0,
+            },
+        }
+        self._update_summary()
+        if not self.log_file.exists():
             # Create initial log file
             self._save_log()
 
-    def _save_log(self) -> None:
-        """Persist execution log to disk with minimal overhead."""
-        start_time = time.perf_counter()
+    @property
+    def log(self) -> dict[str, Any]:
+        """The legacy file layout: retained executions plus the summary.
 
-        with open(self.log_file, "w") as f:
-            json.dump(self.log, f, indent=2)
+        The executions are read from the store on first access and kept up
+        to date by this tracker from then on.
+        """
+        if "executions" not in self._log:
+            self._log["executions"] = self._load_executions()
+        return self._log
+
+    def _load_executions(self) -> list[dict[str, Any]]:
+        with self._db() as conn:
+            return [
+                json.loads(record)
+                for (record,) in conn.execute(
+                    "SELECT record FROM executions ORDER BY seq"
+                )
+            ]
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
-        if elapsed_ms > 10:
-            # Log warning if overhead exceeds 10ms
-            print(f"⚠️  ROI logging overhead: {elapsed_ms:.1f}ms (target: <10ms)")
+    def _save_log(self) -> None:
+        """Write the legacy JSON snapshot of the store (atomic replace).
+
+        Runs at compaction, not on every execution.
+        """
+        snapshot = {
+            "version": self._log["version"],
+            "created": self._log["created"],
+            "executions": self._load_executions(),
+            "summary": self._log["summary"],
+        }
+        tmp = self.log_file.with_name(f".{self.log_file.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f, indent=2)
+        os.replace(tmp, self.log_file)
+        self._unsaved = False
+
+    def flush(self) -> None:
+        """Rewrite the JSON snapshot if executions ended since the last one."""
+        if self._unsaved:
+            self._save_log()
 
     def start_execution(self, agent: str, execution_id: str | None = None) -> str:
         """Start tracking a new execution.
@@ -271,61 +452,82 @@ class ROITracker:
         # Round final cost
         execution["total_cost_usd"] = round(execution["total_cost_usd"], 4)
 
-        # Add to log
-        self.log["executions"].append(execution)
+        # Append the event and bump its agent's counters in one transaction
+        start_time = time.perf_counter()
+        row = _execution_row(execution)
+        with self._db() as conn:
+            conn.execute(_INSERT_EXECUTION_SQL, row)
+            conn.execute(_BUMP_TOTALS_SQL, (row[1], *row[3:8]))
+        if "executions" in self._log:
+            self._log["executions"].append(execution)
+        self._unsaved = True
+        emit("roi_execution", execution)
+
+        # Clean up active tracking
+        del self.active_executions[execution_id]
 
         # Update summary
         self._update_summary()
 
-        # Persist to disk
-        self._save_log()
-
-        # Clean up active tracking
-        del self.active_executions[execution_id]
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        if elapsed_ms > 10:
+            print(f"⚠️  ROI logging overhead: {elapsed_ms:.1f}ms (target: <10ms)")
 
-        # Rotate old logs (30-day retention)
-        self._rotate_logs()
+        # Rotate old logs (30-day retention) and refresh the JSON snapshot
+        if self._compaction_due():
+            self._rotate_logs()
 
         return execution
 
     def _update_summary(self) -> None:
-        """Update aggregate summary metrics."""
-        executions = self.log["executions"]
+        """Read aggregate summary metrics from the per-agent counters."""
+        with self._db() as conn:
+            executions, tokens, cost, hours, human_cost, roi_sum = conn.execute(
+                "SELECT SUM(executions), SUM(total_tokens), SUM(total_cost_usd), "
+                "SUM(human_hours), SUM(human_cost), SUM(roi_sum) FROM agent_totals"
+            ).fetchone()
 
         if not executions:
             return
 
-        self.log["summary"] = {
-            "total_executions": len(executions),
-            "total_tokens": sum(e["total_tokens"] for e in executions),
-            "total_cost_usd": round(sum(e["total_cost_usd"] for e in executions), 2),
-            "total_human_hours_saved": round(
-                sum(e["human_hours_equivalent"] for e in executions),
-                2,
-            ),
-            "total_human_cost_saved": round(
-                sum(e["human_cost_equivalent"] for e in executions),
-                2,
-            ),
-            "avg_roi_multiplier": round(
-                sum(e["roi_multiplier"] for e in executions if e["roi_multiplier"] > 0)
-                / len(executions),
-                2,
-            )
-            if executions
-            else 0.0,
+        self._log["summary"] = {
+            "total_executions": executions,
+            "total_tokens": tokens,
+            "total_cost_usd": round(cost, 2),
+            "total_human_hours_saved": round(hours, 2),
+            "total_human_cost_saved": round(human_cost, 2),
+            "avg_roi_multiplier": round(roi_sum / executions, 2),
             "last_updated": datetime.now().isoformat(),
         }
 
+    def _compaction_due(self) -> bool:
+        with self._db() as conn:
+            last = self._meta(conn, "last_compacted")
+        return last is None or (
+            datetime.now() - datetime.fromisoformat(last) >= COMPACT_INTERVAL
+        )
+
     def _rotate_logs(self) -> None:
-        """Remove executions older than 30 days."""
-        cutoff = datetime.now() - timedelta(days=30)
+        """Compact the store: drop executions older than 30 days.
 
-        self.log["executions"] = [
-            e
-            for e in self.log["executions"]
-            if datetime.fromisoformat(e["start_time"]) > cutoff
-        ]
+        Also recounts the per-agent counters from what remains (clearing any
+        float drift) and rewrites the JSON snapshot.
+        """
+        cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).isoformat()
+
+        with self._db() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM executions WHERE start_time <= ?", (cutoff,))
+            conn.execute("DELETE FROM agent_totals")
+            conn.execute(_RECOUNT_TOTALS_SQL)
+            self._set_meta(conn, "last_compacted", datetime.now().isoformat())
+
+        if "executions" in self._log:
+            self._log["executions"] = [
+                e for e in self._log["executions"] if e["start_time"] > cutoff
+            ]
+        self._update_summary()
+        self._save_log()
 
     def get_metrics(self, execution_id: str) -> dict[str, Any] | None:
         """Get metrics for a specific execution.
@@ -342,15 +544,20 @@ class ROITracker:
             return self.active_executions[execution_id]
 
         # Check completed executions
-        for execution in self.log["executions"]:
-            if execution["execution_id"] == execution_id:
-                return execution
-
-        return None
+        with self._db() as conn:
+            row = conn.execute(
+                "SELECT record FROM executions WHERE execution_id = ? "
+                "ORDER BY seq DESC LIMIT 1",
+                (execution_id,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
 
     def get_agent_summary(self, agent: str) -> dict[str, Any]:
         """Get aggregate metrics for a specific agent.
 
+        Reads the agent's counters by primary key, so the cost does not grow
+        with the number of executions.
+
         Args:
             agent: Agent name
 
@@ -358,9 +565,14 @@ class ROITracker:
             Aggregate metrics for the agent
 
         """
-        agent_executions = [e for e in self.log["executions"] if e["agent"] == agent]
-
-        if not agent_executions:
+        with self._db() as conn:
+            row = conn.execute(
+                "SELECT executions, total_tokens, total_cost_usd, human_hours, "
+                "roi_sum FROM agent_totals WHERE agent = ?",
+                (agent,),
+            ).fetchone()
+
+        if not row or not row[0]:
             return {
                 "agent": agent,
                 "total_executions": 0,
@@ -369,28 +581,15 @@ class ROITracker:
                 "avg_roi_multiplier": 0.0,
             }
 
+        executions, tokens, cost, hours, roi_sum = row
         return {
             "agent": agent,
-            "total_executions": len(agent_executions),
-            "total_tokens": sum(e["total_tokens"] for e in agent_executions),
-            "total_cost_usd": round(
-                sum(e["total_cost_usd"] for e in agent_executions),
-                2,
-            ),
-            "total_human_hours_saved": round(
-                sum(e["human_hours_equivalent"] for e in agent_executions),
-                2,
-            ),
-            "avg_roi_multiplier": round(
-                sum(e["roi_multiplier"] for e in agent_executions)
-                / len(agent_executions),
-                2,
-            ),
-            "avg_tokens_per_execution": round(
-                sum(e["total_tokens"] for e in agent_executions)
-                / len(agent_executions),
-                0,
-            ),
+            "total_executions": executions,
+            "total_tokens": tokens,
+            "total_cost_usd": round(cost, 2),
+            "total_human_hours_saved": round(hours, 2),
+            "avg_roi_multiplier": round(roi_sum / executions, 2),
+            "avg_tokens_per_execution": round(tokens / executions, 0),
         }
 
     def get_all_agent_summaries(self) -> list[dict[str, Any]]:
@@ -400,7 +599,13 @@ class ROITracker:
             List of agent summaries sorted by total cost
 
         """
-        agents = {e["agent"] for e in self.log["executions"]}
+        with self._db() as conn:
+            agents = [
+                agent
+                for (agent,) in conn.execute(
+                    "SELECT agent FROM agent_totals WHERE executions > 0"
+                )
+            ]
         summaries = [self.get_agent_summary(agent) for agent in agents]
 
         # Sort by total cost descending
@@ -413,7 +618,7 @@ class ROITracker:
             Formatted report string
 
         """
-        summary = self.log["summary"]
+        summary = self._log["summary"]
         agent_summaries = self.get_all_agent_summaries()
 
         report = [
@@ -463,4 +668,5 @@ def get_tracker() -> ROITracker:
     global _tracker
     if _tracker is None:
         _tracker = ROITracker()
+        atexit.register(_tracker.flush)
     return _tracker
@@ -73,8 +73,9 @@ def install_model_guard(monkeypatch: Any) -> None:
     ``make ci-local`` began making real model calls and writing generated SVGs
     into ``output/``.
 
-    ``stage3_runner.query`` is the single chokepoint: every model call in the
-    pipeline funnels through ``_collect_text``, which uses it. Tests that
+    ``stage3_runner.query`` and ``stage3_runner.ClaudeSDKClient`` are the
+    chokepoints: every model call in the pipeline funnels through
+    ``_collect_text``, which uses one or the other. Tests that
     legitimately exercise ``_collect_text`` internals patch it themselves, and
     their patch is applied after this one, so it wins.
     """
@@ -89,3 +90,5 @@ def install_model_guard(monkeypatch: Any) -> None:
         )
 
     monkeypatch.setattr(stage3_runner, "query", blocked)
+    # Stoppable calls (speculative writers) use the client instead of query().
+    monkeypatch.setattr(stage3_runner, "ClaudeSDKClient", blocked)
@@ -5,6 +5,10 @@ from unittest.mock import Mock
 
 import pytest
 
+from scripts import eval_store
+from src.telemetry import bus as bus_module
+from src.telemetry import roi_tracker
+from src.telemetry.bus import TelemetryBus
 from tests import _netguard as netguard
 
 
@@ -69,6 +73,40 @@ def _hermetic_env(monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.delenv(var, raising=False)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _hermetic_telemetry(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Send telemetry bus events to a session-scoped sink, not ``logs/``.
+
+    Sibling of :func:`_hermetic_env`. Legacy files mirrored by the bus still
+    go wherever the test points them; call ``src.telemetry.flush()`` before
+    reading one back.
+    """
+    bus_module._bus = TelemetryBus(
+        tmp_path_factory.mktemp("telemetry") / "telemetry.db"
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _hermetic_evals(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Append article evaluations to a session-scoped store, not ``logs/``.
+
+    Sibling of :func:`_hermetic_telemetry`. Tests that read evals back pass
+    their own path or patch ``eval_store.EVALS_PATH``.
+    """
+    eval_store.EVALS_PATH = tmp_path_factory.mktemp("evals") / "article_evals.jsonl"
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _hermetic_roi(tmp_path_factory: pytest.TempPathFactory) -> None:
+    """Point ``ROITracker()`` and ``get_tracker()`` at a session-scoped store.
+
+    Sibling of :func:`_hermetic_telemetry`; keeps ``logs/execution_roi.db``
+    and its JSON snapshot out of the working tree.
+    """
+    roi_tracker.ROI_LOG_PATH = tmp_path_factory.mktemp("roi") / "execution_roi.json"
+    roi_tracker._tracker = None
+
+
 @pytest.fixture
 def temp_output_dir(tmp_path: Path) -> Path:
     """Create temporary output directory for tests.
@@ -4,11 +4,12 @@
 Validates the 5-dimension scoring framework for generated articles.
 """
 
+import json
 import time
 
 import pytest
 
-from scripts.article_evaluator import ArticleEvaluator
+from scripts.article_evaluator import ArticleEvaluator, ArticleFeatures
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
@@ -225,6 +226,51 @@ class TestOverallScoring:
         assert all(isinstance(v, str) for v in result.details.values())
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Feature extraction
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestFeatureExtraction:
+    def test_features_capture_the_article(self, evaluator: ArticleEvaluator) -> None:
+        features = evaluator.extract_features(GOOD_ARTICLE)
+        assert len(features.references) == 5
+        assert features.references[0].startswith("1. DORA")
+        assert features.analyst_vendors == ("gartner",)
+        assert features.headings == 4
+        assert features.missing_frontmatter == ()
+        assert features.has_embedded_image
+
+    def test_scores_are_pure_functions_of_the_features(
+        self, evaluator: ArticleEvaluator
+    ) -> None:
+        result = evaluator.evaluate(GOOD_ARTICLE)
+        assert result.features == evaluator.extract_features(GOOD_ARTICLE)
+        assert result.scores["evidence_sourcing"] == evaluator._score_evidence(
+            result.features
+        )
+
+        # Two placeholders cost 6 points, whatever text produced them
+        sourced = ArticleFeatures(
+            has_reference_section=True,
+            references=("1. a", "2. b", "3. c", "4. d", "5. e"),
+            fresh_years=("2026", "2025"),
+        )
+        assert evaluator._score_evidence(sourced) == 10
+        placeholders = ArticleFeatures(**{**sourced.to_dict(), "placeholders": 2})
+        assert evaluator._score_evidence(placeholders) == 4
+
+    def test_features_are_persisted_with_the_scores(
+        self, evaluator: ArticleEvaluator
+    ) -> None:
+        record = json.loads(json.dumps(evaluator.evaluate(BAD_ARTICLE).to_dict()))
+        assert record["features"]["missing_frontmatter"] == [
+            "layout",
+            "categories",
+            "image",
+        ]
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Performance
 # ═══════════════════════════════════════════════════════════════════════════
@@ -145,3 +145,68 @@ class TestPapersAnalyzedContract:
         searcher = ArxivSearcher(max_results=3, days_back=60)
         out = searcher.extract_business_insights([])
         assert out["papers_analyzed"] == []
+
+
+class TestArxivStreaming:
+    """The date window goes to arXiv, and reading stops once enough is collected."""
+
+    def test_date_cutoff_is_pushed_into_the_query(self) -> None:
+        searcher = ArxivSearcher(max_results=3, days_back=60)
+
+        query = searcher._build_search_query("flaky tests", ["cs.SE"])
+
+        cutoff = searcher.cutoff_date.strftime("%Y%m%d")
+        assert f"submittedDate:[{cutoff}" in query
+        assert query.startswith("(flaky tests) AND (cat:cs.SE) AND ")
+
+    def test_stops_reading_once_enough_papers_are_collected(self) -> None:
+        searcher = ArxivSearcher(max_results=2, days_back=60)
+        pulled = {"n": 0}
+
+        def endless(_search):
+            while True:
+                pulled["n"] += 1
+                yield _mock_result(f"P{pulled['n']}")
+
+        with patch("scripts.arxiv_search.arxiv.Client") as mock_client_cls:
+            mock_client_cls.return_value.results.side_effect = endless
+            papers = searcher.search_recent_papers("ai")
+
+        assert [p["title"] for p in papers] == ["P1", "P2"]
+        assert pulled["n"] == 2
+        # Pages are sized to what is needed, not the client's default of 100.
+        assert mock_client_cls.call_args.kwargs["page_size"] == 2
+
+    def test_first_stale_paper_ends_the_stream(self) -> None:
+        searcher = ArxivSearcher(max_results=5, days_back=60)
+        stale = _mock_result("Old")
+        stale.published = datetime(2000, 1, 1)
+
+        with patch("scripts.arxiv_search.arxiv.Client") as mock_client_cls:
+            mock_client_cls.return_value.results.return_value = iter(
+                [_mock_result("New"), stale, _mock_result("Never read")]
+            )
+            papers = searcher.search_recent_papers("ai")
+
+        assert [p["title"] for p in papers] == ["New"]
+
+    def test_mid_stream_failure_resumes_from_the_offset(self) -> None:
+        searcher = ArxivSearcher(max_results=3, days_back=60)
+        offsets: list[int] = []
+
+        def flaky(_search, offset=0):
+            offsets.append(offset)
+            yield _mock_result(f"P{offset}")
+            if offset == 0:
+                raise arxiv.HTTPError(url="http://arxiv.org", retry=0, status=429)
+            yield _mock_result(f"P{offset + 1}")
+
+        with (
+            patch("scripts.arxiv_search.arxiv.Client") as mock_client_cls,
+            patch("scripts.arxiv_search.time.sleep"),
+        ):
+            mock_client_cls.return_value.results.side_effect = flaky
+            papers = searcher.search_recent_papers("ai")
+
+        assert offsets == [0, 1]
+        assert [p["title"] for p in papers] == ["P0", "P1", "P2"]
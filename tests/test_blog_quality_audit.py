@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the Blog Quality Audit script (Story #135)."""
 
+import base64
 import json
 from pathlib import Path
 from unittest.mock import patch
@@ -77,60 +78,142 @@ MOCK_POSTS = [
 # ── fetch_posts ───────────────────────────────────────────────────────────────
 
 
-class TestFetchPosts:
-    def test_filters_non_markdown_files(self) -> None:
-        import base64
+def _tree_item(path: str, sha: str = "abc", kind: str = "blob") -> dict:
+    return {"path": path, "type": kind, "sha": sha, "url": f"https://blob/{sha}"}
 
-        contents_response = [
-            {
-                "name": "2026-04-01-post.md",
-                "path": "_posts/2026-04-01-post.md",
-                "url": "https://api.github.com/repos/oviney/blog/contents/_posts/2026-04-01-post.md",
-            },
-            {
-                "name": "README.txt",
-                "path": "_posts/README.txt",
-                "url": "https://api.github.com/repos/oviney/blog/contents/_posts/README.txt",
-            },
-        ]
-        file_response = {
-            "content": base64.b64encode(GOOD_POST_CONTENT.encode()).decode() + "\n",
-        }
 
-        call_responses = [contents_response, file_response]
+class _FakeClient:
+    """Serves a trees listing and base64 blobs by URL, recording each GET."""
+
+    def __init__(self, tree: list[dict], blobs: dict[str, str]) -> None:
+        self.tree = tree
+        self.blobs = blobs
+        self.urls: list[str] = []
+        self.calls = self.not_modified = 0
+
+    def get(self, url: str, cacheable: bool = True) -> dict:
+        self.urls.append(url)
+        if "/git/trees/" in url:
+            return {"tree": self.tree, "truncated": False}
+        raw = self.blobs[url.rsplit("/", 1)[-1]]
+        return {"content": base64.b64encode(raw.encode()).decode() + "\n"}
 
-        def fake_gh_get(url):
-            return call_responses.pop(0)
+    def save(self) -> None:
+        pass
 
-        with patch.object(audit, "_gh_get", side_effect=fake_gh_get):
-            posts = audit.fetch_posts()
+
+class TestFetchPosts:
+    def test_filters_non_markdown_files(self) -> None:
+        client = _FakeClient(
+            [
+                _tree_item("_posts", kind="tree"),
+                _tree_item("_posts/2026-04-01-post.md", sha="p1"),
+                _tree_item("_posts/README.txt", sha="r1"),
+                _tree_item("_posts/drafts/2026-04-02-draft.md", sha="d1"),
+                _tree_item("about.md", sha="a1"),
+            ],
+            {"p1": GOOD_POST_CONTENT},
+        )
+
+        posts = audit.fetch_posts(client=client)
 
         assert len(posts) == 1
         assert posts[0]["filename"] == "2026-04-01-post.md"
+        assert posts[0]["sha"] == "p1"
         assert posts[0]["content"] == GOOD_POST_CONTENT
 
     def test_decodes_base64_content(self) -> None:
-        import base64
-
         raw = "# Hello\nThis is a post."
-        contents_response = [
-            {
-                "name": "2026-04-01-post.md",
-                "path": "_posts/2026-04-01-post.md",
-                "url": "https://example.com/file",
-            },
-        ]
-        file_response = {"content": base64.b64encode(raw.encode()).decode() + "\n"}
+        client = _FakeClient([_tree_item("_posts/2026-04-01-post.md")], {"abc": raw})
 
-        with patch.object(
-            audit,
-            "_gh_get",
-            side_effect=[contents_response, file_response],
-        ):
-            posts = audit.fetch_posts()
+        posts = audit.fetch_posts(client=client)
 
         assert posts[0]["content"] == raw
 
+    def test_unchanged_posts_are_not_downloaded(self) -> None:
+        client = _FakeClient(
+            [_tree_item("_posts/old.md", sha="s1"), _tree_item("_posts/new.md", "s2")],
+            {"s2": "changed"},
+        )
+
+        posts = audit.fetch_posts({"_posts/old.md": "s1"}, client=client)
+
+        assert [p["content"] for p in posts] == [None, "changed"]
+        assert len(client.urls) == 2  # one tree listing, one blob
+
+    def test_a_local_clone_is_read_with_git_blob_shas(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        (tmp_path / "_posts").mkdir()
+        (tmp_path / "_posts" / "2026-04-01-post.md").write_text("hello\n")
+        monkeypatch.setenv("BLOG_CLONE", str(tmp_path))
+
+        (post,) = audit.fetch_posts()
+
+        # `git hash-object` of "hello\n"
+        assert post["sha"] == "ce013625030ba8dba906f756967f9e9ca394464a"
+        assert post["content"] == "hello\n"
+
+    def test_a_local_clone_skips_posts_with_known_shas(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        (tmp_path / "_posts").mkdir()
+        (tmp_path / "_posts" / "a.md").write_text("hello\n")
+        (tmp_path / "_posts" / "b.md").write_text("edited\n")
+        monkeypatch.setenv("BLOG_CLONE", str(tmp_path))
+
+        posts = audit.fetch_posts(
+            {
+                "_posts/a.md": "ce013625030ba8dba906f756967f9e9ca394464a",
+                "_posts/b.md": "sha-of-the-previous-version",
+            }
+        )
+
+        assert [p["content"] for p in posts] == [None, "edited\n"]
+
+
+class _FakeResponse:
+    def __init__(self, status: int, body: object = None, etag: str = "") -> None:
+        self.status_code = status
+        self._body = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self) -> object:
+        return self._body
+
+    def raise_for_status(self) -> None:
+        assert self.status_code < 400
+
+
+class TestGitHubClient:
+    def test_revalidates_with_the_etag_and_reuses_the_body_on_304(
+        self, tmp_path: Path
+    ) -> None:
+        cache = tmp_path / "etags.json"
+        sent: list[dict] = []
+        replies = [_FakeResponse(200, {"tree": []}, etag='"v1"'), _FakeResponse(304)]
+
+        first = audit.GitHubClient(cache_path=cache)
+        first._session.get = lambda url, headers, timeout: (  # type: ignore[method-assign]
+            sent.append(headers) or replies.pop(0)
+        )
+        first.get("https://api/tree")
+        first.save()
+
+        second = audit.GitHubClient(cache_path=cache)
+        second._session.get = first._session.get  # type: ignore[method-assign]
+        assert second.get("https://api/tree") == {"tree": []}
+        assert sent == [{}, {"If-None-Match": '"v1"'}]
+        assert second.not_modified == 1
+
+    def test_uncacheable_responses_are_not_kept(self) -> None:
+        client = audit.GitHubClient()
+        client._session.get = lambda url, headers, timeout: _FakeResponse(  # type: ignore[method-assign]
+            200, {"content": ""}, etag='"b"'
+        )
+        client.get("https://api/blob", cacheable=False)
+        assert client._cache == {}
+
 
 # ── existing_issue_title ──────────────────────────────────────────────────────
 
@@ -192,7 +275,7 @@ class TestRecommendations:
 class TestRunAuditDryRun:
     def test_dry_run_writes_audit_log(self, tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
-        monkeypatch.setattr(audit, "fetch_posts", lambda: MOCK_POSTS)
+        monkeypatch.setattr(audit, "fetch_posts", lambda *_: MOCK_POSTS)
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
 
         audit.run_audit(dry_run=True)
@@ -201,7 +284,7 @@ class TestRunAuditDryRun:
 
     def test_dry_run_does_not_create_issues(self, tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
-        monkeypatch.setattr(audit, "fetch_posts", lambda: MOCK_POSTS)
+        monkeypatch.setattr(audit, "fetch_posts", lambda *_: MOCK_POSTS)
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
 
         issue_calls: list = []
@@ -217,7 +300,7 @@ class TestRunAuditDryRun:
 
     def test_audit_log_structure(self, tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
-        monkeypatch.setattr(audit, "fetch_posts", lambda: MOCK_POSTS)
+        monkeypatch.setattr(audit, "fetch_posts", lambda *_: MOCK_POSTS)
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
 
         audit.run_audit(dry_run=True)
@@ -231,6 +314,56 @@ class TestRunAuditDryRun:
         assert data["dry_run"] is True
 
 
+class TestIncrementalAudit:
+    def test_only_changed_posts_are_re_evaluated(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
+        monkeypatch.setattr(audit, "ensure_label", lambda: None)
+        shas = {"good": "g1", "bad": "b1"}
+
+        def fake_fetch(known_shas):  # honours known_shas like fetch_posts
+            posts = []
+            for post in MOCK_POSTS:
+                sha = shas["good" if "good" in post["path"] else "bad"]
+                unchanged = known_shas.get(post["path"]) == sha
+                posts.append(
+                    {
+                        **post,
+                        "sha": sha,
+                        "content": None if unchanged else post["content"],
+                    }
+                )
+            return posts
+
+        evaluated: list[str] = []
+        real_evaluate = audit.evaluate_posts
+
+        def spy(posts, max_workers=None):
+            evaluated.extend(p["filename"] for p in posts)
+            return real_evaluate(posts, max_workers)
+
+        monkeypatch.setattr(audit, "fetch_posts", fake_fetch)
+        monkeypatch.setattr(audit, "evaluate_posts", spy)
+
+        audit.run_audit(dry_run=True)
+        first = json.loads((tmp_path / "blog_audit.json").read_bytes())
+        shas["bad"] = "b2"
+        evaluated.clear()
+        audit.run_audit(dry_run=True)
+        second = json.loads((tmp_path / "blog_audit.json").read_bytes())
+
+        assert evaluated == ["2026-04-01-bad-post.md"]
+        assert second["posts_evaluated"] == 1
+        assert [r["reused"] for r in second["results"]] == [True, False]
+        assert second["results"][0]["scores"] == first["results"][0]["scores"]
+
+    def test_a_worker_pool_scores_like_the_serial_path(self) -> None:
+        serial = audit.evaluate_posts(MOCK_POSTS, max_workers=1)
+        pooled = audit.evaluate_posts(MOCK_POSTS, max_workers=2)
+        assert [r.scores for r in pooled] == [r.scores for r in serial]
+
+
 # ── run_audit (live, mocked) ──────────────────────────────────────────────────
 
 
@@ -244,7 +377,7 @@ class TestRunAuditLive:
         monkeypatch.setattr(
             audit,
             "fetch_posts",
-            lambda: [MOCK_POSTS[1]],
+            lambda *_: [MOCK_POSTS[1]],
         )  # bad post only
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
         monkeypatch.setattr(audit, "existing_issue_title", lambda t: False)
@@ -262,7 +395,7 @@ class TestRunAuditLive:
 
     def test_skips_issue_if_already_exists(self, tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
-        monkeypatch.setattr(audit, "fetch_posts", lambda: [MOCK_POSTS[1]])
+        monkeypatch.setattr(audit, "fetch_posts", lambda *_: [MOCK_POSTS[1]])
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
         monkeypatch.setattr(
             audit,
@@ -283,7 +416,9 @@ class TestRunAuditLive:
 
     def test_no_issue_for_high_scoring_post(self, tmp_path: Path, monkeypatch) -> None:
         monkeypatch.setattr(audit, "AUDIT_LOG", tmp_path / "blog_audit.json")
-        monkeypatch.setattr(audit, "fetch_posts", lambda: [MOCK_POSTS[0]])  # good post
+        monkeypatch.setattr(
+            audit, "fetch_posts", lambda *_: [MOCK_POSTS[0]]
+        )  # good post
         monkeypatch.setattr(audit, "ensure_label", lambda: None)
         monkeypatch.setattr(audit, "existing_issue_title", lambda t: False)
 
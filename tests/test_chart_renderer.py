@@ -7,7 +7,15 @@ from pathlib import Path
 
 import pytest
 
-from src.agent_sdk.chart_renderer import ChartRenderError, render_chart
+from src.agent_sdk import chart_renderer
+from src.agent_sdk.chart_renderer import (
+    ChartRenderError,
+    is_current,
+    load_manifest,
+    render_chart,
+    render_charts,
+    spec_digest,
+)
 
 
 def _valid_spec() -> dict:
@@ -191,3 +199,83 @@ def test_missing_metric_in_data_item_raises(tmp_path: Path) -> None:
     del spec["data"][1]["metric"]
     with pytest.raises(ChartRenderError, match="metric"):
         render_chart(spec, tmp_path / "x.png")
+
+
+# ── batch rendering and the render manifest ──────────────────────────
+
+
+def test_the_template_leaves_nothing_behind_for_the_next_chart(
+    tmp_path: Path,
+) -> None:
+    """One figure is redrawn per process: chart B must not carry chart A's ink."""
+    other = _valid_spec()
+    other["title"] = "Another chart"
+    other["data"] = [{"metric": "A much longer metric label", "value": 7}]
+
+    render_chart(_valid_spec(), tmp_path / "first.png")
+    render_chart(other, tmp_path / "other.png")
+    render_chart(_valid_spec(), tmp_path / "again.png")
+
+    assert (tmp_path / "first.png").read_bytes() == (
+        tmp_path / "again.png"
+    ).read_bytes()
+
+
+def test_batch_renders_match_render_chart_and_are_then_cached(
+    tmp_path: Path,
+) -> None:
+    second = _valid_spec()
+    second["title"] = "Second chart"
+    jobs = [(_valid_spec(), tmp_path / "a.png"), (second, tmp_path / "b.png")]
+
+    first_run = render_charts(jobs, max_workers=2)  # the process-pool path
+    assert [r.status for r in first_run] == ["rendered", "rendered"]
+    render_chart(second, tmp_path / "direct.png")
+    assert (tmp_path / "b.png").read_bytes() == (tmp_path / "direct.png").read_bytes()
+
+    assert [r.status for r in render_charts(jobs)] == ["cached", "cached"]
+
+
+def test_only_the_edited_spec_is_rerendered(tmp_path: Path) -> None:
+    edited = _valid_spec()
+    jobs = [(_valid_spec(), tmp_path / "a.png"), (edited, tmp_path / "b.png")]
+    render_charts(jobs, max_workers=1)
+
+    edited["title"] = "A sharper title"
+    assert [r.status for r in render_charts(jobs, max_workers=1)] == [
+        "cached",
+        "rendered",
+    ]
+    manifest = load_manifest(tmp_path)
+    assert manifest["b.png"]["digest"] == spec_digest(edited)
+
+
+def test_a_png_replaced_on_disk_is_not_current(tmp_path: Path) -> None:
+    out = tmp_path / "a.png"
+    render_charts([(_valid_spec(), out)])
+    out.write_bytes(b"HAND-MADE")
+
+    assert not is_current(out, spec_digest(_valid_spec()), load_manifest(tmp_path))
+
+
+def test_digest_ignores_key_order_but_not_the_renderer_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec = _valid_spec()
+    reordered = dict(reversed(list(spec.items())))
+    assert spec_digest(spec) == spec_digest(reordered)
+
+    before = spec_digest(spec)
+    monkeypatch.setattr(chart_renderer, "RENDERER_VERSION", "next")
+    assert spec_digest(spec) != before
+
+
+def test_a_bad_spec_fails_alone(tmp_path: Path) -> None:
+    results = render_charts(
+        [({"title": ""}, tmp_path / "bad.png"), (_valid_spec(), tmp_path / "ok.png")]
+    )
+
+    assert [r.status for r in results] == ["failed", "rendered"]
+    assert "title" in (results[0].error or "")
+    assert not (tmp_path / "bad.png").exists()
+    assert "bad.png" not in load_manifest(tmp_path)
@@ -0,0 +1,80 @@
+"""Tests for src/agent_sdk/chart_sandbox.py — warm workers for chart scripts.
+
+These start real worker processes (one pool for the module), because the
+property under test is what survives from one job to the next inside them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.agent_sdk.chart_sandbox import ChartSandbox
+
+_CHART = """
+import matplotlib.pyplot as plt
+plt.rcParams["font.size"] = 30
+fig, ax = plt.subplots()
+ax.plot([1, 2, 3])
+plt.savefig({path!r})
+"""
+
+
+@pytest.fixture(scope="module")
+def sandbox() -> Iterator[ChartSandbox]:
+    pool = ChartSandbox(workers=1, timeout=30)
+    yield pool
+    pool.close()
+
+
+def test_a_script_writes_its_chart(sandbox: ChartSandbox, tmp_path: Path) -> None:
+    out = tmp_path / "chart.png"
+    assert sandbox.run(_CHART.format(path=str(out)), out) == (True, "")
+    assert out.read_bytes().startswith(b"\x89PNG")
+
+
+def test_one_job_cannot_restyle_the_next(sandbox: ChartSandbox, tmp_path: Path) -> None:
+    out = tmp_path / "chart.png"
+    sandbox.run(_CHART.format(path=str(out)), out)
+
+    probe = (
+        "import matplotlib.pyplot as plt\n"
+        "assert plt.rcParams['font.size'] == 10.0, plt.rcParams['font.size']\n"
+        "assert not plt.get_fignums(), 'a figure leaked from the last job'\n"
+        f"open({str(out)!r}, 'ab').close()\n"
+    )
+    assert sandbox.run(probe, out) == (True, "")
+
+
+def test_a_failing_script_reports_its_traceback(
+    sandbox: ChartSandbox, tmp_path: Path
+) -> None:
+    ok, error = sandbox.run("raise ValueError('bad data')", tmp_path / "x.png")
+    assert not ok
+    assert "ValueError: bad data" in error
+
+
+def test_a_script_that_writes_nothing_fails(
+    sandbox: ChartSandbox, tmp_path: Path
+) -> None:
+    ok, error = sandbox.run("x = 1", tmp_path / "missing.png")
+    assert not ok
+    assert "did not write" in error
+
+
+def test_a_hung_script_is_killed_and_the_worker_replaced(tmp_path: Path) -> None:
+    pool = ChartSandbox(workers=1, timeout=30)
+    try:
+        pool.run("x = 1", tmp_path / "warm.png")  # let the worker start
+        pool.timeout = 1
+        assert pool.run("while True: pass", tmp_path / "x.png") == (
+            False,
+            "Chart script timed out after 1s",
+        )
+        pool.timeout = 30
+        out = tmp_path / "after.png"
+        assert pool.run(_CHART.format(path=str(out)), out) == (True, "")
+    finally:
+        pool.close()
@@ -25,6 +25,7 @@ from scripts.content_intelligence import (
     get_top_performers,
     get_traffic_summary,
 )
+from scripts.performance_rollup import ensure_page_rollup
 
 
 @pytest.fixture
@@ -289,3 +290,33 @@ class TestGetPerformanceContext:
         # No single line should be absurdly long
         for line in context.split("\n"):
             assert len(line) < 300
+
+
+class TestRollupSource:
+    """Reads never write; the rollup is used once an ETL has set it up."""
+
+    def test_reading_leaves_the_database_untouched(self, synthetic_db: Path) -> None:
+        before = synthetic_db.read_bytes()
+
+        get_performance_context(db_path=synthetic_db)
+
+        assert synthetic_db.read_bytes() == before
+
+    def test_rollup_is_picked_up_once_an_etl_creates_it(
+        self, synthetic_db: Path
+    ) -> None:
+        on_the_fly = get_top_performers(db_path=synthetic_db)
+
+        conn = sqlite3.connect(synthetic_db)
+        ensure_page_rollup(conn)
+        # Prove the reader now uses the table, not the daily rows.
+        conn.execute(
+            "UPDATE page_rollup SET avg_composite_score = 0.01 "
+            "WHERE page_path = '/2026/01/01/great-article/'"
+        )
+        conn.commit()
+        conn.close()
+
+        from_rollup = get_top_performers(db_path=synthetic_db)
+        assert [a.page_path for a in from_rollup] != [a.page_path for a in on_the_fly]
+        assert from_rollup[-1].page_path == "/2026/01/01/great-article/"
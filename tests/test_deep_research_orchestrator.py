@@ -172,3 +172,70 @@ def test_zero_source_subquestion_records_no_evidence(monkeypatch) -> None:
 
     assert "## q1?" in brief
     assert "No evidence found." in brief
+
+
+def test_straggler_does_not_hold_up_gap_dispatch(monkeypatch) -> None:
+    """Gaps are dispatched once a quorum lands, while a slow sub-question is
+    still running — and the straggler's finding still reaches the brief."""
+    counters = _wire(
+        monkeypatch,
+        subquestions=["fast?", "slow?"],
+        verdicts=[{"enough": False, "gaps": ["gap?"]}],
+    )
+    order: list[str] = []
+
+    async def fake_research(subquestion, budget):
+        await asyncio.sleep(0.2 if subquestion == "slow?" else 0.0)
+        order.append(subquestion)
+        return _finding(subquestion, [f"passage for {subquestion}"]), 0.01
+
+    monkeypatch.setattr(deep_research, "_research_one", fake_research)
+
+    brief, _cost = asyncio.run(build_deep_research_brief("Topic", max_iterations=2))
+
+    assert order == ["fast?", "gap?", "slow?"]
+    assert counters["assess"] == 1
+    # The brief keeps dispatch order, not arrival order.
+    assert brief.index("## fast?") < brief.index("## slow?") < brief.index("## gap?")
+
+
+def test_enough_verdict_abandons_in_flight_subquestions(monkeypatch) -> None:
+    _wire(
+        monkeypatch,
+        subquestions=["fast?", "slow?"],
+        verdicts=[{"enough": True, "gaps": []}],
+    )
+
+    async def fake_research(subquestion, budget):
+        await asyncio.sleep(30 if subquestion == "slow?" else 0.0)
+        return _finding(subquestion, [f"passage for {subquestion}"]), 0.01
+
+    monkeypatch.setattr(deep_research, "_research_one", fake_research)
+
+    brief, cost = asyncio.run(
+        build_deep_research_brief("Topic", max_iterations=2, research_budget_usd=1.0)
+    )
+
+    assert "passage for fast?" in brief
+    assert "slow?" not in brief
+    # plan + fast + assess, plus the abandoned call's whole slice
+    assert cost == pytest.approx(0.02 + 0.01 + 0.02 + (1.0 - 0.02) / 2)
+
+
+def test_timed_out_subquestion_records_no_evidence(monkeypatch) -> None:
+    _wire(monkeypatch, subquestions=["hung?"])
+    monkeypatch.setattr(deep_research, "SUBQUESTION_TIMEOUT_S", 0.01)
+
+    async def fake_research(subquestion, budget):
+        await asyncio.sleep(30)
+
+    monkeypatch.setattr(deep_research, "_research_one", fake_research)
+
+    brief, cost = asyncio.run(
+        build_deep_research_brief("Topic", max_iterations=1, research_budget_usd=1.0)
+    )
+
+    assert "## hung?" in brief
+    assert "No evidence found." in brief
+    # Charged its whole slice: what the abandoned call spent is unknown.
+    assert cost == pytest.approx(1.0)
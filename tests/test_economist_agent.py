@@ -567,11 +567,11 @@ class TestRunGraphicsAgent:
         with (
             patch("scripts.llm_client.call_llm") as mock_call_llm,
             patch("agents.graphics_agent.get_metrics_collector") as mock_metrics,
-            patch("subprocess.run") as mock_subprocess,
+            patch("agents.graphics_agent.get_sandbox") as mock_sandbox,
             patch("builtins.open", mock_open()),
         ):
             mock_call_llm.return_value = "plt.plot([1, 2, 3])\nplt.savefig('test.png')"
-            mock_subprocess.return_value = Mock(returncode=0)
+            mock_sandbox.return_value.run.return_value = (True, "")
             mock_collector = Mock()
             mock_chart_record = {"title": "Test Chart"}
             mock_collector.start_chart.return_value = mock_chart_record
@@ -609,18 +609,18 @@ class TestRunGraphicsAgent:
         with pytest.raises(ValueError, match="Invalid output_path"):
             ea.run_graphics_agent(mock_llm_client, chart_spec, 123)
 
-    def test_graphics_agent_with_subprocess_failure(self, mock_llm_client):
-        """Test graphics agent handles subprocess failures."""
+    def test_graphics_agent_with_execution_failure(self, mock_llm_client):
+        """Test graphics agent handles chart script failures."""
         chart_spec = {"title": "Test Chart", "data": []}
 
         with (
             patch("scripts.llm_client.call_llm") as mock_call_llm,
             patch("agents.graphics_agent.get_metrics_collector") as mock_metrics,
-            patch("subprocess.run") as mock_subprocess,
+            patch("agents.graphics_agent.get_sandbox") as mock_sandbox,
             patch("builtins.open", mock_open()),
         ):
             mock_call_llm.return_value = "plt.plot([1, 2, 3])"
-            mock_subprocess.return_value = Mock(returncode=1, stderr="Matplotlib error")
+            mock_sandbox.return_value.run.return_value = (False, "Matplotlib error")
             mock_collector = Mock()
             mock_collector.start_chart.return_value = {"title": "Test"}
             mock_metrics.return_value = mock_collector
@@ -637,12 +637,12 @@ class TestRunGraphicsAgent:
         with (
             patch("scripts.llm_client.call_llm") as mock_call_llm,
             patch("agents.graphics_agent.get_metrics_collector") as mock_metrics,
-            patch("subprocess.run") as mock_subprocess,
+            patch("agents.graphics_agent.get_sandbox") as mock_sandbox,
             patch("builtins.open", mock_open()),
         ):
             # LLM returns code in markdown block
             mock_call_llm.return_value = "```python\nplt.plot([1, 2, 3])\n```"
-            mock_subprocess.return_value = Mock(returncode=0)
+            mock_sandbox.return_value.run.return_value = (True, "")
             mock_collector = Mock()
             mock_collector.start_chart.return_value = {"title": "Test"}
             mock_metrics.return_value = mock_collector
@@ -905,7 +905,7 @@ class TestIntegration:
             patch("agents.writer_agent.review_agent_output") as mock_review,
             patch("scripts.llm_client.call_llm") as mock_graphics_llm,
             patch("agents.graphics_agent.get_metrics_collector") as mock_metrics,
-            patch("subprocess.run") as mock_subprocess,
+            patch("agents.graphics_agent.get_sandbox") as mock_sandbox,
             patch("builtins.open", mock_open()),
         ):
             # Setup mocks - separate for each agent
@@ -916,7 +916,7 @@ class TestIntegration:
                 "plt.plot([1, 2, 3])\nplt.savefig('test.png')"
             )
             mock_review.return_value = (True, [])
-            mock_subprocess.return_value = Mock(returncode=0)
+            mock_sandbox.return_value.run.return_value = (True, "")
             mock_collector = Mock()
             mock_collector.start_chart.return_value = {"title": "Test"}
             mock_metrics.return_value = mock_collector
@@ -7,9 +7,12 @@ weighted aggregation, and consensus determination.
 Target Coverage: 80%+ (105/131 statements)
 """
 
+import asyncio
 import json
+import os
 import sqlite3
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
@@ -18,9 +21,11 @@ import pytest
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import scripts.editorial_board as eb
 from scripts.editorial_board import (
     BOARD_MEMBERS,
     PERFORMANCE_ANALYST_ID,
+    _board_prompt_prefix,
     _score_topic_against_underperformers,
     format_board_report,
     get_board_vote,
@@ -29,6 +34,19 @@ from scripts.editorial_board import (
     run_editorial_board,
 )
 
+
+@contextmanager
+def _patch_call_llm():
+    """Patch the blocking LLM call for the sequential board and for the
+    parallel board, which reaches it through ``acall_llm``'s worker thread."""
+    mock = Mock()
+    with (
+        patch("scripts.editorial_board.call_llm", mock),
+        patch("scripts.llm_client.call_llm", mock),
+    ):
+        yield mock
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # FIXTURES
 # ═══════════════════════════════════════════════════════════════════════════
@@ -104,7 +122,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test VP of Engineering persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "vp_engineering"
@@ -139,7 +157,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test Senior QE Lead persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "senior_qe_lead"
@@ -164,7 +182,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test Data Skeptic persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "data_skeptic"
@@ -188,7 +206,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test Career Climber persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "career_climber"
@@ -212,7 +230,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test Economist Editor persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "economist_editor"
@@ -236,7 +254,7 @@ class TestPersonaAgents:
         sample_vote_response,
     ):
         """Test Busy Reader persona votes on topics."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             member_id = "busy_reader"
@@ -270,7 +288,7 @@ class TestVoteCollection:
         capsys,
     ):
         """Test collecting votes from all 7 board members (6 LLM + Performance Analyst)."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # Each LLM member returns the same vote structure. The
             # Performance Analyst is deterministic and does not call the LLM.
             mock_call_llm.return_value = sample_vote_response
@@ -305,7 +323,7 @@ class TestVoteCollection:
         sample_vote_response,
     ):
         """Test handling of API failures during voting."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # First 3 succeed, rest fail
             mock_call_llm.side_effect = [
                 sample_vote_response,
@@ -330,7 +348,7 @@ class TestVoteCollection:
 
     def test_vote_format_validation(self, mock_llm_client, sample_topics, capsys):
         """Test handling of invalid vote format from LLM."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # Return invalid JSON
             mock_call_llm.return_value = "This is not valid JSON"
 
@@ -367,7 +385,7 @@ class TestAggregation:
         sample_vote_response,
     ):
         """Test weighted score calculation with different weights."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # Create different scores for each member
             def create_vote(score1, score2):
                 return json.dumps(
@@ -415,7 +433,7 @@ class TestAggregation:
         sample_vote_response,
     ):
         """Test complete board decision aggregation."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             result = run_editorial_board(mock_llm_client, sample_topics, parallel=False)
@@ -438,7 +456,7 @@ class TestAggregation:
     def test_consensus_determination(self, mock_llm_client, sample_topics):
         """Test consensus determination (unanimous vs split)."""
         with (
-            patch("scripts.editorial_board.call_llm") as mock_call_llm,
+            _patch_call_llm() as mock_call_llm,
             patch(
                 "scripts.editorial_board.get_performance_analyst_vote",
             ) as mock_perf_vote,
@@ -473,7 +491,7 @@ class TestAggregation:
             assert result["consensus"] is True
 
         # Test split vote
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # Members disagree on top pick
             def create_vote(top_pick_idx):
                 return json.dumps(
@@ -512,7 +530,7 @@ class TestOutput:
 
     def test_json_structure(self, mock_llm_client, sample_topics, sample_vote_response):
         """Test board decision JSON structure."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             result = run_editorial_board(mock_llm_client, sample_topics, parallel=False)
@@ -537,7 +555,7 @@ class TestOutput:
     ):
         """Test saving board decision to files."""
         with (
-            patch("scripts.editorial_board.call_llm") as mock_call_llm,
+            _patch_call_llm() as mock_call_llm,
             patch("scripts.editorial_board.create_llm_client") as mock_create_client,
             patch("builtins.open", mock_open()),
             patch("os.path.exists") as mock_exists,
@@ -592,7 +610,7 @@ class TestErrorHandling:
 
     def test_llm_api_errors(self, mock_llm_client, sample_topics):
         """Test handling of LLM API errors."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             # Simulate API error
             mock_call_llm.side_effect = Exception("API connection timeout")
 
@@ -616,7 +634,7 @@ class TestIntegration:
         sample_vote_response,
     ):
         """Test markdown report generation."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             result = run_editorial_board(mock_llm_client, sample_topics, parallel=False)
@@ -638,7 +656,7 @@ class TestIntegration:
         sample_vote_response,
     ):
         """Test parallel and sequential voting produce same results."""
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             # Run sequentially
@@ -648,7 +666,7 @@ class TestIntegration:
                 parallel=False,
             )
 
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = sample_vote_response
 
             # Run in parallel
@@ -683,7 +701,7 @@ class TestMainFunction:
     ):
         """Test main() with TOPICS environment variable."""
         with (
-            patch("scripts.editorial_board.call_llm") as mock_call_llm,
+            _patch_call_llm() as mock_call_llm,
             patch("scripts.editorial_board.create_llm_client") as mock_create_client,
             patch.dict("os.environ", {"TOPICS": json.dumps(sample_topics)}),
             patch("builtins.open", mock_open()),
@@ -736,7 +754,7 @@ class TestMainFunction:
         github_output = tmp_path / "github_output.txt"
 
         with (
-            patch("scripts.editorial_board.call_llm") as mock_call_llm,
+            _patch_call_llm() as mock_call_llm,
             patch("scripts.editorial_board.create_llm_client") as mock_create_client,
             patch.dict(
                 "os.environ",
@@ -756,6 +774,124 @@ class TestMainFunction:
             assert True  # If we got here, no exceptions were raised
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# TEST ASYNC BOARD RUNNER
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestAsyncBoard:
+    """The parallel board runs every persona on one event loop."""
+
+    def test_personas_share_a_byte_identical_prefix(
+        self, mock_llm_client, sample_topics, sample_vote_response
+    ):
+        with _patch_call_llm() as mock_call_llm:
+            mock_call_llm.return_value = sample_vote_response
+            run_editorial_board(mock_llm_client, sample_topics, parallel=True)
+
+        prompts = [c[0][2] for c in mock_call_llm.call_args_list]
+        prefix = _board_prompt_prefix(sample_topics)
+        assert len(prompts) == len(BOARD_MEMBERS) - 1
+        assert all(p.startswith(prefix) for p in prompts)
+        # The persona is the only part that varies, and it comes last.
+        assert len({p[len(prefix) :] for p in prompts}) == len(prompts)
+
+    def test_agent_sdk_votes_are_awaited_on_one_loop(
+        self, sample_topics, sample_vote_response
+    ):
+        client = Mock(provider="agent_sdk")
+        loops = set()
+
+        async def fake_acall(llm_client, system_prompt, user_prompt, **kwargs):
+            loops.add(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+            return sample_vote_response
+
+        with (
+            patch("scripts.editorial_board.acall_llm", side_effect=fake_acall),
+            _patch_call_llm() as mock_call_llm,
+        ):
+            result = run_editorial_board(client, sample_topics, parallel=True)
+
+        mock_call_llm.assert_not_called()
+        assert len(loops) == 1
+        assert len(result["all_votes"]) == len(BOARD_MEMBERS)
+
+    def test_slow_member_abstains(self, sample_topics, sample_vote_response):
+        client = Mock(provider="agent_sdk")
+        slow_id = next(m for m in BOARD_MEMBERS if m != PERFORMANCE_ANALYST_ID)
+        slow_name = BOARD_MEMBERS[slow_id]["name"]
+
+        async def fake_acall(llm_client, system_prompt, user_prompt, timeout=None, **_):
+            if user_prompt.endswith(BOARD_MEMBERS[slow_id]["prompt"]):
+                await asyncio.wait_for(asyncio.sleep(5), timeout)
+            return sample_vote_response
+
+        with patch("scripts.editorial_board.acall_llm", side_effect=fake_acall):
+            result = asyncio.run(
+                eb._arun_board_members(
+                    client,
+                    {
+                        m: info
+                        for m, info in BOARD_MEMBERS.items()
+                        if m != PERFORMANCE_ANALYST_ID
+                    },
+                    sample_topics,
+                    timeout_s=0.05,
+                )
+            )
+
+        abstained = [v for v in result if v.get("abstained")]
+        assert [v["member_name"] for v in abstained] == [slow_name]
+        assert abstained[0]["votes"] == []
+        assert len(result) == len(BOARD_MEMBERS) - 1
+
+    def test_key_based_request_carries_the_member_deadline(
+        self, mock_llm_client, sample_topics, sample_vote_response
+    ):
+        """A worker thread cannot be cancelled, so the request itself must end."""
+        slow_id = next(m for m in BOARD_MEMBERS if m != PERFORMANCE_ANALYST_ID)
+
+        def fake_call(client, system, user, max_tokens, temperature, timeout):
+            assert timeout == 7.0
+            if user.endswith(BOARD_MEMBERS[slow_id]["prompt"]):
+                raise TimeoutError("request exceeded 7.0s")
+            return sample_vote_response
+
+        with _patch_call_llm() as mock_call_llm:
+            mock_call_llm.side_effect = fake_call
+            result = asyncio.run(
+                eb._arun_board_members(
+                    mock_llm_client,
+                    {slow_id: BOARD_MEMBERS[slow_id]},
+                    sample_topics,
+                    timeout_s=7.0,
+                )
+            )
+
+        assert [v.get("abstained") for v in result] == [True]
+
+    def test_abstention_does_not_break_consensus(
+        self, mock_llm_client, sample_topics, sample_vote_response
+    ):
+        abstain = eb._abstention("x", {"name": "X", "weight": 1.0}, "timeout")
+
+        async def fake_members(client, members, topics, timeout_s=0):
+            return [
+                {
+                    **json.loads(sample_vote_response),
+                    **info,
+                    "member_name": info["name"],
+                }
+                for info in list(members.values())[:2]
+            ] + [abstain]
+
+        with patch.object(eb, "_arun_board_members", fake_members):
+            result = run_editorial_board(mock_llm_client, sample_topics, parallel=True)
+
+        assert result["consensus"] is True
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # TEST PERFORMANCE ANALYST (#341)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -970,7 +1106,7 @@ class TestPenaltyPath:
             },
         )
 
-        with patch("scripts.editorial_board.call_llm") as mock_call_llm:
+        with _patch_call_llm() as mock_call_llm:
             mock_call_llm.return_value = equal_vote
             result = run_editorial_board(
                 mock_llm_client,
@@ -1011,3 +1147,68 @@ class TestPenaltyPath:
             v["score"] for v in perf_vote["votes"] if v["topic_index"] == 2
         )
         assert topic1_perf_score < topic2_perf_score
+
+
+class TestPerformerIndex:
+    """The title index is built once per ETL refresh and reused between runs."""
+
+    def test_index_is_reused_until_the_database_changes(
+        self, underperformer_db: Path
+    ) -> None:
+        with patch(
+            "scripts.editorial_board.get_bottom_performers",
+            wraps=eb.get_bottom_performers,
+        ) as loads:
+            first = eb.load_performer_indexes(underperformer_db)
+            second = eb.load_performer_indexes(underperformer_db)
+            assert first is second
+            assert loads.call_count == 1
+
+            stat = underperformer_db.stat()
+            os.utime(underperformer_db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            third = eb.load_performer_indexes(underperformer_db)
+
+        assert third is not first
+        assert loads.call_count == 2
+
+    def test_best_match_prefers_most_shared_tokens_then_list_order(self) -> None:
+        from scripts.content_intelligence import ArticlePerformance
+
+        def article(title: str) -> ArticlePerformance:
+            return ArticlePerformance("/2025/01/01/x/", title, 100, 0, 0, 0, 0.1)
+
+        index = eb.PerformerTitleIndex(
+            [
+                article("Flaky Pipelines"),
+                article("Flaky Tests Break Pipelines"),
+                article("Flaky Tests Break Pipelines Again"),
+            ]
+        )
+
+        match, shared = index.best_match({"flaky", "tests", "pipelines"})
+
+        assert match.page_title == "Flaky Tests Break Pipelines"
+        assert shared == {"flaky", "tests", "pipelines"}
+        assert index.best_match({"sharding"}) == (None, frozenset())
+
+    def test_top_performer_note_needs_a_strong_overlap(self) -> None:
+        from scripts.content_intelligence import ArticlePerformance
+
+        top = eb.PerformerTitleIndex(
+            [
+                ArticlePerformance(
+                    "/2026/02/10/economist-style-guide/",
+                    "Writing Like The Economist",
+                    800,
+                    0.8,
+                    220.0,
+                    0.85,
+                    0.880,
+                )
+            ]
+        )
+
+        note = eb._top_performer_note({"topic": "Writing economist charts"}, top)
+
+        assert "Closest top performer: 'Writing Like The Economist'" in note
+        assert eb._top_performer_note({"topic": "Economist charts"}, top) == ""
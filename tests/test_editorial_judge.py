@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Tests for the Editorial Judge — post-deployment shift-right quality gate."""
 
+import json
+import re
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -236,6 +239,115 @@ class TestStructure:
         assert result.status == WARN
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Prefetch and API call budget
+# ═══════════════════════════════════════════════════════════════════════════
+
+PAST_POSTS = {
+    f"_posts/2026-03-0{i}-past.md": f"---\ntitle: Past {i}\n---\n\nGardening note {i}."
+    for i in range(1, 6)
+}
+
+
+class _FakeGh:
+    """Stands in for ``gh api``: a trees endpoint and a GraphQL blob query."""
+
+    def __init__(self, files: dict[str, str], truncated: bool = False) -> None:
+        self.files = files
+        self.truncated = truncated
+        self.etag = '"tree-v1"'
+        self.calls: list[list[str]] = []
+
+    @staticmethod
+    def sha(path: str) -> str:
+        return f"sha-{abs(hash(path))}"
+
+    def __call__(self, argv: list[str], **_: object) -> Mock:
+        args = argv[2:]
+        self.calls.append(args)
+        if args[0] == "graphql":
+            query = next(a for a in args if a.startswith("query="))
+            by_sha = {self.sha(p): text for p, text in self.files.items()}
+            found = re.findall(r'(b\d+): object\(oid: "([^"]+)"\)', query)
+            data = {alias: {"text": by_sha.get(sha)} for alias, sha in found}
+            return Mock(returncode=0, stdout=json.dumps({"data": {"repository": data}}))
+        if "/contents/" in args[0]:
+            # A truncated listing leaves the image out; the contents API has it.
+            found = args[0].endswith("assets/images/test-article.png")
+            return Mock(returncode=0 if found else 1, stdout="{}", stderr="Not Found")
+        paths = [*self.files]
+        if not self.truncated:
+            paths.append("assets/images/test-article.png")
+        tree = {
+            "tree": [
+                {"path": path, "type": "blob", "sha": self.sha(path)} for path in paths
+            ],
+            "truncated": self.truncated,
+        }
+        if "--include" not in args:
+            return Mock(returncode=0, stdout=json.dumps(tree))
+        if f"If-None-Match: {self.etag}" in args:
+            return Mock(returncode=1, stdout="HTTP/2.0 304 Not Modified\r\n\r\n")
+        head = f"HTTP/2.0 200 OK\r\nEtag: {self.etag}\r\n\r\n"
+        return Mock(returncode=0, stdout=head + json.dumps(tree))
+
+
+class TestPrefetch:
+    ARTICLE = "_posts/2026-04-04-test-article.md"
+
+    def test_run_all_checks_makes_a_constant_number_of_calls(self) -> None:
+        gh = _FakeGh({self.ARTICLE: VALID_ARTICLE, **PAST_POSTS})
+        judge = EditorialJudge("oviney", "blog", "2026-04-04-test-article.md")
+
+        with patch("scripts.editorial_judge.subprocess.run", side_effect=gh):
+            report = judge.run_all_checks()
+
+        assert judge.api_calls == 2  # one tree listing, one blob query
+        assert [c.status for c in report.checks] == [PASS] * 6
+        assert report.article_title == "Test Article Title"
+
+    def test_a_cache_dir_makes_a_rerun_a_single_conditional_call(
+        self, tmp_path: Path
+    ) -> None:
+        gh = _FakeGh({self.ARTICLE: VALID_ARTICLE, **PAST_POSTS})
+
+        with patch("scripts.editorial_judge.subprocess.run", side_effect=gh):
+            first = EditorialJudge("o", "b", "2026-04-04-test-article.md", tmp_path)
+            first.run_all_checks()
+            gh.calls.clear()
+            second = EditorialJudge("o", "b", "2026-04-04-test-article.md", tmp_path)
+            report = second.run_all_checks()
+
+        assert second.api_calls == 1
+        assert 'If-None-Match: "tree-v1"' in gh.calls[0]
+        assert [c.status for c in report.checks] == [PASS] * 6
+
+    def test_a_path_missing_from_a_truncated_tree_is_looked_up(self) -> None:
+        gh = _FakeGh({self.ARTICLE: VALID_ARTICLE, **PAST_POSTS}, truncated=True)
+        judge = EditorialJudge("o", "b", "2026-04-04-test-article.md")
+
+        with patch("scripts.editorial_judge.subprocess.run", side_effect=gh):
+            report = judge.run_all_checks()
+            missing = judge._file_exists("assets/images/nope.png")
+
+        assert [c.status for c in report.checks] == [PASS] * 6
+        assert judge.api_calls == 4  # tree, blobs, two contents lookups
+        assert missing is False
+
+    def test_duplication_is_found_through_the_prefetched_blobs(self) -> None:
+        copy = "_posts/2026-03-09-copy.md"
+        gh = _FakeGh({self.ARTICLE: VALID_ARTICLE, copy: VALID_ARTICLE, **PAST_POSTS})
+        judge = EditorialJudge("o", "b", "2026-04-04-test-article.md")
+
+        with patch("scripts.editorial_judge.subprocess.run", side_effect=gh):
+            report = judge.run_all_checks()
+
+        duplication = next(c for c in report.checks if c.name == "Duplication")
+        assert duplication.status == FAIL
+        assert "2026-03-09-copy.md" in duplication.message
+        assert judge.api_calls == 2
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Report and verdict
 # ═══════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,126 @@
+"""Tests for scripts/eval_store.py — the append-only article evaluation store."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import orjson
+
+from scripts import eval_store
+from scripts.article_evaluator import EvalResult
+from scripts.eval_store import EvalStore, migrate_json_log
+from scripts.quality_metrics import QualityMetricsPipeline
+
+
+def _record(i: int, day: int = 1) -> dict:
+    return {
+        "article_filename": f"article-{i % 3}.md",
+        "timestamp": f"2026-04-{day:02d}T10:00:{i:02d}",
+        "scores": {"structure": 5},
+        "total_score": 40,
+        "percentage": 80,
+    }
+
+
+def _append_many(path: str, worker: int) -> None:
+    store = EvalStore(path)
+    for i in range(50):
+        store.append({**_record(i), "worker": worker})
+
+
+def test_records_stream_back_in_append_order(tmp_path: Path) -> None:
+    store = EvalStore(tmp_path / "evals.jsonl")
+    store.extend(_record(i) for i in range(5))
+    store.append(_record(5))
+
+    assert [r["timestamp"][-2:] for r in store.iter_records()] == [
+        "00",
+        "01",
+        "02",
+        "03",
+        "04",
+        "05",
+    ]
+    assert len(store) == 6
+
+
+def test_index_serves_filename_and_time_range_reads(tmp_path: Path) -> None:
+    store = EvalStore(tmp_path / "evals.jsonl")
+    store.extend(_record(i, day=i + 1) for i in range(9))
+
+    by_name = list(store.iter_records(article_filename="article-1.md"))
+    in_range = list(store.iter_records(since="2026-04-03", until="2026-04-06"))
+
+    assert [r["timestamp"][:10] for r in by_name] == [
+        "2026-04-02",
+        "2026-04-05",
+        "2026-04-08",
+    ]
+    assert [r["timestamp"][:10] for r in in_range] == [
+        "2026-04-03",
+        "2026-04-04",
+        "2026-04-05",
+    ]
+
+
+def test_index_catches_up_and_skips_a_torn_tail(tmp_path: Path) -> None:
+    store = EvalStore(tmp_path / "evals.jsonl")
+    store.append(_record(0))
+    assert len(store) == 1  # index now built
+    with store.path.open("ab") as fh:  # another writer, then a crash mid-line
+        fh.write(orjson.dumps(_record(1, day=2)) + b"\n")
+        fh.write(b'{"article_filename": "torn')
+
+    assert len(store) == 2
+    assert len(list(store.iter_records(since="2026-04-02"))) == 1
+    assert len(list(store.iter_records())) == 2
+
+
+def test_concurrent_writers_lose_nothing(tmp_path: Path) -> None:
+    path = str(tmp_path / "evals.jsonl")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_append_many, [path] * 4, range(4)))
+
+    records = list(EvalStore(path).iter_records())
+    assert len(records) == 200
+    assert {r["worker"] for r in records} == {0, 1, 2, 3}
+
+
+def test_migrator_imports_legacy_array_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "article_evals.json"
+    legacy.write_bytes(orjson.dumps([_record(i) for i in range(3)]))
+    store = EvalStore(tmp_path / "article_evals.jsonl")
+
+    assert migrate_json_log(legacy, store) == 3
+    assert migrate_json_log(legacy, store) == 0
+    assert len(store) == 3
+    assert (tmp_path / "article_evals.json.migrated").exists()
+
+
+def test_persist_appends_and_quality_metrics_streams_it(tmp_path: Path) -> None:
+    path = tmp_path / "article_evals.jsonl"
+    for name in ("a.md", "b.md"):
+        EvalResult(
+            scores={"opening_quality": 8, "structure": 9},
+            article_filename=name,
+        ).persist(str(path))
+
+    pipeline = QualityMetricsPipeline(
+        evals_path=path,
+        runs_path=tmp_path / "runs.json",
+        dashboard_path=tmp_path / "dashboard.json",
+    )
+    summary = pipeline.generate_dashboard()["summary"]
+    assert summary["total_articles"] == 2
+    assert summary["avg_eval_score"] == 17.0
+
+
+def test_default_store_follows_evals_path(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "article_evals.jsonl"
+    monkeypatch.setattr(eval_store, "EVALS_PATH", path)
+
+    EvalResult(scores={"structure": 9}, article_filename="a.md").persist()
+
+    assert [r["article_filename"] for r in EvalStore().iter_records()] == ["a.md"]
+    assert QualityMetricsPipeline().evals_path == path
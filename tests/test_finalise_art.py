@@ -15,7 +15,7 @@ from pathlib import Path
 import pytest
 
 from scripts.deploy_to_blog import _reject_unrendered_hero_prompt, _require_hero
-from scripts.finalise_art import finalise
+from scripts.finalise_art import finalise, main
 
 _ARTICLE = (
     '---\nlayout: post\ntitle: "My Slug"\n---\n\n'
@@ -84,6 +84,71 @@ class TestTheOwnersArtIsNeverOverwritten:
         assert (workspace / "output" / "charts" / "my-slug.png").is_file()
 
 
+class TestRenderedChartsFollowTheirSpec:
+    """Only a PNG this script rendered is re-rendered, and only when its spec changed."""
+
+    def test_an_edited_spec_is_rerendered(self, workspace: Path, capsys) -> None:
+        png = workspace / "output" / "charts" / "my-slug.png"
+        _write_spec(workspace, _VALID_SPEC)
+        finalise("my-slug")
+        first = png.read_bytes()
+
+        _write_spec(workspace, {**_VALID_SPEC, "title": "The rework tax, again"})
+        finalise("my-slug")
+
+        assert png.read_bytes() != first
+        assert "re-rendered" in capsys.readouterr().out
+
+    def test_an_unchanged_spec_is_not_rerendered(self, workspace: Path, capsys) -> None:
+        png = workspace / "output" / "charts" / "my-slug.png"
+        _write_spec(workspace, _VALID_SPEC)
+        finalise("my-slug")
+        written = png.stat().st_mtime_ns
+
+        finalise("my-slug")
+
+        assert png.stat().st_mtime_ns == written
+        assert "up to date" in capsys.readouterr().out
+
+    def test_a_rendered_png_edited_by_hand_becomes_the_owners(
+        self, workspace: Path
+    ) -> None:
+        png = workspace / "output" / "charts" / "my-slug.png"
+        _write_spec(workspace, _VALID_SPEC)
+        finalise("my-slug")
+        png.write_bytes(b"RETOUCHED")
+
+        _write_spec(workspace, {**_VALID_SPEC, "title": "The rework tax, again"})
+        finalise("my-slug")
+
+        assert png.read_bytes() == b"RETOUCHED"
+
+
+class TestRebuildAll:
+    def test_rebuild_reports_the_hit_rate_and_skips_hand_made_art(
+        self, workspace: Path, capsys
+    ) -> None:
+        charts = workspace / "output" / "charts"
+        for slug in ("one", "two"):
+            (charts / f"{slug}.spec.json").write_text(json.dumps(_VALID_SPEC))
+        (charts / "drawn.spec.json").write_text(json.dumps(_VALID_SPEC))
+        (charts / "drawn.png").write_bytes(b"HAND-MADE")
+
+        assert main(["--all", "--workers", "1"]) == 0
+        assert (charts / "one.png").is_file() and (charts / "two.png").is_file()
+        assert "0% hit rate" in capsys.readouterr().out
+
+        assert main(["--all"]) == 0
+        out = capsys.readouterr().out
+        assert "2 cached (100% hit rate), 0 rendered" in out
+        assert "1 hand-made kept" in out
+        assert (charts / "drawn.png").read_bytes() == b"HAND-MADE"
+
+    def test_a_rejected_spec_fails_the_rebuild(self, workspace: Path) -> None:
+        _write_spec(workspace, _UNFRAMED_SPEC)
+        assert main(["--all"]) == 1
+
+
 class TestTheEmbedFollowsTheChart:
     def test_an_embed_is_written_when_a_chart_exists(self, workspace: Path) -> None:
         _write_spec(workspace, _VALID_SPEC)
@@ -189,3 +254,24 @@ class TestTheHandOffSurvivesTheDeployGate:
 
 def test_a_missing_article_is_an_error(workspace: Path) -> None:
     assert finalise("no-such-slug") == 1
+
+
+class TestOtherRenderersArtIsNeverOverwritten:
+    def test_a_graphics_agent_png_in_the_manifest_is_left_alone(
+        self, workspace: Path, capsys
+    ) -> None:
+        """The Graphics Agent shares the manifest, but its charts are not ours."""
+        from src.agent_sdk.chart_renderer import load_manifest, record_render
+
+        charts = workspace / "output" / "charts"
+        png = charts / "my-slug.png"
+        png.write_bytes(b"LLM-DRAWN")
+        record_render(png, "graphics-agent-digest", "graphics_agent")
+        _write_spec(workspace, _VALID_SPEC)
+
+        assert finalise("my-slug") == 0
+        assert main(["--all"]) == 0
+
+        assert png.read_bytes() == b"LLM-DRAWN"
+        assert "1 hand-made kept" in capsys.readouterr().out
+        assert load_manifest(charts)["my-slug.png"]["renderer"] == "graphics_agent"
@@ -373,7 +373,9 @@ class TestRequestRevision:
         self,
         mock_run_pipeline: AsyncMock,
         tmp_path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
+        monkeypatch.chdir(tmp_path)
         failing = _passing_pipeline_result()
         failing.publication_validator_passed = False
         failing.publication_validator_issues = [
@@ -884,6 +886,8 @@ class TestKickoffResultFile:
 
         import src.economist_agents.flow as flow_module
 
+        # The revision path quarantines the draft under output/.
+        monkeypatch.chdir(tmp_path)
         result_path = tmp_path / "pipeline_result.json"
         monkeypatch.setattr(flow_module, "PIPELINE_RESULT_PATH", result_path)
         mock_client.return_value = Mock()
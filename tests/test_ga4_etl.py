@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import pathlib
 import sqlite3
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,7 @@ import pytest
 from scripts.ga4_etl import (
     COMPOSITE_WEIGHTS,
     COMPOSITE_WEIGHTS_ACTIVE,
+    compact,
     compute_scores,
     fetch_ga4_report,
     main,
@@ -397,10 +399,155 @@ class TestStoreResults:
             "scroll_depth_rate",
             "composite_score",
             "fetched_at",
+            "date",
         }
         assert columns == expected
 
 
+def _scored_row(path: str, date: str, pageviews: int = 10) -> dict[str, Any]:
+    return {
+        "page_path": path,
+        "page_title": path.strip("/").title(),
+        "date": date,
+        "pageviews": pageviews,
+        "engagement_rate": 0.5,
+        "avg_engagement_time": 60.0,
+        "scroll_depth_rate": 0.4,
+        "composite_score": 0.5,
+    }
+
+
+class TestIdempotentLoad:
+    """Bulk UPSERT on (page_path, date), WAL, retention."""
+
+    def test_rerun_updates_instead_of_duplicating(
+        self,
+        sample_response: MagicMock,
+        tmp_db: pathlib.Path,
+    ) -> None:
+        rows = compute_scores(parse_rows(sample_response))
+        store_results(rows, db_path=tmp_db)
+        rows[0]["pageviews"] = 999
+        store_results(rows, db_path=tmp_db)
+
+        conn = sqlite3.connect(str(tmp_db))
+        count = conn.execute("SELECT COUNT(*) FROM article_performance").fetchone()
+        views, date = conn.execute(
+            "SELECT pageviews, date FROM article_performance "
+            "WHERE page_path = '/blog/ai-trends'"
+        ).fetchone()
+        rollup_views = conn.execute(
+            "SELECT total_pageviews FROM page_rollup "
+            "WHERE page_path = '/blog/ai-trends'"
+        ).fetchone()
+        mode = conn.execute("PRAGMA journal_mode").fetchone()
+        conn.close()
+
+        assert count == (3,)
+        assert (views, date) == (999, "2026-04-01")
+        assert rollup_views == (999,)
+        assert mode == ("wal",)
+
+    def test_titles_of_one_page_day_are_summed_not_overwritten(
+        self, tmp_db: pathlib.Path
+    ) -> None:
+        """GA4 splits a retitled page's day by pageTitle; the table keys on
+        (page_path, date), so both halves must land in the one row."""
+        resp = _make_response(
+            [
+                _make_row("/blog/x", "Old Title", "20260401", 100, 0.5, 60.0, 20),
+                _make_row("/blog/x", "New Title", "20260401", 300, 0.9, 120.0, 240),
+            ],
+        )
+
+        rows = compute_scores(parse_rows(resp))
+        store_results(rows, db_path=tmp_db)
+
+        conn = sqlite3.connect(str(tmp_db))
+        stored = conn.execute(
+            "SELECT page_title, pageviews, engagement_rate, avg_engagement_time, "
+            "scroll_depth_rate FROM article_performance"
+        ).fetchall()
+        conn.close()
+
+        assert len(stored) == 1
+        title, views, rate, seconds, scroll = stored[0]
+        assert (title, views) == ("New Title", 400)
+        assert rate == pytest.approx((0.5 * 100 + 0.9 * 300) / 400)
+        assert seconds == pytest.approx((60.0 * 100 + 120.0 * 300) / 400)
+        assert scroll == pytest.approx((20 + 240) / 400)
+
+    def test_legacy_table_gains_date_column(self, tmp_db: pathlib.Path) -> None:
+        conn = sqlite3.connect(str(tmp_db))
+        conn.execute(
+            "CREATE TABLE article_performance (page_path TEXT, page_title TEXT, "
+            "pageviews INTEGER, engagement_rate REAL, avg_engagement_time REAL, "
+            "scroll_depth_rate REAL, composite_score REAL, fetched_at TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO article_performance VALUES "
+            "('/a/', 'A', 1, 0, 0, 0, 0, '2026-01-01T00:00:00+00:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        store_results([_scored_row("/a/", "20260401")], db_path=tmp_db)
+
+        conn = sqlite3.connect(str(tmp_db))
+        dates = conn.execute(
+            "SELECT date FROM article_performance ORDER BY date"
+        ).fetchall()
+        conn.close()
+        assert dates == [(None,), ("2026-04-01",)]
+
+    def test_year_backfill_is_one_bulk_write(self, tmp_db: pathlib.Path) -> None:
+        start = date(2025, 4, 1)
+        rows = [
+            _scored_row(f"/2025/01/01/p{p}/", (start + timedelta(days=d)).isoformat())
+            for d in range(365)
+            for p in range(20)
+        ]
+
+        assert store_results(rows, db_path=tmp_db) == len(rows)
+        assert store_results(rows, db_path=tmp_db) == len(rows)
+
+        conn = sqlite3.connect(str(tmp_db))
+        total = conn.execute("SELECT COUNT(*) FROM article_performance").fetchone()
+        rollup = conn.execute(
+            "SELECT COUNT(*), SUM(row_count), SUM(total_pageviews) FROM page_rollup"
+        ).fetchone()
+        conn.close()
+        assert total == (len(rows),)
+        assert rollup == (20, len(rows), 10 * len(rows))
+
+    def test_compact_applies_the_retention_window(self, tmp_db: pathlib.Path) -> None:
+        today = datetime.now(UTC).date()
+        old = (today - timedelta(days=400)).isoformat()
+        recent = (today - timedelta(days=10)).isoformat()
+        store_results(
+            [_scored_row("/2025/01/01/a/", old), _scored_row("/2025/01/01/a/", recent)],
+            db_path=tmp_db,
+        )
+
+        assert compact(tmp_db, retain_days=365) == 1
+
+        conn = sqlite3.connect(str(tmp_db))
+        left = conn.execute("SELECT date FROM article_performance").fetchall()
+        rollup = conn.execute("SELECT row_count FROM page_rollup").fetchall()
+        conn.close()
+        assert left == [(recent,)]
+        assert rollup == [(1,)]
+
+    @patch("scripts.ga4_etl.build_ga4_client")
+    def test_compact_cli_skips_the_fetch(
+        self, mock_build_client: MagicMock, tmp_db: pathlib.Path
+    ) -> None:
+        main(["--compact", "--retain-days", "30", "--db", str(tmp_db)])
+
+        mock_build_client.assert_not_called()
+        assert tmp_db.exists()
+
+
 # ---------------------------------------------------------------------------
 # fetch_ga4_report()
 # ---------------------------------------------------------------------------
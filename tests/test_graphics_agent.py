@@ -92,6 +92,16 @@ def mock_metrics_collector():
         yield collector
 
 
+@pytest.fixture(autouse=True)
+def mock_sandbox():
+    """Stand-in for the warm worker pool; no test spawns a worker process."""
+    with patch("agents.graphics_agent.get_sandbox") as mock:
+        sandbox = Mock()
+        sandbox.run.return_value = (True, "")
+        mock.return_value = sandbox
+        yield sandbox
+
+
 @pytest.fixture
 def sample_matplotlib_code():
     """Sample matplotlib code for testing."""
@@ -181,11 +191,10 @@ class TestChartGeneration:
             agent.generate_chart(valid_chart_spec, None)
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
     def test_generate_chart_success(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
@@ -194,31 +203,60 @@ class TestChartGeneration:
     ):
         """Should generate chart successfully."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         agent = GraphicsAgent(mock_llm_client)
         result = agent.generate_chart(valid_chart_spec, temp_output_path)
 
         assert result == temp_output_path
         mock_call_llm.assert_called_once()
-        mock_subprocess.assert_called_once()
+        mock_sandbox.run.assert_called_once()
         mock_metrics_collector.record_generation.assert_called_once()
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
-    def test_generate_chart_subprocess_failure(
+    def test_generate_chart_reuses_a_chart_from_the_same_spec(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
+        mock_llm_client,
+        valid_chart_spec,
+        tmp_path,
+        sample_matplotlib_code,
+        mock_metrics_collector,
+    ):
+        """A second call with an unchanged spec should not reach the LLM."""
+        output_path = str(tmp_path / "chart.png")
+
+        def draw(*args, **kwargs):
+            Path(output_path).write_bytes(b"PNG")
+            return True, ""
+
+        mock_call_llm.return_value = sample_matplotlib_code
+        mock_sandbox.run.side_effect = draw
+
+        agent = GraphicsAgent(mock_llm_client)
+        assert agent.generate_chart(valid_chart_spec, output_path) == output_path
+        assert agent.generate_chart(valid_chart_spec, output_path) == output_path
+        valid_chart_spec["title"] = "A different chart"
+        assert agent.generate_chart(valid_chart_spec, output_path) == output_path
+
+        assert mock_call_llm.call_count == 2
+        assert (agent.cache_hits, agent.cache_misses) == (1, 2)
+
+    @patch("scripts.llm_client.call_llm")
+    def test_generate_chart_execution_failure(
+        self,
+        mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
         sample_matplotlib_code,
         mock_metrics_collector,
     ):
-        """Should handle subprocess execution failure."""
+        """Should handle chart script execution failure."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=1, stderr="Matplotlib error")
+        mock_sandbox.run.return_value = (False, "Matplotlib error")
 
         agent = GraphicsAgent(mock_llm_client)
         result = agent.generate_chart(valid_chart_spec, temp_output_path)
@@ -299,16 +337,15 @@ class TestMatplotlibCodeGeneration:
 class TestMatplotlibCodeExecution:
     """Test matplotlib code execution."""
 
-    @patch("subprocess.run")
     def test_execute_matplotlib_code_success(
         self,
-        mock_subprocess,
+        mock_sandbox,
         mock_llm_client,
         sample_matplotlib_code,
         temp_output_path,
     ):
         """Should execute matplotlib code successfully."""
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         agent = GraphicsAgent(mock_llm_client)
         success = agent._execute_matplotlib_code(
@@ -317,19 +354,18 @@ class TestMatplotlibCodeExecution:
         )
 
         assert success is True
-        mock_subprocess.assert_called_once()
+        mock_sandbox.run.assert_called_once()
 
-    @patch("subprocess.run")
     def test_execute_matplotlib_code_failure(
         self,
-        mock_subprocess,
+        mock_sandbox,
         mock_llm_client,
         sample_matplotlib_code,
         temp_output_path,
         mock_metrics_collector,
     ):
         """Should handle matplotlib execution failure."""
-        mock_subprocess.return_value = Mock(returncode=1, stderr="Execution error")
+        mock_sandbox.run.return_value = (False, "Execution error")
 
         # Mock the metrics properly so it's not subscriptable
         mock_metrics_collector.current_session = {"charts": []}
@@ -342,42 +378,40 @@ class TestMatplotlibCodeExecution:
 
         assert success is False
 
-    def test_execute_adds_savefig_if_missing(self, mock_llm_client, temp_output_path):
+    def test_execute_adds_savefig_if_missing(
+        self, mock_llm_client, temp_output_path, mock_sandbox
+    ):
         """Should add plt.savefig if not present."""
         code = "import matplotlib.pyplot as plt\nplt.plot([1,2,3])"
 
         agent = GraphicsAgent(mock_llm_client)
+        agent._execute_matplotlib_code(code, temp_output_path)
 
-        # Mock subprocess to avoid actual execution
-        with patch("subprocess.run") as mock_subprocess:
-            mock_subprocess.return_value = Mock(returncode=0)
-            agent._execute_matplotlib_code(code, temp_output_path)
-
-        # Check that temp file was created with savefig
-        # (Code should have savefig added)
+        sent = mock_sandbox.run.call_args.args[0]
+        assert f"plt.savefig({temp_output_path!r}" in sent
 
-    def test_execute_replaces_savefig_params(self, mock_llm_client, temp_output_path):
+    def test_execute_replaces_savefig_params(
+        self, mock_llm_client, temp_output_path, mock_sandbox
+    ):
         """Should replace existing plt.savefig with correct params."""
         code = "import matplotlib.pyplot as plt\nplt.savefig('old.png')"
 
         agent = GraphicsAgent(mock_llm_client)
+        agent._execute_matplotlib_code(code, temp_output_path)
 
-        with patch("subprocess.run") as mock_subprocess:
-            mock_subprocess.return_value = Mock(returncode=0)
-            agent._execute_matplotlib_code(code, temp_output_path)
-
-        # Savefig should be replaced with correct path
+        sent = mock_sandbox.run.call_args.args[0]
+        assert "old.png" not in sent
+        assert f"plt.savefig({temp_output_path!r}, dpi=300" in sent
 
 
 class TestBackwardCompatibility:
     """Test backward compatibility with economist_agent.py."""
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
     def test_run_graphics_agent_function(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
@@ -386,7 +420,7 @@ class TestBackwardCompatibility:
     ):
         """Should maintain backward compatibility."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         result = run_graphics_agent(mock_llm_client, valid_chart_spec, temp_output_path)
 
@@ -511,11 +545,10 @@ class TestMetricsIntegration:
     """Test metrics collection integration."""
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
     def test_metrics_start_chart_called(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
@@ -524,7 +557,7 @@ class TestMetricsIntegration:
     ):
         """Should call metrics.start_chart."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         agent = GraphicsAgent(mock_llm_client)
         agent.generate_chart(valid_chart_spec, temp_output_path)
@@ -535,11 +568,10 @@ class TestMetricsIntegration:
         )
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
     def test_metrics_record_generation_success(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
@@ -548,7 +580,7 @@ class TestMetricsIntegration:
     ):
         """Should record generation success."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         agent = GraphicsAgent(mock_llm_client)
         agent.generate_chart(valid_chart_spec, temp_output_path)
@@ -590,11 +622,10 @@ class TestIntegration:
     """Integration tests."""
 
     @patch("scripts.llm_client.call_llm")
-    @patch("subprocess.run")
     def test_full_chart_generation_flow(
         self,
-        mock_subprocess,
         mock_call_llm,
+        mock_sandbox,
         mock_llm_client,
         valid_chart_spec,
         temp_output_path,
@@ -603,7 +634,7 @@ class TestIntegration:
     ):
         """Should complete full chart generation flow."""
         mock_call_llm.return_value = sample_matplotlib_code
-        mock_subprocess.return_value = Mock(returncode=0)
+        mock_sandbox.run.return_value = (True, "")
 
         # Create agent
         agent = GraphicsAgent(mock_llm_client)
@@ -614,7 +645,7 @@ class TestIntegration:
         # Verify flow
         assert result == temp_output_path
         assert mock_call_llm.call_count == 1
-        assert mock_subprocess.call_count == 1
+        assert mock_sandbox.run.call_count == 1
         assert mock_metrics_collector.start_chart.call_count == 1
         assert mock_metrics_collector.record_generation.call_count == 1
 
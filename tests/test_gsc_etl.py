@@ -1,24 +1,29 @@
 """Tests for scripts/gsc_etl.py — Google Search Console ETL (Issue #163).
 
-All Google API calls are mocked. Tests cover:
+All Google API calls are mocked or served by ``FakeSearchConsole``. Tests cover:
 - Successful data fetch and SQLite storage
 - Empty response handling (new GSC property)
 - Content gap identification logic
 - SQLite table creation and row persistence
+- Pagination, date windows and incremental loads from the high-water mark
 """
 
 import sqlite3
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+import scripts.gsc_etl as gsc
 from scripts.gsc_etl import (
     aggregate_by_page,
+    date_windows,
     fetch_search_analytics,
     identify_content_gaps,
     init_db,
+    iter_search_analytics,
     parse_rows,
     run_etl,
     store_results,
@@ -63,6 +68,44 @@ def _sample_gsc_rows() -> list[dict[str, Any]]:
     ]
 
 
+class FakeSearchConsole:
+    """Local stand-in for the Search Console service resource.
+
+    Serves daily rows (``keys`` = date, query, page) and honours the request
+    body's date range, dimensions, ``rowLimit`` and ``startRow`` the way the
+    real API does. Every request body is recorded in ``requests``.
+    """
+
+    def __init__(self, daily_rows: list[dict[str, Any]]) -> None:
+        self.daily_rows = daily_rows
+        self.requests: list[dict[str, Any]] = []
+
+    def searchanalytics(self) -> "FakeSearchConsole":
+        return self
+
+    def query(self, siteUrl: str, body: dict[str, Any]) -> MagicMock:  # noqa: N803
+        self.requests.append(body)
+        matching = [
+            row
+            for row in self.daily_rows
+            if body["startDate"] <= row["keys"][0] <= body["endDate"]
+        ]
+        assert body["dimensions"] == ["date", "query", "page"]
+        page = matching[body["startRow"] : body["startRow"] + body["rowLimit"]]
+        request = MagicMock()
+        request.execute.return_value = {"rows": page} if page else {}
+        return request
+
+
+def _daily(day: date, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Date-stamp query+page rows as the API returns them with a date dimension."""
+    return [{**row, "keys": [day.isoformat(), *row["keys"]]} for row in rows]
+
+
+def _today() -> date:
+    return datetime.now(tz=UTC).date()
+
+
 @pytest.fixture
 def tmp_db(tmp_path: Path) -> Path:
     """Return a temporary database path."""
@@ -296,11 +339,8 @@ class TestRunEtl:
     @patch("scripts.gsc_etl.build_gsc_service")
     def test_full_pipeline(self, mock_build: MagicMock, tmp_db: Path) -> None:
         """End-to-end: data flows from API through transforms into SQLite."""
-        mock_service = MagicMock()
-        mock_service.searchanalytics().query().execute.return_value = {
-            "rows": _sample_gsc_rows(),
-        }
-        mock_build.return_value = mock_service
+        day = _today() - timedelta(days=5)
+        mock_build.return_value = FakeSearchConsole(_daily(day, _sample_gsc_rows()))
 
         summary = run_etl(
             credentials_path="/fake/creds.json",
@@ -336,3 +376,136 @@ class TestRunEtl:
         )
 
         assert summary == {"total_queries": 0, "total_pages": 0, "content_gaps": 0}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Streaming extraction
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestStreaming:
+    """Pagination, date windows and the high-water mark."""
+
+    def test_pages_by_start_row(self) -> None:
+        """A full page triggers the next request; a short page ends the range."""
+        day = date(2026, 4, 1)
+        service = FakeSearchConsole(_daily(day, _sample_gsc_rows()) * 2)
+
+        rows = list(iter_search_analytics(service, "s", day, day, row_limit=3))
+
+        assert len(rows) == 8
+        assert [r["startRow"] for r in service.requests] == [0, 3, 6]
+
+    def test_date_windows_cover_the_range_once(self) -> None:
+        """Windows are consecutive, inclusive and clipped to the end date."""
+        windows = list(date_windows(date(2026, 4, 1), date(2026, 4, 10), 4))
+        assert windows == [
+            (date(2026, 4, 1), date(2026, 4, 4)),
+            (date(2026, 4, 5), date(2026, 4, 8)),
+            (date(2026, 4, 9), date(2026, 4, 10)),
+        ]
+
+    @patch("scripts.gsc_etl.build_gsc_service")
+    def test_second_run_fetches_only_new_days(
+        self,
+        mock_build: MagicMock,
+        tmp_db: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Rerunning reloads only the unsettled days and never duplicates rows."""
+        monkeypatch.setattr(gsc, "ROW_LIMIT", 2)
+        monkeypatch.setattr(gsc, "BATCH_SIZE", 3)
+        today = _today()
+        rows = _daily(today - timedelta(days=20), _sample_gsc_rows()) + _daily(
+            today - timedelta(days=1), _sample_gsc_rows()[:2]
+        )
+        service = FakeSearchConsole(rows)
+        mock_build.return_value = service
+
+        first = run_etl("/fake/creds.json", "https://www.viney.ca/", 30, tmp_db)
+        service.requests.clear()
+        second = run_etl("/fake/creds.json", "https://www.viney.ca/", 30, tmp_db)
+
+        assert first == second
+        assert first["total_queries"] == 4
+        settled = today - timedelta(days=gsc.FRESH_DATA_DAYS)
+        assert min(r["startDate"] for r in service.requests) == (
+            (settled + timedelta(days=1)).isoformat()
+        )
+        conn = sqlite3.connect(str(tmp_db))
+        kw = conn.execute("SELECT COUNT(*) FROM keyword_data").fetchone()[0]
+        mark = conn.execute("SELECT loaded_through FROM gsc_load_state").fetchone()
+        conn.close()
+        assert kw == 6
+        assert mark == (settled.isoformat(),)
+
+    @patch("scripts.gsc_etl.build_gsc_service")
+    def test_wider_second_run_backfills_before_the_low_water_mark(
+        self,
+        mock_build: MagicMock,
+        tmp_db: Path,
+    ) -> None:
+        """A larger --days fetches the earlier days instead of summarising the
+        wider window from the narrower run's data."""
+        today = _today()
+        old = today - timedelta(days=50)
+        rows = _daily(old, _sample_gsc_rows()[:2]) + _daily(
+            today - timedelta(days=10), _sample_gsc_rows()[2:]
+        )
+        service = FakeSearchConsole(rows)
+        mock_build.return_value = service
+
+        narrow = run_etl("/fake/creds.json", "https://www.viney.ca/", 30, tmp_db)
+        service.requests.clear()
+        wide = run_etl("/fake/creds.json", "https://www.viney.ca/", 60, tmp_db)
+
+        assert narrow["total_queries"] == 2
+        assert wide["total_queries"] == 4
+        since = today - timedelta(days=60)
+        assert min(r["startDate"] for r in service.requests) == since.isoformat()
+        # The days the first run loaded are not fetched again.
+        settled = today - timedelta(days=gsc.FRESH_DATA_DAYS)
+        first_since = today - timedelta(days=30)
+        assert not [
+            r
+            for r in service.requests
+            if first_since.isoformat() <= r["startDate"] <= settled.isoformat()
+        ]
+        conn = sqlite3.connect(str(tmp_db))
+        marks = conn.execute(
+            "SELECT loaded_from, loaded_through FROM gsc_load_state"
+        ).fetchone()
+        conn.close()
+        assert marks == (since.isoformat(), settled.isoformat())
+
+    def test_window_summary_matches_in_memory_transforms(self, tmp_db: Path) -> None:
+        """Splitting a pair across days does not change gaps or page totals."""
+        conn = init_db(tmp_db)
+        first = [
+            {**r, "impressions": r["impressions"] // 2, "clicks": r["clicks"] // 2}
+            for r in _sample_gsc_rows()
+        ]
+        rest = [
+            {
+                **r,
+                "impressions": r["impressions"] - h["impressions"],
+                "clicks": r["clicks"] - h["clicks"],
+            }
+            for r, h in zip(_sample_gsc_rows(), first, strict=True)
+        ]
+        for day, rows in ((date(2026, 4, 1), first), (date(2026, 4, 2), rest)):
+            parsed = parse_rows(_daily(day, rows), gsc.DAILY_DIMENSIONS)
+            gsc.store_keyword_batch(conn, parsed, "t")
+
+        summary = gsc.summarise_window(conn, date(2026, 3, 1), "t")
+        stored = conn.execute(
+            "SELECT page_url, total_impressions, total_clicks FROM search_performance"
+        ).fetchall()
+        conn.close()
+
+        expected = identify_content_gaps(parse_rows(_sample_gsc_rows()))
+        assert summary["content_gaps"] == sum(r["is_content_gap"] for r in expected)
+        assert sorted(stored) == sorted(
+            (p["page_url"], p["total_impressions"], p["total_clicks"])
+            for p in aggregate_by_page(expected)
+        )
@@ -28,11 +28,18 @@ reviewer and must not quarantine a publishable article.
 
 from __future__ import annotations
 
+from collections import Counter
 from pathlib import Path
 
+import numpy as np
+import pytest
 from PIL import Image
 
-from src.agent_sdk.hero_svg import report_edge_contact
+from src.agent_sdk.hero_svg import (
+    _EDGE_COLOUR_TOLERANCE,
+    _EDGE_MIN_COVERAGE,
+    report_edge_contact,
+)
 
 _CREAM = (243, 239, 228)
 _NAVY = (11, 43, 70)
@@ -175,3 +182,76 @@ class TestEdgeContactDegradation:
         bad.write_bytes(b"not a png at all")
 
         assert report_edge_contact(bad) == []
+
+
+def _pixelwise_coverage(png_path: Path) -> dict[str, float]:
+    """The original pixel-at-a-time measurement, kept as the parity oracle."""
+    with Image.open(png_path) as handle:
+        image = handle.convert("RGB")
+    width, height = image.size
+    pixels = image.load()
+
+    def close(a: tuple[int, ...], b: tuple[int, ...]) -> bool:
+        return all(
+            abs(c - d) <= _EDGE_COLOUR_TOLERANCE for c, d in zip(a, b, strict=True)
+        )
+
+    rows = [
+        all(close(pixels[x, y], pixels[0, y]) for x in range(width))
+        for y in range(height)
+    ]
+    cols = [
+        all(close(pixels[x, y], pixels[x, 0]) for y in range(height))
+        for x in range(width)
+    ]
+    edges = {
+        "top": ([pixels[x, 0] for x in range(width)], cols),
+        "bottom": ([pixels[x, height - 1] for x in range(width)], cols),
+        "left": ([pixels[0, y] for y in range(height)], rows),
+        "right": ([pixels[width - 1, y] for y in range(height)], rows),
+    }
+    coverage = {}
+    for name, (line, crosses) in edges.items():
+        dominant = Counter(line).most_common(1)[0][0]
+        clipped = sum(
+            1
+            for i, colour in enumerate(line)
+            if not close(colour, dominant) and not crosses[i]
+        )
+        coverage[name] = clipped / len(line)
+    return coverage
+
+
+class TestEdgeContactParity:
+    """The vectorised measurement must report exactly what the pixel loop did."""
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_findings_match_the_pixelwise_measurement(
+        self, tmp_path: Path, seed: int
+    ) -> None:
+        """Random blocks, full-bleed bands and near-tolerance noise, 16:9."""
+        rng = np.random.default_rng(seed)
+        canvas = np.empty((90, 160, 3), dtype=np.int16)
+        canvas[:] = _CREAM
+        for _ in range(rng.integers(1, 6)):
+            y0, x0 = rng.integers(0, 90), rng.integers(0, 160)
+            h, w = rng.integers(1, 60), rng.integers(1, 120)
+            canvas[y0 : y0 + h, x0 : x0 + w] = rng.integers(0, 256, 3)
+        if seed % 3 == 0:
+            canvas[70:, :] = _NAVY  # full-bleed floor band
+        # Anti-aliasing-like jitter straddling the tolerance boundary.
+        jitter = rng.integers(-18, 19, canvas.shape) * (rng.random(canvas.shape) < 0.1)
+        image = Image.fromarray(np.clip(canvas + jitter, 0, 255).astype(np.uint8))
+        path = tmp_path / f"random-{seed}.png"
+        image.save(path)
+
+        expected = [
+            name
+            for name, coverage in _pixelwise_coverage(path).items()
+            if coverage >= _EDGE_MIN_COVERAGE
+        ]
+        findings = report_edge_contact(path)
+
+        assert [f.split(" the ")[1].split()[0] for f in findings] == expected
+        for finding, name in zip(findings, expected, strict=True):
+            assert f"{_pixelwise_coverage(path)[name]:.0%}" in finding
@@ -0,0 +1,167 @@
+"""The warm hero renderer — one browser, many renders, never raises.
+
+No test spawns Chrome (BUG-058): ``subprocess.Popen`` and the DevTools
+websocket are replaced with fakes that speak just enough CDP.
+"""
+
+from __future__ import annotations
+
+import base64
+import gc
+import json
+import sys
+import types
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+from src.agent_sdk import hero_renderer
+from src.agent_sdk.hero_renderer import HeroRenderer
+
+
+class _FakeProcess:
+    returncode = None
+
+    def __init__(self, argv: list[str], **_: object) -> None:
+        profile = next(a.split("=", 1)[1] for a in argv if "--user-data-dir" in a)
+        (Path(profile) / "DevToolsActivePort").write_text("9222\n/devtools/browser/x\n")
+
+    def poll(self) -> int | None:
+        return self.returncode
+
+    def terminate(self) -> None:
+        self.returncode = 0
+
+    def wait(self, timeout: float | None = None) -> int:
+        return 0
+
+
+class _FakeDevTools:
+    """A CDP peer: replies by id, fires the load event before its reply."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.inbox: deque[str] = deque()
+        self.calls: list[str] = []
+        self.fail_on = fail_on
+
+    def send(self, raw: str) -> None:
+        message = json.loads(raw)
+        method = message["method"]
+        self.calls.append(method)
+        reply: dict = {"id": message["id"], "result": {}}
+        if method == self.fail_on:
+            reply = {"id": message["id"], "error": {"message": "target crashed"}}
+        elif method == "Target.createTarget":
+            reply["result"] = {"targetId": "T1"}
+        elif method == "Target.attachToTarget":
+            reply["result"] = {"sessionId": "S1"}
+        elif method == "Page.navigate":
+            self.inbox.append(json.dumps({"method": "Page.frameStartedLoading"}))
+            self.inbox.append(json.dumps({"method": "Page.loadEventFired"}))
+        elif method == "Page.captureScreenshot":
+            png = b"\x89PNG" + message.get("sessionId", "").encode()
+            reply["result"] = {"data": base64.b64encode(png).decode()}
+        self.inbox.append(json.dumps(reply))
+
+    def recv(self) -> str:
+        return self.inbox.popleft()
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def browser(monkeypatch: pytest.MonkeyPatch) -> dict:
+    state: dict = {"launches": 0, "sockets": [], "fail_on": None}
+
+    def popen(argv, **kwargs):  # type: ignore[no-untyped-def]
+        state["launches"] += 1
+        return _FakeProcess(argv, **kwargs)
+
+    def create_connection(url, **kwargs):  # type: ignore[no-untyped-def]
+        assert url == "ws://127.0.0.1:9222/devtools/browser/x"
+        socket = _FakeDevTools(state["fail_on"])
+        state["sockets"].append(socket)
+        return socket
+
+    monkeypatch.setattr(hero_renderer.subprocess, "Popen", popen)
+    monkeypatch.setitem(
+        sys.modules,
+        "websocket",
+        types.SimpleNamespace(create_connection=create_connection),
+    )
+    monkeypatch.setattr(hero_renderer, "_find_chrome", lambda: "/usr/bin/chromium")
+    return state
+
+
+def _svgs(tmp_path: Path, count: int) -> list[Path]:
+    paths = [tmp_path / f"hero-{i}.svg" for i in range(count)]
+    for path in paths:
+        path.write_text("<svg xmlns='http://www.w3.org/2000/svg'/>")
+    return paths
+
+
+def test_one_browser_serves_every_render(tmp_path: Path, browser: dict) -> None:
+    with HeroRenderer() as renderer:
+        futures = [
+            renderer.submit(svg, svg.with_suffix(".png")) for svg in _svgs(tmp_path, 3)
+        ]
+        results = [f.result(timeout=5) for f in futures]
+
+    assert browser["launches"] == 1
+    assert results == [tmp_path / f"hero-{i}.png" for i in range(3)]
+    assert all(p.read_bytes() == b"\x89PNGS1" for p in results)
+    assert browser["sockets"][0].calls.count("Emulation.setDeviceMetricsOverride") == 1
+    assert browser["sockets"][0].calls.count("Page.captureScreenshot") == 3
+    assert len(renderer.latencies_ms) == 3
+
+
+def test_cdp_failure_falls_back_and_restarts_the_browser(
+    tmp_path: Path, browser: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    one_shot: list[Path] = []
+    monkeypatch.setattr(
+        hero_renderer,
+        "render_to_png",
+        lambda svg, png: one_shot.append(svg) or png,
+    )
+    first, second = _svgs(tmp_path, 2)
+
+    with HeroRenderer() as renderer:
+        browser["fail_on"] = "Page.captureScreenshot"
+        assert renderer.render(first, tmp_path / "a.png") == tmp_path / "a.png"
+        browser["fail_on"] = None
+        assert renderer.render(second, tmp_path / "b.png") == tmp_path / "b.png"
+
+    assert one_shot == [first]
+    assert browser["launches"] == 2
+    assert (tmp_path / "b.png").read_bytes() == b"\x89PNGS1"
+
+
+def test_without_chrome_it_degrades_like_render_to_png(
+    tmp_path: Path, browser: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(hero_renderer, "_find_chrome", lambda: None)
+    monkeypatch.setattr(hero_renderer, "render_to_png", lambda svg, png: None)
+    (svg,) = _svgs(tmp_path, 1)
+
+    with HeroRenderer() as renderer:
+        assert renderer.render(svg, tmp_path / "h.png") is None
+
+    assert browser["launches"] == 0
+
+
+def test_an_unclosed_browser_is_reaped(browser: dict) -> None:
+    """Chrome and its profile must not outlive a renderer nobody closed."""
+    warm = hero_renderer._Browser("/usr/bin/chromium")
+    process, profile = warm._process, Path(warm._profile)
+    reaper = warm._reaper
+
+    assert reaper.atexit  # also runs at interpreter exit
+    del warm
+    gc.collect()
+
+    assert not reaper.alive
+    assert process.poll() == 0
+    assert not profile.exists()
@@ -215,6 +215,43 @@ class TestSizeCeiling:
             check_hero_svg(_svg(body='<path d="M0 0 ' + "L1 1 " * 30000 + '"/>'))
 
 
+class TestStreaming:
+    """The parse is incremental, so a bad document fails before it is all read."""
+
+    def test_a_path_is_validated_like_text(self, tmp_path: Path) -> None:
+        hero = tmp_path / "hero.svg"
+        hero.write_text(_svg())
+        check_hero_svg(hero)  # must not raise
+
+    def test_forbidden_content_fails_before_the_rest_is_parsed(self) -> None:
+        # The tail is never well-formed; the <script> is reported first.
+        head = _svg(body="<script>alert(1)</script>").removesuffix("</svg>")
+        with pytest.raises(HeroSvgError, match="script"):
+            check_hero_svg(head + "<rect" * 5000)
+
+    def test_an_oversized_file_is_rejected_without_parsing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        hero = tmp_path / "hero.svg"
+        hero.write_text(_svg(body='<path d="M0 0 ' + "L1 1 " * 30000 + '"/>'))
+        fed: list[bytes] = []
+        real_parser = hero_svg.ElementTree.XMLPullParser
+
+        class _Spy(real_parser):  # type: ignore[misc, valid-type]
+            def feed(self, data: bytes) -> None:
+                fed.append(data)
+                super().feed(data)
+
+        monkeypatch.setattr(hero_svg.ElementTree, "XMLPullParser", _Spy)
+        with pytest.raises(HeroSvgError, match="bytes"):
+            check_hero_svg(hero)
+        assert fed == []
+
+    def test_an_unreadable_path_is_a_hero_svg_error(self, tmp_path: Path) -> None:
+        with pytest.raises(HeroSvgError, match="could not be read"):
+            check_hero_svg(tmp_path / "missing.svg")
+
+
 class TestErrorQuality:
     def test_the_message_names_the_failing_rule(self) -> None:
         with pytest.raises(HeroSvgError) as exc:
@@ -20,6 +20,7 @@ moot.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -104,7 +105,13 @@ class TestCallLlmRoutesKeyless:
     ) -> None:
         seen: dict[str, Any] = {}
 
-        def fake(system: str, user: str, max_tokens: int, temperature: float) -> str:
+        def fake(
+            system: str,
+            user: str,
+            max_tokens: int,
+            temperature: float,
+            timeout: float | None = None,
+        ) -> str:
             seen.update(
                 system=system, user=user, max_tokens=max_tokens, temp=temperature
             )
@@ -120,6 +127,22 @@ class TestCallLlmRoutesKeyless:
         assert seen["user"] == "USER"
         assert seen["max_tokens"] == 1234
 
+    def test_acall_llm_awaits_the_sdk_on_the_callers_loop(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def fake(
+            system: str, user: str, max_tokens: int, temp: float, timeout=None
+        ) -> str:
+            return f"{system}|{user}"
+
+        monkeypatch.setattr(lc, "_acall_agent_sdk", fake)
+        monkeypatch.setattr(
+            lc, "_call_agent_sdk", lambda *a: pytest.fail("blocking path used")
+        )
+        client = lc.create_llm_client()
+
+        assert asyncio.run(lc.acall_llm(client, "SYS", "USER")) == "SYS|USER"
+
     def test_the_flow_can_build_a_client_without_any_key(self) -> None:
         """The BUG-046 reproduction, stated as the thing that was broken.
 
@@ -127,3 +150,82 @@ class TestCallLlmRoutesKeyless:
         no arguments. That is the call that raised.
         """
         assert lc.create_llm_client().provider == "agent_sdk"
+
+
+class TestRequestTimeouts:
+    """A deadline reaches the request itself, so no worker thread outlives it."""
+
+    def test_key_based_request_is_bounded_and_not_retried(self) -> None:
+        import anthropic
+        import httpx
+
+        seen: dict[str, Any] = {}
+
+        class _Messages:
+            def create(self, **kwargs: Any) -> Any:
+                raise anthropic.APITimeoutError(request=httpx.Request("POST", "x"))
+
+        class _Client:
+            messages = _Messages()
+
+            def with_options(self, **kwargs: Any) -> _Client:
+                seen.update(kwargs)
+                return self
+
+        client = lc.LLMClient("anthropic", _Client(), "m")
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(lc.acall_llm(client, "SYS", "USER", timeout=3.0))
+        assert seen == {"timeout": 3.0, "max_retries": 0}
+
+    def test_key_based_await_has_one_overall_deadline(self) -> None:
+        """A request that trickles past each per-phase limit still ends on time."""
+        import threading
+        import time
+
+        release = threading.Event()
+
+        class _Messages:
+            def create(self, **kwargs: Any) -> Any:
+                release.wait(5)
+                raise AssertionError("the caller should have stopped waiting")
+
+        class _Client:
+            messages = _Messages()
+
+            def with_options(self, **kwargs: Any) -> _Client:
+                return self
+
+        client = lc.LLMClient("anthropic", _Client(), "m")
+
+        async def waited() -> float:
+            started = time.monotonic()
+            try:
+                with pytest.raises(TimeoutError):
+                    await lc.acall_llm(client, "SYS", "USER", timeout=0.05)
+                return time.monotonic() - started
+            finally:
+                release.set()
+
+        assert asyncio.run(waited()) < 2
+
+    def test_agent_sdk_call_is_cancelled_at_the_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cancelled = []
+
+        async def slow(system: str, user: str) -> str:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "late"
+
+        monkeypatch.setenv("AGENT_SDK_POOL", "0")
+        monkeypatch.setattr(lc, "_query_agent_sdk", slow)
+        client = lc.create_llm_client()
+
+        with pytest.raises(TimeoutError):
+            lc.call_llm(client, "SYS", "USER", timeout=0.05)
+        assert cancelled == [True]
@@ -0,0 +1,175 @@
+"""The Agent SDK session pool keeps a connected CLI session ready for the next
+call, retires each session after one exchange, and bounds concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import claude_agent_sdk as sdk
+import pytest
+
+from scripts import llm_client as lc
+
+
+class _FakeClient:
+    """Stands in for ``ClaudeSDKClient``: echoes the prompt it was asked."""
+
+    live = 0
+    peak = 0
+    guard = threading.Lock()
+
+    def __init__(self, model: str, system_prompt: str, delay: float = 0.0) -> None:
+        self.system_prompt = system_prompt
+        self.delay = delay
+        self.prompts: list[str] = []
+        self.connected = False
+        self.dead = False
+        self.disconnected = False
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    async def query(self, prompt: str) -> None:
+        if not self.connected or self.dead:
+            raise sdk.CLIConnectionError("ProcessTransport is not ready for writing")
+        self.prompts.append(prompt)
+
+    async def receive_response(self):
+        with _FakeClient.guard:
+            _FakeClient.live += 1
+            _FakeClient.peak = max(_FakeClient.peak, _FakeClient.live)
+        try:
+            await asyncio.sleep(self.delay)
+            yield sdk.AssistantMessage(
+                content=[
+                    sdk.TextBlock(text=f"{self.system_prompt}:{self.prompts[-1]}")
+                ],
+                model="claude-sonnet-4-6",
+            )
+        finally:
+            with _FakeClient.guard:
+                _FakeClient.live -= 1
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+
+@pytest.fixture
+def made() -> list[_FakeClient]:
+    _FakeClient.live = _FakeClient.peak = 0
+    return []
+
+
+def _pool(made: list[_FakeClient], **kwargs) -> lc.AgentSDKSessionPool:
+    delay = kwargs.pop("delay", 0.0)
+
+    def factory(model: str, system_prompt: str) -> _FakeClient:
+        client = _FakeClient(model, system_prompt, delay)
+        made.append(client)
+        return client
+
+    return lc.AgentSDKSessionPool(client_factory=factory, **kwargs)
+
+
+def test_second_call_starts_on_a_warm_session(made) -> None:
+    pool = _pool(made, warm_spares=1)
+    try:
+        assert pool.submit("SYS", "one", "m").result(5) == "SYS:one"
+        assert pool.submit("SYS", "two", "m").result(5) == "SYS:two"
+    finally:
+        pool.close()
+
+    stats = pool.stats()
+    assert stats["calls"] == 2
+    assert stats["warm_hits"] == 1
+    # Each session answered exactly one prompt, then was retired.
+    assert all(len(c.prompts) <= 1 for c in made)
+    assert all(c.disconnected for c in made)
+
+
+def test_dead_spare_is_replaced_with_a_cold_session(made) -> None:
+    pool = _pool(made, warm_spares=1)
+    try:
+        pool.submit("SYS", "one", "m").result(5)
+        for client in made[1:]:
+            client.dead = True
+        assert pool.submit("SYS", "two", "m").result(5) == "SYS:two"
+    finally:
+        pool.close()
+
+    assert pool.stats()["warm_hits"] == 0
+    assert made[1].prompts == []
+
+
+def test_queued_call_deadline_starts_once_it_holds_a_slot(made) -> None:
+    pool = _pool(made, max_concurrency=1, warm_spares=0, delay=0.2)
+    try:
+        # The second call queues for ~0.2s, then runs for ~0.2s: over its
+        # 0.3s timeout in total, but not once it is actually running.
+        futures = [pool.submit("SYS", str(i), "m", timeout=0.3) for i in range(2)]
+        assert [f.result(5) for f in futures] == ["SYS:0", "SYS:1"]
+    finally:
+        pool.close()
+
+
+def test_call_past_its_deadline_times_out(made) -> None:
+    pool = _pool(made, warm_spares=0, delay=1.0)
+    try:
+        with pytest.raises(TimeoutError):
+            pool.submit("SYS", "slow", "m", timeout=0.05).result(5)
+    finally:
+        pool.close()
+
+    assert all(c.disconnected for c in made)
+
+
+def test_spares_are_keyed_by_system_prompt(made) -> None:
+    pool = _pool(made, warm_spares=1)
+    try:
+        pool.submit("A", "one", "m").result(5)
+        assert pool.submit("B", "two", "m").result(5) == "B:two"
+    finally:
+        pool.close()
+
+    assert pool.stats()["warm_hits"] == 0
+
+
+def test_concurrency_is_bounded(made) -> None:
+    pool = _pool(made, max_concurrency=2, warm_spares=0, delay=0.05)
+    try:
+        futures = [pool.submit("SYS", str(i), "m") for i in range(6)]
+        assert sorted(f.result(5) for f in futures) == [f"SYS:{i}" for i in range(6)]
+    finally:
+        pool.close()
+
+    assert _FakeClient.peak == 2
+
+
+def test_call_llm_routes_through_the_pool(made, monkeypatch) -> None:
+    pool = _pool(made, warm_spares=1)
+    monkeypatch.setattr(lc, "_session_pool", pool)
+    monkeypatch.delenv("AGENT_SDK_POOL", raising=False)
+    client = lc.LLMClient(provider="agent_sdk", client=None, model="m")
+    try:
+        assert lc.call_llm(client, "SYS", "hi") == "SYS:hi"
+        assert asyncio.run(lc.acall_llm(client, "SYS", "again")) == "SYS:again"
+    finally:
+        pool.close()
+
+    assert pool.stats()["warm_hits"] == 1
+
+
+def test_spares_are_opt_in(made, monkeypatch) -> None:
+    pool = _pool(made)
+    try:
+        pool.submit("SYS", "one", "m").result(5)
+        pool.submit("SYS", "two", "m").result(5)
+    finally:
+        pool.close()
+
+    assert pool.stats()["warm_hits"] == 0
+    assert len(made) == 2
+    assert lc.AGENT_SDK_POOL_SIZE >= 6  # the editorial board's width
+    monkeypatch.setenv("AGENT_SDK_POOL_WARM", "1")
+    assert lc._pool_warm_spares() == 1
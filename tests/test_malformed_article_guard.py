@@ -61,8 +61,12 @@ class TestMalformedArticleError:
         ):
             asyncio.run(run_stage3("AI Testing"))
 
-    def test_run_stage3_does_not_raise_on_valid_article(self) -> None:
+    def test_run_stage3_does_not_raise_on_valid_article(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Well-formed frontmatter + body must not raise."""
+        # The image-prompt sidecar is written under output/posts/.
+        monkeypatch.chdir(tmp_path)
         from src.agent_sdk.stage3_runner import run_stage3
 
         valid = (
@@ -67,13 +67,17 @@ _INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
 
 
 def _run_server(
-    server: str, payloads: list[dict[str, Any]]
+    server: str, payloads: list[dict[str, Any]], cwd: Path
 ) -> subprocess.CompletedProcess[str]:
-    """Spawn a server standalone and feed it newline-delimited JSON-RPC messages."""
+    """Spawn a server standalone and feed it newline-delimited JSON-RPC messages.
+
+    ``cwd`` is a scratch directory so relative stores (``.chromadb``) the
+    server creates on first use land there, not in the repo.
+    """
     script = _REPO_ROOT / "mcp_servers" / f"{server}.py"
     assert script.exists(), f"missing server script: {script}"
     stdin = "".join(json.dumps(p) + "\n" for p in payloads)
-    # cwd is the repo root, but `python path/to/x.py` still puts the script dir
+    # cwd is not the repo root, and `python path/to/x.py` puts the script dir
     # (not cwd) on sys.path[0] — so the bootstrap is what actually matters.
     return subprocess.run(
         [sys.executable, str(script)],
@@ -81,7 +85,7 @@ def _run_server(
         capture_output=True,
         text=True,
         timeout=30,
-        cwd=str(_REPO_ROOT),
+        cwd=str(cwd),
     )
 
 
@@ -108,9 +112,9 @@ def _assert_stdout_all_json_rpc(
 
 
 @pytest.mark.parametrize("server", _LOCAL_SERVERS)
-def test_server_launches_and_completes_handshake(server: str) -> None:
+def test_server_launches_and_completes_handshake(server: str, tmp_path: Path) -> None:
     """Each stdio server, launched standalone, answers initialize on stdout."""
-    proc = _run_server(server, [_INITIALIZE])
+    proc = _run_server(server, [_INITIALIZE], tmp_path)
 
     assert "ModuleNotFoundError" not in proc.stderr, (
         f"{server} failed to import when launched standalone:\n{proc.stderr}"
@@ -123,7 +127,7 @@ def test_server_launches_and_completes_handshake(server: str) -> None:
 
 
 @pytest.mark.parametrize("server", sorted(_TOOL_CALLS))
-def test_tool_call_keeps_stdout_protocol_clean(server: str) -> None:
+def test_tool_call_keeps_stdout_protocol_clean(server: str, tmp_path: Path) -> None:
     """A real tools/call must not leak any non-JSON-RPC output to stdout.
 
     Regression for #414: lazily-constructed backing objects (StyleMemoryTool /
@@ -143,6 +147,7 @@ def test_tool_call_keeps_stdout_protocol_clean(server: str) -> None:
                 "params": {"name": tool_name, "arguments": arguments},
             },
         ],
+        tmp_path,
     )
 
     assert "ModuleNotFoundError" not in proc.stderr, proc.stderr
@@ -0,0 +1,147 @@
+"""Tests for scripts/performance_rollup.py — the materialised page_rollup table.
+
+The rollup must always equal a ``GROUP BY page_path`` over the daily rows,
+however those rows got there.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scripts import content_intelligence as ci
+from scripts.ga4_etl import CREATE_TABLE_SQL
+from scripts.performance_rollup import (
+    ROLLUP_SELECT_SQL,
+    ensure_page_rollup,
+    page_path_of,
+    upsert_search_rollup,
+)
+
+_ROWS = [
+    ("/2026/01/01/a/", "A", 100, 0.5, 60.0, 0.4, 0.50, "2026-04-01"),
+    ("/2026/01/01/a/", "A (updated)", 50, 0.7, 90.0, 0.6, 0.70, "2026-04-02"),
+    ("/2026/02/01/b/", "B", 300, 0.2, 20.0, 0.1, 0.20, "2026-04-01"),
+]
+
+_GA4_COLUMNS = (
+    "page_path, page_title, row_count, total_pageviews, sum_engagement_rate, "
+    "sum_engagement_time, sum_scroll_depth, sum_composite_score, "
+    "avg_composite_score"
+)
+
+
+def _insert(conn: sqlite3.Connection, rows) -> None:
+    conn.executemany(
+        "INSERT INTO article_performance (page_path, page_title, pageviews, "
+        "engagement_rate, avg_engagement_time, scroll_depth_rate, "
+        "composite_score, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+def _rollup(conn: sqlite3.Connection) -> list[tuple]:
+    return conn.execute(
+        f"SELECT {_GA4_COLUMNS} FROM page_rollup WHERE row_count > 0 ORDER BY page_path"
+    ).fetchall()
+
+
+def _group_by(conn: sqlite3.Connection) -> list[tuple]:
+    return conn.execute(
+        f"{ROLLUP_SELECT_SQL} GROUP BY page_path ORDER BY page_path"
+    ).fetchall()
+
+
+def _assert_matches(conn: sqlite3.Connection) -> None:
+    got, want = _rollup(conn), _group_by(conn)
+    assert [r[:4] for r in got] == [r[:4] for r in want]
+    for g, w in zip(got, want, strict=True):
+        assert g[4:] == pytest.approx(w[4:])
+
+
+@pytest.fixture
+def conn(tmp_path: Path):
+    conn = sqlite3.connect(tmp_path / "performance.db")
+    conn.execute(CREATE_TABLE_SQL)
+    ensure_page_rollup(conn)
+    yield conn
+    conn.close()
+
+
+class TestTriggers:
+    def test_inserts_accumulate_per_page(self, conn) -> None:
+        _insert(conn, _ROWS)
+
+        _assert_matches(conn)
+        assert _rollup(conn)[0][1] == "A (updated)"  # MAX(page_title)
+
+    def test_delete_recomputes_the_page(self, conn) -> None:
+        _insert(conn, _ROWS)
+        conn.execute("DELETE FROM article_performance WHERE fetched_at = '2026-04-01'")
+        conn.commit()
+
+        _assert_matches(conn)
+        assert [r[0] for r in _rollup(conn)] == ["/2026/01/01/a/"]
+
+    def test_update_recomputes_old_and_new_page(self, conn) -> None:
+        _insert(conn, _ROWS)
+        conn.execute(
+            "UPDATE article_performance SET page_path = '/2026/02/01/b/', "
+            "pageviews = 1 WHERE fetched_at = '2026-04-02'"
+        )
+        conn.commit()
+
+        _assert_matches(conn)
+
+
+def test_existing_history_is_backfilled_once(tmp_path: Path) -> None:
+    conn = sqlite3.connect(tmp_path / "legacy.db")
+    conn.execute(CREATE_TABLE_SQL)
+    _insert(conn, _ROWS)
+
+    ensure_page_rollup(conn)
+    ensure_page_rollup(conn)
+
+    _assert_matches(conn)
+    conn.close()
+
+
+def test_search_columns_key_on_the_path_and_survive_ga4_writes(conn) -> None:
+    upsert_search_rollup(
+        conn,
+        [
+            {
+                "page_url": "https://example.com/2026/01/01/a/",
+                "total_impressions": 1000,
+                "total_clicks": 40,
+                "avg_ctr": 0.04,
+                "avg_position": 7.5,
+            }
+        ],
+    )
+    _insert(conn, _ROWS)
+
+    row = conn.execute(
+        "SELECT search_impressions, search_clicks, row_count FROM page_rollup "
+        "WHERE page_path = '/2026/01/01/a/'"
+    ).fetchone()
+    assert row == (1000, 40, 2)
+    assert page_path_of("/already/a/path/") == "/already/a/path/"
+
+
+def test_context_queries_share_one_connection(tmp_path: Path) -> None:
+    db_path = tmp_path / "performance.db"
+    setup = sqlite3.connect(db_path)
+    setup.execute(CREATE_TABLE_SQL)
+    _insert(setup, _ROWS)
+    setup.close()
+
+    with patch.object(ci.sqlite3, "connect", wraps=sqlite3.connect) as connect:
+        context = ci.get_performance_context(db_path=db_path)
+
+    assert "| 0.600 | 150 | A (updated) |" in context
+    assert connect.call_count == 1
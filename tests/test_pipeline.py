@@ -10,6 +10,7 @@ import orjson
 import pytest
 
 from src.agent_sdk.pipeline import PipelineResult, run_pipeline
+from src.telemetry import flush
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
@@ -85,6 +86,7 @@ class TestRunPipeline:
             ),
         ):
             asyncio.run(run_pipeline("AI Testing"))
+        flush()
 
         assert log_path.exists(), "Cost log was not created"
         lines = log_path.read_bytes().splitlines()
@@ -111,6 +113,7 @@ class TestRunPipeline:
         ):
             asyncio.run(run_pipeline("Topic One"))
             asyncio.run(run_pipeline("Topic Two"))
+        flush()
 
         lines = log_path.read_bytes().splitlines()
         assert len(lines) == 2, (
@@ -11,7 +11,7 @@ from pathlib import Path
 import orjson
 import pytest
 
-from scripts.quality_metrics import QualityMetricsPipeline
+from scripts.quality_metrics import EvalColumns, QualityMetricsPipeline
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
@@ -592,6 +592,66 @@ class TestDashboardGeneration:
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Columnar analytics
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestEvalColumns:
+    def test_metrics_agree_on_records_and_columns(
+        self,
+        tmp_pipeline: QualityMetricsPipeline,
+    ) -> None:
+        """Passing prebuilt columns gives the same metrics as passing records."""
+        records = [INVALID_EVAL, *SAMPLE_EVALS]
+        columns = EvalColumns.from_records(records, SAMPLE_RUNS)
+
+        assert tmp_pipeline.calculate_pass_rates(
+            columns, SAMPLE_RUNS
+        ) == tmp_pipeline.calculate_pass_rates(records, SAMPLE_RUNS)
+        assert tmp_pipeline.categorize_failure_modes(
+            columns
+        ) == tmp_pipeline.categorize_failure_modes(records)
+        assert tmp_pipeline.compute_score_trends(
+            columns, SAMPLE_RUNS
+        ) == tmp_pipeline.compute_score_trends(records, SAMPLE_RUNS)
+
+    def test_failure_mode_ties_keep_first_seen_order(
+        self,
+        tmp_pipeline: QualityMetricsPipeline,
+    ) -> None:
+        result = tmp_pipeline.categorize_failure_modes([SAMPLE_EVALS[1]])
+        assert list(result)[:3] == [
+            "banned_opening",
+            "unverified_claims",
+            "missing_references",
+        ]
+        assert result["missing_references"] == 2  # evidence and structure
+
+    def test_rolling_average_spans_recent_weeks(
+        self,
+        tmp_pipeline: QualityMetricsPipeline,
+    ) -> None:
+        evals = [
+            {**SAMPLE_EVALS[0], "timestamp": f"2026-0{m}-01T10:00:00", "total_score": s}
+            for m, s in zip(range(1, 7), (10, 20, 30, 40, 50, 60), strict=True)
+        ]
+        weekly, _ = tmp_pipeline.compute_score_trends(evals)
+        rolling = [w["rolling_avg_score"] for w in weekly]
+        assert rolling == [10.0, 15.0, 20.0, 25.0, 35.0, 45.0]
+
+    def test_dashboard_reports_score_percentiles(
+        self,
+        pipeline_with_evals: QualityMetricsPipeline,
+        tmp_path: Path,
+    ) -> None:
+        percentiles = pipeline_with_evals.generate_dashboard()["score_percentiles"]
+        assert percentiles["p50"] == 34.0
+        assert percentiles["p10"] < percentiles["p90"]
+        empty = QualityMetricsPipeline(evals_path=tmp_path / "none.json")
+        assert empty.generate_dashboard()["score_percentiles"] == {}
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Edge cases
 # ═══════════════════════════════════════════════════════════════════════════
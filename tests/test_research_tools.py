@@ -9,12 +9,15 @@ tool wrapper's JSON output.
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 
 import orjson
 
 from src.agent_sdk.tools import research_tools
 from src.agent_sdk.tools.research_tools import (
     DEFAULT_SEARCH_CALL_BUDGET,
+    SourceCache,
     SourceFetchSession,
     build_search_tool,
 )
@@ -182,3 +185,188 @@ def test_tool_empty_query_short_circuits(monkeypatch) -> None:
 
     assert out["content"][0]["text"] == "[]"
     assert counter[0] == 0, "empty query must not hit the provider"
+
+
+def test_tool_runs_provider_off_the_event_loop(monkeypatch) -> None:
+    """The blocking provider call must not run on the writer's event loop."""
+    threads: list[str] = []
+
+    def _record_thread(q, n):
+        threads.append(threading.current_thread().name)
+        return list(_SAMPLE)
+
+    _patch_provider(monkeypatch, _record_thread)
+    search_tool = build_search_tool(SourceFetchSession())
+
+    asyncio.run(search_tool.handler({"query": "roi"}))
+
+    assert threads and threads[0].startswith("source-search")
+
+
+def test_concurrent_identical_queries_share_one_provider_call(monkeypatch) -> None:
+    counter = _patch_provider(monkeypatch, lambda q, n: list(_SAMPLE))
+    session = SourceFetchSession()
+
+    async def _both():
+        return await asyncio.gather(session.asearch("q"), session.asearch(" Q "))
+
+    first, second = asyncio.run(_both())
+
+    assert first == second == _SAMPLE
+    assert counter[0] == 1
+    assert session.calls_made == 1
+
+
+def test_follow_up_for_more_results_is_served_from_prefetch(monkeypatch) -> None:
+    many = [
+        {"title": f"T{i}", "url": f"https://t/{i}", "snippet": "s"} for i in range(5)
+    ]
+    seen_n: list[int] = []
+
+    def _provider(q, n):
+        seen_n.append(n)
+        return many[:n]
+
+    counter = _patch_provider(monkeypatch, _provider)
+    session = SourceFetchSession()
+
+    assert session.search("q", max_results=2) == many[:2]
+    # Only what the writer was handed reaches the brief supplement.
+    assert session.fetched == many[:2]
+    assert session.search("q", max_results=4) == many[:4]
+
+    assert counter[0] == 1
+    assert seen_n == [research_tools.PREFETCH_RESULTS]
+    assert session.fetched == many[:4]
+
+
+def test_request_beyond_the_prefetch_is_fetched_in_full(monkeypatch) -> None:
+    many = [
+        {"title": f"T{i}", "url": f"https://t/{i}", "snippet": "s"} for i in range(20)
+    ]
+    seen_n: list[int] = []
+
+    def _provider(q, n):
+        seen_n.append(n)
+        return many[:n]
+
+    _patch_provider(monkeypatch, _provider)
+    cache = SourceCache()
+    session = SourceFetchSession(cache=cache)
+
+    assert session.search("q", max_results=2) == many[:2]
+    # The prefetch of 5 cannot answer 8, so the query is fetched again.
+    assert session.search("q", max_results=8) == many[:8]
+    # Anything past the stated cap is clamped to it.
+    assert SourceFetchSession(cache=cache).search("q", max_results=50) == many[:10]
+
+    assert seen_n == [research_tools.PREFETCH_RESULTS, 8, 10]
+
+
+def test_short_result_set_answers_any_larger_request(monkeypatch) -> None:
+    counter = _patch_provider(monkeypatch, lambda q, n: list(_SAMPLE))
+    session = SourceFetchSession()
+
+    session.search("q", max_results=1)
+
+    # The provider returned fewer than asked for, so there is nothing more.
+    assert session.search("q", max_results=9) == _SAMPLE
+    assert counter[0] == 1
+
+
+def test_shared_cache_hit_costs_no_budget(monkeypatch) -> None:
+    """A retry's session reuses the first attempt's search for free."""
+    counter = _patch_provider(monkeypatch, lambda q, n: list(_SAMPLE))
+    cache = SourceCache()
+    SourceFetchSession(cache=cache).search("qa roi")
+
+    retry = SourceFetchSession(cache=cache)
+    assert retry.search("QA ROI") == _SAMPLE
+
+    assert counter[0] == 1
+    assert retry.calls_made == 0
+    assert retry.shared_hits == 1
+    assert retry.fetched == _SAMPLE  # still reaches the brief supplement
+
+
+def test_shared_cache_never_stores_empty_results(monkeypatch) -> None:
+    counter = _patch_provider(monkeypatch, lambda q, n: [])
+    cache = SourceCache()
+    SourceFetchSession(cache=cache).search("q")
+    SourceFetchSession(cache=cache).search("q")
+
+    assert counter[0] == 2
+
+
+def test_persistent_cache_survives_a_new_run(tmp_path, monkeypatch) -> None:
+    counter = _patch_provider(monkeypatch, lambda q, n: list(_SAMPLE))
+    path = tmp_path / "source_cache.jsonl"
+    monkeypatch.setenv("SOURCE_CACHE_PATH", str(path))
+    SourceFetchSession(cache=SourceCache.for_run()).search("q")
+
+    next_run = SourceFetchSession(cache=SourceCache.for_run())
+
+    assert next_run.search("q") == _SAMPLE
+    assert counter[0] == 1
+
+
+def test_persistent_cache_drops_expired_and_torn_entries(tmp_path) -> None:
+    path = tmp_path / "source_cache.jsonl"
+    path.write_bytes(
+        orjson.dumps({"query": "old", "fetched_at": 0.0, "sources": _SAMPLE})
+        + b"\n"
+        + b'{"query": "torn", "fetch'
+    )
+
+    cache = SourceCache(path)
+
+    assert cache.get("old") is None
+    assert cache.get("torn") is None
+
+
+def test_persistent_cache_is_compacted_on_load(tmp_path) -> None:
+    path = tmp_path / "source_cache.jsonl"
+    now = time.time()
+    path.write_bytes(
+        orjson.dumps({"query": "old", "fetched_at": 0.0, "sources": _SAMPLE})
+        + b"\n"
+        + orjson.dumps({"query": "q", "fetched_at": now - 1, "sources": []})
+        + b"\n"
+        + orjson.dumps({"query": "q", "fetched_at": now, "sources": _SAMPLE})
+        + b"\n"
+        + b'{"query": "torn", "fetch'
+    )
+
+    SourceCache(path)
+
+    lines = path.read_bytes().splitlines()
+    assert [orjson.loads(line)["query"] for line in lines] == ["q"]
+    assert not path.with_suffix(".jsonl.tmp").exists()
+    assert SourceCache(path).get("q") == _SAMPLE
+
+
+def test_append_during_compaction_is_not_lost(tmp_path, monkeypatch) -> None:
+    """Another run's append waits for the rewrite rather than landing in the
+    file it is about to replace."""
+    path = tmp_path / "source_cache.jsonl"
+    other_run = SourceCache(path)
+    path.write_bytes(
+        orjson.dumps({"query": "old", "fetched_at": 0.0, "sources": _SAMPLE}) + b"\n"
+    )
+    compacting = threading.Event()
+    compact = SourceCache._compact
+
+    def _slow_compact(self, target):
+        compacting.set()
+        time.sleep(0.2)
+        compact(self, target)
+
+    monkeypatch.setattr(SourceCache, "_compact", _slow_compact)
+    appender = threading.Thread(
+        target=lambda: compacting.wait(5) and other_run.put("new", _SAMPLE)
+    )
+    appender.start()
+    SourceCache(path)
+    appender.join(5)
+
+    assert SourceCache(path).get("new") == _SAMPLE
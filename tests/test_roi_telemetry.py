@@ -6,15 +6,32 @@ Author: Economist Agents Team
 Sprint: 14, Story: STORY-007
 """
 
+import json
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from src.telemetry import roi_tracker
 from src.telemetry.roi_tracker import MODEL_PRICING, ROITracker, get_tracker
 
 
+def _run_executions(log_file: str, count: int) -> None:
+    tracker = ROITracker(log_file=log_file)
+    for _ in range(count):
+        execution_id = tracker.start_execution("writer_agent")
+        tracker.log_llm_call(
+            execution_id=execution_id,
+            agent="writer_agent",
+            model="claude-sonnet-4-6",
+            input_tokens=100,
+            output_tokens=50,
+        )
+        tracker.end_execution(execution_id)
+
+
 class TestROITrackerBasics:
     """Test core ROI tracker functionality."""
 
@@ -390,6 +407,96 @@ class TestLogRotation:
             assert tracker.log["executions"][0]["execution_id"] != "old_exec"
 
 
+class TestEventStore:
+    """Append-only store: counters, compaction, legacy import, concurrency."""
+
+    def test_concurrent_writers_keep_counters_exact(self, tmp_path: Path):
+        log_file = str(tmp_path / "roi.json")
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_run_executions, [log_file] * 4, [25] * 4))
+
+        summary = ROITracker(log_file=log_file).get_agent_summary("writer_agent")
+        assert summary["total_executions"] == 100
+        assert summary["total_tokens"] == 15_000
+
+    def test_snapshot_is_rewritten_only_when_compaction_is_due(
+        self, tmp_path: Path, monkeypatch
+    ):
+        log_file = tmp_path / "roi.json"
+        _run_executions(str(log_file), 1)
+        assert len(json.loads(log_file.read_text())["executions"]) == 1
+
+        _run_executions(str(log_file), 2)
+        assert len(json.loads(log_file.read_text())["executions"]) == 1
+
+        monkeypatch.setattr(roi_tracker, "COMPACT_INTERVAL", roi_tracker.timedelta(0))
+        _run_executions(str(log_file), 1)
+        assert len(json.loads(log_file.read_text())["executions"]) == 4
+
+    def test_default_store_follows_roi_log_path(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(roi_tracker, "ROI_LOG_PATH", tmp_path / "roi.json")
+
+        tracker = ROITracker()
+
+        assert tracker.db_path == tmp_path / "roi.db"
+        assert (tmp_path / "roi.json").exists()
+
+    def test_opening_a_tracker_reads_counters_not_records(self, tmp_path: Path):
+        log_file = str(tmp_path / "roi.json")
+        _run_executions(log_file, 3)
+
+        tracker = ROITracker(log_file=log_file)
+
+        assert "executions" not in tracker._log
+        assert tracker._log["summary"]["total_executions"] == 3
+        assert len(tracker.log["executions"]) == 3
+
+    def test_flush_brings_the_snapshot_up_to_date(self, tmp_path: Path):
+        log_file = tmp_path / "roi.json"
+        _run_executions(str(log_file), 1)
+        tracker = ROITracker(log_file=str(log_file))
+        execution_id = tracker.start_execution("writer_agent")
+        tracker.end_execution(execution_id)
+        assert len(json.loads(log_file.read_text())["executions"]) == 1
+
+        tracker.flush()
+
+        snapshot = json.loads(log_file.read_text())
+        assert len(snapshot["executions"]) == 2
+        assert snapshot["summary"]["total_executions"] == 2
+
+    def test_avg_roi_counts_zero_cost_executions_but_not_their_roi(
+        self, tmp_path: Path
+    ):
+        tracker = ROITracker(log_file=str(tmp_path / "roi.json"))
+        _run_executions(str(tmp_path / "roi.json"), 1)
+        free = tracker.start_execution("writer_agent")
+        tracker.end_execution(free)
+
+        summary = tracker.get_agent_summary("writer_agent")
+        roi = tracker.log["executions"][0]["roi_multiplier"]
+
+        assert summary["total_executions"] == 2
+        assert summary["avg_roi_multiplier"] == round(roi / 2, 2)
+        assert tracker.log["summary"]["avg_roi_multiplier"] == round(roi / 2, 2)
+
+    def test_legacy_json_log_is_imported_once(self, tmp_path: Path):
+        log_file = tmp_path / "roi.json"
+        _run_executions(str(log_file), 2)
+        tracker = ROITracker(log_file=str(log_file))
+        tracker._rotate_logs()  # snapshot now holds both executions
+        tracker.db_path.unlink()
+        for suffix in ("-wal", "-shm"):
+            Path(f"{tracker.db_path}{suffix}").unlink(missing_ok=True)
+
+        assert (
+            ROITracker(log_file=str(log_file)).log["summary"]["total_executions"] == 2
+        )
+        assert (
+            ROITracker(log_file=str(log_file)).log["summary"]["total_executions"] == 2
+        )
+
+
 class TestClaude4Pricing:
     """Issue #333 AC1: Claude 4 model IDs are present with current Anthropic rates.
 
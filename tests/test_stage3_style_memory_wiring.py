@@ -59,13 +59,15 @@ def captured_prompts() -> dict[str, str]:
 
 
 @pytest.fixture
-def stub_pipeline(captured_prompts):
+def stub_pipeline(captured_prompts, tmp_path, monkeypatch):
     """Stub research + Agent SDK calls so ``run_stage3`` runs offline.
 
     The first call to ``_collect_text`` (the writer) records its prompt
     under ``captured_prompts["writer"]`` and returns a minimally valid
     article. The second call (graphics) returns a trivial JSON chart.
+    Runs in ``tmp_path`` so the image-prompt sidecar stays out of the repo.
     """
+    monkeypatch.chdir(tmp_path)
 
     async def fake_collect_text(prompt, system_prompt, **kwargs):
         if "writer" not in captured_prompts:
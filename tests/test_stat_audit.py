@@ -8,6 +8,7 @@ cleanly.
 
 from src.agent_sdk._shared import (
     _extract_stats,
+    audit_stat_sentences,
     parse_research_for_verification,
 )
 from src.agent_sdk._shared import (
@@ -106,6 +107,18 @@ class TestAuditArticleStats:
         assert "## References" in result
         assert "99%" in result  # References not audited
 
+    def test_counts_removed_sentences_not_full_stops(self) -> None:
+        research = "Teams report a 23% improvement."
+        article = (
+            "---\ntitle: Test\n---\n"
+            "Version 2.5 shipped with a 41% cut in flaky tests. "
+            "The U.S. team saw a 17% gain! "
+            "This is a clean sentence."
+        )
+        cleaned, removed = audit_stat_sentences(article, research)
+        assert removed == 2
+        assert cleaned == _audit_article_stats(article, research)
+
 
 class TestParseResearchForVerification:
     """Stage3Crew._parse_research_for_verification() extracts URL+stat pairs."""
@@ -0,0 +1,83 @@
+"""Tests for src/telemetry/bus.py — non-blocking emit, batched SQLite sink."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+
+from src.telemetry.bus import JsonlMirror, TelemetryBus
+
+
+def test_events_reach_the_sink_in_emit_order(tmp_path: Path) -> None:
+    bus = TelemetryBus(tmp_path / "telemetry.db")
+    for i in range(5):
+        bus.emit("token_usage", {"n": i})
+    bus.emit("pipeline_run", {"topic": "x"})
+
+    assert bus.flush()
+    assert [e["payload"]["n"] for e in bus.iter_events(kind="token_usage")] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert [e["kind"] for e in bus.iter_events()][-1] == "pipeline_run"
+
+
+def test_mirror_keeps_the_legacy_jsonl_format(tmp_path: Path) -> None:
+    bus = TelemetryBus(tmp_path / "telemetry.db")
+    mirror = JsonlMirror(tmp_path / "nested" / "costs.jsonl")
+    bus.emit("pipeline_run", {"topic": "a"}, mirror=mirror)
+    bus.emit("pipeline_run", {"topic": "b"}, mirror=mirror)
+    bus.emit("roi_execution", {"agent": "writer"})
+    bus.flush()
+
+    lines = mirror.path.read_bytes().splitlines()
+    assert [orjson.loads(line) for line in lines] == [{"topic": "a"}, {"topic": "b"}]
+
+
+def test_emit_does_not_wait_for_the_writer(tmp_path: Path) -> None:
+    bus = TelemetryBus(tmp_path / "telemetry.db")
+    release = threading.Event()
+    real_write = bus._write
+
+    def slow_write(batch):
+        release.wait(5)
+        real_write(batch)
+
+    with patch.object(bus, "_write", side_effect=slow_write):
+        for i in range(100):
+            bus.emit("timing", {"n": i})  # returns while the writer is stuck
+        release.set()
+        assert bus.flush()
+
+    assert len(list(bus.iter_events())) == 100
+
+
+def test_batches_share_one_transaction(tmp_path: Path) -> None:
+    bus = TelemetryBus(tmp_path / "telemetry.db", batch_size=50, flush_interval=5)
+    with patch.object(bus, "_write", wraps=bus._write) as write:
+        for i in range(120):
+            bus.emit("timing", {"n": i})
+        bus.flush()
+
+    assert sum(len(call.args[0]) for call in write.call_args_list) == 120
+    assert write.call_count <= 4
+    with closing(sqlite3.connect(bus.db_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_unwritable_mirror_does_not_lose_the_event(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    bus = TelemetryBus(tmp_path / "telemetry.db")
+    bus.emit("token_usage", {"n": 1}, mirror=JsonlMirror(blocker / "usage.jsonl"))
+    bus.flush()
+
+    assert [e["payload"] for e in bus.iter_events()] == [{"n": 1}]
@@ -18,6 +18,7 @@ from scripts.token_usage import (
     read_usage_log,
     summarise_usage,
 )
+from src.telemetry import flush
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -93,6 +94,7 @@ class TestLogTokenUsage:
 
         log_file = tmp_path / "usage.jsonl"
         log_token_usage("gpt-4o", 100, 50, 150, log_file=log_file)
+        flush()
 
         lines = log_file.read_bytes().splitlines()
         assert len(lines) == 1
@@ -111,6 +113,7 @@ class TestLogTokenUsage:
         log_file = tmp_path / "usage.jsonl"
         log_token_usage("gpt-4o", 100, 50, 150, log_file=log_file)
         log_token_usage("gpt-4o-mini", 200, 80, 280, log_file=log_file)
+        flush()
 
         lines = log_file.read_bytes().splitlines()
         assert len(lines) == 2
@@ -130,6 +133,7 @@ class TestLogTokenUsage:
     def test_creates_parent_directory(self, tmp_path):
         log_file = tmp_path / "deep" / "nested" / "usage.jsonl"
         log_token_usage("gpt-4o", 10, 5, 15, log_file=log_file)
+        flush()
         assert log_file.exists()
 
     def test_warns_on_write_failure(self, tmp_path, caplog):
@@ -7,6 +7,7 @@ Covers public surface:
 * ``ZoneBoundaryValidator._validate_matplotlib_code``
 * ``ZoneBoundaryValidator._validate_pixels``
 * ``ZoneBoundaryValidator.generate_report``
+* ``ZoneBoundaryValidator.validate_charts`` (batch)
 * ``validate_chart_cli`` (CLI entry point)
 """
 
@@ -18,6 +19,7 @@ import numpy as np
 import pytest
 from PIL import Image
 
+from src.quality import visual_qa_zones
 from src.quality.visual_qa_zones import ZoneBoundaryValidator, validate_chart_cli
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -366,6 +368,108 @@ class TestValidatePixels:
         assert mod.ZoneBoundaryValidator is ZoneBoundaryValidator
 
 
+# ── ZoneBoundaryValidator.validate_charts ─────────────────────────────────────
+
+
+class TestValidateCharts:
+    def test_batch_verdicts_match_validate_chart(self, tmp_path: Path) -> None:
+        charts = [
+            _make_compliant_chart(tmp_path / "good.png"),
+            _make_blank_chart(tmp_path / "blank.png"),
+            _make_bottom_bar_chart(tmp_path / "bottom-bar.png"),
+            _make_compliant_chart(tmp_path / "Bad_Name.png"),
+            tmp_path / "missing.png",
+        ]
+        validator = ZoneBoundaryValidator()
+
+        results = validator.validate_charts(charts, max_workers=2)
+
+        assert [r.path for r in results] == charts
+        for chart, result in zip(charts, results, strict=True):
+            assert result.issues == ZoneBoundaryValidator().validate_chart(chart)[1]
+        assert [r.is_valid for r in results] == [True, False, False, False, False]
+        assert validator.issues == []
+
+    def test_each_check_is_timed(self, tmp_path: Path) -> None:
+        chart = _make_compliant_chart(tmp_path / "timed.png")
+
+        (result,) = ZoneBoundaryValidator().validate_charts([chart])
+
+        assert set(result.timings_ms) == {
+            "filename",
+            "decode",
+            "red_bar",
+            "background",
+        }
+        assert all(ms >= 0 for ms in result.timings_ms.values())
+
+    def test_an_unreadable_chart_is_reported_not_swallowed(
+        self, tmp_path: Path
+    ) -> None:
+        chart = tmp_path / "corrupt.png"
+        chart.write_bytes(b"not a png")
+
+        (result,) = ZoneBoundaryValidator().validate_charts([chart])
+
+        assert not result.is_valid
+        assert result.issues[0].startswith("Pixel checks could not run")
+
+    def test_sampling_a_large_chart_keeps_the_verdict(self, tmp_path: Path) -> None:
+        """A 300-dpi chart is checked on a sample of rows and columns."""
+        good = _make_compliant_chart(tmp_path / "large.png", width=3600, height=2400)
+        bad = _make_bottom_bar_chart(tmp_path / "large-bad.png", 3600, 2400)
+
+        results = ZoneBoundaryValidator().validate_charts([good, bad])
+
+        assert [r.issues for r in results] == [
+            [],
+            ["Red bar not detected in RED BAR ZONE (top 4%)"],
+        ]
+
+    @pytest.mark.parametrize(
+        ("check", "rgb", "rows", "share"),
+        [
+            ("_check_red_bar", (227, 49, 11), slice(0, 96), 0.47),
+            ("_check_red_bar", (227, 49, 11), slice(0, 96), 0.53),
+            ("_check_background", (241, 240, 233), slice(144, 360), 0.27),
+            ("_check_background", (241, 240, 233), slice(144, 360), 0.33),
+        ],
+    )
+    def test_sampled_check_matches_a_full_scan_near_its_threshold(
+        self, monkeypatch, check: str, rgb: tuple, rows: slice, share: float
+    ) -> None:
+        """Three points either side of the 0.5 / 0.3 thresholds, pixels scattered
+        at random. Closer than that, or with a pattern that repeats at the
+        sampling step, the sample can disagree with a full scan."""
+        rng = np.random.default_rng(45)
+        pixels = np.zeros((2400, 3600, 3), dtype=np.uint8)
+        zone = pixels[rows]
+        zone[rng.random(zone.shape[:2]) < share] = rgb
+        validator = ZoneBoundaryValidator()
+
+        sampled = getattr(validator, check)(pixels)
+        monkeypatch.setattr(visual_qa_zones, "PIXEL_SAMPLE_ROWS", 10**6)
+        full = getattr(validator, check)(pixels)
+
+        assert sampled == full
+        assert bool(full) == (share < (0.5 if check == "_check_red_bar" else 0.3))
+
+    def test_cli_checks_a_directory(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        _make_compliant_chart(tmp_path / "first-chart.png")
+        _make_blank_chart(tmp_path / "second-chart.png")
+        monkeypatch.setattr("sys.argv", ["visual_qa_zones", str(tmp_path), "--timings"])
+
+        assert validate_chart_cli() == 1
+        out = capsys.readouterr().out
+        assert "1/2 charts passed" in out
+        assert "decode" in out
+
+
 # ── ZoneBoundaryValidator.generate_report ─────────────────────────────────────
 
 
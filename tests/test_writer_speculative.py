@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Opt-in speculative writing: ``writer_parallelism > 1`` races writer attempts
+under the shared budget, keeps the first acceptable draft, and stops the losers
+through the BUG-048-safe path (an interrupt, not a cancel inside ``query()``)."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import claude_agent_sdk as sdk
+import pytest
+
+import src.agent_sdk.stage3_runner as s3
+from src.agent_sdk.stage3_runner import MalformedArticleError, run_stage3
+
+_GOOD = (
+    "---\nlayout: post\ntitle: t\n"
+    "image: /assets/images/test-slug.png\n---\n\n"
+    "Body paragraph. As the chart shows, things happen.\n"
+)
+_EMPTY_BODY = "---\nlayout: post\ntitle: t\n---\n\n"
+
+
+def _wire(monkeypatch, drafts: dict[int, tuple[str, float]]) -> list[float | None]:
+    """Writer attempt N returns the text in ``drafts[N]`` after its delay (seconds).
+
+    Attempts are numbered in dispatch order from the ``label`` kwarg. An attempt
+    still running when the stop event fires returns early with the $0.04 its
+    interrupted turn cost, as ``_collect_text`` does. Returns the per-attempt
+    caps the writer was given.
+    """
+    caps: list[float | None] = []
+
+    async def fake_collect(prompt, system_prompt, **kwargs):
+        caps.append(kwargs.get("max_budget_usd"))
+        attempt = int(kwargs["label"].split("attempt ")[1].split("/")[0])
+        text, delay = drafts[attempt]
+        stop = kwargs.get("stop_event")
+        for _ in range(int(delay * 100)):
+            if stop is not None and stop.is_set():
+                return "", 0.04
+            await asyncio.sleep(0.01)
+        return text, 0.10
+
+    monkeypatch.setattr(s3, "_collect_text", fake_collect)
+    monkeypatch.setattr(s3, "_fetch_style_context", lambda topic: "")
+    monkeypatch.setattr(s3, "build_research_brief", lambda topic: "# Brief")
+    monkeypatch.setattr(s3, "_audit_article_stats", lambda article, brief: article)
+    monkeypatch.setattr(
+        s3, "_audit_stat_sentences", lambda article, brief: (article, 0)
+    )
+    return caps
+
+
+def test_first_valid_draft_wins(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RESEARCH_MODE", raising=False)
+    # Attempt 1 is slow, attempt 2 is fast but malformed, attempt 3 is good.
+    caps = _wire(
+        monkeypatch,
+        {1: (_GOOD, 5.0), 2: (_EMPTY_BODY, 0.01), 3: (_GOOD + "Third.\n", 0.05)},
+    )
+
+    result = asyncio.run(run_stage3("topic", writer_parallelism=3))
+
+    assert "Third." in result.article
+    # Every attempt got an equal slice of the shared budget.
+    assert caps == [pytest.approx(s3.DEFAULT_WRITER_BUDGET_USD / 3)] * 3
+    # Two completed ($0.10 each); the stopped loser is charged what it reported.
+    assert result.writer_cost_usd == pytest.approx(0.24)
+
+
+def test_all_malformed_raises(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RESEARCH_MODE", raising=False)
+    _wire(monkeypatch, dict.fromkeys((1, 2, 3), (_EMPTY_BODY, 0.01)))
+
+    with pytest.raises(MalformedArticleError, match="after 3 attempts"):
+        asyncio.run(run_stage3("topic", writer_parallelism=2))
+
+
+def test_draft_over_stat_threshold_is_the_fallback(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RESEARCH_MODE", raising=False)
+    _wire(monkeypatch, {1: (_GOOD, 0.01), 2: (_GOOD, 0.02)})
+    # The audit strips every sentence, so no draft meets the threshold.
+    monkeypatch.setattr(
+        s3, "_audit_stat_sentences", lambda article, brief: ("---\n", 20)
+    )
+    monkeypatch.setattr(s3, "_WRITER_MAX_ATTEMPTS", 2)
+
+    result = asyncio.run(run_stage3("topic", writer_parallelism=2))
+
+    assert result.article.startswith("---")
+
+
+def test_wave_is_narrowed_to_what_the_budget_funds(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("RESEARCH_MODE", raising=False)
+    caps = _wire(monkeypatch, {1: (_GOOD, 0.01), 2: (_GOOD, 0.01)})
+
+    asyncio.run(
+        run_stage3(
+            "topic",
+            writer_parallelism=3,
+            writer_budget_usd=s3._WRITER_ATTEMPT_COST_USD * 2,
+        )
+    )
+
+    assert len(caps) == 2
+
+
+class _FakeClient:
+    """A ``ClaudeSDKClient`` whose turn streams one chunk, then waits.
+
+    ``interrupt()`` ends the turn with a ``ResultMessage``, as the CLI does.
+    With ``deaf=True`` the interrupt is ignored, so only a cancel stops it.
+    """
+
+    instances: list[_FakeClient] = []
+
+    def __init__(self, options=None, *, deaf: bool = False) -> None:
+        self.deaf = deaf
+        self.interrupted = asyncio.Event()
+        self.streaming = asyncio.Event()
+        self.closed = False
+        _FakeClient.instances.append(self)
+
+    async def __aenter__(self) -> _FakeClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.closed = True
+
+    async def query(self, prompt: str) -> None:
+        pass
+
+    async def interrupt(self) -> None:
+        if not self.deaf:
+            self.interrupted.set()
+
+    async def receive_response(self):
+        yield sdk.AssistantMessage(
+            content=[sdk.TextBlock(text="partial")], model="claude-sonnet-4-6"
+        )
+        self.streaming.set()
+        await self.interrupted.wait()  # mid-pump until interrupted
+        yield sdk.ResultMessage(
+            subtype="error_during_execution",
+            duration_ms=1,
+            duration_api_ms=1,
+            is_error=True,
+            num_turns=1,
+            session_id="s",
+            total_cost_usd=0.03,
+        )
+
+
+def test_stop_event_interrupts_collect_text_cleanly(monkeypatch) -> None:
+    """A stopped call returns what it has — no aclose() RuntimeError (BUG-048)."""
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(s3, "ClaudeSDKClient", _FakeClient)
+
+    async def run() -> tuple[str, float]:
+        stop = asyncio.Event()
+        call = asyncio.create_task(s3._collect_text("p", "sys", stop_event=stop))
+        while (
+            not _FakeClient.instances or not _FakeClient.instances[0].streaming.is_set()
+        ):
+            await asyncio.sleep(0)
+        stop.set()
+        return await call
+
+    text, cost = asyncio.run(run())
+
+    assert text == "partial"
+    assert cost == pytest.approx(0.03)
+    assert _FakeClient.instances[0].closed
+
+
+def test_a_hard_cancel_mid_pump_unwinds_without_aclose_errors(monkeypatch) -> None:
+    """The grace-period fallback: a deaf attempt is cancelled mid-stream."""
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(
+        s3, "ClaudeSDKClient", lambda options: _FakeClient(options, deaf=True)
+    )
+    monkeypatch.setattr(s3, "_SPECULATIVE_CANCEL_GRACE_S", 0.05)
+
+    async def run() -> list[object]:
+        stop = asyncio.Event()
+        task = asyncio.create_task(s3._collect_text("p", "sys", stop_event=stop))
+        while (
+            not _FakeClient.instances or not _FakeClient.instances[0].streaming.is_set()
+        ):
+            await asyncio.sleep(0)
+        cost = await s3._stop_losing_attempts({task}, stop)
+        return [task.exception() if not task.cancelled() else "cancelled", cost]
+
+    # A cancelled attempt reports no cost, so it is charged the estimate.
+    assert asyncio.run(run()) == ["cancelled", s3._WRITER_ATTEMPT_COST_USD]
+    assert _FakeClient.instances[0].closed